@@ -0,0 +1,99 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Utilities for reading and writing (optionally) compressed text files
+#
+
+import gzip
+
+from pyomo.common.dependencies import zstandard, zstandard_available
+
+#: The supported compression formats and their file suffixes
+compression_suffixes = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+_magic_numbers = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+
+def _check_compression(compression):
+    if compression not in compression_suffixes:
+        raise ValueError(
+            "Unrecognized compression format '%s'.  Valid formats are: %s"
+            % (compression, ', '.join(sorted(compression_suffixes))))
+    if compression == 'zstd' and not zstandard_available:
+        raise RuntimeError(
+            "zstd compression requires the 'zstandard' package, "
+            "which is not available")
+
+
+def guess_compression(filename):
+    """Return the compression format implied by the file suffix
+    (or None if the suffix is not a compression suffix)"""
+    for compression, suffix in compression_suffixes.items():
+        if filename.endswith(suffix):
+            return compression
+    return None
+
+
+def strip_compression_suffix(filename):
+    """Return the filename without any compression suffix"""
+    compression = guess_compression(filename)
+    if compression is None:
+        return filename
+    return filename[:-len(compression_suffixes[compression])]
+
+
+def detect_compression(filename):
+    """Return the compression format of an existing file, determined
+    from its leading bytes (or None if the file is not compressed)"""
+    with open(filename, 'rb') as f:
+        header = f.read(4)
+    for magic, compression in _magic_numbers:
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def open_file(filename, mode='r', compression=None):
+    """Open a (possibly compressed) file
+
+    Args:
+        filename (str): the file to open
+        mode (str): 'r', 'w', or 'a', optionally followed by 'b' to
+            open the file in binary mode (text mode is the default)
+        compression (str): one of the keys of
+            :py:data:`compression_suffixes`, or 'none' to disable
+            compression.  If None, the compression is detected from the
+            file contents when reading and inferred from the file suffix
+            when writing.
+
+    Returns:
+        A file object
+    """
+    mode = mode.replace('t', '')
+    text = '' if 'b' in mode else 't'
+    if compression is None:
+        if 'r' in mode:
+            compression = detect_compression(filename)
+        else:
+            compression = guess_compression(filename)
+    elif compression == 'none':
+        compression = None
+    if compression is None:
+        return open(filename, mode)
+    _check_compression(compression)
+    if compression == 'gzip':
+        return gzip.open(filename, mode+text)
+    return zstandard.open(filename, mode+text)
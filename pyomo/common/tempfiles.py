@@ -31,38 +31,141 @@ except ImportError:
 deletion_errors_are_fatal = True
 
 
+# Standard locations of RAM-backed (tmpfs) file systems
+_ram_tempdir_candidates = ('/dev/shm', '/run/shm')
+
+
+def _free_space(dirname):
+    """Return the number of bytes available in the file system
+    containing dirname (or None if it cannot be determined)"""
+    try:
+        st = os.statvfs(dirname)
+    except (AttributeError, OSError):
+        return None
+    return st.f_bavail * st.f_frsize
+
+
 class TempfileManagerClass:
-    """A class that manages temporary files."""
+    """A class that manages temporary files.
+
+    Temporary files are created in ``tempdir`` (if it is set).
+    Otherwise, they are created in ``ram_tempdir`` (see
+    :py:meth:`use_ram_tempdir`) as long as that directory has at least
+    ``ram_tempdir_min_free`` bytes available, falling back to the
+    system default temporary directory.
+
+    Note that the free space is only checked when the file is created:
+    a file that grows past the available space still fills the
+    RAM-backed file system.  Pass the expected ``size`` to
+    :py:meth:`create_tempfile` when it is known.  The problem writers
+    called by the solvers (see the 'pyomo' problem converter) write the
+    file again in the default temporary directory if the RAM-backed
+    file system fills up.
+    """
 
     tempdir = None
+    ram_tempdir = None
+    ram_tempdir_min_free = 256*1024*1024
 
     def __init__(self, **kwds):
         self._tempfiles = [[]]
         self._ctr = -1
 
-    def create_tempfile(self, suffix=None, prefix=None, text=False, dir=None):
+    def use_ram_tempdir(self, dir=None, min_free=None):
+        """Prefer a RAM-backed directory for temporary files
+
+        Writing the problem, solution and log files to a tmpfs file
+        system (like /dev/shm) avoids the disk (or network file system)
+        I/O.  Temporary files are only created in the RAM-backed
+        directory while it has at least ``min_free`` bytes available
+        (so that large files fall back to the default temporary
+        directory instead of exhausting the system memory).  The
+        free space is only checked when a file is created (see
+        :py:class:`TempfileManagerClass`).
+
+        If ``dir`` is None, the first of the standard tmpfs locations
+        that is a writable directory is used.  Returns the directory
+        that will be used (None if no RAM-backed directory is
+        available).  Call with ``dir=False`` to stop using the
+        RAM-backed directory.
+
+        """
+        if min_free is not None:
+            self.ram_tempdir_min_free = min_free
+        if dir is False:
+            self.ram_tempdir = None
+            return None
+        if dir is None:
+            for candidate in _ram_tempdir_candidates:
+                if os.path.isdir(candidate) and \
+                   os.access(candidate, os.W_OK | os.X_OK):
+                    dir = candidate
+                    break
+            else:
+                self.ram_tempdir = None
+                return None
+        elif not os.path.isdir(dir):
+            raise ValueError(
+                "The RAM-backed temporary directory '%s' does not exist"
+                % (dir,))
+        self.ram_tempdir = dir
+        return dir
+
+    def _default_dir(self, size=None, kind='files'):
+        """Return the directory for a new temporary file (None selects
+        the system default temporary directory)"""
+        if self.tempdir is not None:
+            return self.tempdir
+        if pyutilib_mngr is not None and pyutilib_mngr.tempdir is not None:
+            deprecation_warning(
+                "The use of the PyUtilib TempfileManager.tempdir "
+                "to specify the default location for Pyomo "
+                "temporary %s has been deprecated.  "
+                "Please set TempfileManager.tempdir in "
+                "pyomo.common.tempfiles" % (kind,), version='5.7.2')
+            return pyutilib_mngr.tempdir
+        if self.ram_tempdir is not None:
+            free = _free_space(self.ram_tempdir)
+            if free is not None and \
+               free >= self.ram_tempdir_min_free + (size or 0):
+                return self.ram_tempdir
+        return None
+
+    def in_ram_tempdir(self, filename):
+        """Return True if filename is in the RAM-backed temporary
+        directory"""
+        if self.ram_tempdir is None:
+            return False
+        return os.path.dirname(os.path.abspath(filename)) == \
+            os.path.abspath(self.ram_tempdir)
+
+    def create_tempfile(self, suffix=None, prefix=None, text=False, dir=None,
+                        compression=None, size=None):
         """Create a unique temporary file
 
         Returns the absolute path of a temporary filename that is
         guaranteed to be unique.  This function generates the file and
         returns the filename.
 
+        If ``compression`` is specified (e.g., 'gzip' or 'zstd'), the
+        corresponding compression suffix is appended to ``suffix``.
+        The (optional) ``size`` is the expected size (in bytes) of the
+        file, which is used when deciding whether the file can be
+        created in the RAM-backed directory.
+
         """
         if suffix is None:
             suffix = ''
+        if compression is not None and compression != 'none':
+            from pyomo.common.compression import compression_suffixes
+            if compression not in compression_suffixes:
+                raise ValueError(
+                    "Unrecognized compression format '%s'" % (compression,))
+            suffix += compression_suffixes[compression]
         if prefix is None:
             prefix = 'tmp'
         if dir is None:
-            dir = self.tempdir
-            if dir is None and pyutilib_mngr is not None:
-                dir = pyutilib_mngr.tempdir
-                if dir is not None:
-                    deprecation_warning(
-                        "The use of the PyUtilib TempfileManager.tempdir "
-                        "to specify the default location for Pyomo "
-                        "temporary files has been deprecated.  "
-                        "Please set TempfileManager.tempdir in "
-                        "pyomo.common.tempfiles", version='5.7.2')
+            dir = self._default_dir(size)
 
         ans = tempfile.mkstemp(suffix=suffix, prefix=prefix, text=text, dir=dir)
         ans = list(ans)
@@ -72,7 +175,8 @@ class TempfileManagerClass:
             fname = ans[1]
         os.close(ans[0])
         if self._ctr >= 0:
-            new_fname = os.path.join(dir, prefix + str(self._ctr) + suffix)
+            new_fname = os.path.join(os.path.dirname(fname),
+                                     prefix + str(self._ctr) + suffix)
             # Delete any file having the sequential name and then
             # rename
             if os.path.exists(new_fname):
@@ -96,20 +200,12 @@ class TempfileManagerClass:
         if prefix is None:
             prefix = 'tmp'
         if dir is None:
-            dir = self.tempdir
-            if dir is None and pyutilib_mngr is not None:
-                dir = pyutilib_mngr.tempdir
-                if dir is not None:
-                    deprecation_warning(
-                        "The use of the PyUtilib TempfileManager.tempdir "
-                        "to specify the default location for Pyomo "
-                        "temporary directories has been deprecated.  "
-                        "Please set TempfileManager.tempdir in "
-                        "pyomo.common.tempfiles", version='5.7.2')
+            dir = self._default_dir(kind='directories')
 
         dirname = tempfile.mkdtemp(suffix=suffix, prefix=prefix, dir=dir)
         if self._ctr >= 0:
-            new_dirname = os.path.join(dir, prefix + str(self._ctr) + suffix)
+            new_dirname = os.path.join(os.path.dirname(dirname),
+                                       prefix + str(self._ctr) + suffix)
             # Delete any directory having the sequential name and then
             # rename
             if os.path.exists(new_dirname):
@@ -121,6 +217,25 @@ class TempfileManagerClass:
         self._tempfiles[-1].append(dirname)
         return dirname
 
+    def create_fifo(self, suffix=None, prefix=None, dir=None):
+        """Create a unique named pipe (FIFO)
+
+        Returns the absolute path of a named pipe that is created in a
+        new temporary directory (so that files derived from the pipe
+        name, like solution files, are also unique).  The directory
+        (and pipe) are removed with the other temporary files.
+
+        """
+        if not hasattr(os, 'mkfifo'):
+            raise NotImplementedError(
+                "Named pipes are not supported on this platform")
+        if suffix is None:
+            suffix = ''
+        dirname = self.create_tempdir(prefix=prefix, dir=dir)
+        fname = os.path.join(dirname, os.path.basename(dirname) + suffix)
+        os.mkfifo(fname)
+        return fname
+
     def add_tempfile(self, filename, exists=True):
         """Declare this file to be temporary."""
         tmp = os.path.abspath(filename)
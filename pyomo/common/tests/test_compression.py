@@ -0,0 +1,86 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import gzip
+import os
+
+import pyutilib.th as unittest
+
+from pyomo.common.compression import (
+    open_file, guess_compression, detect_compression,
+    strip_compression_suffix,
+)
+from pyomo.common.dependencies import zstandard_available
+from pyomo.common.tempfiles import TempfileManager
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop()
+
+    def test_suffixes(self):
+        self.assertEqual(guess_compression('a.lp.gz'), 'gzip')
+        self.assertEqual(guess_compression('a.nl.zst'), 'zstd')
+        self.assertIsNone(guess_compression('a.lp'))
+        self.assertEqual(strip_compression_suffix('a.mps.gz'), 'a.mps')
+        self.assertEqual(strip_compression_suffix('a.mps'), 'a.mps')
+
+    def test_create_tempfile(self):
+        fname = TempfileManager.create_tempfile(suffix='.lp',
+                                                compression='gzip')
+        self.assertTrue(fname.endswith('.lp.gz'))
+        fname = TempfileManager.create_tempfile(suffix='.lp',
+                                                compression='none')
+        self.assertTrue(fname.endswith('.lp'))
+        with self.assertRaisesRegex(ValueError, "compression format 'bz'"):
+            TempfileManager.create_tempfile(suffix='.lp', compression='bz')
+
+    def test_gzip(self):
+        fname = TempfileManager.create_tempfile(suffix='.txt.gz')
+        with open_file(fname, 'w') as f:
+            f.write("line 1\nline 2\n")
+        self.assertEqual(detect_compression(fname), 'gzip')
+        with gzip.open(fname, 'rt') as f:
+            self.assertEqual(f.read(), "line 1\nline 2\n")
+        with open_file(fname) as f:
+            self.assertEqual(f.readline(), "line 1\n")
+
+        # Explicit compression overrides the suffix; reading detects
+        # the compression from the file contents
+        fname = TempfileManager.create_tempfile(suffix='.txt')
+        with open_file(fname, 'w', compression='gzip') as f:
+            f.write("abc\n")
+        with open_file(fname) as f:
+            self.assertEqual(f.read(), "abc\n")
+        with open_file(fname, 'w', compression='none') as f:
+            f.write("abc\n")
+        self.assertIsNone(detect_compression(fname))
+        with open_file(fname) as f:
+            self.assertEqual(f.read(), "abc\n")
+
+        with self.assertRaisesRegex(ValueError, "compression format 'lzma'"):
+            open_file(fname, 'w', compression='lzma')
+
+    @unittest.skipIf(not zstandard_available, "zstandard is not available")
+    def test_zstd(self):
+        fname = TempfileManager.create_tempfile(suffix='.txt.zst')
+        with open_file(fname, 'w') as f:
+            f.write("line 1\nline 2\n")
+        self.assertEqual(detect_compression(fname), 'zstd')
+        with open_file(fname) as f:
+            self.assertEqual(f.read(), "line 1\nline 2\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
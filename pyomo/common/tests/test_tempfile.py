@@ -19,6 +19,7 @@
 import glob
 import os
 import shutil
+import stat
 import sys
 from six import StringIO
 
@@ -350,5 +351,80 @@ class Test(unittest.TestCase):
             TempfileManager.pop()
             pyutilib_mngr.tempdir = _orig
 
+    def test_ram_tempdir(self):
+        ramdir = TempfileManager.create_tempdir()
+        TempfileManager.tempdir = None
+        try:
+            self.assertEqual(TempfileManager.use_ram_tempdir(ramdir), ramdir)
+            fname = TempfileManager.create_tempfile(suffix='.nl')
+            self.assertEqual(os.path.dirname(fname), ramdir)
+            dname = TempfileManager.create_tempdir()
+            self.assertEqual(os.path.dirname(dname), ramdir)
+            # Files that would not fit fall back to the default location
+            fname = TempfileManager.create_tempfile(size=2**62)
+            self.assertNotEqual(os.path.dirname(fname), ramdir)
+            TempfileManager.use_ram_tempdir(ramdir, min_free=2**62)
+            fname = TempfileManager.create_tempfile()
+            self.assertNotEqual(os.path.dirname(fname), ramdir)
+            # An explicit tempdir takes precedence
+            TempfileManager.use_ram_tempdir(ramdir, min_free=0)
+            TempfileManager.tempdir = tempdir
+            fname = TempfileManager.create_tempfile()
+            self.assertEqual(os.path.dirname(fname) + os.sep, tempdir)
+            self.assertIsNone(TempfileManager.use_ram_tempdir(False))
+            TempfileManager.tempdir = None
+            fname = TempfileManager.create_tempfile()
+            self.assertNotEqual(os.path.dirname(fname), ramdir)
+        finally:
+            TempfileManager.ram_tempdir = None
+            TempfileManager.ram_tempdir_min_free = \
+                tempfiles.TempfileManagerClass.ram_tempdir_min_free
+        with self.assertRaisesRegexp(ValueError, 'does not exist'):
+            TempfileManager.use_ram_tempdir(tempdir + 'missing')
+
+    def test_ram_tempdir_size(self):
+        ramdir = TempfileManager.create_tempdir()
+        TempfileManager.tempdir = None
+        try:
+            TempfileManager.use_ram_tempdir(ramdir, min_free=1024)
+            free = tempfiles._free_space(ramdir)
+            # Files that fit (with min_free to spare) use the RAM-backed
+            # directory; larger files fall back to the default location
+            fname = TempfileManager.create_tempfile(size=free // 2)
+            self.assertTrue(TempfileManager.in_ram_tempdir(fname))
+            self.assertEqual(os.path.dirname(fname), ramdir)
+            fname = TempfileManager.create_tempfile(size=free)
+            self.assertFalse(TempfileManager.in_ram_tempdir(fname))
+            self.assertNotEqual(os.path.dirname(fname), ramdir)
+        finally:
+            TempfileManager.ram_tempdir = None
+            TempfileManager.ram_tempdir_min_free = \
+                tempfiles.TempfileManagerClass.ram_tempdir_min_free
+        self.assertFalse(TempfileManager.in_ram_tempdir(fname))
+
+    def test_ram_tempdir_default(self):
+        try:
+            dirname = TempfileManager.use_ram_tempdir()
+            if dirname is None:
+                self.assertFalse(any(
+                    os.path.isdir(d) for d in
+                    tempfiles._ram_tempdir_candidates))
+            else:
+                self.assertIn(dirname, tempfiles._ram_tempdir_candidates)
+        finally:
+            TempfileManager.ram_tempdir = None
+
+    @unittest.skipIf(not hasattr(os, 'mkfifo'), "named pipes not supported")
+    def test_create_fifo(self):
+        TempfileManager.push()
+        fname = TempfileManager.create_fifo(suffix='.nl')
+        self.assertTrue(stat.S_ISFIFO(os.stat(fname).st_mode))
+        self.assertTrue(fname.endswith('.nl'))
+        self.assertEqual(os.path.dirname(os.path.dirname(fname)) + os.sep,
+                         tempdir)
+        TempfileManager.pop()
+        self.assertFalse(os.path.exists(os.path.dirname(fname)))
+
+
 if __name__ == "__main__":
     unittest.main()
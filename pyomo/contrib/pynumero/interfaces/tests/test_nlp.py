@@ -376,6 +376,18 @@ class TestAslNLP(unittest.TestCase):
         self.assertIsNone(anlp.get_eq_constraints_scaling())
         self.assertIsNone(anlp.get_ineq_constraints_scaling())
         
+class TestAslNLPBinary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pm = create_pyomo_model1()
+        temporary_dir = tempfile.mkdtemp()
+        cls.filename = os.path.join(temporary_dir, "Pyomo_TestAslNLPBinary")
+        cls.pm.write(cls.filename+'.nl', io_options={"binary": True})
+
+    def test_nlp_interface(self):
+        anlp = AslNLP(self.filename)
+        execute_extended_nlp_interface(self, anlp)
+
 class TestAmplNLP(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
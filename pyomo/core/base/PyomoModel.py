@@ -51,6 +51,7 @@ from pyomo.core.base.label import CNameLabeler, CuidLabeler
 from pyomo.opt.results import SolverResults, Solution, SolverStatus, UndefinedData
 
 from six import itervalues, iteritems, StringIO, string_types
+from six.moves import xrange, zip
 try:
     unicode
 except:
@@ -213,33 +214,7 @@ class ModelSolutions(object):
         """
         Load solver results
         """
-        instance = self._instance()
-        #
-        # If there is a warning, then print a warning message.
-        #
-        if (results.solver.status == SolverStatus.warning):
-            tc = getattr(results.solver, 'termination_condition', None)
-            msg = getattr(results.solver, 'message', None)
-            logger.warning(
-                'Loading a SolverResults object with a '
-                'warning status into model.name="%s";\n'
-                '  - termination condition: %s\n'
-                '  - message from solver: %s'
-                % (instance.name, tc, msg))
-        #
-        # If the solver status not one of either OK or Warning, then
-        # generate an error.
-        #
-        elif results.solver.status != SolverStatus.ok:
-            if (results.solver.status == SolverStatus.aborted) and \
-               (len(results.solution) > 0):
-                logger.warning(
-                    "Loading a SolverResults object with "
-                    "an 'aborted' status, but containing a solution")
-            else:
-                raise ValueError("Cannot load a SolverResults object "
-                                 "with bad status: %s"
-                                 % str(results.solver.status))
+        self._check_results_status(results)
         if clear:
             #
             # Clear the solutions, but not the symbol map
@@ -287,6 +262,147 @@ class ModelSolutions(object):
                 ignore_invalid_labels=ignore_invalid_labels,
                 ignore_fixed_vars=ignore_fixed_vars)
 
+    def load_vectors(self, results, delete_symbol_map=True, clear=True,
+                     default_variable_value=None):
+        """
+        Load the solution vectors read from a *.sol file
+
+        This is a fast alternative to load_from() for results that
+        were generated by the ResultsReader_sol in vectorized mode:
+        the variable values and suffixes (stored in the NL file order)
+        are assigned directly to the components in the NL writer's
+        symbol map.  The solution is not stored in this object, so it
+        cannot be re-selected later.
+
+        If default_variable_value is not None, it is assigned to the
+        (unfixed) variables in the NL file that have no value in the
+        solution.
+        """
+        vectors = results.__dict__.get('_sol_vectors', None)
+        if vectors is None:
+            raise ValueError("Cannot load a SolverResults object that "
+                             "does not contain solution vectors")
+        self._check_results_status(results)
+        if clear:
+            self.clear(clear_symbol_maps=False)
+        instance = self._instance()
+        smap = results.__dict__.get('_smap', None)
+        if smap is None:
+            smap_id = results.__dict__.get('_smap_id')
+            smap = self.symbol_map[smap_id]
+            if delete_symbol_map:
+                self.delete_symbol_map(smap_id)
+        else:
+            results._smap = None
+        bySymbol = smap.bySymbol
+
+        instance._flag_vars_as_stale()
+        valid_import_suffixes = dict(active_import_suffix_generator(instance))
+        for suffix in itervalues(valid_import_suffixes):
+            suffix.clear_all_values()
+        #
+        # Load problem and objective suffixes (these are few, so they
+        # are still stored in the solution)
+        #
+        if len(results.solution):
+            soln = results.solution(0)
+            for name in ('problem', 'objective'):
+                for symb, entry in iteritems(getattr(soln, name)):
+                    if name == 'problem':
+                        obj = instance
+                    elif symb in bySymbol:
+                        obj = bySymbol[symb]()
+                    else:
+                        continue
+                    for _attr_key, attr_value in iteritems(entry):
+                        attr_key = _attr_key[0].lower() + _attr_key[1:]
+                        if attr_key in valid_import_suffixes:
+                            valid_import_suffixes[attr_key][obj] = attr_value
+        #
+        # Load variable values
+        #
+        # Note: the NL writer records the variables and constraints in
+        # the NL file order (symbol maps that were rebuilt, e.g., by
+        # unpickling, only hold the symbols)
+        var_refs = getattr(smap, '_nl_variables', None)
+        if var_refs is None:
+            var_refs = [bySymbol["v%d" % i]
+                        for i in xrange(len(vectors.primal))]
+            while "v%d" % len(var_refs) in bySymbol:
+                var_refs.append(bySymbol["v%d" % len(var_refs)])
+        variables = [ref() for ref in var_refs]
+        for vdata, val in zip(variables, vectors.primal):
+            if vdata.fixed:
+                continue
+            vdata.value = val
+            vdata.stale = False
+        if default_variable_value is not None:
+            for vdata in variables[len(vectors.primal):]:
+                if vdata.fixed:
+                    continue
+                vdata.value = default_variable_value
+                vdata.stale = False
+        #
+        # Load constraint duals and variable / constraint suffixes
+        #
+        con_refs = getattr(smap, '_nl_constraints', None)
+        constraints = None
+        if con_refs is not None and (
+                vectors.con_suffixes or (vectors.dual is not None and
+                                         'dual' in valid_import_suffixes)):
+            constraints = [ref() for ref in con_refs]
+        if vectors.dual is not None and 'dual' in valid_import_suffixes:
+            if constraints is None:
+                constraints = [bySymbol["c%d" % i]()
+                               for i in xrange(len(vectors.dual))]
+            valid_import_suffixes['dual'].update(
+                zip(constraints, vectors.dual))
+        for name, (idx, vals) in iteritems(vectors.var_suffixes):
+            name = name[0].lower() + name[1:]
+            if name in valid_import_suffixes:
+                valid_import_suffixes[name].update(
+                    (variables[i], val) for i, val in zip(idx, vals))
+        for name, (idx, vals) in iteritems(vectors.con_suffixes):
+            name = name[0].lower() + name[1:]
+            if name not in valid_import_suffixes:
+                continue
+            if constraints is None:
+                valid_import_suffixes[name].update(
+                    (bySymbol["c%d" % i](), val)
+                    for i, val in zip(idx, vals))
+            else:
+                valid_import_suffixes[name].update(
+                    (constraints[i], val) for i, val in zip(idx, vals))
+
+    def _check_results_status(self, results):
+        instance = self._instance()
+        #
+        # If there is a warning, then print a warning message.
+        #
+        if (results.solver.status == SolverStatus.warning):
+            tc = getattr(results.solver, 'termination_condition', None)
+            msg = getattr(results.solver, 'message', None)
+            logger.warning(
+                'Loading a SolverResults object with a '
+                'warning status into model.name="%s";\n'
+                '  - termination condition: %s\n'
+                '  - message from solver: %s'
+                % (instance.name, tc, msg))
+        #
+        # If the solver status not one of either OK or Warning, then
+        # generate an error.
+        #
+        elif results.solver.status != SolverStatus.ok:
+            if (results.solver.status == SolverStatus.aborted) and \
+               (len(results.solution) > 0):
+                logger.warning(
+                    "Loading a SolverResults object with "
+                    "an 'aborted' status, but containing a solution")
+            else:
+                raise ValueError("Cannot load a SolverResults object "
+                                 "with bad status: %s"
+                                 % str(results.solver.status))
+
     def store_to(self, results, cuid=False, skip_stale_vars=False):
         """
         Return a Solution() object that is populated with the values in the model.
@@ -15,6 +15,7 @@ __all__ = ['Block', 'TraversalStrategy', 'SortComponents',
 import collections
 import copy
 import logging
+import pickle
 import sys
 import weakref
 import textwrap
@@ -28,6 +29,7 @@ from pyutilib.misc.indent_io import StreamIndenter
 
 from pyomo.common.collections import ComponentMap, Mapping
 from pyomo.common.deprecation import deprecated, deprecation_warning
+from pyomo.common.gc_manager import PauseGC
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import (
@@ -1212,9 +1214,21 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
-    def clone(self):
+    def clone(self, share_expressions=False):
         """
-        TODO
+        Return a copy of this block and all of the components beneath it.
+
+        Components that are referenced by (but not stored beneath) this
+        block are not copied.
+
+        If share_expressions is True, the expressions (e.g., the
+        constraint bodies and the objectives) are copied with
+        remap_expression(): only the expression nodes that (directly or
+        indirectly) refer to a copied component are rebuilt, and the
+        remaining subtrees are shared with the original model.  This is
+        much faster than the default deep copy of the expression trees.
+        As expression nodes are immutable, this is safe unless a node is
+        (improperly) modified in place.
         """
         # FYI: we used to remove all _parent() weakrefs before
         # deepcopying and then restore them on the original and cloned
@@ -1230,24 +1244,80 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # NonNegativeReals, etc) that are not "owned" by any blocks and
         # should be preserved as singletons.
         #
+        # Note: the clone creates (and keeps) a large number of objects,
+        # so pause the garbage collector
+        pgc = PauseGC()
         save_parent, self._parent = self._parent, None
         try:
             new_block = copy.deepcopy(
                 self, {
                     '__block_scope__': {id(self): True, id(None): False},
                     '__paranoid__': False,
+                    '__share_expressions__': share_expressions,
                     })
         except:
             new_block = copy.deepcopy(
                 self, {
                     '__block_scope__': {id(self): True, id(None): False},
                     '__paranoid__': True,
+                    '__share_expressions__': share_expressions,
                     })
         finally:
             self._parent = save_parent
+            pgc.close()
 
         return new_block
 
+    def to_bytes(self, protocol=None, buffer_callback=None):
+        """
+        Serialize this block and all of the components beneath it.
+
+        The block is pickled (without its parent block) with the
+        highest available pickle protocol by default.  The result can
+        be restored with from_bytes().
+
+        For pickle protocol 5 (and higher), buffer_callback is passed to
+        the pickler, so that array data (e.g., the values of
+        array-backed Vars) can be transferred out-of-band (the buffers
+        must then be passed to from_bytes()).
+        """
+        if protocol is None:
+            protocol = pickle.HIGHEST_PROTOCOL
+        kwds = {}
+        if buffer_callback is not None:
+            kwds['buffer_callback'] = buffer_callback
+        # Note: detach the block from its parent (as in clone()), so
+        # that the parent model is not pickled
+        save_parent, self._parent = self._parent, None
+        pgc = PauseGC()
+        try:
+            return pickle.dumps(self, protocol, **kwds)
+        finally:
+            self._parent = save_parent
+            pgc.close()
+
+    @classmethod
+    def from_bytes(cls, data, buffers=None):
+        """
+        Restore a block serialized by to_bytes().
+
+        The buffers are the out-of-band buffers collected by the
+        buffer_callback passed to to_bytes().
+        """
+        kwds = {}
+        if buffers is not None:
+            kwds['buffers'] = buffers
+        pgc = PauseGC()
+        try:
+            ans = pickle.loads(data, **kwds)
+        finally:
+            pgc.close()
+        if not isinstance(ans, cls):
+            raise TypeError(
+                "The serialized data holds a %s (expected %s)"
+                % (type(ans).__name__, cls.__name__))
+        return ans
+
     def contains_component(self, ctype):
         """
         Return True if the component type is in _ctypes and ... TODO.
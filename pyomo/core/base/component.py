@@ -21,6 +21,7 @@ from pyutilib.misc.indent_io import StreamIndenter
 import pyomo.common
 from pyomo.common.deprecation import deprecated, relocated_module_attribute
 from pyomo.core.pyomoobject import PyomoObject
+from pyomo.core.expr.visitor import remap_expression
 from pyomo.core.base.misc import tabular_writer, sorted_robust
 
 logger = logging.getLogger('pyomo.core')
@@ -187,10 +188,19 @@ class _ComponentBase(PyomoObject):
         # slot-ized class, we cannot overwrite the __deepcopy__
         # attribute to prevent infinite recursion.
         state = self.__getstate__()
+        # Block.clone(share_expressions=True) copies the expressions
+        # with remap_expression(), which shares unchanged subtrees
+        if memo.get('__share_expressions__', False):
+            _copy = remap_expression
+        else:
+            _copy = deepcopy
         try:
             if paranoid:
                 saved_memo = dict(memo)
-            new_state = deepcopy(state, memo)
+            if _copy is deepcopy:
+                new_state = deepcopy(state, memo)
+            else:
+                new_state = {k: _copy(v, memo) for k, v in iteritems(state)}
         except:
             if paranoid:
                 # Note: memo is intentionally pass-by-reference.  We
@@ -205,7 +215,7 @@ class _ComponentBase(PyomoObject):
                 try:
                     if paranoid:
                         saved_memo = dict(memo)
-                    new_state[k] = deepcopy(v, memo)
+                    new_state[k] = _copy(v, memo)
                 except CloneError:
                     raise
                 except:
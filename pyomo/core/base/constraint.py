@@ -26,10 +26,11 @@ from pyomo.core.expr.numvalue import (ZeroConstant,
                                       is_constant,
                                       native_numeric_types)
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ActiveComponentData
+from pyomo.core.base.component import ActiveComponent, ActiveComponentData
 from pyomo.core.base.indexed_component import \
     ( ActiveIndexedComponent,
       UnindexedComponent_set,
+      _DeferredConstructionMixin,
       _get_indexed_component_data_name, )
 from pyomo.core.base.misc import (apply_indexed_rule,
                                   tabular_writer)
@@ -39,7 +40,7 @@ from pyomo.core.base.util import (
     IndexedCallInitializer, CountedCallInitializer
 )
 
-from six import StringIO, iteritems
+from six import StringIO, iteritems, itervalues
 
 if six.PY3:
     from collections.abc import Sequence as collections_Sequence
@@ -713,7 +714,7 @@ class _GeneralConstraintData(_ConstraintData):
 
 
 @ModelComponentFactory.register("General constraint expressions.")
-class Constraint(ActiveIndexedComponent):
+class Constraint(_DeferredConstructionMixin, ActiveIndexedComponent):
     """
     This modeling component defines a constraint expression using a
     rule function.
@@ -723,6 +724,11 @@ class Constraint(ActiveIndexedComponent):
             A Pyomo expression for this constraint
         rule
             A function that is used to construct constraint expressions
+        deferred
+            If True, the rule of an indexed constraint is only called
+            for an index when that constraint is accessed, or when the
+            constraints are iterated over (e.g., when the model is
+            written).  Defaults to False.
         doc
             A text string describing this component
         name
@@ -762,6 +768,9 @@ class Constraint(ActiveIndexedComponent):
     NoConstraint = ActiveIndexedComponent.Skip
     Violated = Infeasible
     Satisfied = Feasible
+    # The active state of the deferred constraints (only changed by
+    # activate() and deactivate(), not by the constraint data)
+    _deferred_active = True
 
     def __new__(cls, *args, **kwds):
         if cls != Constraint:
@@ -783,6 +792,7 @@ class Constraint(ActiveIndexedComponent):
             raise ValueError("Duplicate initialization: Constraint() only "
                              "accepts one of 'rule=' and 'expr='")
 
+        self._construct_on_demand = kwargs.pop('deferred', False)
         kwargs.setdefault('ctype', Constraint)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
 
@@ -828,6 +838,10 @@ class Constraint(ActiveIndexedComponent):
                 # assumption is that the user will trigger specific
                 # indices to be created at a later time).
                 pass
+            elif self._construct_on_demand and self.is_indexed():
+                # The constraints are created by _getitem_when_not_present
+                # and construct_deferred()
+                self._defer_construction()
             else:
                 # Bypass the index validation and create the member directly
                 for index in self.index_set():
@@ -847,7 +861,48 @@ class Constraint(ActiveIndexedComponent):
         finally:
             timer.report()
 
+    def _construct_deferred_index(self, index):
+        try:
+            con = self._setitem_when_not_present(
+                index, self.rule(self.parent_block(), index))
+            if con is not None and not self._deferred_active:
+                # Match the members deactivated by deactivate()
+                con.deactivate()
+            return con
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when generating expression for "
+                "constraint %s with index %s:\n%s: %s"
+                % (self.name,
+                   str(index),
+                   type(err).__name__,
+                   err))
+            raise
+
+    def activate(self):
+        """Set the active attribute to True"""
+        self._deferred_active = True
+        if self._deferred is None:
+            return super(Constraint, self).activate()
+        # Do not construct the deferred constraints (they are
+        # constructed with the state of this component)
+        ActiveComponent.activate(self)
+        for component_data in itervalues(self._data):
+            component_data.activate()
+
+    def deactivate(self):
+        """Set the active attribute to False"""
+        self._deferred_active = False
+        if self._deferred is None:
+            return super(Constraint, self).deactivate()
+        ActiveComponent.deactivate(self)
+        for component_data in itervalues(self._data):
+            component_data.deactivate()
+
     def _getitem_when_not_present(self, idx):
+        if self._deferred is not None:
+            return self._getitem_when_deferred(idx)
         if self.rule is None:
             raise KeyError(idx)
         con = self._setitem_when_not_present(
@@ -886,6 +941,7 @@ class Constraint(ActiveIndexedComponent):
             ostream = sys.stdout
         tab="    "
         ostream.write(prefix+self.local_name+" : ")
+        # Note: len() constructs any deferred constraints
         ostream.write("Size="+str(len(self)))
 
         ostream.write("\n")
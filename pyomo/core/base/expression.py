@@ -20,7 +20,8 @@ from pyomo.core.base.component import ComponentData
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
-    UnindexedComponent_set, )
+    UnindexedComponent_set,
+    _DeferredConstructionMixin, )
 from pyomo.core.base.misc import (apply_indexed_rule,
                                   tabular_writer)
 from pyomo.core.base.numvalue import (NumericValue,
@@ -247,7 +248,7 @@ class _GeneralExpressionData(_GeneralExpressionDataImpl,
 
 
 @ModelComponentFactory.register("Named expressions that can be used in other expressions.")
-class Expression(IndexedComponent):
+class Expression(_DeferredConstructionMixin, IndexedComponent):
     """
     A shared expression container, which may be defined over a index.
 
@@ -256,6 +257,10 @@ class Expression(IndexedComponent):
                         used to initialize this object.
         expr        A synonym for initialize.
         rule        A rule function used to initialize this object.
+        deferred    If True, the rule of an indexed Expression is only
+                        called for an index when that expression is
+                        accessed, or when the expressions are iterated
+                        over.  Defaults to False.
     """
 
     _ComponentDataClass = _GeneralExpressionData
@@ -274,6 +279,7 @@ class Expression(IndexedComponent):
         self._init_rule = kwds.pop('rule', None)
         self._init_expr = kwds.pop('initialize', None)
         self._init_expr = kwds.pop('expr', self._init_expr)
+        self._construct_on_demand = kwds.pop('deferred', False)
         if is_functor(self._init_expr) and \
            (not isinstance(self._init_expr, NumericValue)):
             raise TypeError(
@@ -310,6 +316,7 @@ class Expression(IndexedComponent):
             ostream = sys.stdout
         tab="    "
         ostream.write(prefix+self.local_name+" : ")
+        # Note: len() constructs any deferred expressions
         ostream.write("Size="+str(len(self)))
 
         ostream.write("\n")
@@ -345,10 +352,22 @@ class Expression(IndexedComponent):
                 "="+self.name+"; no value with index "
                 "None in input new values map.")
 
+        self.construct_deferred()
         for index, new_value in iteritems(new_values):
             self._data[index].set_value(new_value)
 
+    def _construct_deferred_index(self, index):
+        return self.add(index, apply_indexed_rule(
+            self, self._init_rule, self._parent(), index))
+
     def _getitem_when_not_present(self, index):
+        if self._deferred is not None:
+            try:
+                return self._getitem_when_deferred(index)
+            except KeyError:
+                # Skipped and deleted expressions are implicitly
+                # defined, as they are without deferred construction
+                pass
         # TBD: Is this desired behavior?  I can see implicitly setting
         # an Expression if it was not originally defined, but I am less
         # convinced that implicitly creating an Expression (like what
@@ -385,7 +404,11 @@ class Expression(IndexedComponent):
         #
         if _init_rule is not None:
             # construct and initialize with a rule
-            if self.is_indexed():
+            if self.is_indexed() and self._construct_on_demand:
+                # The expressions are created by _getitem_when_not_present
+                # and construct_deferred()
+                self._defer_construction()
+            elif self.is_indexed():
                 for key in self._index:
                     self.add(key,
                              apply_indexed_rule(
@@ -847,3 +847,96 @@ class ActiveIndexedComponent(IndexedComponent, ActiveComponent):
             for component_data in itervalues(self):
                 component_data.deactivate()
 
+
+
+class _DeferredConstructionMixin(object):
+    """
+    Support for indexed components whose members are constructed on
+    demand.
+
+    A component that supports deferred construction calls
+    _defer_construction() (instead of calling its rule for every index)
+    in construct(), and implements _construct_deferred_index(index),
+    which constructs, stores and returns the member for the index (or
+    returns None if the rule skips the index).  Members are then
+    constructed when they are accessed, and all remaining members are
+    constructed (see construct_deferred()) as soon as the component is
+    iterated over or its length is needed (e.g., by
+    Block.component_data_objects() and thus by the problem writers).
+
+    While construction is deferred, _deferred holds the indices that
+    must not be constructed: the indices skipped by the rule and the
+    indices of deleted members.
+    """
+
+    _deferred = None
+
+    def _defer_construction(self):
+        self._deferred = set()
+
+    def _construct_deferred_index(self, index):
+        raise DeveloperError(
+            "Derived component %s failed to define "
+            "_construct_deferred_index()." % (self.__class__.__name__,))
+
+    def construct_deferred(self):
+        """Construct all members whose construction was deferred"""
+        deferred = self._deferred
+        if deferred is None:
+            return
+        # Note: reset the flag first, so that the rules can iterate over
+        # (and get the length of) this component
+        self._deferred = None
+        try:
+            _data = self._data
+            for index in self._index:
+                if index not in _data and index not in deferred:
+                    self._construct_deferred_index(index)
+        except:
+            self._deferred = deferred
+            raise
+
+    def _getitem_when_deferred(self, index):
+        if index in self._deferred:
+            raise KeyError(index)
+        obj = self._construct_deferred_index(index)
+        if obj is None:
+            self._deferred.add(index)
+            raise KeyError(index)
+        return obj
+
+    def __len__(self):
+        if self._deferred is not None:
+            self.construct_deferred()
+        return super(_DeferredConstructionMixin, self).__len__()
+
+    def __iter__(self):
+        if self._deferred is not None:
+            self.construct_deferred()
+        return super(_DeferredConstructionMixin, self).__iter__()
+
+    def __contains__(self, idx):
+        if self._deferred is not None and idx not in self._data:
+            try:
+                self[idx]
+            except KeyError:
+                return False
+        return super(_DeferredConstructionMixin, self).__contains__(idx)
+
+    def __delitem__(self, index):
+        deferred = self._deferred
+        if deferred is None:
+            return super(_DeferredConstructionMixin, self).__delitem__(index)
+        try:
+            pending = index not in self._data and index in self._index
+        except TypeError:
+            # e.g., slices (these only expand to constructed members)
+            pending = False
+        if not pending:
+            super(_DeferredConstructionMixin, self).__delitem__(index)
+            try:
+                pending = index in self._index
+            except TypeError:
+                pass
+        if pending:
+            deferred.add(index)
@@ -15,6 +15,9 @@ import types
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.common.dependencies import (
+    numpy, numpy_available, pandas, pandas_available,
+)
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.modeling import NoArgumentGiven
 from pyomo.common.timing import ConstructionTimer
@@ -23,6 +26,7 @@ from pyomo.core.base.component import ComponentData
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
+from pyomo.core.base.util import invalid_value_mask
 from pyomo.core.base.numvalue import NumericValue, native_types, value
 from pyomo.core.base.set_types import Any, Reals
 
@@ -391,6 +395,14 @@ class Param(IndexedComponent):
         """
         A utility to update a Param with a dictionary or scalar.
 
+        The values of an indexed Param can also be updated in bulk
+        from a NumPy array holding the values for all indices, ordered
+        like the index set (multidimensional arrays are flattened in C
+        order, so an (|I|, |J|) array matches the index I*J), or from a
+        pandas Series (or single-column DataFrame) indexed by the Param
+        indices.  The values are then validated vectorially (for
+        interval domains) before any value is stored.
+
         If check=True, then both the index and value
         are checked through the __getitem__ method.  Using check=False
         should only be used by developers!
@@ -398,6 +410,12 @@ class Param(IndexedComponent):
         if not self._mutable:
             _raise_modifying_immutable_error(self, '*')
         #
+        if self.is_indexed():
+            array_values = self._array_values(new_values, check)
+            if array_values is not None:
+                self._store_array_values(*array_values, check=check)
+                return
+        #
         _srcType = type(new_values)
         _isDict = _srcType is dict or ( \
             hasattr(_srcType, '__getitem__')
@@ -454,6 +472,75 @@ class Param(IndexedComponent):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def _array_values(self, new_values, check=True):
+        """
+        Return the indices and the (1-D NumPy array of) values in
+        new_values if it is a NumPy array or a pandas Series /
+        DataFrame, and None otherwise.
+        """
+        if numpy_available and isinstance(new_values, numpy.ndarray):
+            values = new_values.ravel()
+            if len(values) != len(self._index):
+                raise ValueError(
+                    "Cannot store the values of Param %s: %s values given "
+                    "for %s indices"
+                    % (self.name, len(values), len(self._index)))
+            return self._index, values
+        # Note: checking for pandas objects only makes sense (and only
+        # pays for the import) if pandas was already imported
+        if 'pandas' not in sys.modules or not pandas_available:
+            return None
+        if isinstance(new_values, pandas.DataFrame):
+            if len(new_values.columns) != 1:
+                raise ValueError(
+                    "Cannot store the values of Param %s from a DataFrame "
+                    "with %s columns (expected a single column)"
+                    % (self.name, len(new_values.columns)))
+            new_values = new_values.iloc[:, 0]
+        if not isinstance(new_values, pandas.Series):
+            return None
+        indices = new_values.index.tolist()
+        if check:
+            _index = self._index
+            for i, index in enumerate(indices):
+                if index not in _index:
+                    # Normalize the index (or raise the KeyError)
+                    indices[i] = self._validate_index(index)
+        return indices, numpy.asarray(new_values.values)
+
+    def _store_array_values(self, indices, values, check=True):
+        """
+        Store the values (a 1-D NumPy array) for the (valid) indices in
+        a single pass.  If check=True, all values are validated before
+        any value is stored.
+        """
+        if check:
+            domain = self.domain
+            if values.dtype.kind not in 'biuf':
+                invalid = [val not in domain for val in values.tolist()]
+            elif domain is Any or domain.__class__ is _ImplicitAny:
+                # All numbers are in Any
+                invalid = ()
+            else:
+                invalid = invalid_value_mask(
+                    domain, values.astype(float)).tolist()
+            if any(invalid):
+                for index, val, bad in zip(indices, values.tolist(), invalid):
+                    if bad:
+                        self._validate_value(index, val)
+            if self._validate:
+                for index, val in zip(indices, values.tolist()):
+                    self._validate_value(index, val, validate_domain=False)
+        _data = self._data
+        if self._mutable:
+            for index, val in zip(indices, values.tolist()):
+                obj = _data.get(index, None)
+                if obj is None:
+                    obj = _data[index] = _ParamData(self)
+                obj._value = val
+        else:
+            _data.update(zip(indices, values.tolist()))
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -665,6 +752,13 @@ class Param(IndexedComponent):
         _init_type = type(_init)
         _isDict = _init_type is dict
 
+        if not _isDict and _init_type not in native_types \
+           and self.is_indexed():
+            array_values = self._array_values(_init)
+            if array_values is not None:
+                self._store_array_values(*array_values)
+                return
+
         if _isDict or _init_type in native_types:
             #
             # We skip the other tests if we have a dictionary or constant
@@ -15,6 +15,7 @@ import functools
 import inspect
 import six
 
+from copy import deepcopy
 from six import iteritems, iterkeys
 from six.moves import xrange
 
@@ -31,9 +32,11 @@ else:
 
 
 from pyomo.common import DeveloperError
+from pyomo.common.dependencies import numpy
 from pyomo.core.expr.numvalue import (
     native_types,
 )
+from pyomo.core.expr.visitor import remap_expression
 
 def is_functor(obj):
     """
@@ -41,6 +44,34 @@ def is_functor(obj):
     """
     return inspect.isfunction(obj) or hasattr(obj,'__call__')
 
+def invalid_value_mask(domain, values):
+    """
+    Return a boolean NumPy array flagging the values (a 1-D NumPy array
+    of floats) that are not in the domain.
+
+    Domains that are continuous or integer intervals (e.g., Reals,
+    NonNegativeIntegers, Binary) are checked vectorially; values are
+    checked against any other domain one at a time.
+    """
+    interval = domain.get_interval()
+    if interval is None or interval[2] not in (0, 1):
+        return numpy.fromiter((val not in domain for val in values.tolist()),
+                              dtype=bool, count=len(values))
+    lb, ub, step = interval
+    invalid = numpy.zeros(len(values), dtype=bool)
+    if float('nan') not in domain:
+        # NaN compares False against any bound
+        invalid |= numpy.isnan(values)
+    if lb is not None:
+        invalid |= values < lb
+    if ub is not None:
+        invalid |= values > ub
+    if step == 1:
+        # Integer ranges may be offset (e.g., {0.5, 1.5, 2.5})
+        ref = lb if lb is not None else (ub if ub is not None else 0)
+        invalid |= (values - ref) != numpy.floor(values - ref)
+    return invalid
+
 
 #
 # The following decorator is general and should probably be promoted to
@@ -233,6 +264,20 @@ class InitializerBase(object):
         for key, val in iteritems(state):
             object.__setattr__(self, key, val)
 
+    def __deepcopy__(self, memo):
+        # Initializers may hold the expressions used to construct a
+        # component (e.g., Constraint(expr=...)), so these must be
+        # copied like the component expressions by
+        # Block.clone(share_expressions=True).
+        if memo.get('__share_expressions__', False):
+            _copy = remap_expression
+        else:
+            _copy = deepcopy
+        ans = memo[id(self)] = self.__class__.__new__(self.__class__)
+        ans.__setstate__({k: _copy(v, memo)
+                          for k, v in iteritems(self.__getstate__())})
+        return ans
+
     def constant(self):
         """Return True if this initializer is constant across all indices"""
         return False
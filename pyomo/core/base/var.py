@@ -13,16 +13,21 @@ __all__ = ['Var', '_VarData', '_GeneralVarData', 'VarList', 'SimpleVar']
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.modeling import NoArgumentGiven
 from pyomo.common.timing import ConstructionTimer
-from pyomo.core.base.numvalue import NumericValue, value, is_fixed
+from pyomo.core.base.numvalue import (
+    NumericValue, value, is_fixed, native_numeric_types
+)
 from pyomo.core.base.set_types import Reals, Binary
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ComponentData
+from pyomo.core.base.component import (
+    ComponentData, _name_index_generator
+)
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.set import Set, _SetDataBase
-from pyomo.core.base.util import is_functor
+from pyomo.core.base.util import is_functor, invalid_value_mask
 
 from six import iteritems, itervalues
 from six.moves import xrange
@@ -472,6 +477,340 @@ class _GeneralVarData(_VarData):
     free = unfix
 
 
+class _ArrayVarData(_VarData):
+    """
+    This class defines a variable of an array-backed IndexedVar.
+
+    The data of the variable is stored (at position _pos) in the arrays
+    of the _ArrayVarDict that is the _data of the owning component;
+    this object is only a (lightweight) view of that data.
+
+    Constructor Arguments:
+        component   The Var object that owns this data.
+        pos         The position of the variable in the index set.
+    """
+
+    __slots__ = ('_pos',)
+
+    def __init__(self, component, pos):
+        self._component = weakref_ref(component)
+        self._pos = pos
+
+    def __getstate__(self):
+        state = super(_ArrayVarData, self).__getstate__()
+        state['_pos'] = self._pos
+        return state
+
+    def index(self):
+        """Returns the index of this variable in the owning component"""
+        self_component = self.parent_component()
+        if self_component is None:
+            return None
+        return self_component._index[self._pos + 1]
+
+    def getname(self, fully_qualified=False, name_buffer=None,
+                relative_to=None):
+        """Return a string with the component name and index"""
+        c = self.parent_component()
+        if name_buffer is not None or c is None:
+            return super(_ArrayVarData, self).getname(
+                fully_qualified, name_buffer, relative_to)
+        # The index is known, so (unlike ComponentData.getname) there
+        # is no need to search the component for this object
+        return c.getname(fully_qualified, name_buffer, relative_to) \
+            + _name_index_generator(self.index())
+
+    @property
+    def value(self):
+        """Return the value for this variable."""
+        val = self._component()._data.value[self._pos]
+        if val != val:
+            return None
+        return float(val)
+    @value.setter
+    def value(self, val):
+        """Set the value for this variable."""
+        self._component()._data.value[self._pos] = \
+            _nan if val is None else val
+
+    @property
+    def domain(self):
+        """Return the domain for this variable."""
+        data = self._component()._data
+        return data.domains.get(self._pos, data.domain)
+    @domain.setter
+    def domain(self, domain):
+        """Set the domain for this variable."""
+        self._component()._data.set_domain(self._pos, domain)
+
+    @property
+    def lb(self):
+        """Return the lower bound for this variable."""
+        data = self._component()._data
+        lb = data.get_bound(data.lb, data.lb_exprs, self._pos)
+        dlb, _ = data.domains.get(self._pos, data.domain).bounds()
+        if lb is None:
+            return dlb
+        elif dlb is None:
+            return value(lb)
+        return max(value(lb), dlb)
+    @lb.setter
+    def lb(self, val):
+        raise AttributeError("Assignment not allowed. Use the setlb method")
+
+    @property
+    def ub(self):
+        """Return the upper bound for this variable."""
+        data = self._component()._data
+        ub = data.get_bound(data.ub, data.ub_exprs, self._pos)
+        _, dub = data.domains.get(self._pos, data.domain).bounds()
+        if ub is None:
+            return dub
+        elif dub is None:
+            return value(ub)
+        return min(value(ub), dub)
+    @ub.setter
+    def ub(self, val):
+        raise AttributeError("Assignment not allowed. Use the setub method")
+
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return bool(self._component()._data.fixed[self._pos])
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._component()._data.fixed[self._pos] = val
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        return bool(self._component()._data.stale[self._pos])
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        self._component()._data.stale[self._pos] = val
+
+    def get_units(self):
+        """Return the units for this variable entry."""
+        return self.parent_component()._units
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        data = self._component()._data
+        data.set_bound(data.lb, data.lb_exprs, self._pos,
+                       _validate_bound(val, 'lower'))
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        data = self._component()._data
+        data.set_bound(data.ub, data.ub_exprs, self._pos,
+                       _validate_bound(val, 'upper'))
+
+    def fix(self, value=NoArgumentGiven):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        self.fixed = True
+        if value is not NoArgumentGiven:
+            self.value = value
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self.fixed = False
+
+    free = unfix
+
+
+_nan = float('nan')
+
+def _validate_bound(val, which):
+    # Note: is_fixed(None) returns True
+    if not is_fixed(val):
+        raise ValueError(
+            "Non-fixed input of type '%s' supplied as variable %s "
+            "bound - legal types must be fixed expressions or variables."
+            % (type(val), which))
+    return val
+
+
+class _ArrayVarDict(object):
+    """
+    The _data dictionary of an array-backed IndexedVar.
+
+    The values, bounds and fixed / stale flags of the variables are
+    stored in NumPy arrays, ordered like the (ordered) index set of the
+    component, with NaN representing None.  Bounds that are not numeric
+    constants (e.g., mutable Params) and domains that differ from the
+    component domain are stored sparsely in dictionaries.  The
+    _ArrayVarData objects are only created when a variable is
+    accessed, and are then cached so that each variable is always
+    represented by the same object.
+    """
+
+    def __init__(self, component):
+        n = len(component._index)
+        self._component = component
+        self._views = {}
+        self.domain = component._domain_init_value
+        self.domains = {}
+        self.value = numpy.full(n, numpy.nan)
+        self.lb = numpy.full(n, numpy.nan)
+        self.ub = numpy.full(n, numpy.nan)
+        self.lb_exprs = {}
+        self.ub_exprs = {}
+        self.fixed = numpy.zeros(n, dtype=bool)
+        self.stale = numpy.ones(n, dtype=bool)
+
+    def position(self, index):
+        """Return the position of index in the arrays"""
+        try:
+            pos = self._component._index.ord(index) - 1
+        except (KeyError, ValueError, IndexError, TypeError):
+            raise KeyError(index)
+        # The index set must not change once the arrays are allocated
+        if pos >= len(self.value):
+            raise KeyError(index)
+        return pos
+
+    def view(self, pos):
+        """Return the _ArrayVarData for the variable at position pos"""
+        obj = self._views.get(pos, None)
+        if obj is None:
+            obj = self._views[pos] = _ArrayVarData(self._component, pos)
+        return obj
+
+    def set_domain(self, pos, domain):
+        # TODO: see _GeneralVarData.domain
+        if not isinstance(domain, _SetDataBase):
+            raise ValueError(
+                "%s is not a valid domain. Variable domains must be an "
+                "instance of a Pyomo Set.  Examples: NonNegativeReals, "
+                "Integers, Binary" % (domain,))
+        if pos is None:
+            self.domain = domain
+            self.domains.clear()
+        elif domain is self.domain:
+            self.domains.pop(pos, None)
+        else:
+            self.domains[pos] = domain
+
+    @staticmethod
+    def get_bound(bounds, exprs, pos):
+        val = bounds[pos]
+        if val == val:
+            return float(val)
+        if exprs:
+            return exprs.get(pos, None)
+        return None
+
+    @staticmethod
+    def set_bound(bounds, exprs, pos, val):
+        """Set the bound at pos (or all bounds if pos is None)"""
+        if pos is None:
+            pos = slice(None)
+            exprs.clear()
+        else:
+            exprs.pop(pos, None)
+        if val is None:
+            bounds[pos] = numpy.nan
+        elif val.__class__ in native_numeric_types:
+            bounds[pos] = val
+        else:
+            # Fixed expressions (e.g., mutable Params) are stored as-is
+            # so that the bound follows their value
+            bounds[pos] = numpy.nan
+            if pos.__class__ is slice:
+                exprs.update(dict.fromkeys(xrange(len(bounds)), val))
+            else:
+                exprs[pos] = val
+
+    def invalid_values(self, values, positions=None):
+        """
+        Return the positions (in values) of the values that are not in
+        the domain of the corresponding variable.  The positions of the
+        variables are given by positions (default: all variables).
+        """
+        defined = ~numpy.isnan(values)
+        # Note: the component domain is None if the domains were
+        # initialized by a rule
+        if self.domain is None:
+            invalid = numpy.zeros(len(values), dtype=bool)
+        else:
+            invalid = invalid_value_mask(self.domain, values)
+        if self.domains:
+            # Check the values of variables with their own domain
+            if positions is None:
+                positions = xrange(len(values))
+            for i, pos in enumerate(positions):
+                domain = self.domains.get(pos, None)
+                if domain is not None and defined[i]:
+                    invalid[i] = values[i] not in domain
+        return numpy.flatnonzero(invalid & defined)
+
+    #
+    # The dict interface (for the IndexedComponent base class)
+    #
+
+    def __len__(self):
+        return len(self.value)
+
+    def __contains__(self, index):
+        try:
+            self.position(index)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return self._component._index.__iter__()
+
+    def __getitem__(self, index):
+        return self.view(self.position(index))
+
+    def get(self, index, default=None):
+        # Raise a TypeError for unhashable indices (e.g., slices), like
+        # dict.get()
+        hash(index)
+        try:
+            return self.view(self.position(index))
+        except KeyError:
+            return default
+
+    def __setitem__(self, index, val):
+        if val is not self.get(index):
+            raise TypeError(
+                "Array-backed IndexedVar '%s' does not support replacing "
+                "its variables" % (self._component.name,))
+
+    def __delitem__(self, index):
+        raise TypeError(
+            "Array-backed IndexedVar '%s' does not support deleting "
+            "its variables" % (self._component.name,))
+
+    def keys(self):
+        return self.__iter__()
+
+    def values(self):
+        for pos in xrange(len(self.value)):
+            yield self.view(pos)
+
+    def items(self):
+        for pos, index in enumerate(self._component._index):
+            yield index, self.view(pos)
+
+    iterkeys = keys
+    itervalues = values
+    iteritems = items
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent):
     """A numeric variable, which may be defined over an index.
@@ -493,6 +832,13 @@ class Var(IndexedComponent):
             to True.
         units (pyomo units expression, optional): Set the units corresponding                                                  
             to the entries in this variable.
+        array (bool, optional): Store the values, bounds and fixed /
+            stale flags of the (dense) indexed variable in NumPy arrays
+            (ordered like the index set, which must be ordered and must
+            not change after construction) instead of in one
+            _GeneralVarData object per index.  The variable objects are
+            then only created when they are accessed.  Values and
+            numeric bounds are stored as floats.  Defaults to False.
     """
 
     _ComponentDataClass = _GeneralVarData
@@ -516,7 +862,11 @@ class Var(IndexedComponent):
         bounds = kwd.pop('bounds', None)
         self._dense = kwd.pop('dense', True)
         self._units = kwd.pop('units', None)
-        
+        self._array = kwd.pop('array', False)
+        if self._array and not self._dense:
+            raise ValueError(
+                "Var 'array' storage requires dense=True")
+
         #
         # Initialize the base class
         #
@@ -557,13 +907,30 @@ class Var(IndexedComponent):
         """
         Set the 'stale' attribute of every variable data object to True.
         """
+        if self._data.__class__ is _ArrayVarDict:
+            self._data.stale[:] = True
+            return
         for var_data in itervalues(self._data):
             var_data.stale = True
 
-    def get_values(self, include_fixed_values=True):
+    def get_values(self, include_fixed_values=True, as_array=False):
         """
         Return a dictionary of index-value pairs.
+
+        If as_array is True, return a NumPy array of the values of an
+        indexed variable, ordered like the index set, with NaN for
+        undefined values (and fixed variables if include_fixed_values
+        is False).
         """
+        if as_array:
+            return self._get_value_array(include_fixed_values)
+        if self._data.__class__ is _ArrayVarDict:
+            vals = [None if val != val else val
+                    for val in self._data.value.tolist()]
+            if include_fixed_values:
+                return dict(zip(self._index, vals))
+            return {idx: val for idx, val, fixed in zip(
+                self._index, vals, self._data.fixed.tolist()) if not fixed}
         if include_fixed_values:
             return {idx:vardata.value for idx,vardata in iteritems(self._data)}
         return {idx:vardata.value
@@ -572,16 +939,81 @@ class Var(IndexedComponent):
 
     extract_values = get_values
 
+    def _get_value_array(self, include_fixed_values=True):
+        if not self.is_indexed():
+            raise ValueError(
+                "get_values(as_array=True) is not supported by the "
+                "scalar Var '%s'" % (self.name,))
+        if self._data.__class__ is _ArrayVarDict:
+            ans = self._data.value.copy()
+            if not include_fixed_values:
+                ans[self._data.fixed] = numpy.nan
+            return ans
+        ans = numpy.full(len(self._index), numpy.nan)
+        for i, idx in enumerate(self._index):
+            vardata = self._data.get(idx, None)
+            if vardata is None or vardata.value is None or \
+               (vardata.fixed and not include_fixed_values):
+                continue
+            ans[i] = vardata.value
+        return ans
+
     def set_values(self, new_values, valid=False):
         """
         Set the values of a dictionary.
 
+        The new values may also be a sequence (e.g., a NumPy array) of
+        the values of all variables of an indexed variable, ordered like
+        the index set (with None or NaN for undefined values).
+
         The default behavior is to validate the values in the
         dictionary.
         """
+        if not hasattr(new_values, 'items') and self.is_indexed():
+            if self._data.__class__ is _ArrayVarDict:
+                self._set_value_array(new_values, valid)
+                return
+            if len(new_values) != len(self._index):
+                raise ValueError(
+                    "Cannot set the values of Var '%s': %s values given "
+                    "for %s variables"
+                    % (self.name, len(new_values), len(self._index)))
+            for index, new_value in zip(self._index, new_values):
+                if new_value is not None and new_value != new_value:
+                    new_value = None
+                self[index].set_value(new_value, valid)
+            return
         for index, new_value in iteritems(new_values):
             self[index].set_value(new_value, valid)
 
+    def _set_value_array(self, new_values, valid=False, positions=None):
+        """
+        Set the values of the variables at the positions (default: all
+        variables) of an array-backed Var.
+        """
+        data = self._data
+        # Note: numpy converts None to NaN
+        new_values = numpy.array(new_values, dtype=float).ravel()
+        n = len(data) if positions is None else len(positions)
+        if len(new_values) != n:
+            raise ValueError(
+                "Cannot set the values of Var '%s': %s values given "
+                "for %s variables" % (self.name, len(new_values), n))
+        if not valid:
+            invalid = data.invalid_values(new_values, positions)
+            if len(invalid):
+                i = invalid[0]
+                pos = i if positions is None else positions[i]
+                raise ValueError(
+                    "Numeric value `%s` (%s) is not in domain %s for "
+                    "Var %s" % (float(new_values[i]), float,
+                                data.domains.get(pos, data.domain),
+                                data.view(pos).name))
+        if positions is None:
+            positions = slice(None)
+        data.value[positions] = new_values
+        data.stale[positions] = False
+
     def get_units(self):
         """Return the units expression for this Var."""
         return self._units
@@ -611,6 +1043,17 @@ class Var(IndexedComponent):
         if not self.is_indexed():
             self._data[None] = self
             self._initialize_members((None,))
+        elif self._array:
+            if not numpy_available:
+                raise ValueError(
+                    "Var '%s' with array storage requires numpy"
+                    % (self.name,))
+            if not self._index.isfinite() or not self._index.isordered():
+                raise ValueError(
+                    "Var '%s' with array storage requires a finite, "
+                    "ordered index set" % (self.name,))
+            self._data = _ArrayVarDict(self)
+            self._initialize_array_members()
         elif self._dense:
             # This loop is optimized for speed with pypy.
             # Calling dict.update((...) for ...) is roughly
@@ -635,6 +1078,11 @@ class Var(IndexedComponent):
     #
     def _getitem_when_not_present(self, index):
         """Returns the default component data value."""
+        if self._data.__class__ is _ArrayVarDict:
+            raise KeyError(
+                "Index '%s' is not a valid index for the array-backed "
+                "Var '%s' (the index set must not change after the Var "
+                "is constructed)" % (index, self.name))
         if index is None and not self.is_indexed():
             obj = self._data[index] = self
         else:
@@ -766,6 +1214,56 @@ class Var(IndexedComponent):
                 vardata.setlb(lb)
                 vardata.setub(ub)
 
+    def _initialize_array_members(self):
+        """Initialize the arrays of an array-backed Var"""
+        data = self._data
+        parent = self._parent()
+        #
+        # Initialize domains
+        #
+        if self._domain_init_rule is not None:
+            for pos, ndx in enumerate(self._index):
+                data.set_domain(pos, apply_indexed_rule(
+                    self, self._domain_init_rule, parent, ndx))
+        #
+        # Initialize values
+        #
+        if self._value_init_rule is not None:
+            self._set_value_array(
+                [value(apply_indexed_rule(
+                    self, self._value_init_rule, parent, ndx))
+                 for ndx in self._index])
+        elif self._value_init_value is not None:
+            if self._value_init_value.__class__ is dict:
+                # Skip indices that are not in the dictionary
+                positions = []
+                vals = []
+                for pos, ndx in enumerate(self._index):
+                    if ndx in self._value_init_value:
+                        positions.append(pos)
+                        vals.append(self._value_init_value[ndx])
+                self._set_value_array(vals, positions=positions)
+            else:
+                self._set_value_array(numpy.full(
+                    len(data), value(self._value_init_value), dtype=float))
+        #
+        # Initialize bounds
+        #
+        if self._bounds_init_rule is not None:
+            for pos, ndx in enumerate(self._index):
+                (lb, ub) = apply_indexed_rule(
+                    self, self._bounds_init_rule, parent, ndx)
+                data.set_bound(data.lb, data.lb_exprs, pos,
+                               _validate_bound(lb, 'lower'))
+                data.set_bound(data.ub, data.ub_exprs, pos,
+                               _validate_bound(ub, 'upper'))
+        elif self._bounds_init_value is not None:
+            (lb, ub) = self._bounds_init_value
+            data.set_bound(data.lb, data.lb_exprs, None,
+                           _validate_bound(lb, 'lower'))
+            data.set_bound(data.ub, data.ub_exprs, None,
+                           _validate_bound(ub, 'upper'))
+
     def _pprint(self):
         """Print component information."""
         return ( [("Size", len(self)),
@@ -939,6 +1437,10 @@ class IndexedVar(Var):
         """
         Set the lower bound for this variable.
         """
+        if self._data.__class__ is _ArrayVarDict:
+            self._data.set_bound(self._data.lb, self._data.lb_exprs, None,
+                                 _validate_bound(val, 'lower'))
+            return
         for vardata in itervalues(self):
             vardata.setlb(val)
 
@@ -946,19 +1448,69 @@ class IndexedVar(Var):
         """
         Set the upper bound for this variable.
         """
+        if self._data.__class__ is _ArrayVarDict:
+            self._data.set_bound(self._data.ub, self._data.ub_exprs, None,
+                                 _validate_bound(val, 'upper'))
+            return
         for vardata in itervalues(self):
             vardata.setub(val)
 
+    def set_bounds(self, lb, ub):
+        """
+        Set the lower and upper bounds of all variables in this
+        container.
+
+        Each bound may be a single value (see setlb and setub) or a
+        sequence (e.g., a NumPy array) of the numeric bounds of all
+        variables, ordered like the index set (with None or NaN for
+        unbounded variables).
+        """
+        for bound, which, setter in ((lb, 'lower', self.setlb),
+                                     (ub, 'upper', self.setub)):
+            if bound is None or not hasattr(bound, '__len__'):
+                setter(bound)
+                continue
+            if len(bound) != len(self._index):
+                raise ValueError(
+                    "Cannot set the %s bounds of Var '%s': %s bounds "
+                    "given for %s variables"
+                    % (which, self.name, len(bound), len(self._index)))
+            if self._data.__class__ is _ArrayVarDict:
+                data = self._data
+                if which == 'lower':
+                    bounds, exprs = data.lb, data.lb_exprs
+                else:
+                    bounds, exprs = data.ub, data.ub_exprs
+                bounds[:] = numpy.array(bound, dtype=float).ravel()
+                exprs.clear()
+                continue
+            for index, val in zip(self._index, bound):
+                if val is not None and val != val:
+                    val = None
+                vardata = self[index]
+                if which == 'lower':
+                    vardata.setlb(val)
+                else:
+                    vardata.setub(val)
+
     def fix(self, value=NoArgumentGiven):
         """
         Set the fixed indicator to True. Value argument is optional,
         indicating the variable should be fixed at its current value.
         """
+        if self._data.__class__ is _ArrayVarDict:
+            self._data.fixed[:] = True
+            if value is not NoArgumentGiven:
+                self._data.value[:] = numpy.nan if value is None else value
+            return
         for vardata in itervalues(self):
             vardata.fix(value=value)
 
     def unfix(self):
         """Sets the fixed indicator to False."""
+        if self._data.__class__ is _ArrayVarDict:
+            self._data.fixed[:] = False
+            return
         for vardata in itervalues(self):
             vardata.unfix()
 
@@ -971,6 +1523,9 @@ class IndexedVar(Var):
     @domain.setter
     def domain(self, domain):
         """Sets the domain for all variables in this container."""
+        if self._data.__class__ is _ArrayVarDict:
+            self._data.set_domain(None, domain)
+            return
         for vardata in itervalues(self):
             vardata.domain = domain
 
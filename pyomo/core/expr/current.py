@@ -139,6 +139,9 @@ if _mode == Mode.pyomo5_trees:
                                          _IsFixedVisitor, _ToStringVisitor)
     # FIXME: we shouldn't need circular dependencies between modules
     _visitor.LinearExpression = _numeric_expr.LinearExpression
+    _visitor.ExternalFunctionExpression \
+        = _numeric_expr.ExternalFunctionExpression
+    _visitor._MutableSumExpression = _numeric_expr._MutableSumExpression
     _visitor.MonomialTermExpression = _numeric_expr.MonomialTermExpression
     _visitor.NPV_expression_types = _numeric_expr.NPV_expression_types
     _visitor.clone_counter = _numeric_expr.clone_counter
@@ -29,6 +29,7 @@ from .symbol_map import SymbolMap
 from . import expr_common as common
 from .expr_errors import TemplateExpressionError
 from pyomo.common.deprecation import deprecation_warning
+from pyomo.core.pyomoobject import PyomoObject
 
 from pyomo.core.expr.boolean_value import (
     BooleanValue,)
@@ -912,6 +913,96 @@ def clone_expression(expr, substitute=None):
     return deepcopy(expr, memo)
 
 
+# =====================================================
+#  remap_expression
+# =====================================================
+
+_remapped_node_types = {}
+
+def _is_remapped_node(node):
+    # Only plain expression nodes are rebuilt (with
+    # create_node_with_local_data()).  Nodes that hold other references
+    # (e.g., the variables in LinearExpression or the ExternalFunction
+    # component), that may be modified in place, or that define their
+    # own __deepcopy__ are deep copied, as are named expressions and
+    # all other leaves.
+    cls = node.__class__
+    try:
+        return _remapped_node_types[cls]
+    except KeyError:
+        pass
+    ans = _remapped_node_types[cls] = (
+        isinstance(node, PyomoObject)
+        and node.is_expression_type()
+        and not node.is_named_expression_type()
+        and not hasattr(cls, '__deepcopy__')
+        and not issubclass(cls, (LinearExpression,
+                                 ExternalFunctionExpression,
+                                 _MutableSumExpression)))
+    return ans
+
+def remap_expression(expr, memo):
+    """Copy an expression, sharing the subtrees that are not changed.
+
+    The leaves of the expression (Pyomo components, including named
+    Expressions) are copied by calling ``copy.deepcopy`` with the
+    memo, so the components that are in the scope of a
+    :py:meth:`Block.clone() <pyomo.core.base.block._BlockData.clone>`
+    are replaced by their clones.  Unlike ``copy.deepcopy``, an
+    expression node is only rebuilt (with
+    ``create_node_with_local_data()``) if one of its children was
+    replaced.  Because expression nodes are immutable, the remaining
+    subtrees (e.g., subtrees containing only constants and components
+    outside the cloned block) are shared by the original expression and
+    its copy.
+
+    Args:
+        expr: The expression (or any other object, which is simply
+            deep copied)
+        memo (dict): The ``copy.deepcopy`` memo
+
+    Returns:
+        The copied expression.
+    """
+    if expr.__class__ in nonpyomo_leaf_types:
+        return expr
+    if id(expr) in memo:
+        return memo[id(expr)]
+    if not _is_remapped_node(expr):
+        return deepcopy(expr, memo)
+
+    # Walk the tree (without recursion) and rebuild the nodes from the
+    # bottom up
+    stack = [(expr, expr.args, [])]
+    while 1:
+        node, args, new_args = stack[-1]
+        descend = False
+        for child in args[len(new_args):]:
+            if child.__class__ in nonpyomo_leaf_types:
+                new_args.append(child)
+            elif id(child) in memo:
+                new_args.append(memo[id(child)])
+            elif _is_remapped_node(child):
+                stack.append((child, child.args, []))
+                descend = True
+                break
+            else:
+                new_args.append(deepcopy(child, memo))
+        if descend:
+            continue
+        stack.pop()
+        for old, new in zip(args, new_args):
+            if old is not new:
+                ans = node.create_node_with_local_data(tuple(new_args))
+                break
+        else:
+            ans = node
+        memo[id(node)] = ans
+        if not stack:
+            return ans
+        stack[-1][2].append(ans)
+
+
 # =====================================================
 #  sizeof_expression
 # =====================================================
@@ -2046,6 +2046,56 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (m.x, m.y[1], nb.x, nb.y[1])),
         )
 
+    def test_clone_share_expressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.p = Param(mutable=True, initialize=2)
+        m.b = Block()
+        m.b.y = Var([1,2], initialize=1)
+        m.b.q = Param(mutable=True, initialize=3)
+        m.b.e = Expression(expr=m.b.q*m.b.y[1])
+        m.b.c = Constraint(expr=(m.p + 1)*m.x**2 + m.b.e + m.b.y[2] <= 10)
+        m.b.l = Constraint(expr=EXPR.LinearExpression(
+            constant=1, linear_coefs=[m.p, 2], linear_vars=[m.x, m.b.y[2]])
+            >= 0)
+        m.b.o = Objective(expr=m.b.y[1] + m.b.y[2])
+
+        nb = m.b.clone(share_expressions=True)
+        self.assertIsNot(nb.c, m.b.c)
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(nb.c.body)),
+            sorted(id(x) for x in (m.x, nb.y[1], nb.y[2])),
+        )
+        # Subtrees that do not refer to cloned components are shared
+        self.assertIsNot(nb.c.body, m.b.c.body)
+        self.assertIs(nb.c.body.arg(0), m.b.c.body.arg(0))
+        # Named expressions are cloned
+        self.assertIs(nb.c.body.arg(1), nb.e)
+        self.assertIs(nb.e.expr.arg(0), nb.q)
+        self.assertIs(nb.e.expr.arg(1), nb.y[1])
+        self.assertIsNot(nb.l.body, m.b.l.body)
+        self.assertIs(nb.l.body.linear_vars[0], m.x)
+        self.assertIs(nb.l.body.linear_vars[1], nb.y[2])
+        self.assertIs(nb.l.body.linear_coefs[0], m.p)
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(nb.o.expr)),
+            sorted(id(x) for x in (nb.y[1], nb.y[2])),
+        )
+
+        # The clone is independent of the original model
+        nb.y[1].value = 4
+        nb.q.value = 5
+        self.assertEqual(value(nb.e), 20)
+        self.assertEqual(value(m.b.e), 3)
+
+        # Cloning the model copies all components
+        n = m.clone(share_expressions=True)
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(n.b.c.body)),
+            sorted(id(x) for x in (n.x, n.b.y[1], n.b.y[2])),
+        )
+        self.assertIs(n.b.c.body.arg(0).arg(0).arg(0), n.p)
+
     def test_clone_unclonable_attribute(self):
         class foo(object):
             def __deepcopy__(bogus):
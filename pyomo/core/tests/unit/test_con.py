@@ -1115,6 +1115,132 @@ class Test2DArrayCon(unittest.TestCase):
 
         self.assertEqual(len(model.c),1)
 
+class TestDeferredCon(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(1, 11))
+        m.x = Var(m.I)
+        m.calls = []
+        def rule(m, i):
+            m.calls.append(i)
+            if i % 3:
+                return Constraint.Skip
+            return m.x[i] >= i
+        m.c = Constraint(m.I, rule=rule, deferred=True)
+        return m
+
+    def test_construct_on_access(self):
+        m = self._model()
+        self.assertTrue(m.c._constructed)
+        self.assertEqual(m.calls, [])
+        self.assertEqual(len(m.c._data), 0)
+        self.assertEqual(m.c[3].lower, 3)
+        self.assertIs(m.c[3].body, m.x[3])
+        self.assertEqual(m.calls, [3])
+        # Members are only built once
+        m.c[3]
+        self.assertEqual(m.calls, [3])
+
+    def test_skipped_index(self):
+        m = self._model()
+        self.assertRaises(KeyError, m.c.__getitem__, 4)
+        self.assertEqual(m.calls, [4])
+        # The rule is not called again for skipped indices
+        self.assertRaises(KeyError, m.c.__getitem__, 4)
+        self.assertNotIn(4, m.c)
+        self.assertEqual(m.calls, [4])
+        # Indices that are not in the index set are not built
+        self.assertRaises(KeyError, m.c.__getitem__, 11)
+        self.assertEqual(m.calls, [4])
+
+    def test_contains_and_delete(self):
+        m = self._model()
+        self.assertIn(6, m.c)
+        self.assertNotIn(7, m.c)
+        self.assertEqual(m.calls, [6, 7])
+        del m.c[6]
+        del m.c[9]
+        self.assertNotIn(6, m.c)
+        self.assertEqual(m.calls, [6, 7])
+        self.assertEqual(list(m.c.keys()), [3])
+        self.assertEqual(m.calls, [6, 7, 1, 2, 3, 4, 5, 8, 10])
+
+    def test_len_and_iteration(self):
+        m = self._model()
+        m.c[9]
+        self.assertEqual(len(m.c), 3)
+        self.assertEqual(sorted(m.calls), list(range(1, 11)))
+        self.assertEqual(list(m.c.keys()), [3, 6, 9])
+        self.assertEqual(len(m.calls), 10)
+
+    def test_component_data_objects(self):
+        m = self._model()
+        cons = list(m.component_data_objects(Constraint))
+        self.assertEqual([c.lower for c in cons], [3, 6, 9])
+        self.assertEqual(len(m.calls), 10)
+
+    def test_construct_deferred(self):
+        m = self._model()
+        m.c.construct_deferred()
+        self.assertEqual(m.calls, list(range(1, 11)))
+        self.assertEqual(sorted(m.c._data), [3, 6, 9])
+        self.assertEqual(len(m.c), 3)
+        self.assertEqual(len(m.calls), 10)
+
+    def test_deactivated(self):
+        m = self._model()
+        m.c.deactivate()
+        self.assertEqual(
+            list(m.component_data_objects(Constraint, active=True)), [])
+        self.assertEqual(m.calls, [])
+        # Members are built inactive
+        self.assertFalse(m.c[3].active)
+        m.c.activate()
+        self.assertTrue(m.c[3].active)
+        self.assertTrue(m.c[6].active)
+
+    def test_partially_reactivated(self):
+        m = self._model()
+        m.c.deactivate()
+        m.c[3].activate()
+        self.assertTrue(m.c.active)
+        self.assertEqual(m.calls, [3])
+        # The other members are built inactive, as they are without
+        # deferred construction
+        self.assertFalse(m.c[6].active)
+        self.assertEqual(
+            [c.name for c in m.component_data_objects(
+                Constraint, active=True)], ['c[3]'])
+        m.c.activate()
+        self.assertTrue(m.c[6].active)
+        self.assertTrue(m.c[9].active)
+
+    def test_rule_error(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        def rule(m, i):
+            if i == 2:
+                raise RuntimeError("bad rule")
+            return m.x[i] >= 0
+        m.c = Constraint([1, 2], rule=rule, deferred=True)
+        self.assertEqual(m.c[1].lower, 0)
+        self.assertRaises(RuntimeError, m.c.__getitem__, 2)
+        self.assertRaises(RuntimeError, m.c.construct_deferred)
+        self.assertEqual(list(m.c._data), [1])
+
+    def test_not_deferred(self):
+        m = ConcreteModel()
+        m.x = Var()
+        # Scalar constraints and indexed constraints without rules are
+        # constructed as usual
+        m.c = Constraint(expr=m.x >= 1, deferred=True)
+        self.assertEqual(m.c.lower, 1)
+        m.d = Constraint([1, 2], deferred=True)
+        self.assertEqual(len(m.d), 0)
+        self.assertIsNone(m.d._deferred)
+
+
 class MiscConTests(unittest.TestCase):
 
     def test_slack_methods(self):
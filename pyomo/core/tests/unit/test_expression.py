@@ -512,6 +512,34 @@ E : Size=2
         self.assertIsNot(expr, model.E[2])
         self.assertEqual(model.E.extract_values(), {1:5, 2:6})
 
+    def test_deferred_construct_rule(self):
+        model = ConcreteModel()
+        model.Index = Set(initialize=[1,2,3])
+        model.x = Var(model.Index)
+        calls = []
+        def _some_rule(model, i):
+            calls.append(i)
+            if i == 1:
+                return Expression.Skip
+            return i*model.x[i]
+        model.E = Expression(model.Index, rule=_some_rule, deferred=True)
+        self.assertEqual(calls, [])
+        self.assertEqual(str(model.E[3].expr), "3*x[3]")
+        self.assertEqual(calls, [3])
+        self.assertEqual(sorted(model.E.extract_values()), [2, 3])
+        self.assertEqual(calls, [3, 1, 2])
+        self.assertEqual(len(model.E), 2)
+        # Skipped expressions are implicitly defined
+        self.assertIs(model.E[1].expr, None)
+        self.assertEqual(len(model.E), 3)
+        self.assertEqual(calls, [3, 1, 2])
+
+    def test_deferred_store_values(self):
+        model = ConcreteModel()
+        model.E = Expression([1,2], rule=lambda m,i: i, deferred=True)
+        model.E.store_values({1: 5})
+        self.assertEqual(model.E.extract_values(), {1:5, 2:2})
+
     def test_indexed_construct_expr(self):
         model = ConcreteModel()
         model.Index = Set(initialize=[1,2,3])
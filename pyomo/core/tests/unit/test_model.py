@@ -23,12 +23,49 @@ import pyutilib.th as unittest
 from pyomo.common.dependencies import yaml_available
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.core.expr import current as EXPR
-from pyomo.environ import RangeSet, ConcreteModel, Var, Param, Block, AbstractModel, Set, Constraint, Objective, value, sum_product, SolverFactory, VarList, ObjectiveList, ConstraintList
-from pyomo.opt import check_available_solvers
+from pyomo.environ import RangeSet, ConcreteModel, Var, Param, Block, AbstractModel, Set, Constraint, Objective, value, sum_product, SolverFactory, VarList, ObjectiveList, ConstraintList, Suffix
+from pyomo.common.collections import Bunch
+from pyomo.opt import (check_available_solvers, ReaderFactory, OptSolver,
+                       ProblemFormat, ResultsFormat, TerminationCondition)
 from pyomo.opt.parallel.local import SolverManager_Serial
 
 solvers = check_available_solvers('glpk')
 
+class MockSolSolver(OptSolver):
+    """A solver that writes a *.sol file with v<i> = i/10 and a dual
+    of 10+i for c<i> for the NL file it is given"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'mock_sol'
+        OptSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.nl]
+        self._problem_format = ProblemFormat.nl
+        self._results_format = ResultsFormat.sol
+        self._capabilities.linear = True
+
+    def _apply_solver(self):
+        nlfile = self._problem_files[0]
+        with open(nlfile) as FILE:
+            FILE.readline()
+            n, m = [int(x) for x in FILE.readline().split()[:2]]
+        self._solfile = nlfile[:-3] + '.sol'
+        with open(self._solfile, 'w') as FILE:
+            FILE.write("Mock solver\n\nOptions\n3\n1\n1\n0\n"
+                       "%s\n%s\n%s\n%s\n" % (m, m, n, n))
+            FILE.write("".join("%s\n" % (10+i,) for i in range(m)))
+            FILE.write("".join("%s\n" % (i/10.,) for i in range(n)))
+            FILE.write("objno 0 0\n")
+        return Bunch(rc=0)
+
+    def _postsolve(self):
+        with ReaderFactory("sol") as reader:
+            results = reader(self._solfile, suffixes=self._suffixes,
+                             vectorized=self._vectorized_load)
+        os.remove(self._solfile)
+        os.remove(self._problem_files[0])
+        return results
+
+
 class Test(unittest.TestCase):
 
     def tearDown(self):
@@ -295,6 +332,123 @@ class Test(unittest.TestCase):
                 self.assertIn(model.x[index].getname(), results.solution.variable.keys())
 
 
+    def test_load_vectors(self):
+        model = ConcreteModel()
+        model.A = RangeSet(1,4)
+        model.x = Var(model.A, bounds=(-1,1))
+        model.obj = Objective(expr=sum_product(model.x))
+        model.c = Constraint(model.A, rule=lambda m,i: i*m.x[i] >= -1)
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        model.rc = Suffix(direction=Suffix.IMPORT)
+        fname = join(currdir, "load_vectors.nl")
+        fname, smap_id = model.write(fname, format='nl')
+        os.remove(fname)
+        smap = model.solutions.symbol_map[smap_id]
+        solfile = join(currdir, "load_vectors.sol")
+        with open(solfile, 'w') as FILE:
+            FILE.write("Solver message\n\nOptions\n3\n1\n1\n0\n"
+                       "4\n4\n4\n4\n")
+            FILE.write("".join("%s\n" % (10+i,) for i in range(4)))
+            FILE.write("".join("%s\n" % (i/10.,) for i in range(4)))
+            FILE.write("objno 0 0\n")
+            FILE.write("suffix 4 2 3 0 0\nrc\n0 0.5\n3 -0.5\n")
+        self.assertIs(type(smap.bySymbol['v0']()), type(model.x[1]))
+        with ReaderFactory("sol") as reader:
+            results = reader(solfile, suffixes=['dual', 'rc'],
+                             vectorized=True)
+        os.remove(solfile)
+        self.assertEqual(len(results.solution(0).variable), 0)
+        results._smap_id = smap_id
+        model.x[4].fix(1)
+        model.solutions.load_vectors(results)
+        self.assertEqual(len(model.solutions.symbol_map), 0)
+        for i in range(4):
+            v = smap.bySymbol['v%d' % i]()
+            c = smap.bySymbol['c%d' % i]()
+            if v is model.x[4]:
+                self.assertEqual(v.value, 1)
+            else:
+                self.assertEqual(v.value, i/10.)
+                self.assertFalse(v.stale)
+            self.assertEqual(model.dual[c], 10+i)
+        self.assertEqual(
+            model.rc[smap.bySymbol['v0']()], 0.5)
+        self.assertEqual(
+            model.rc[smap.bySymbol['v3']()], -0.5)
+        self.assertEqual(len(model.rc), 2)
+
+    def test_load_vectors_default_variable_value(self):
+        model = ConcreteModel()
+        model.A = RangeSet(1,3)
+        model.x = Var(model.A, bounds=(-1,1))
+        model.obj = Objective(expr=sum_product(model.x))
+        model.c = Constraint(model.A, rule=lambda m,i: i*m.x[i] >= -1)
+        solfile = join(currdir, "load_vectors_default.sol")
+        with open(solfile, 'w') as FILE:
+            FILE.write("Solver message\n\nOptions\n3\n1\n1\n0\n"
+                       "3\n0\n3\n0\nobjno 0 0\n")
+        for nl_order in (True, False):
+            fname = join(currdir, "load_vectors_default.nl")
+            fname, smap_id = model.write(fname, format='nl')
+            os.remove(fname)
+            smap = model.solutions.symbol_map[smap_id]
+            # The writer records the variables in the NL file order
+            self.assertEqual([ref() for ref in smap._nl_variables],
+                             [smap.bySymbol['v%d' % i]() for i in range(3)])
+            if not nl_order:
+                del smap._nl_variables
+                del smap._nl_constraints
+            with ReaderFactory("sol") as reader:
+                results = reader(solfile, vectorized=True)
+            results._smap_id = smap_id
+            model.x[2].fix(1)
+            model.x[3].value = None
+            model.solutions.load_vectors(results, default_variable_value=0.5)
+            self.assertEqual(model.x[1].value, 0.5)
+            self.assertFalse(model.x[1].stale)
+            self.assertEqual(model.x[2].value, 1)
+            self.assertEqual(model.x[3].value, 0.5)
+            model.x[2].unfix()
+        os.remove(solfile)
+
+    def test_results_mode(self):
+        model = ConcreteModel()
+        model.A = RangeSet(1,4)
+        model.x = Var(model.A, bounds=(-1,1))
+        model.obj = Objective(expr=sum_product(model.x))
+        model.c = Constraint(model.A, rule=lambda m,i: i*m.x[i] >= -1)
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        opt = MockSolSolver()
+
+        results = opt.solve(model)
+        self.assertEqual(len(results.solution), 0)
+        self.assertEqual(len(model.solutions), 1)
+        full = dict((i, model.x[i].value) for i in model.A)
+        duals = dict((i, model.dual[model.c[i]]) for i in model.A)
+        self.assertEqual(sorted(full.values()), [0, 0.1, 0.2, 0.3])
+
+        model.x.set_values(dict((i, None) for i in model.A))
+        model.dual.clear()
+        results = opt.solve(model, results_mode='lean')
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(len(results.solution), 1)
+        self.assertEqual(len(results.solution(0).variable), 0)
+        self.assertEqual(len(results.solution(0).constraint), 0)
+        self.assertAlmostEqual(
+            results.solution(0).objective['obj']['Value'], 0.6)
+        self.assertEqual(len(model.solutions), 0)
+        self.assertEqual(len(model.solutions.symbol_map), 0)
+        for i in model.A:
+            self.assertEqual(model.x[i].value, full[i])
+            self.assertFalse(model.x[i].stale)
+            self.assertEqual(model.dual[model.c[i]], duals[i])
+
+        with self.assertRaisesRegex(ValueError, "Invalid results_mode"):
+            opt.solve(model, results_mode='none')
+        with self.assertRaisesRegex(ValueError, "load_solutions=True"):
+            opt.solve(model, results_mode='lean', load_solutions=False)
+
     def test_display(self):
         model = ConcreteModel()
         model.A = RangeSet(1,4)
@@ -27,10 +27,14 @@ import pyutilib.th as unittest
 from pyomo.environ import (Set, RangeSet, Param, ConcreteModel,
                            AbstractModel, Constraint, Var,
                            NonNegativeIntegers, Integers,
-                           NonNegativeReals, Boolean, Reals, Any, display,
+                           NonNegativeReals, PercentFraction, Boolean, Reals,
+                           Any, display,
                            value, set_options, sin, cos, tan, log, log10,
                            exp, sqrt, ceil, floor, asin, acos, atan, sinh,
                            cosh, tanh, asinh, acosh, atanh)
+from pyomo.common.dependencies import (
+    numpy as np, numpy_available, pandas as pd, pandas_available,
+)
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.core.base.param import _NotValid, _ParamData 
@@ -2024,5 +2028,94 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests,instrinsic_test_list)
 
 
+@unittest.skipIf(not numpy_available, "numpy is not available")
+class TestArrayParamValues(unittest.TestCase):
+
+    def test_store_array(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, mutable=True, within=NonNegativeReals)
+        m.x = Var()
+        m.c = Constraint(expr=m.p[2] <= m.x)
+        m.p.store_values(np.array([1., 2., 3.]))
+        self.assertEqual(m.p.extract_values(), {1: 1, 2: 2, 3: 3})
+        self.assertIs(type(m.p[1].value), float)
+        self.assertEqual(value(m.c.lower), 2)
+        m.p.store_values(np.array([4, 5, 6]))
+        self.assertEqual(value(m.c.lower), 5)
+        self.assertIs(type(m.p[1].value), int)
+
+        # Nothing is stored if any value is invalid
+        with self.assertRaisesRegexp(
+                ValueError, "p\\[3\\] = '-1.0'.*\n.*domain NonNegativeReals"):
+            m.p.store_values(np.array([0., 1., -1.]))
+        self.assertEqual(m.p[1].value, 4)
+        # ... unless they are not checked
+        m.p.store_values(np.array([0., 1., -1.]), check=False)
+        self.assertEqual(m.p[3].value, -1)
+
+        with self.assertRaisesRegexp(ValueError, '2 values given for 3'):
+            m.p.store_values(np.array([1, 2]))
+
+    def test_store_array_nan(self):
+        m = ConcreteModel()
+        m.I = RangeSet(2)
+        with self.assertRaisesRegexp(
+                ValueError, "p\\[1\\] = 'nan'.*\n.*domain NonNegativeReals"):
+            m.p = Param(m.I, within=NonNegativeReals,
+                        initialize=np.array([float('nan'), 2.]))
+        m.q = Param(m.I, mutable=True, within=PercentFraction, initialize=0)
+        with self.assertRaisesRegexp(ValueError, 'domain PercentFraction'):
+            m.q.store_values(np.array([0.5, float('nan')]))
+        self.assertEqual(m.q[2].value, 0)
+        # NaN is still valid for Reals
+        m.r = Param(m.I, within=Reals, initialize=np.array([float('nan'), 2.]))
+        self.assertNotEqual(m.r[1], m.r[1])
+
+    def test_store_array_validate(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2], [1, 2], mutable=True, within=Integers,
+                    validate=lambda m, v, i, j: v < 10)
+        m.p.store_values(np.array([[1, 2], [3, 4]]))
+        self.assertEqual(m.p[2, 1].value, 3)
+        with self.assertRaisesRegexp(ValueError, 'domain Integers'):
+            m.p.store_values(np.array([[1, 2.5], [3, 4]]))
+        with self.assertRaisesRegexp(ValueError, 'validation rule'):
+            m.p.store_values(np.array([[1, 2], [3, 40]]))
+        self.assertEqual(m.p[2, 2].value, 4)
+
+    def test_initialize_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=['a', 'b'])
+        m.p = Param(m.I, initialize=np.array([1.5, 2.5]))
+        self.assertEqual(m.p['b'], 2.5)
+        m.q = Param(m.I, [1, 2], initialize=np.arange(4).reshape(2, 2),
+                    mutable=True)
+        self.assertEqual(m.q['b', 1].value, 2)
+        with self.assertRaisesRegexp(ValueError, 'domain Reals'):
+            m.r = Param(m.I, within=Reals,
+                        initialize=np.array(['x', 'y'], dtype=object))
+
+    @unittest.skipIf(not pandas_available, "pandas is not available")
+    def test_store_pandas(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2], ['a', 'b'], mutable=True, initialize=0)
+        m.p.store_values(pd.Series(
+            [3., 4.], index=pd.MultiIndex.from_tuples([(2, 'a'), (1, 'b')])))
+        self.assertEqual(m.p.extract_values(),
+                         {(1, 'a'): 0, (1, 'b'): 4, (2, 'a'): 3, (2, 'b'): 0})
+        m.p.store_values(pd.DataFrame(
+            {'val': [5.]}, index=pd.MultiIndex.from_tuples([(1, 'a')])))
+        self.assertEqual(m.p[1, 'a'].value, 5)
+        with self.assertRaisesRegexp(ValueError, 'single column'):
+            m.p.store_values(pd.DataFrame({'a': [1], 'b': [2]}))
+        with self.assertRaises(KeyError):
+            m.p.store_values(pd.Series(
+                [3.], index=pd.MultiIndex.from_tuples([(3, 'a')])))
+
+        m.q = Param(['x', 'y'], initialize=pd.Series({'x': 1, 'y': 2}))
+        self.assertEqual(m.q['y'], 2)
+
+
 if __name__ == "__main__":
     unittest.main()
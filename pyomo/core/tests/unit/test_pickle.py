@@ -20,7 +20,10 @@ currdir = dirname(abspath(__file__))+os.sep
 import platform
 
 import pyutilib.th as unittest
-from pyomo.environ import AbstractModel, ConcreteModel, Set, Param, Var, Constraint, Objective, Reals, NonNegativeReals, sum_product
+from pyomo.common.dependencies import numpy_available
+from pyomo.environ import AbstractModel, ConcreteModel, Set, Param, Var, Constraint, Objective, Reals, NonNegativeReals, sum_product, Block, Expression, ConstraintList, Suffix, Binary, exp, inequality, quicksum
+from pyomo.core.base.block import SimpleBlock
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 using_pypy = platform.python_implementation() == "PyPy"
@@ -345,5 +348,171 @@ class Test(unittest.TestCase):
         OUTPUT.close()
         self.assertFileEqualsBaseline(currdir+"test_pickle4_after.out",currdir+"test_pickle4_baseline.txt")
 
+
+class TestToBytes(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.D = Set(initialize=[0, 1, 2.5])
+        m.p = Param(m.I, initialize={1: 1.5, 2: 2}, mutable=True)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.x[2].value = 2.5
+        m.x[2].setlb(None)
+        m.x[3].fix(3)
+        m.y = Var(m.I, within=Binary)
+        m.z = Var(m.I, within=m.D, bounds=(0, m.p[1]))
+        m.w = Var(initialize=4)
+        m.e = Expression(expr=m.p[1]*m.x[1] + 2)
+        m.c = ConstraintList()
+        m.c.add(2.5*m.x[1] + m.p[2]*m.x[2]**2 + exp(m.y[1]) <= 10)
+        m.c.add(m.e + m.w == 2**40)
+        m.c.add(inequality(-1, m.x[1] - m.z[3], m.p[2]))
+        m.c.add(LinearExpression(constant=1, linear_coefs=[1, 2],
+                                 linear_vars=[m.x[1], m.x[2]]) >= 0)
+        m.o = Objective(expr=m.c[1].body)
+        m.b = Block()
+        m.b.v = Var(m.I, initialize={1: 1, 2: 2, 3: 3})
+        m.b.c = Constraint(expr=sum(i*m.b.v[i] for i in m.I) >= 1)
+        m.b.c.deactivate()
+        m.dual = Suffix()
+        m.dual[m.c[1]] = 5
+        m.dual[m.c[2]] = 2.5*m.x[2] + m.p[1]
+        return m
+
+    def test_round_trip(self):
+        m = self._model()
+        n = ConcreteModel.from_bytes(m.to_bytes())
+        self.assertIsNot(n, m)
+        for v in m.component_data_objects(Var):
+            nv = n.find_component(v)
+            self.assertIs(type(nv), type(v))
+            self.assertIs(nv.parent_component(), n.find_component(
+                v.parent_component()))
+            self.assertEqual(nv.value, v.value)
+            self.assertEqual(type(nv.value), type(v.value))
+            self.assertEqual(nv.lb, v.lb)
+            self.assertEqual(nv.ub, v.ub)
+            self.assertEqual(nv.fixed, v.fixed)
+            self.assertEqual(nv.stale, v.stale)
+            self.assertEqual(str(nv.domain), str(v.domain))
+        self.assertIs(n.y[1].domain, Binary)
+        self.assertIs(n.z[1].domain, n.D)
+        self.assertIs(n.z[1]._ub.parent_component(), n.p)
+        self.assertEqual(n.p[1].value, 1.5)
+        self.assertEqual(n.p[2].value, 2)
+        self.assertIs(type(n.p[2].value), int)
+        self.assertEqual(n.p[3]._value, m.p[3]._value)
+        for c in m.component_data_objects(Constraint):
+            nc = n.find_component(c)
+            self.assertEqual(str(nc.body), str(c.body))
+            self.assertEqual(str(nc.lower), str(c.lower))
+            self.assertEqual(str(nc.upper), str(c.upper))
+            self.assertEqual(nc.active, c.active)
+        self.assertEqual(n.c[2].upper, 2**40)
+        self.assertIs(type(n.c[4].body), LinearExpression)
+        self.assertIs(n.c[2].body.arg(0), n.e)
+        self.assertIs(n.c[1].body.arg(1).arg(0), n.p[2])
+        self.assertIs(n.c[1].body.arg(1).arg(1).arg(0), n.x[2])
+        # shared expressions remain shared
+        self.assertIs(m.o.expr, m.c[1].body)
+        self.assertIs(n.o.expr, n.c[1].body)
+        self.assertEqual(str(n.e.expr), str(m.e.expr))
+        self.assertEqual(n.dual[n.c[1]], 5)
+        self.assertEqual(str(n.dual[n.c[2]]), "2.5*x[2] + p[1]")
+        self.assertIs(n.dual[n.c[2]].arg(0).arg(1), n.x[2])
+        self.assertEqual(n.b.v[2].value, 2)
+        n.p[2] = 4
+        n.y[1].value = 0
+        self.assertEqual(n.c[1].body(), 2.5 + 4*2.5**2 + exp(0))
+
+    def test_sub_block(self):
+        m = self._model()
+        data = m.b.to_bytes()
+        self.assertIs(m.b.parent_block(), m)
+        b = SimpleBlock.from_bytes(data)
+        self.assertIsNone(b.parent_block())
+        self.assertEqual(str(b.c.body), "v[1] + 2*v[2] + 3*v[3]")
+        self.assertIs(b.c.body.arg(1).arg(1), b.v[2])
+        self.assertFalse(b.c.active)
+        self.assertEqual(b.c.body(), 1 + 2*2 + 3*3)
+        with self.assertRaisesRegexp(
+                TypeError, "holds a SimpleBlock \\(expected "
+                "ConcreteModel\\)"):
+            ConcreteModel.from_bytes(data)
+
+    def test_protocols(self):
+        m = self._model()
+        ref = str(m.c[1].body)
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            n = ConcreteModel.from_bytes(m.to_bytes(protocol=protocol))
+            self.assertEqual(str(n.c[1].body), ref)
+            self.assertEqual(n.x[2].value, 2.5)
+
+    def test_linear_expressions(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(500))
+        m.p = Param(range(10), initialize=dict((j, j + 1) for j in range(10)),
+                    mutable=True)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1.5)
+        m.w = Var(initialize=1)
+        m.c = ConstraintList()
+        for i in m.I:
+            m.c.add(quicksum((j + 1.5)*m.x[(i + j) % 500]
+                             for j in range(10)) <= i)
+        # Param coefficients and a Var that is not in the Var tables
+        m.d = Constraint(expr=LinearExpression(
+            constant=2.5,
+            linear_coefs=[m.p[j] for j in range(10)] + [1],
+            linear_vars=[m.x[j] for j in range(10)] + [m.w]) >= 1)
+        self.assertIs(type(m.c[1].body), LinearExpression)
+        self.assertIs(type(m.d.body), LinearExpression)
+
+        n = ConcreteModel.from_bytes(m.to_bytes())
+        for c in m.component_data_objects(Constraint):
+            nc = n.find_component(c)
+            self.assertIs(type(nc.body), LinearExpression)
+            self.assertEqual(nc.body.constant, c.body.constant)
+            self.assertEqual([str(coef) for coef in nc.body.linear_coefs],
+                             [str(coef) for coef in c.body.linear_coefs])
+            self.assertEqual([n.find_component(v) for v in c.body.linear_vars],
+                             nc.body.linear_vars)
+            self.assertEqual(nc.upper, c.upper)
+        self.assertIs(n.c[2].body.linear_vars[0], n.x[1])
+        self.assertIs(n.c[2].body.linear_vars[0].parent_component(), n.x)
+        self.assertIs(n.d.body.linear_coefs[1], n.p[1])
+        self.assertIs(n.d.body.linear_vars[-1], n.w)
+        self.assertEqual(n.d.body(), 2.5 + 1.5*55 + 1)
+        n.p[1] = 4
+        n.w = 0
+        self.assertEqual(n.d.body(), 2.5 + 1.5*57)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_array_var(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(5), ordered=True)
+        m.x = Var(m.I, array=True, bounds=(0, 1), initialize=0.5)
+        m.c = Constraint(expr=sum(m.x[i] for i in m.I) >= 1)
+        n = ConcreteModel.from_bytes(m.to_bytes())
+        self.assertEqual([n.x[i].value for i in n.I], [0.5]*5)
+        self.assertIs(n.c.body.arg(0), n.x[0])
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    @unittest.skipIf(getattr(pickle, 'PickleBuffer', None) is None,
+                     "pickle protocol 5 is not available")
+    def test_out_of_band_buffers(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(5), ordered=True)
+        m.x = Var(m.I, array=True, bounds=(0, 1), initialize=0.5)
+        m.c = Constraint(expr=sum(m.x[i] for i in m.I) >= 1)
+        buffers = []
+        data = m.to_bytes(protocol=5, buffer_callback=buffers.append)
+        self.assertTrue(buffers)
+        n = ConcreteModel.from_bytes(data, buffers=buffers)
+        self.assertEqual([n.x[i].value for i in n.I], [0.5]*5)
+        self.assertIs(n.c.body.arg(0), n.x[0])
+        with self.assertRaises(pickle.UnpicklingError):
+            ConcreteModel.from_bytes(data)
+
 if __name__ == "__main__":
     unittest.main()
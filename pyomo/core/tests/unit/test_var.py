@@ -12,14 +12,18 @@
 #
 # TestSimpleVar                Class for testing single variables
 # TestArrayVar                Class for testing array of variables
+# TestArrayStorageVar         Class for testing array-backed variables
 #
 
 import os
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
+import pickle
+
 import pyutilib.th as unittest
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.core.base import IntegerSet
 from pyomo.environ import AbstractModel, ConcreteModel, Set, Param, Var, VarList, RangeSet, Suffix, Expression, NonPositiveReals, PositiveReals, Reals, RealSet, NonNegativeReals, Integers, Binary, value
 
@@ -1369,5 +1373,146 @@ class MiscVarTests(unittest.TestCase):
         model.x = Var(model.C)
 
 
+@unittest.skipIf(not numpy_available, "numpy is not available")
+class TestArrayStorageVar(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.p = Param(mutable=True, initialize=3)
+        m.x = Var(m.I, array=True, bounds=(0, 10),
+                  initialize={1: 1, 2: 2})
+        m.y = Var([(1, 'a'), (2, 'b')], array=True, within=Binary,
+                  initialize=0)
+        m.e = Expression(expr=m.x[1] + 2*m.x[2] + m.y[2, 'b'])
+        return m
+
+    def test_elements(self):
+        m = self._model()
+        # The variables are only created on access (here, by m.e)
+        self.assertEqual(sorted(m.x._data._views), [0, 1])
+        self.assertEqual(len(m.x), 4)
+        self.assertIs(m.x[1], m.x[1])
+        self.assertEqual(m.x[1].name, 'x[1]')
+        self.assertEqual(m.y[2, 'b'].name, 'y[2,b]')
+        self.assertEqual(m.y[2, 'b'].index(), (2, 'b'))
+        self.assertEqual(m.x[1].value, 1)
+        self.assertIsNone(m.x[3].value)
+        self.assertFalse(m.x[1].stale)
+        self.assertTrue(m.x[3].stale)
+        self.assertEqual(m.x[1].bounds, (0, 10))
+        self.assertEqual(m.y[1, 'a'].bounds, (0, 1))
+        self.assertEqual(value(m.e), 5)
+        self.assertEqual(list(m.x.keys()), [1, 2, 3, 4])
+        self.assertEqual([v.name for v in m.x[:]],
+                         ['x[1]', 'x[2]', 'x[3]', 'x[4]'])
+        self.assertIn(4, m.x)
+        self.assertNotIn(5, m.x)
+        self.assertRaises(KeyError, m.x.__getitem__, 5)
+
+        m.x[3] = 5
+        self.assertEqual(m.x[3].value, 5)
+        self.assertFalse(m.x[3].stale)
+        self.assertRaises(ValueError, m.y[1, 'a'].set_value, 2)
+        m.x[3].domain = Integers
+        self.assertRaises(ValueError, m.x[3].set_value, 1.5)
+        m.x[3].fix(4)
+        self.assertTrue(m.x[3].fixed)
+        self.assertEqual(m.x[3].value, 4)
+        m.x[3].unfix()
+        self.assertFalse(m.x[3].fixed)
+
+        m.x[2].setub(m.p)
+        self.assertEqual(m.x[2].ub, 3)
+        m.p = 4
+        self.assertEqual(m.x[2].ub, 4)
+        m.x[2].setlb(None)
+        self.assertEqual(m.x[2].bounds, (None, 4))
+        with self.assertRaisesRegexp(ValueError, 'Non-fixed input'):
+            m.x[2].setlb(m.x[1])
+
+    def test_vectorized(self):
+        m = self._model()
+        np.testing.assert_array_equal(
+            m.x.get_values(as_array=True), [1, 2, np.nan, np.nan])
+        self.assertEqual(m.x.get_values(), {1: 1, 2: 2, 3: None, 4: None})
+
+        m.x.set_values(np.array([4, 3, 2, 1]))
+        self.assertEqual(m.x[1].value, 4)
+        self.assertFalse(m.x[4].stale)
+        m.x.set_values([None, 1, 2, 3])
+        self.assertIsNone(m.x[1].value)
+        with self.assertRaisesRegexp(ValueError, '3 values given for 4'):
+            m.x.set_values([1, 2, 3])
+        with self.assertRaisesRegexp(ValueError, 'not in domain Binary'):
+            m.y.set_values([1, 0.5])
+        m.y.domain = Reals
+        m.y.set_values([1, 0.5])
+        m.y[1, 'a'].domain = Binary
+        with self.assertRaisesRegexp(ValueError, 'for Var y\\[1,a\\]'):
+            m.y.set_values([0.5, 1])
+
+        m.x.set_bounds(np.arange(4), None)
+        self.assertEqual(m.x[3].bounds, (2, None))
+        m.x.set_bounds(None, [1, None, 3, 4])
+        self.assertEqual(m.x[2].bounds, (None, None))
+        self.assertEqual(m.x[4].bounds, (None, 4))
+
+        m.x.fix(2)
+        self.assertTrue(m.x[1].fixed)
+        self.assertEqual(m.x.get_values(as_array=True).tolist(), [2]*4)
+        m.x[2].unfix()
+        self.assertEqual(m.x.get_values(include_fixed_values=False),
+                         {2: 2})
+        m.x.unfix()
+        m.x.flag_as_stale()
+        self.assertTrue(m.x[1].stale)
+
+    def test_general_var(self):
+        # The vectorized methods also work for general IndexedVars
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=1)
+        m.x.set_values(np.array([1, np.nan, 3]))
+        self.assertIsNone(m.x[2].value)
+        np.testing.assert_array_equal(
+            m.x.get_values(as_array=True), [1, np.nan, 3])
+        m.x.set_bounds([0, 1, None], 5)
+        self.assertEqual(m.x[2].bounds, (1, 5))
+        self.assertEqual(m.x[3].bounds, (None, 5))
+
+    def test_construction_errors(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegexp(ValueError, 'requires dense=True'):
+            m.x = Var([1, 2], array=True, dense=False)
+        m.s = Set(initialize=[1, 2], ordered=False)
+        with self.assertRaisesRegexp(ValueError, 'ordered index set'):
+            m.y = Var(m.s, array=True)
+
+    def test_rules(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], array=True, initialize=lambda m, i: i,
+                  bounds=lambda m, i: (i, 2*i),
+                  domain=lambda m, i: Integers if i == 1 else Reals)
+        self.assertEqual(m.x[2].value, 2)
+        self.assertEqual(m.x[2].bounds, (2, 4))
+        self.assertIs(m.x[1].domain, Integers)
+        self.assertIs(m.x[2].domain, Reals)
+
+    def test_clone_and_pickle(self):
+        m = self._model()
+        m.x[2].setub(m.p)
+        m.x[3].fix(7)
+        for n in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNot(n.x[1], m.x[1])
+            self.assertIs(n.x[1].parent_component(), n.x)
+            self.assertIs(n.e.expr.arg(0), n.x[1])
+            self.assertEqual(value(n.e), 5)
+            self.assertTrue(n.x[3].fixed)
+            self.assertEqual(n.x[3].value, 7)
+            n.p = 5
+            self.assertEqual(n.x[2].ub, 5)
+            self.assertEqual(m.x[2].ub, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
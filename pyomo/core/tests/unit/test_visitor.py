@@ -27,7 +27,7 @@ from pyomo.core.expr.visitor import (
     FixedExpressionError, NonConstantExpressionError,
     StreamBasedExpressionVisitor, ExpressionReplacementVisitor,
     evaluate_expression, expression_to_string, replace_expressions,
-    sizeof_expression,
+    sizeof_expression, remap_expression,
     identify_variables, identify_components, identify_mutable_parameters,
 )
 from pyomo.core.base.param import _ParamData, SimpleParam
@@ -141,6 +141,39 @@ class TestExpressionUtilities(unittest.TestCase):
             expr, include_fixed=False)), [m.x])
 
 
+    def test_remap_expression(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.z = Var()
+        m.p = Param(mutable=True)
+        e = (m.p + 1)*m.x**2 + sin(m.y) + 3*m.z
+        # Replace z with y (and do not copy any other components)
+        memo = {'__block_scope__': {id(None): False}, id(m.z): m.y}
+        f = remap_expression(e, memo)
+        self.assertIsNot(f, e)
+        self.assertIs(type(f), SumExpression)
+        self.assertEqual(str(f), "(p + 1)*x**2 + sin(y) + 3*y")
+        # Subtrees that were not changed are shared
+        self.assertIs(f.arg(0), e.arg(0))
+        self.assertIs(f.arg(1), e.arg(1))
+        self.assertIsNot(f.arg(2), e.arg(2))
+        # ... and the original expression is not changed
+        self.assertEqual(str(e), "(p + 1)*x**2 + sin(y) + 3*z")
+        # Nodes are only copied once
+        self.assertIs(remap_expression(e.arg(2), memo), f.arg(2))
+        memo = {'__block_scope__': {id(None): False}}
+        self.assertIs(remap_expression(e, memo), e)
+        self.assertIs(remap_expression(5, memo), 5)
+
+        # Other nodes are deep copied
+        e = LinearExpression(constant=1, linear_coefs=[2],
+                             linear_vars=[m.z])
+        f = remap_expression(
+            e, {'__block_scope__': {id(None): False}, id(m.z): m.y})
+        self.assertIsNot(f, e)
+        self.assertIs(f.linear_vars[0], m.y)
+
 
 class TestIdentifyParams(unittest.TestCase):
 
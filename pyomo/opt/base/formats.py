@@ -15,6 +15,8 @@ __all__ = ['ProblemFormat', 'ResultsFormat', 'guess_format']
 
 import enum 
 
+from pyomo.common.compression import strip_compression_suffix
+
 #
 # pyomo - A pyomo.core.PyomoModel object, or a *.py file that defines such an object
 # cpxlp - A CPLEX LP file
@@ -100,6 +102,9 @@ def guess_format(filename):
     formats['json']=ResultsFormat.json
     formats['results']=ResultsFormat.yaml
     if filename:
+        # Compressed files (e.g., model.mps.gz) use the format of the
+        # uncompressed file name
+        filename = strip_compression_suffix(filename)
         return formats.get(filename.split('.')[-1].strip(), None)
     else:
         return None
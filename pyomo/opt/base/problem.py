@@ -17,6 +17,7 @@ __all__ = [
 ]
 
 from pyomo.common import Factory
+from pyomo.common.compression import open_file
 
 
 ProblemConfigFactory = Factory('problem configuration object')
@@ -41,6 +42,15 @@ class AbstractProblemWriter(object):
     def __call__(self, model, filename, solver_capability, **kwds): #pragma:nocover
         raise TypeError("Method __call__ undefined in writer for format "+str(self.format))
 
+    def _open_output_file(self, filename, compression=None, binary=False):
+        """Open the output file for writing
+
+        The file is written through a streaming compressor if
+        ``compression`` is 'gzip' or 'zstd', or if it is None and the
+        filename ends with a compression suffix ('.gz' or '.zst').
+        """
+        return open_file(filename, 'wb' if binary else 'w', compression)
+
     #
     # Support "with" statements.
     #
@@ -234,6 +234,35 @@ def _raise_ephemeral_error(name, keyword=""):
         "solve." % (name, keyword))
 
 
+def _lean_results(results, model):
+    """Reduce the results of a solve (that have been loaded into the
+    model) to the solver status, termination condition and objective
+    values.
+
+    The variable and constraint entries of the solution are dropped
+    (as is the copy of the solution stored in model.solutions), and
+    the objective values are recorded from the model.  The problem
+    information (including the objective bounds in
+    results.problem.lower_bound and upper_bound) is kept.
+    """
+    from pyomo.core.base.objective import Objective
+    from pyomo.core.base.numvalue import value
+    from pyomo.opt.results import UndefinedData
+    model.solutions.clear(clear_symbol_maps=False)
+    if len(results.solution) == 0:
+        return
+    soln = results.solution(0)
+    results.solution.clear()
+    lean = results.solution.add()
+    lean.status = soln.status
+    for name in ('message', 'gap'):
+        val = getattr(soln, name)
+        if type(val) is not UndefinedData:
+            setattr(lean, name, val)
+    for obj in model.component_data_objects(Objective, active=True):
+        lean.objective[obj.name] = {'Value': value(obj)}
+
+
 class OptSolver(object):
     """A generic optimization solver"""
 
@@ -355,6 +384,8 @@ class OptSolver(object):
         # These are ephimeral options that can be set by the user during
         # the call to solve, but will be reset to defaults if not given
         self._load_solutions = True
+        self._vectorized_load = False
+        self._results_mode = 'full'
         self._select_index = 0
         self._report_timing = False
         self._suffixes = []
@@ -510,7 +541,24 @@ class OptSolver(object):
 
     def solve(self, *args, **kwds):
         """ Solve the problem """
+        steps = self._solve_steps(args, kwds)
+        next(steps)
+        try:
+            _status = self._apply_solver()
+        except:
+            steps.close()
+            raise
+        return steps.send(_status)
 
+    def _solve_steps(self, args, kwds):
+        """
+        A generator that performs the steps of solve() before and after
+        the solver is applied.  The generator yields once the problem
+        has been presolved, expects the status returned by
+        _apply_solver() to be sent to it, and then yields the results.
+        Leaving the call to _apply_solver() to the caller allows it to
+        be replaced (e.g., by an asynchronous implementation).
+        """
         self.available(exception_flag=True)
         #
         # If the inputs are models, then validate that they have been
@@ -549,6 +597,13 @@ class OptSolver(object):
                         if name not in kwds_suffixes:
                             kwds_suffixes.append(name)
 
+        if kwds.get('results_mode', 'full') == 'lean' and not (
+                isinstance(_model, _BlockData) and
+                kwds.get('load_solutions', True)):
+            raise ValueError(
+                "results_mode='lean' requires a (non-kernel) Pyomo model "
+                "and load_solutions=True")
+
         #
         # Handle ephemeral solvers options here. These
         # will override whatever is currently in the options
@@ -569,6 +624,11 @@ class OptSolver(object):
             initial_time = time.time()
 
             self._presolve(*args, **kwds)
+            if self._vectorized_load and not (
+                    self._load_solutions and isinstance(_model, _BlockData)):
+                # Solution vectors can only be loaded directly into
+                # (non-kernel) models
+                self._vectorized_load = False
 
             presolve_completion_time = time.time()
             if self._report_timing:
@@ -577,7 +637,7 @@ class OptSolver(object):
             if not _model is None:
                 self._initialize_callbacks(_model)
 
-            _status = self._apply_solver()
+            _status = yield
             if hasattr(self, '_transformation_data'):
                 del self._transformation_data
             if not hasattr(_status, 'rc'):
@@ -625,12 +685,21 @@ class OptSolver(object):
                         logger.error("No solution is available")
                 else:
                     if self._load_solutions:
-                        _model.solutions.load_from(
-                            result,
-                            select=self._select_index,
-                            default_variable_value=self._default_variable_value)
+                        if '_sol_vectors' in result.__dict__:
+                            _model.solutions.load_vectors(
+                                result,
+                                default_variable_value=self._default_variable_value)
+                            del result._sol_vectors
+                        else:
+                            _model.solutions.load_from(
+                                result,
+                                select=self._select_index,
+                                default_variable_value=self._default_variable_value)
                         result._smap_id = None
-                        result.solution.clear()
+                        if self._results_mode == 'lean':
+                            _lean_results(result, _model)
+                        else:
+                            result.solution.clear()
                     else:
                         result._smap = _model.solutions.symbol_map[self._smap_id]
                         _model.solutions.delete_symbol_map(self._smap_id)
@@ -646,7 +715,7 @@ class OptSolver(object):
             #
             self.options = orig_options
 
-        return result
+        yield result
 
     def _presolve(self, *args, **kwds):
 
@@ -654,12 +723,21 @@ class OptSolver(object):
         self._soln_file               = kwds.pop("solnfile", None)
         self._select_index            = kwds.pop("select", 0)
         self._load_solutions          = kwds.pop("load_solutions", True)
+        self._vectorized_load         = kwds.pop("vectorized_load", False)
+        self._results_mode            = kwds.pop("results_mode", 'full')
         self._timelimit               = kwds.pop("timelimit", None)
         self._report_timing           = kwds.pop("report_timing", False)
         self._tee                     = kwds.pop("tee", False)
         self._assert_available        = kwds.pop("available", True)
         self._suffixes                = kwds.pop("suffixes", [])
 
+        if self._results_mode not in ('full', 'lean'):
+            raise ValueError("Invalid results_mode '%s': expected one of "
+                             "'full' or 'lean'" % (self._results_mode,))
+        if self._results_mode == 'lean':
+            # Lean results are loaded straight into the model
+            self._vectorized_load = True
+
         self.available()
 
         if self._problem_format:
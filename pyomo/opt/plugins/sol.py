@@ -12,10 +12,14 @@
 # Class for reading an AMPL *.sol file
 #
 
+import itertools
 import re
+import warnings
 
 import pyutilib.misc
 
+from pyomo.common.compression import open_file
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.opt.base import results
 from pyomo.opt.base.formats import ResultsFormat
 from pyomo.opt import (SolverResults,
@@ -26,11 +30,63 @@ from pyomo.opt import (SolverResults,
 from six.moves import xrange
 
 
+class SolVectors(object):
+    """
+    The solution vectors read from a *.sol file.
+
+    Values are stored in the order of the NL file (i.e., the i-th
+    entry of ``primal`` is the value of variable "v<i>" in the
+    symbol map of the NL writer).  Variable and constraint suffixes
+    are stored in ``var_suffixes`` and ``con_suffixes``, which map
+    suffix names to an (indices, values) tuple of lists.
+    """
+
+    __slots__ = ('primal', 'dual', 'var_suffixes', 'con_suffixes')
+
+    def __init__(self, primal, dual=None):
+        self.primal = primal
+        self.dual = dual
+        self.var_suffixes = {}
+        self.con_suffixes = {}
+
+
+def _read_values(fin, n, vectorized=False):
+    """Read n lines containing a single real number from fin"""
+    if not n:
+        return []
+    if vectorized and numpy_available:
+        data = ''.join(itertools.islice(fin, n))
+        try:
+            with warnings.catch_warnings():
+                # NumPy warns (and stops) on values it cannot parse
+                warnings.simplefilter('ignore', DeprecationWarning)
+                ans = numpy.fromstring(data, dtype=float, sep=' ')
+        except ValueError:
+            ans = ()
+        if len(ans) == n:
+            return ans.tolist()
+        # Fall back on float() (e.g., for "Infinity") to parse (or
+        # generate the error message for) the values
+        lines = data.splitlines()
+        if len(lines) != n:
+            raise ValueError("expected %s values, but found %s"
+                             % (n, len(lines)))
+        return [float(line) for line in lines]
+    return [float(fin.readline()) for i in xrange(n)]
+
+
 @results.ReaderFactory.register(str(ResultsFormat.sol))
 class ResultsReader_sol(results.AbstractResultsReader):
     """
     Class that reads in a *.sol results file and generates a
     SolverResults object.
+
+    If the reader is called with vectorized=True, the variable values,
+    constraint duals and variable / constraint suffixes are not stored
+    in the solution (keyed by symbol name).  Instead, they are parsed
+    in bulk and stored (in the NL file order) in a SolVectors object
+    in the ``_sol_vectors`` attribute of the results, which is loaded
+    into the model by ModelSolutions.load_vectors().
     """
 
     def __init__(self, name=None):
@@ -38,22 +94,25 @@ class ResultsReader_sol(results.AbstractResultsReader):
         if not name is None:
             self.name = name
 
-    def __call__(self, filename, res=None, soln=None, suffixes=[]):
+    def __call__(self, filename, res=None, soln=None, suffixes=[],
+                 vectorized=False):
         """
         Parse a *.sol file
+
+        Compressed (gzip or zstd) files are detected automatically.
         """
         try:
-            with open(filename,"r") as f:
-                return self._load(f, res, soln, suffixes)
+            with open_file(filename,"r") as f:
+                return self._load(f, res, soln, suffixes, vectorized)
         except ValueError as e:
-            with open(filename,"r") as f:
+            with open_file(filename,"r") as f:
                 fdata = f.read()
             raise ValueError(
                 "Error reading '%s': %s.\n"
                 "SOL File Output:\n%s"
                 % (filename, str(e), fdata))
 
-    def _load(self, fin, res, soln, suffixes):
+    def _load(self, fin, res, soln, suffixes, vectorized=False):
 
         if res is None:
             res = SolverResults()
@@ -86,18 +145,8 @@ class ResultsReader_sol(results.AbstractResultsReader):
             raise ValueError("no Options line found")
         n = z[nopts + 3] # variables
         m = z[nopts + 1] # constraints
-        x = []
-        y = []
-        i = 0
-        while i < m:
-            line = fin.readline()
-            y.append(float(line))
-            i += 1
-        i = 0
-        while i < n:
-            line = fin.readline()
-            x.append(float(line))
-            i += 1
+        y = _read_values(fin, m, vectorized)
+        x = _read_values(fin, n, vectorized)
         objno = [0,0]
         line = fin.readline()
         if line:                    # WEH - when is this true?
@@ -167,14 +216,19 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.message = msg.strip()
             soln.message = res.solver.message.replace("\n","; ")
             soln_variable = soln.variable
-            i = 0
-            for var_value in x:
-                soln_variable["v"+str(i)] = {"Value" : var_value}
-                i = i + 1
             soln_constraint = soln.constraint
-            if any(re.match(suf,"dual") for suf in suffixes):
-                for i in xrange(0,len(y)):
-                    soln_constraint["c"+str(i)] = {"Dual" : y[i]}
+            load_duals = any(re.match(suf,"dual") for suf in suffixes)
+            if vectorized:
+                vectors = SolVectors(x, y if load_duals else None)
+                res._sol_vectors = vectors
+            else:
+                i = 0
+                for var_value in x:
+                    soln_variable["v"+str(i)] = {"Value" : var_value}
+                    i = i + 1
+                if load_duals:
+                    for i in xrange(0,len(y)):
+                        soln_constraint["c"+str(i)] = {"Dual" : y[i]}
 
             ### Read suffixes ###
             line = fin.readline()
@@ -209,7 +263,18 @@ class ResultsReader_sol(results.AbstractResultsReader):
                     # this information can be obtained from the solver documentation
                     for n in xrange(tabline):
                         fin.readline()
-                    if kind == 0: # Var
+                    if vectorized and kind in (0, 1):
+                        idx = []
+                        vals = []
+                        for cnt in xrange(nvalues):
+                            suf_line = fin.readline().split()
+                            idx.append(int(suf_line[0]))
+                            vals.append(convert_function(suf_line[1]))
+                        if kind == 0:
+                            vectors.var_suffixes[suffix_name] = (idx, vals)
+                        else:
+                            vectors.con_suffixes[suffix_name] = (idx, vals)
+                    elif kind == 0: # Var
                         for cnt in xrange(nvalues):
                             suf_line = fin.readline().split()
                             key = "v"+suf_line[0]
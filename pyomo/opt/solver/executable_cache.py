@@ -0,0 +1,155 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['ExecutableCache']
+
+import json
+import logging
+import os
+import tempfile
+
+from pyomo.common.config import PYOMO_CONFIG_DIR
+
+logger = logging.getLogger('pyomo.opt')
+
+
+def _from_json(val):
+    # JSON has no tuples: the cached values (e.g., version tuples) never
+    # contain lists, so convert the lists back
+    if isinstance(val, list):
+        return tuple(_from_json(v) for v in val)
+    return val
+
+
+class ExecutableCacheClass(object):
+    """A cache of information obtained by running solver executables.
+
+    Querying a solver executable (e.g., running ``ipopt -v`` to get the
+    solver version) requires starting a subprocess.  This cache records
+    the query results for each executable, both in memory and in a JSON
+    file (by default, ``solver_cache.json`` in the Pyomo configuration
+    directory) that is shared by all Python processes.  The cached
+    results for an executable are keyed by its (real) path, modification
+    time and size, so they are discarded when the executable changes.
+
+    Set ``persistent`` to False (or the ``PYOMO_SOLVER_CACHE``
+    environment variable to 0) to only cache results in memory.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.persistent = os.environ.get(
+            'PYOMO_SOLVER_CACHE', '1').strip().lower() \
+            not in ('0', 'false', 'no', 'off')
+        self._memo = {}
+
+    def cache_file(self):
+        """Return the name of the file where the cache is stored"""
+        if self.filename is not None:
+            return self.filename
+        return os.path.join(PYOMO_CONFIG_DIR, 'solver_cache.json')
+
+    def get(self, executable, query, compute, cacheable=None):
+        """Return the (cached) result of the query
+
+        If the result of ``query`` (a string identifying the
+        information) for the ``executable`` is not cached, it is
+        computed by calling ``compute()``.  The result is only cached
+        if ``cacheable(result)`` is True (by default, if the result is
+        not None), so failed queries are repeated.
+        """
+        try:
+            path = os.path.realpath(executable)
+            st = os.stat(path)
+        except (OSError, TypeError):
+            return compute()
+        stamp = [st.st_mtime, st.st_size]
+        key = (path, query)
+
+        entry = self._memo.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        if self.persistent:
+            record = self._load().get(path)
+            if record is not None and record.get('stamp') == stamp \
+               and query in record['queries']:
+                ans = _from_json(record['queries'][query])
+                self._memo[key] = (stamp, ans)
+                return ans
+
+        ans = compute()
+        if cacheable is None:
+            cache_ans = ans is not None
+        else:
+            cache_ans = cacheable(ans)
+        if not cache_ans:
+            return ans
+        self._memo[key] = (stamp, ans)
+        if self.persistent:
+            self._store(path, stamp, query, ans)
+        return ans
+
+    def clear(self, persistent=True):
+        """Clear the cache (including the cache file if persistent is
+        True)"""
+        self._memo = {}
+        if persistent:
+            fname = self.cache_file()
+            try:
+                if os.path.exists(fname):
+                    os.remove(fname)
+            except OSError:
+                logger.debug("Unable to remove the solver executable "
+                             "cache file '%s'" % (fname,))
+
+    def _load(self):
+        fname = self.cache_file()
+        if not os.path.exists(fname):
+            return {}
+        try:
+            with open(fname) as FILE:
+                data = json.load(FILE)
+        except (IOError, OSError, ValueError):
+            logger.debug("Ignoring the unreadable solver executable "
+                         "cache file '%s'" % (fname,))
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _store(self, path, stamp, query, ans):
+        fname = self.cache_file()
+        data = self._load()
+        record = data.get(path)
+        if record is None or record.get('stamp') != stamp:
+            record = data[path] = {'stamp': stamp, 'queries': {}}
+        record['queries'][query] = ans
+        #
+        # Write to a temporary file and then (atomically) replace the
+        # cache file, so that other processes never read a partial file
+        #
+        try:
+            dirname = os.path.dirname(fname)
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            fd, tmpname = tempfile.mkstemp(
+                prefix='.solver_cache', suffix='.json', dir=dirname)
+            try:
+                with os.fdopen(fd, 'w') as FILE:
+                    json.dump(data, FILE, indent=1, sort_keys=True)
+                getattr(os, 'replace', os.rename)(tmpname, fname)
+            except:
+                os.remove(tmpname)
+                raise
+        except (IOError, OSError, TypeError, ValueError):
+            logger.debug("Unable to update the solver executable cache "
+                         "file '%s'" % (fname,))
+
+ExecutableCache = ExecutableCacheClass()
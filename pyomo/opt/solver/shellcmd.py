@@ -12,8 +12,12 @@ __all__ = ['SystemCallSolver']
 
 import os
 import sys
+import errno
 import time
 import logging
+import threading
+
+import six
 
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Bunch
@@ -21,12 +25,47 @@ from pyomo.common.tempfiles import TempfileManager
 from pyutilib.subprocess import run
 
 import pyomo.common
-from pyomo.opt.base import ResultsFormat
+from pyomo.opt.base import ResultsFormat, ProblemFormat
 from pyomo.opt.base.solvers import OptSolver
+from pyomo.opt.solver.executable_cache import ExecutableCache
+from pyomo.opt.solver.solve_cache import SolveCache
 from pyomo.opt.results import SolverStatus, SolverResults
 
 logger = logging.getLogger('pyomo.opt')
 
+# The problem formats that can be written to a named pipe (the writers
+# for these formats generate the file in a single sequential pass)
+_fifo_problem_suffixes = {
+    ProblemFormat.nl: '.pyomo.nl',
+    ProblemFormat.cpxlp: '.pyomo.lp',
+    ProblemFormat.mps: '.pyomo.mps',
+}
+
+
+class _ProblemWriterThread(threading.Thread):
+    """Write a model to a named pipe while the solver reads it"""
+
+    def __init__(self, model, filename, format, capabilities, io_options):
+        threading.Thread.__init__(self, name='pyomo problem writer')
+        self.daemon = True
+        self.model = model
+        self.filename = filename
+        self.format = format
+        self.capabilities = capabilities
+        self.io_options = io_options
+        self.smap_id = None
+        self.error = None
+
+    def run(self):
+        try:
+            _, self.smap_id = self.model.write(
+                filename=self.filename,
+                format=self.format,
+                solver_capability=self.capabilities,
+                io_options=self.io_options)
+        except:
+            self.error = sys.exc_info()
+
 
 class SystemCallSolver(OptSolver):
     """ A generic command line solver """
@@ -46,6 +85,12 @@ class SystemCallSolver(OptSolver):
         # a solver plugin may not report execution time.
         self._last_solve_time = None
         self._define_signal_handlers = None
+        self._problem_fifo = False
+        self._problem_writer = None
+        self._solve_cache = None
+        self._solve_cache_key = None
+        self._solve_tempfiles = None
+        self._worker_pool = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -118,6 +163,47 @@ class SystemCallSolver(OptSolver):
             return False
         return True
 
+    def version(self):
+        """
+        Returns a 4-tuple describing the solver executable version.
+
+        The version reported by each solver executable is cached (see
+        pyomo.opt.solver.executable_cache), so the executable is not
+        run every time a solver object is created.
+        """
+        if self._version is None:
+            try:
+                exe = self.executable()
+            except NotImplementedError:
+                exe = None
+            if exe is None:
+                self._version = self._get_version()
+            else:
+                self._version = ExecutableCache.get(
+                    exe, type(self).__name__ + '.version', self._get_version)
+        return self._version
+
+    def solve_async(self, *args, **kwds):
+        """
+        Returns a coroutine that solves the problem (accepting the same
+        arguments as solve()) without blocking an asyncio event loop
+        while the solver executable runs.
+
+        The solver output is collected (and echoed, if tee=True) as it
+        is generated.  If the coroutine is cancelled (e.g., with
+        asyncio.wait_for), or if the timelimit expires, the solver
+        process is killed.  A solver object can only run one
+        asynchronous solve at a time: create a solver object for each
+        solve that should be in flight concurrently.
+
+        This method requires Python 3.5 or newer.
+        """
+        if sys.version_info[:2] < (3,5):
+            raise RuntimeError(
+                "SystemCallSolver.solve_async() requires Python 3.5+")
+        from pyomo.opt.solver.shellcmd_async import solve_async
+        return solve_async(self, *args, **kwds)
+
     def create_command_line(self,executable,problem_files):
         """
         Create the command line that is executed.
@@ -190,9 +276,23 @@ class SystemCallSolver(OptSolver):
         Peform presolves.
         """
         TempfileManager.push()
+        # The temporary files of this solve
+        self._solve_tempfiles = TempfileManager._tempfiles[-1]
 
         self._keepfiles = kwds.pop("keepfiles", False)
         self._define_signal_handlers = kwds.pop('use_signal_handling',None)
+        self._problem_fifo = kwds.pop("problem_fifo", False)
+        self._problem_writer = None
+        self._worker_pool = kwds.pop("worker_pool", None)
+        self._solve_cache = kwds.pop("solve_cache", None)
+        if self._solve_cache is True:
+            self._solve_cache = SolveCache
+        elif self._solve_cache is False:
+            self._solve_cache = None
+        if self._solve_cache is not None and self._problem_fifo:
+            raise ValueError(
+                "Solver (%s): solve_cache cannot be combined with "
+                "problem_fifo=True" % (self.name,))
 
         OptSolver._presolve(self, *args, **kwds)
 
@@ -220,6 +320,93 @@ class SystemCallSolver(OptSolver):
            os.path.exists(self._soln_file):
             os.remove(self._soln_file)
 
+    def _convert_problem(self,
+                         args,
+                         problem_format,
+                         valid_problem_formats,
+                         **kwds):
+        if not self._problem_fifo:
+            return OptSolver._convert_problem(self,
+                                              args,
+                                              problem_format,
+                                              valid_problem_formats,
+                                              **kwds)
+        #
+        # Write the problem to a named pipe in a separate thread, so
+        # that the solver can read the problem while it is generated.
+        # This is only useful for solvers that read the problem file
+        # in a single sequential pass.
+        #
+        from pyomo.core.base.block import _BlockData
+        if len(args) != 1 or not isinstance(args[0], _BlockData):
+            raise ValueError(
+                "Solver (%s): problem_fifo=True is only supported when "
+                "solving a single Pyomo model" % (self.name,))
+        if problem_format not in _fifo_problem_suffixes:
+            raise ValueError(
+                "Solver (%s): problem_fifo=True is not supported for "
+                "problem format '%s'" % (self.name, problem_format))
+        if kwds.get('compression', None) not in (None, 'none'):
+            raise ValueError(
+                "Solver (%s): problem_fifo=True cannot be combined with "
+                "compressed problem files" % (self.name,))
+        problem_filename = TempfileManager.create_fifo(
+            suffix=_fifo_problem_suffixes[problem_format])
+        self._problem_writer = _ProblemWriterThread(
+            args[0], problem_filename, problem_format,
+            self.has_capability, kwds)
+        self._problem_writer.start()
+        # The symbol map is available once the writer finishes (see
+        # _finish_problem_writer)
+        return (problem_filename,), problem_format, None
+
+    def _finish_problem_writer(self, rc):
+        """Wait for the thread writing the problem to a named pipe
+
+        Errors raised by the writer are re-raised if the solver
+        succeeded (returned rc=0).  Otherwise, the (more useful) solver
+        error is reported from the return code.
+        """
+        writer = self._problem_writer
+        if writer is None:
+            return
+        self._problem_writer = None
+        if writer.is_alive():
+            # The solver exited without reading the whole problem (for
+            # example, it failed to start).  The writer may not have
+            # opened the pipe yet, so hold a (nonblocking) read end
+            # open until it has: closing the read end then releases
+            # the writer (which fails with a broken pipe).
+            self._release_problem_writer(writer)
+        writer.join()
+        if writer.error is not None:
+            if rc == 0:
+                six.reraise(*writer.error)
+            logger.debug("Writing problem to named pipe '%s' failed: %s"
+                         % (writer.filename, writer.error[1]))
+        self._smap_id = writer.smap_id
+
+    @staticmethod
+    def _release_problem_writer(writer):
+        try:
+            fd = os.open(writer.filename, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            return
+        try:
+            while writer.is_alive():
+                # Reading returns EOF until a writer opens the pipe, and
+                # then either data or EAGAIN (an empty pipe)
+                try:
+                    if os.read(fd, 4096):
+                        break
+                except OSError as e:
+                    if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                        break
+                    raise
+                writer.join(0.01)
+        finally:
+            os.close(fd)
+
     def _apply_solver(self):
         if pyomo.common.Executable('timer'):
             self._timer = pyomo.common.Executable('timer').path()
@@ -240,7 +427,24 @@ class SystemCallSolver(OptSolver):
                 print("Solver problem files: %s" % str(self._problem_files))
 
         sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
+        if self._solve_cache is not None:
+            cached = self._solve_cache.load_solve(self)
+            if cached is not None:
+                self._rc, self._log = cached
+                return Bunch(rc=self._rc, log=self._log)
+        try:
+            status = None
+            if self._worker_pool is not None:
+                status = self._worker_pool.execute(self, self._command)
+            if status is None:
+                status = self._execute_command(self._command)
+            self._rc, self._log = status
+        except:
+            self._finish_problem_writer(rc=None)
+            raise
+        self._finish_problem_writer(rc=self._rc)
+        if self._solve_cache is not None:
+            self._solve_cache.record_solve(self)
         sys.stdout.flush()
         return Bunch(rc=self._rc, log=self._log)
 
@@ -286,6 +490,27 @@ class SystemCallSolver(OptSolver):
 
         return results
 
+    def _worker_session(self, command):
+        """
+        Return the interactive solver session that solves the problem
+        of the command, or None if the solver (or this command) cannot
+        be run by a SolverWorkerPool (the default).
+
+        The session is a tuple (cmd, setup, lines), where cmd starts
+        the solver process, setup is the list of input lines that
+        configure a new process, and lines is the list of input lines
+        that solve the problem.  A process is only reused for solves
+        with the same cmd and setup.
+        """
+        return None
+
+    def _worker_marker_line(self, marker):
+        """
+        Return the input line that makes an interactive solver session
+        print the marker (once the previous input has been processed).
+        """
+        raise NotImplementedError
+
     def _execute_command(self,command):
         """
         Execute the command
@@ -338,15 +563,23 @@ class SystemCallSolver(OptSolver):
             # information, but perhaps also in a results file.
             # For now, if there is a single solution, then we assume that
             # the results file is going to add more data to it.
+            kwds = {}
+            if self._vectorized_load and \
+               self._results_format == ResultsFormat.sol:
+                # Bypass the (symbol-keyed) solution dictionaries
+                # and load the solution vectors directly
+                kwds['vectorized'] = True
             if len(results.solution) == 1:
                 results = self._results_reader(self._results_file,
                                                res=results,
                                                soln=results.solution(0),
-                                               suffixes=self._suffixes)
+                                               suffixes=self._suffixes,
+                                               **kwds)
             else:
                 results = self._results_reader(self._results_file,
                                                res=results,
-                                               suffixes=self._suffixes)
+                                               suffixes=self._suffixes,
+                                               **kwds)
             results_reader_completion_time = time.time()
             if self._report_timing is True:
                 print("      %6.2f seconds required to read solution file" % (results_reader_completion_time - log_file_completion_time))
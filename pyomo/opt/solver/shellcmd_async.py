@@ -0,0 +1,187 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# The asyncio implementation of SystemCallSolver.solve_async().  This
+# module uses Python 3.5+ syntax, so it is only imported (by
+# SystemCallSolver.solve_async) under Python 3.
+#
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from asyncio.subprocess import PIPE, STDOUT, DEVNULL
+
+from pyutilib.misc import quote_split
+
+from pyomo.common.collections import Bunch
+from pyomo.common.errors import ApplicationError
+from pyomo.common.tempfiles import TempfileManager
+
+logger = logging.getLogger('pyomo.opt')
+
+
+async def solve_async(solver, *args, **kwds):
+    """Solve the problem with a SystemCallSolver, awaiting (instead of
+    blocking on) the solver subprocess.
+
+    The problem is written and the results are loaded synchronously
+    (exactly as in solve()).  If the coroutine is cancelled (or the
+    timelimit expires), the solver process is killed.
+    """
+    from pyomo.opt.solver.shellcmd import SystemCallSolver
+    if getattr(solver, '_async_solve_in_progress', False):
+        raise RuntimeError(
+            "Solver '%s' is already running an asynchronous solve.  "
+            "Use a separate solver object for each concurrent solve."
+            % (solver.name,))
+    solver._async_solve_in_progress = True
+    try:
+        steps = solver._solve_steps(args, kwds)
+        next(steps)
+        #
+        # _presolve() pushed a TempfileManager context for this solve.
+        # The TempfileManager context stack is shared by all the solves
+        # that the event loop interleaves, so we detach the context
+        # while the solver runs and restore it just before _postsolve()
+        # pops it.
+        #
+        tempfiles = TempfileManager._tempfiles.pop()
+        try:
+            if type(solver)._execute_command is \
+               SystemCallSolver._execute_command and \
+               solver._worker_pool is None:
+                _status = await _apply_solver(solver)
+            else:
+                # The plugin customizes the command execution (or the
+                # command is run by a worker pool), so we (blocking) run
+                # it in a separate thread.
+                _status = await asyncio.get_event_loop().run_in_executor(
+                    None, solver._apply_solver)
+        except BaseException:
+            steps.close()
+            TempfileManager._tempfiles.append(tempfiles)
+            TempfileManager.pop(remove=not solver._keepfiles)
+            raise
+        TempfileManager._tempfiles.append(tempfiles)
+        return steps.send(_status)
+    finally:
+        solver._async_solve_in_progress = False
+
+
+async def _apply_solver(solver):
+    """The asyncio version of SystemCallSolver._apply_solver()"""
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running %s", solver._command.cmd)
+
+    if solver._keepfiles:
+        if solver._log_file is not None:
+            print("Solver log file: '%s'" % solver._log_file)
+        if solver._soln_file is not None:
+            print("Solver solution file: '%s'" % solver._soln_file)
+        if solver._problem_files is not []:
+            print("Solver problem files: %s" % str(solver._problem_files))
+
+    sys.stdout.flush()
+    if solver._solve_cache is not None:
+        cached = solver._solve_cache.load_solve(solver)
+        if cached is not None:
+            solver._rc, solver._log = cached
+            return Bunch(rc=solver._rc, log=solver._log)
+    try:
+        solver._rc, solver._log = await _execute_command(
+            solver, solver._command)
+    except BaseException:
+        solver._finish_problem_writer(rc=None)
+        raise
+    solver._finish_problem_writer(rc=solver._rc)
+    if solver._solve_cache is not None:
+        solver._solve_cache.record_solve(solver)
+    sys.stdout.flush()
+    return Bunch(rc=solver._rc, log=solver._log)
+
+
+async def _execute_command(solver, command):
+    """The asyncio version of SystemCallSolver._execute_command()"""
+    start_time = time.time()
+
+    cmd = command.cmd
+    if type(cmd) not in (list, tuple):
+        cmd = quote_split(cmd.strip())
+    _input = command.script if 'script' in command else None
+    env = command.env
+    if env is None:
+        env = os.environ.copy()
+    timelimit = solver._timelimit
+    if timelimit is not None:
+        timelimit += max(1, 0.01*timelimit)
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=DEVNULL if _input is None else PIPE,
+            stdout=PIPE,
+            stderr=STDOUT,
+            env=env)
+    except OSError:
+        err = sys.exc_info()[1]
+        msg = 'Could not execute the command: %s\tError message: %s'
+        raise ApplicationError(msg % (command.cmd, err))
+
+    log = []
+    try:
+        await asyncio.wait_for(
+            _communicate(process, _input, log, solver._tee), timelimit)
+        rc = process.returncode
+    except asyncio.TimeoutError:
+        # Match pyutilib.subprocess.run(): kill the process and return
+        # an error return code
+        await _kill(process)
+        rc = -1
+    except BaseException:
+        # Most notably, asyncio.CancelledError
+        await _kill(process)
+        raise
+
+    solver._last_solve_time = time.time() - start_time
+    return [rc, ''.join(log)]
+
+
+async def _communicate(process, _input, log, tee):
+    """Send the input to the process, and collect (and optionally
+    echo) its output as it is generated"""
+    if _input is not None:
+        if not isinstance(_input, bytes):
+            _input = _input.encode()
+        process.stdin.write(_input)
+        await process.stdin.drain()
+        process.stdin.close()
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            break
+        line = line.decode(errors='replace')
+        log.append(line)
+        if tee:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    await process.wait()
+
+
+async def _kill(process):
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    # Shield the wait so that the process is reaped even if the task
+    # is cancelled again
+    await asyncio.shield(process.wait())
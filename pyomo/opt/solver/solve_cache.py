@@ -0,0 +1,245 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolveCache']
+
+import base64
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from six import iteritems, string_types
+
+logger = logging.getLogger('pyomo.opt')
+
+
+class SolveCacheClass(object):
+    """A cache of the output of shell solvers, keyed by the problem
+    that was solved.
+
+    The key of a solve is a hash of the written problem files (and any
+    other input files of the solve, such as warm start or options
+    files), the solver executable, options and command line.  The
+    cached entry holds the solver return code and log and the
+    contents of the files that the solver generated (e.g., the
+    solution file).  On a hit, the solver is not run: the files are
+    restored, and the results are read (and loaded into the model)
+    exactly as if the solver had generated them.
+
+    Entries are kept in a bounded (least recently used) in-memory
+    cache and, if ``directory`` is set, in a bounded on-disk store
+    that is shared by all Python processes.  Only successful solves
+    (return code 0) are cached.
+    """
+
+    def __init__(self, maxsize=128, directory=None, max_disk_entries=1024):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memo = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._memo)
+
+    def clear(self, persistent=True):
+        """Clear the cache (including the on-disk store if persistent is
+        True)"""
+        self._memo.clear()
+        self.hits = self.misses = 0
+        if persistent and self.directory is not None \
+           and os.path.isdir(self.directory):
+            for fname in os.listdir(self.directory):
+                if fname.endswith('.solve.json'):
+                    os.remove(os.path.join(self.directory, fname))
+
+    def get(self, key):
+        """Return the cached entry for key (or None)"""
+        entry = self._memo.pop(key, None)
+        if entry is None:
+            entry = self._load(key)
+            if entry is None:
+                self.misses += 1
+                return None
+        self._memo[key] = entry
+        self._trim()
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """Store the entry for key"""
+        self._memo.pop(key, None)
+        self._memo[key] = entry
+        self._trim()
+        if self.directory is not None:
+            self._store(key, entry)
+
+    def _trim(self):
+        while len(self._memo) > max(self.maxsize, 0):
+            self._memo.popitem(last=False)
+
+    def _entry_file(self, key):
+        return os.path.join(self.directory, key + '.solve.json')
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        fname = self._entry_file(key)
+        if not os.path.exists(fname):
+            return None
+        try:
+            with open(fname) as FILE:
+                entry = json.load(FILE)
+            # Update the modification time (used to find the least
+            # recently used entries)
+            os.utime(fname, None)
+        except (IOError, OSError, ValueError):
+            logger.debug("Ignoring the unreadable solve cache entry '%s'"
+                         % (fname,))
+            return None
+        return entry
+
+    def _store(self, key, entry):
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, tmpname = tempfile.mkstemp(
+                prefix='.solve', suffix='.json', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'w') as FILE:
+                    json.dump(entry, FILE)
+                getattr(os, 'replace', os.rename)(
+                    tmpname, self._entry_file(key))
+            except:
+                os.remove(tmpname)
+                raise
+            entries = [os.path.join(self.directory, fname)
+                       for fname in os.listdir(self.directory)
+                       if fname.endswith('.solve.json')]
+            if len(entries) > self.max_disk_entries:
+                entries.sort(key=os.path.getmtime)
+                for fname in entries[:len(entries)-self.max_disk_entries]:
+                    os.remove(fname)
+        except (IOError, OSError, TypeError, ValueError):
+            logger.debug("Unable to update the solve cache in '%s'"
+                         % (self.directory,))
+
+    #
+    # The interface used by SystemCallSolver
+    #
+
+    def load_solve(self, solver):
+        """Restore the output of a cached solve for the problem
+        prepared by the solver's _presolve().  Returns the status
+        (rc, log) of the cached solve, or None if the problem is not
+        cached."""
+        files, inputs, key = _solve_key(solver)
+        solver._solve_cache_key = (files, inputs, key)
+        entry = self.get(key)
+        if entry is None:
+            return None
+        for i, data in iteritems(entry['files']):
+            with open(files[int(i)], 'wb') as FILE:
+                FILE.write(base64.b64decode(data.encode('ascii')))
+        if solver._tee and entry['log']:
+            print(entry['log'])
+        solver._last_solve_time = 0.
+        return entry['rc'], entry['log']
+
+    def record_solve(self, solver):
+        """Cache the output of the solve (if it succeeded)"""
+        files, inputs, key = solver._solve_cache_key
+        solver._solve_cache_key = None
+        if solver._rc != 0:
+            return
+        outputs = {}
+        for i, fname in enumerate(files):
+            if i not in inputs and os.path.isfile(fname):
+                with open(fname, 'rb') as FILE:
+                    outputs[str(i)] = base64.b64encode(
+                        FILE.read()).decode('ascii')
+        self.put(key, {'rc': solver._rc, 'log': solver._log,
+                       'files': outputs})
+
+SolveCache = SolveCacheClass()
+
+
+def _solve_files(solver):
+    """Return the (ordered) list of files used by the solve"""
+    files = []
+    for fname in list(solver._problem_files) + [
+            solver._soln_file, solver._results_file, solver._log_file,
+            getattr(solver, '_warm_start_file_name', None)] + \
+            list(solver._solve_tempfiles or ()):
+        if isinstance(fname, string_types) and fname not in files:
+            files.append(fname)
+    return files
+
+
+def _solve_key(solver):
+    """Return the files used by the solve, the (positions of the) input
+    files and the hash of the problem and solver inputs.
+
+    The names of the files (which are usually temporary files) are
+    replaced by their position in the list of files, so that the hash
+    only depends on their contents.
+    """
+    files = _solve_files(solver)
+    by_length = sorted(enumerate(files), key=lambda x: -len(x[1]))
+    def _anonymize(val):
+        val = str(val)
+        for i, fname in by_length:
+            val = val.replace(fname, '<file %d>' % (i,))
+        return val
+
+    h = hashlib.sha256()
+    def _update(val):
+        h.update(_anonymize(val).encode('utf-8'))
+        h.update(b'\0')
+
+    _update(type(solver).__name__)
+    exe = solver.executable()
+    if exe is not None:
+        exe = os.path.realpath(exe)
+        try:
+            st = os.stat(exe)
+            _update((exe, st.st_mtime, st.st_size))
+        except OSError:
+            _update(exe)
+    command = solver._command
+    cmd = command.cmd
+    if isinstance(cmd, string_types):
+        _update(cmd)
+    else:
+        _update(' '.join(str(x) for x in cmd))
+    _update(command.script if 'script' in command else None)
+    if command.env is not None:
+        # Only the variables set by the solver plugin matter
+        _update(sorted((k, v) for k, v in iteritems(command.env)
+                       if os.environ.get(k) != v))
+    _update(sorted((str(k), repr(v)) for k, v in iteritems(solver.options)))
+    _update(solver._timelimit)
+    #
+    # The contents of the input files
+    #
+    inputs = set()
+    for i, fname in enumerate(files):
+        if not os.path.isfile(fname):
+            continue
+        inputs.add(i)
+        _update(i)
+        with open(fname, 'rb') as FILE:
+            for chunk in iter(lambda: FILE.read(1 << 20), b''):
+                h.update(chunk)
+    return files, inputs, h.hexdigest()
@@ -0,0 +1,241 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolverWorkerPool']
+
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+from six.moves import queue
+
+from pyomo.common.errors import ApplicationError
+
+
+class SolverWorker(object):
+    """A long-lived (interactive) solver process.
+
+    The worker solves problems by writing solver commands to the
+    process stdin.  The end of the output for each problem is detected
+    by sending a command that makes the solver print a unique marker.
+    """
+
+    def __init__(self, key, cmd, setup, env=None):
+        self.key = key
+        self.solves = 0
+        self._lines = queue.Queue()
+        try:
+            self.process = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, env=env,
+                universal_newlines=True, bufsize=1)
+        except OSError:
+            err = sys.exc_info()[1]
+            raise ApplicationError(
+                "Could not start the solver worker: %s\tError message: %s"
+                % (cmd, err))
+        self._reader = threading.Thread(target=self._read_output)
+        self._reader.daemon = True
+        self._reader.start()
+        if setup:
+            self._write(setup)
+
+    def _read_output(self):
+        for line in iter(self.process.stdout.readline, ''):
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def _write(self, lines):
+        try:
+            self.process.stdin.write(''.join(line + '\n' for line in lines))
+            self.process.stdin.flush()
+        except (IOError, OSError):
+            # The process died (this is detected when reading the output)
+            pass
+
+    def run(self, lines, marker_line, marker, timelimit=None, tee=False):
+        """Send the lines (followed by the marker_line) to the solver,
+        and return the output up to the marker
+
+        Returns the tuple (rc, log).  A nonzero rc indicates that the
+        process exited (rc is the process return code) or that the
+        timelimit expired (rc is -1); the worker is unusable in both
+        cases.
+        """
+        self.solves += 1
+        log = []
+        self._write(list(lines) + [marker_line])
+        deadline = None if timelimit is None else time.time() + timelimit
+        while True:
+            timeout = None if deadline is None \
+                else max(deadline - time.time(), 0)
+            try:
+                line = self._lines.get(timeout=timeout)
+            except queue.Empty:
+                self.close(kill=True)
+                return -1, ''.join(log)
+            if line is None:
+                self.process.wait()
+                return self.process.returncode or 1, ''.join(log)
+            if marker in line:
+                return 0, ''.join(log)
+            log.append(line)
+            if tee:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+
+    def close(self, kill=False):
+        """Stop the solver process"""
+        if not kill:
+            # Closing its input should make the solver exit
+            try:
+                self.process.stdin.close()
+            except (IOError, OSError):
+                pass
+            deadline = time.time() + 1
+            while self.alive() and time.time() < deadline:
+                time.sleep(0.01)
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+        self._reader.join()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except (IOError, OSError):
+                pass
+
+
+class SolverWorkerPool(object):
+    """A pool of long-lived solver processes for shell solvers.
+
+    Starting a solver process (and checking out a license) can take
+    much longer than solving a small problem.  Solvers that can read
+    several problems in one (interactive) session can be run by a
+    worker pool instead::
+
+        pool = SolverWorkerPool(size=2)
+        for model in models:
+            opt.solve(model, worker_pool=pool)
+        pool.close()
+
+    The pool keeps up to ``size`` solver processes alive.  A worker is
+    only reused by solves with the same solver executable and session
+    settings (e.g., solver options), is discarded if its process exits
+    or the solve timelimit expires, and is replaced after
+    ``max_solves`` solves.  Solves that the solver interface cannot run
+    in a worker (see SystemCallSolver._worker_session) are run in a
+    new process, as usual.
+    """
+
+    def __init__(self, size=1, max_solves=1000):
+        self.size = size
+        self.max_solves = max_solves
+        self._idle = []
+        self._busy = 0
+        self._lock = threading.Condition()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        self.close()
+
+    def num_workers(self):
+        """The number of live worker processes"""
+        with self._lock:
+            return len(self._idle) + self._busy
+
+    def close(self):
+        """Stop all (idle) workers"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+    def execute(self, solver, command):
+        """Run the command with a pooled worker
+
+        Returns (rc, log), or None if the solver cannot run the command
+        in a worker.
+        """
+        session = solver._worker_session(command)
+        if session is None:
+            return None
+        cmd, setup, lines = session
+        key = (tuple(cmd), tuple(setup))
+        worker = self._acquire(key, cmd, setup, command.env)
+        marker = 'pyomo_worker_' + uuid.uuid4().hex
+        start_time = time.time()
+        timelimit = solver._timelimit
+        if timelimit is not None:
+            timelimit += max(1, 0.01*timelimit)
+        try:
+            rc, log = worker.run(lines, solver._worker_marker_line(marker),
+                                 marker, timelimit, solver._tee)
+        except:
+            self._release(worker, discard=True)
+            raise
+        solver._last_solve_time = time.time() - start_time
+        self._release(worker, discard=rc != 0)
+        return rc, log
+
+    def _acquire(self, key, cmd, setup, env):
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The solver worker pool is closed")
+                for i, worker in enumerate(self._idle):
+                    if worker.key == key:
+                        del self._idle[i]
+                        if worker.alive():
+                            self._busy += 1
+                            return worker
+                        # The process died while idle
+                        worker.close()
+                        break
+                else:
+                    if len(self._idle) + self._busy < self.size:
+                        break
+                    if self._idle:
+                        # Replace the least recently used idle worker
+                        self._idle.pop(0).close()
+                        break
+                    self._lock.wait()
+            self._busy += 1
+        try:
+            worker = SolverWorker(key, cmd, setup, env)
+        except:
+            with self._lock:
+                self._busy -= 1
+                self._lock.notify()
+            raise
+        return worker
+
+    def _release(self, worker, discard=False):
+        if discard or worker.solves >= self.max_solves \
+           or not worker.alive():
+            worker.close(kill=True)
+            worker = None
+        with self._lock:
+            self._busy -= 1
+            if worker is not None:
+                if self._closed:
+                    worker.close()
+                else:
+                    self._idle.append(worker)
+            self._lock.notify()
@@ -11,6 +11,7 @@
 # Unit Tests for pyomo.opt.base.OS
 #
 
+import gzip
 import os
 from os.path import abspath, dirname
 pyomodir = dirname(abspath(__file__))+os.sep+".."+os.sep+".."+os.sep
@@ -51,6 +52,48 @@ class Test(unittest.TestCase):
             soln.write(filename=currdir+"factory.txt", format='json')
             self.assertMatchesJsonBaseline(currdir+"factory.txt", currdir+"test4_sol.jsn")
 
+    def test_compressed(self):
+        fname = TempfileManager.create_tempfile(suffix='.sol.gz')
+        with open(currdir+"test4_sol.sol", 'rb') as src:
+            with gzip.open(fname, 'wb') as dest:
+                dest.write(src.read())
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            soln = reader(fname, suffixes=["dual"])
+            soln.write(filename=currdir+"factory.txt", format='json')
+            self.assertMatchesJsonBaseline(currdir+"factory.txt", currdir+"test4_sol.jsn")
+
+    def test_vectorized(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            soln = reader(currdir+"test4_sol.sol", suffixes=["dual"])
+            vsoln = reader(currdir+"test4_sol.sol", suffixes=["dual"],
+                           vectorized=True)
+        self.assertEqual(len(vsoln.solution(0).variable), 0)
+        self.assertEqual(len(vsoln.solution(0).constraint), 0)
+        self.assertEqual(vsoln.solver.termination_condition,
+                         soln.solver.termination_condition)
+        vectors = vsoln._sol_vectors
+        self.assertEqual(
+            vectors.primal,
+            [soln.solution(0).variable['v%d' % i]['Value']
+             for i in range(len(vectors.primal))])
+        self.assertEqual(
+            vectors.dual,
+            [soln.solution(0).constraint['c%d' % i]['Dual']
+             for i in range(len(vectors.dual))])
+
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            vsoln = reader(currdir+"test4_sol.sol", vectorized=True)
+        self.assertIsNone(vsoln._sol_vectors.dual)
+
+    def test_vectorized_suffixes(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            result = reader(currdir+"iis_no_variable_values.sol",
+                            suffixes=["iis"], vectorized=True)
+        vectors = result._sol_vectors
+        self.assertEqual(vectors.primal, [])
+        self.assertEqual(vectors.var_suffixes, {'iis': ([0, 1], [1, 1])})
+        self.assertEqual(vectors.con_suffixes, {'iis': ([0], [4])})
+
     def test_infeasible1(self):
         with pyomo.opt.ReaderFactory("sol") as reader:
             if reader is None:
@@ -0,0 +1,148 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for pyomo.opt.solver.executable_cache
+#
+
+import json
+import os
+import shutil
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.executable_cache import (ExecutableCache,
+                                               ExecutableCacheClass)
+
+
+class MockVersionSolver(SystemCallSolver):
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'mock_version'
+        SystemCallSolver.__init__(self, **kwds)
+        self.queries = 0
+
+    def _default_executable(self):
+        return self.exe
+
+    def _get_version(self):
+        self.queries += 1
+        return (1, 2, 3, 0)
+
+
+class TestExecutableCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.exe = os.path.join(self.tmpdir, 'solver')
+        with open(self.exe, 'w') as FILE:
+            FILE.write('#!/bin/sh\n')
+        self.cache_file = os.path.join(self.tmpdir, 'cache', 'cache.json')
+        self.queries = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _query(self):
+        self.queries += 1
+        return (5, 1, 0, 0)
+
+    def test_get(self):
+        cache = ExecutableCacheClass(self.cache_file)
+        cache.persistent = True
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 1)
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 1)
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        # A new cache (e.g., in another process) uses the cache file
+        cache = ExecutableCacheClass(self.cache_file)
+        cache.persistent = True
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 1)
+        # ... but queries are cached separately
+        self.assertEqual(cache.get(self.exe, 'other', lambda: 'x'), 'x')
+        with open(self.cache_file) as FILE:
+            data = json.load(FILE)
+        self.assertEqual(
+            sorted(data[os.path.realpath(self.exe)]['queries']),
+            ['other', 'v'])
+
+        # Changing the executable invalidates the cached results
+        with open(self.exe, 'a') as FILE:
+            FILE.write('exit 0\n')
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 2)
+
+        cache.clear()
+        self.assertFalse(os.path.exists(self.cache_file))
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 3)
+
+    def test_not_cacheable(self):
+        cache = ExecutableCacheClass(self.cache_file)
+        cache.persistent = False
+        self.assertIsNone(cache.get(self.exe, 'v', lambda: None))
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 1)
+
+        ans = cache.get(self.exe, 'w', self._query,
+                        cacheable=lambda ans: False)
+        self.assertEqual(ans, (5,1,0,0))
+        cache.get(self.exe, 'w', self._query, cacheable=lambda ans: False)
+        self.assertEqual(self.queries, 3)
+        # Results are not written for non-persistent caches
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_missing_executable(self):
+        cache = ExecutableCacheClass(self.cache_file)
+        cache.persistent = True
+        exe = os.path.join(self.tmpdir, 'missing')
+        cache.get(exe, 'v', self._query)
+        cache.get(exe, 'v', self._query)
+        self.assertEqual(self.queries, 2)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_corrupt_cache_file(self):
+        os.mkdir(os.path.dirname(self.cache_file))
+        with open(self.cache_file, 'w') as FILE:
+            FILE.write('{not json')
+        cache = ExecutableCacheClass(self.cache_file)
+        cache.persistent = True
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        cache = ExecutableCacheClass(self.cache_file)
+        cache.persistent = True
+        self.assertEqual(cache.get(self.exe, 'v', self._query), (5,1,0,0))
+        self.assertEqual(self.queries, 1)
+
+    def test_solver_version(self):
+        orig = ExecutableCache.filename, ExecutableCache.persistent
+        ExecutableCache.filename = self.cache_file
+        ExecutableCache.persistent = True
+        ExecutableCache.clear(persistent=False)
+        try:
+            opt = MockVersionSolver()
+            opt.exe = self.exe
+            self.assertEqual(opt.version(), (1,2,3,0))
+            self.assertEqual(opt.queries, 1)
+            # A new solver object does not query the executable
+            opt = MockVersionSolver()
+            opt.exe = self.exe
+            self.assertEqual(opt.version(), (1,2,3,0))
+            self.assertEqual(opt.queries, 0)
+        finally:
+            ExecutableCache.clear(persistent=False)
+            ExecutableCache.filename, ExecutableCache.persistent = orig
+
+
+if __name__ == "__main__":
+    unittest.main()
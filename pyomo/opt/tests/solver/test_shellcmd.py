@@ -12,13 +12,29 @@
 #
 
 import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
 
 import pyutilib.th as unittest
+from pyomo.common.collections import Bunch
 from pyomo.common.errors import ApplicationError
+from pyomo.common.tempfiles import TempfileManager
 
-from pyomo.opt.base import UnknownSolver
+from pyomo.opt.base import UnknownSolver, ProblemFormat, ResultsFormat
 from pyomo.opt.base.solvers import SolverFactory
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.solve_cache import SolveCacheClass
+from pyomo.opt.solver.worker_pool import SolverWorkerPool
+
+try:
+    import asyncio
+    asyncio_available = sys.version_info[:2] >= (3,5)
+except ImportError:
+    asyncio_available = False
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 exedirname = "exe_dir"
@@ -284,5 +300,448 @@ class TestSystemCallSolver(unittest.TestCase):
                 self.assertEqual(opt._user_executable, isexe_abspath)
                 self.assertEqual(opt.executable(), isexe_abspath)
 
+
+# A "solver" that writes a *.sol file with v<i> = i/10 and a dual of
+# 10+i for c<i> for the NL file it is given (after sleeping for the
+# specified number of seconds)
+_mock_solver_script = """
+import sys, time
+nlfile = sys.argv[1]
+print('Solving ' + nlfile)
+sys.stdout.flush()
+time.sleep(float(sys.argv[2]))
+if sys.argv[3] == 'fail':
+    sys.exit(1)
+with open(nlfile) as FILE:
+    lines = FILE.read().splitlines()
+n, m = [int(x) for x in lines[1].split()[:2]]
+with open(nlfile[:-3] + '.sol', 'w') as FILE:
+    FILE.write('Mock solver\\n\\nOptions\\n3\\n1\\n1\\n0\\n'
+               '%s\\n%s\\n%s\\n%s\\n' % (m, m, n, n))
+    FILE.write(''.join('%s\\n' % (10+i,) for i in range(m)))
+    FILE.write(''.join('%s\\n' % (i/10.,) for i in range(n)))
+    FILE.write('objno 0 0\\n')
+"""
+
+class MockSolSystemCallSolver(SystemCallSolver):
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'mock_sol_shell'
+        SystemCallSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.nl]
+        self._problem_format = ProblemFormat.nl
+        self._results_format = ResultsFormat.sol
+        self._capabilities.linear = True
+
+    def _default_executable(self):
+        return sys.executable
+
+    def create_command_line(self, executable, problem_files):
+        self._soln_file = problem_files[0][:-3] + '.sol'
+        self._results_file = self._soln_file
+        cmd = [executable, '-c', _mock_solver_script, problem_files[0],
+               str(self.options.get('sleep', 0)),
+               str(self.options.get('mode', 'solve'))]
+        return Bunch(cmd=cmd, log_file=self._log_file, env=None)
+
+
+def _make_model(n):
+    from pyomo.environ import ConcreteModel, Var, Constraint, Objective
+    m = ConcreteModel()
+    m.x = Var(range(n))
+    m.c = Constraint(range(n), rule=lambda m, i: m.x[i] >= i)
+    m.o = Objective(expr=sum(m.x.values()))
+    return m
+
+
+@unittest.skipIf(not asyncio_available, "asyncio (Python 3.5+) not available")
+class TestSolveAsync(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pyomo.environ
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.tempfile_contexts = len(TempfileManager._tempfiles)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        self.assertEqual(len(TempfileManager._tempfiles),
+                         self.tempfile_contexts)
+
+    def test_solve(self):
+        m = _make_model(3)
+        opt = MockSolSystemCallSolver()
+        results = opt.solve(m)
+        self.assertAlmostEqual(m.x[2].value, 0.2)
+        self.assertEqual(str(results.solver.termination_condition),
+                         'optimal')
+
+    def test_solve_async(self):
+        models = [_make_model(n) for n in (2, 3, 4)]
+        solvers = [MockSolSystemCallSolver() for m in models]
+        coros = [opt.solve_async(m, options={'sleep': 0.5})
+                 for opt, m in zip(solvers, models)]
+        start = time.time()
+        all_results = self.loop.run_until_complete(asyncio.gather(*coros))
+        # The solves ran concurrently
+        self.assertLess(time.time() - start, 1.4)
+        for m, opt, results in zip(models, solvers, all_results):
+            self.assertEqual(str(results.solver.termination_condition),
+                             'optimal')
+            for i in range(len(m.x)):
+                self.assertAlmostEqual(m.x[i].value, i/10.)
+            self.assertIn('Solving ', opt._log)
+
+    def test_solve_async_busy(self):
+        opt = MockSolSystemCallSolver()
+        task = self.loop.create_task(
+            opt.solve_async(_make_model(2), options={'sleep': 1}))
+        # Let the first solve start
+        self.loop.run_until_complete(asyncio.sleep(0.2))
+        with self.assertRaisesRegex(RuntimeError, 'already running'):
+            self.loop.run_until_complete(opt.solve_async(_make_model(2)))
+        self.loop.run_until_complete(task)
+
+    def test_cancel(self):
+        m = _make_model(2)
+        opt = MockSolSystemCallSolver()
+        coro = opt.solve_async(m, options={'sleep': 30})
+        start = time.time()
+        with self.assertRaises(asyncio.TimeoutError):
+            self.loop.run_until_complete(
+                asyncio.wait_for(coro, 0.5))
+        self.assertLess(time.time() - start, 10)
+        self.assertFalse(os.path.exists(opt._problem_files[0]))
+        self.assertIsNone(m.x[0].value)
+        # The solver can be reused
+        self.loop.run_until_complete(opt.solve_async(m))
+        self.assertAlmostEqual(m.x[1].value, 0.1)
+
+    def test_timelimit(self):
+        m = _make_model(2)
+        opt = MockSolSystemCallSolver()
+        start = time.time()
+        with self.assertRaisesRegex(ApplicationError,
+                                    'did not exit normally'):
+            self.loop.run_until_complete(
+                opt.solve_async(m, timelimit=0.01, options={'sleep': 30}))
+        self.assertLess(time.time() - start, 10)
+        self.assertEqual(opt._rc, -1)
+        # Like solve(), a failed solve leaves its temporary files
+        TempfileManager.pop()
+
+
+@unittest.skipIf(not hasattr(os, 'mkfifo'), "named pipes not supported")
+class TestProblemFifo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pyomo.environ
+
+    def test_solve(self):
+        m = _make_model(3)
+        opt = MockSolSystemCallSolver()
+        results = opt.solve(m, problem_fifo=True)
+        self.assertEqual(str(results.solver.termination_condition),
+                         'optimal')
+        for i in range(3):
+            self.assertAlmostEqual(m.x[i].value, i/10.)
+        self.assertTrue(opt._problem_files[0].endswith('.pyomo.nl'))
+        # The pipe (and its directory) were removed
+        self.assertFalse(os.path.exists(
+            os.path.dirname(opt._problem_files[0])))
+
+    def test_solver_failure(self):
+        m = _make_model(3)
+        opt = MockSolSystemCallSolver()
+        # The solver exits without reading the problem: the writer is
+        # released and the solver error is reported
+        with self.assertRaisesRegexp(ApplicationError,
+                                     'did not exit normally'):
+            opt.solve(m, problem_fifo=True, options={'mode': 'fail'})
+        self.assertIsNone(opt._problem_writer)
+        TempfileManager.pop()
+
+    def test_solver_failure_before_writer_opens(self):
+        from pyomo.opt.solver.shellcmd import _ProblemWriterThread
+        # The solver exits before the writer thread opens the pipe
+        class _DelayedWriter(_ProblemWriterThread):
+            def run(self):
+                time.sleep(0.5)
+                _ProblemWriterThread.run(self)
+        opt = MockSolSystemCallSolver()
+        TempfileManager.push()
+        try:
+            opt._problem_writer = _DelayedWriter(
+                _make_model(3), TempfileManager.create_fifo(suffix='.nl'),
+                ProblemFormat.nl, opt.has_capability, {})
+            opt._problem_writer.start()
+            writer = opt._problem_writer
+            finish = threading.Thread(
+                target=opt._finish_problem_writer, args=(1,))
+            finish.daemon = True
+            finish.start()
+            finish.join(10)
+            self.assertFalse(finish.is_alive())
+            self.assertFalse(writer.is_alive())
+            self.assertIsNone(opt._problem_writer)
+        finally:
+            TempfileManager.pop()
+
+    def test_invalid(self):
+        opt = MockSolSystemCallSolver()
+        with self.assertRaisesRegexp(ValueError, 'compressed'):
+            opt.solve(_make_model(2), problem_fifo=True,
+                      compression='gzip')
+        TempfileManager.pop()
+
+    @unittest.skipIf(not asyncio_available,
+                     "asyncio (Python 3.5+) not available")
+    def test_solve_async(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            models = [_make_model(n) for n in (2, 3)]
+            coros = [MockSolSystemCallSolver().solve_async(
+                m, problem_fifo=True) for m in models]
+            loop.run_until_complete(asyncio.gather(*coros))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        for m in models:
+            for i in range(len(m.x)):
+                self.assertAlmostEqual(m.x[i].value, i/10.)
+
+
+class TestSolveCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pyomo.environ
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_solve_cache(self):
+        cache = SolveCacheClass()
+        opt = MockSolSystemCallSolver()
+        m = _make_model(3)
+        opt.solve(m, solve_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(len(cache), 1)
+
+        # An identical problem is not solved again
+        m = _make_model(3)
+        results = opt.solve(m, solve_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(str(results.solver.termination_condition),
+                         'optimal')
+        for i in range(3):
+            self.assertAlmostEqual(m.x[i].value, i/10.)
+        self.assertFalse(os.path.exists(opt._soln_file))
+
+        # ... but different problems and options are
+        opt.solve(_make_model(2), solve_cache=cache)
+        opt.solve(_make_model(3), solve_cache=cache,
+                  options={'sleep': 0.01})
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        # The least recently used entries are discarded
+        cache.maxsize = 2
+        opt.solve(_make_model(3), solve_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        opt.solve(_make_model(2), solve_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+        # Solves without the cache are not recorded
+        opt.solve(_make_model(4))
+        self.assertEqual(len(cache), 2)
+
+    def test_solve_cache_directory(self):
+        cache = SolveCacheClass(directory=self.tmpdir, maxsize=0)
+        opt = MockSolSystemCallSolver()
+        opt.solve(_make_model(3), solve_cache=cache)
+        opt.solve(_make_model(2), solve_cache=cache)
+        self.assertEqual(len(os.listdir(self.tmpdir)), 2)
+
+        # The entries are shared through the directory
+        cache = SolveCacheClass(directory=self.tmpdir, max_disk_entries=2)
+        m = _make_model(3)
+        MockSolSystemCallSolver().solve(m, solve_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        self.assertAlmostEqual(m.x[2].value, 0.2)
+
+        opt.solve(_make_model(4), solve_cache=cache)
+        self.assertEqual(len(os.listdir(self.tmpdir)), 2)
+        cache.clear()
+        self.assertEqual(os.listdir(self.tmpdir), [])
+        self.assertEqual(len(cache), 0)
+
+    def test_failed_solve(self):
+        cache = SolveCacheClass()
+        opt = MockSolSystemCallSolver()
+        with self.assertRaisesRegexp(ApplicationError,
+                                     'did not exit normally'):
+            opt.solve(_make_model(2), solve_cache=cache,
+                      options={'mode': 'fail'})
+        TempfileManager.pop()
+        self.assertEqual(len(cache), 0)
+
+    def test_problem_fifo(self):
+        opt = MockSolSystemCallSolver()
+        with self.assertRaisesRegexp(ValueError, 'problem_fifo'):
+            opt.solve(_make_model(2), solve_cache=True, problem_fifo=True)
+        TempfileManager.pop()
+
+    @unittest.skipIf(not asyncio_available,
+                     "asyncio (Python 3.5+) not available")
+    def test_solve_async(self):
+        cache = SolveCacheClass()
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            models = [_make_model(3) for i in range(2)]
+            for m in models:
+                loop.run_until_complete(MockSolSystemCallSolver().solve_async(
+                    m, solve_cache=cache))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        for m in models:
+            self.assertAlmostEqual(m.x[2].value, 0.2)
+
+
+# An interactive "solver" session for the worker pool tests: it reads
+# "solve <nlfile> <sleep> <mode>" commands (and solves them like the
+# mock solver above) and echoes any other command
+_mock_worker_script = """
+import os, sys, time
+for line in iter(sys.stdin.readline, ''):
+    cmd = line.split()
+    if cmd[0] != 'solve':
+        print('Unknown command ' + cmd[0])
+        sys.stdout.flush()
+        continue
+    nlfile = cmd[1]
+    print('Solving %s in %s' % (nlfile, os.getpid()))
+    sys.stdout.flush()
+    time.sleep(float(cmd[2]))
+    if cmd[3] == 'fail':
+        sys.exit(1)
+    with open(nlfile) as FILE:
+        lines = FILE.read().splitlines()
+    n, m = [int(x) for x in lines[1].split()[:2]]
+    with open(nlfile[:-3] + '.sol', 'w') as FILE:
+        FILE.write('Mock solver\\n\\nOptions\\n3\\n1\\n1\\n0\\n'
+                   '%s\\n%s\\n%s\\n%s\\n' % (m, m, n, n))
+        FILE.write(''.join('%s\\n' % (10+i,) for i in range(m)))
+        FILE.write(''.join('%s\\n' % (i/10.,) for i in range(n)))
+        FILE.write('objno 0 0\\n')
+"""
+
+class MockWorkerSystemCallSolver(MockSolSystemCallSolver):
+
+    def _worker_session(self, command):
+        nlfile, sleep, mode = command.cmd[3:]
+        return ([sys.executable, '-c', _mock_worker_script],
+                ['setup ' + str(self.options.get('setup', ''))],
+                [' '.join(('solve', nlfile, sleep, mode))])
+
+    def _worker_marker_line(self, marker):
+        return marker
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pyomo.environ
+
+    def _solve(self, pool, n=3, opt=None, **kwds):
+        m = _make_model(n)
+        if opt is None:
+            opt = MockWorkerSystemCallSolver()
+        results = opt.solve(m, worker_pool=pool, **kwds)
+        self.assertEqual(str(results.solver.termination_condition),
+                         'optimal')
+        for i in range(n):
+            self.assertAlmostEqual(m.x[i].value, i/10.)
+        # The pid of the process that solved the model
+        pid = re.search(r'Solving \S+ in (\d+)', opt._log)
+        if pid is not None:
+            return pid.group(1)
+
+    def test_solve(self):
+        with SolverWorkerPool() as pool:
+            pids = set(self._solve(pool, n) for n in (2, 3, 4))
+            self.assertEqual(len(pids), 1)
+            self.assertNotEqual(pids.pop(), str(os.getpid()))
+            self.assertEqual(pool.num_workers(), 1)
+
+            # Different session settings require a different worker
+            pid = self._solve(pool)
+            self.assertNotEqual(self._solve(pool, options={'setup': 1}),
+                                pid)
+            self.assertEqual(pool.num_workers(), 1)
+
+            # Solvers that do not support workers run as usual
+            self._solve(pool, opt=MockSolSystemCallSolver())
+        self.assertEqual(pool.num_workers(), 0)
+        with self.assertRaisesRegexp(RuntimeError, 'closed'):
+            self._solve(pool)
+        TempfileManager.pop()
+
+    def test_size(self):
+        with SolverWorkerPool(size=2) as pool:
+            pid = self._solve(pool)
+            pid_setup = self._solve(pool, options={'setup': 1})
+            self.assertEqual(pool.num_workers(), 2)
+            self.assertEqual(self._solve(pool), pid)
+            self.assertEqual(self._solve(pool, options={'setup': 1}),
+                             pid_setup)
+
+    def test_max_solves(self):
+        with SolverWorkerPool(max_solves=2) as pool:
+            pids = [self._solve(pool) for i in range(3)]
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+
+    def test_worker_failure(self):
+        with SolverWorkerPool() as pool:
+            pid = self._solve(pool)
+            opt = MockWorkerSystemCallSolver()
+            with self.assertRaisesRegexp(ApplicationError,
+                                         'did not exit normally'):
+                opt.solve(_make_model(2), worker_pool=pool,
+                          options={'mode': 'fail'})
+            TempfileManager.pop()
+            self.assertEqual(opt._rc, 1)
+            self.assertEqual(pool.num_workers(), 0)
+            # The failed worker is replaced
+            self.assertNotEqual(self._solve(pool), pid)
+
+    def test_timelimit(self):
+        with SolverWorkerPool() as pool:
+            opt = MockWorkerSystemCallSolver()
+            start = time.time()
+            with self.assertRaisesRegexp(ApplicationError,
+                                         'did not exit normally'):
+                opt.solve(_make_model(2), worker_pool=pool,
+                          timelimit=0.01, options={'sleep': 30})
+            TempfileManager.pop()
+            self.assertLess(time.time() - start, 10)
+            self.assertEqual(opt._rc, -1)
+            self.assertEqual(pool.num_workers(), 0)
+            self._solve(pool)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -10,3 +10,6 @@
 
 from pyomo.repn.standard_repn import StandardRepn, generate_standard_repn
 from pyomo.repn.standard_aux import compute_standard_repn
+from pyomo.repn.standard_matrix import (StandardMatrixRepn,
+                                        generate_standard_matrix_repn)
+from pyomo.repn.repn_cache import StandardRepnCache, get_repn_cache
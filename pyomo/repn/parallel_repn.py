@@ -0,0 +1,142 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['parallel_generate_standard_repn']
+
+import logging
+import multiprocessing
+
+from pyomo.repn.standard_repn import StandardRepn, generate_standard_repn
+
+from six.moves import xrange
+
+logger = logging.getLogger('pyomo.core')
+
+#
+# The expressions (and variable index) are handed to the worker
+# processes by forking the current process.  This avoids pickling the
+# model: the workers see the same objects as the parent, and only the
+# (index-encoded) repns are sent back.
+#
+_worker_state = None
+
+
+def _encode_standard_repns(chunk):
+    exprs, var_index, quadratic = _worker_state
+    ans = []
+    for expr in exprs[chunk[0]:chunk[1]]:
+        try:
+            repn = generate_standard_repn(expr, quadratic=quadratic)
+            if repn.nonlinear_expr is not None:
+                # Nonlinear expressions cannot be sent back to the
+                # parent process; they are regenerated there.
+                ans.append(None)
+                continue
+            ans.append((
+                repn.constant,
+                repn.linear_coefs,
+                tuple(var_index[id(v)] for v in repn.linear_vars),
+                repn.quadratic_coefs,
+                tuple((var_index[id(v1)], var_index[id(v2)])
+                      for v1, v2 in repn.quadratic_vars),
+            ))
+        except Exception:
+            # This covers variables that are not in the variable
+            # index.  Any real error will be raised (and logged) when
+            # the repn is regenerated by the parent process.
+            ans.append(None)
+    return ans
+
+
+def _decode_standard_repn(data, variables):
+    repn = StandardRepn()
+    repn.constant = data[0]
+    repn.linear_coefs = data[1]
+    repn.linear_vars = tuple(variables[i] for i in data[2])
+    repn.quadratic_coefs = data[3]
+    repn.quadratic_vars = tuple((variables[i], variables[j])
+                                for i, j in data[4])
+    return repn
+
+
+def parallel_generate_standard_repn(exprs,
+                                    variables,
+                                    nprocs,
+                                    quadratic=True):
+    """Generate the standard repn for a list of expressions using a
+    pool of worker processes.
+
+    The expressions are partitioned into contiguous chunks that are
+    processed by ``nprocs`` forked worker processes.  The workers
+    return the repns with the variables encoded as indices into
+    ``variables``, and the results are merged back in the original
+    order, so the returned list is identical to::
+
+        [generate_standard_repn(e, quadratic=quadratic) for e in exprs]
+
+    Expressions whose repn is nonlinear, that reference variables not in
+    ``variables``, or that raise an exception are regenerated serially
+    in this process.  If the platform does not support forking worker
+    processes (or nprocs <= 1), all repns are generated serially.
+
+    Args:
+        exprs (list): The expressions to process
+        variables (list): The variables that may appear in the
+            expressions
+        nprocs (int): The number of worker processes
+        quadratic (bool): Passed to generate_standard_repn
+
+    Returns:
+        list: The StandardRepn for each expression
+    """
+    global _worker_state
+
+    exprs = list(exprs)
+    n = len(exprs)
+    results = None
+    if nprocs > 1 and n > 1:
+        try:
+            ctx = multiprocessing.get_context('fork')
+        except ValueError:
+            logger.warning(
+                "Parallel repn generation requires the 'fork' process "
+                "start method, which is not available on this platform; "
+                "generating the repns serially.")
+            ctx = None
+        if ctx is not None:
+            nchunks = min(n, 4*nprocs)
+            bounds = [(n*i)//nchunks for i in xrange(nchunks+1)]
+            chunks = list(zip(bounds[:-1], bounds[1:]))
+            var_index = dict((id(v), i) for i, v in enumerate(variables))
+            _worker_state = (exprs, var_index, quadratic)
+            try:
+                pool = ctx.Pool(min(nprocs, nchunks))
+                try:
+                    results = pool.map(_encode_standard_repns, chunks)
+                finally:
+                    pool.close()
+                    pool.join()
+            finally:
+                _worker_state = None
+
+    if results is None:
+        return [generate_standard_repn(expr, quadratic=quadratic)
+                for expr in exprs]
+
+    variables = list(variables)
+    ans = []
+    for chunk_result in results:
+        for data in chunk_result:
+            if data is None:
+                ans.append(generate_standard_repn(exprs[len(ans)],
+                                                  quadratic=quadratic))
+            else:
+                ans.append(_decode_standard_repn(data, variables))
+    return ans
@@ -25,8 +25,11 @@ import operator
 import os
 import time
 
+from weakref import ref as weakref_ref
+
 from pyutilib.math.util import isclose
 
+from pyomo.common.compression import strip_compression_suffix
 from pyomo.common.gc_manager import PauseGC
 from pyomo.opt import ProblemFormat, AbstractProblemWriter, WriterFactory
 from pyomo.core.expr import current as EXPR
@@ -37,13 +40,17 @@ from pyomo.core.expr.numvalue import (NumericConstant,
 from pyomo.core.base import SymbolMap, NameLabeler, _ExpressionData, SortComponents, var, param, Var, ExternalFunction, ComponentMap, Objective, Constraint, SOSConstraint, Suffix
 import pyomo.core.base.suffix
 from pyomo.repn.standard_repn import generate_standard_repn
+from pyomo.repn.repn_cache import get_repn_cache
+from pyomo.repn.plugins.ampl.nl_binary import NLBinaryStream, pack_rows
+from pyomo.repn.plugins.ampl.nl_cse import (collect_common_subexpressions,
+                                            CONSTRAINT, OBJECTIVE)
 
 import pyomo.core.kernel.suffix
 from pyomo.core.kernel.block import IBlock
 from pyomo.core.kernel.expression import IIdentityExpression
 from pyomo.core.kernel.variable import IVariable
 
-from six import itervalues, iteritems
+from six import itervalues, iteritems, StringIO
 from six.moves import xrange, zip
 
 logger = logging.getLogger('pyomo.core')
@@ -71,6 +78,22 @@ _intrinsic_function_operators = {
     'floor':  'o14'
 }
 
+# The text format of the data lines of the NL segments (see
+# ProblemWriter_nl._format_rows)
+_row_templates = {
+    'id': "%d %r\n",
+    'i': "%d\n",
+}
+# The lines of the "r" and "b" segments, by range type
+_range_templates = {
+    0: "0 %r %r\n",
+    1: "1 %r\n",
+    2: "2 %r\n",
+    3: "3\n",
+    4: "4 %r\n",
+    5: "5 %d %d\n",
+}
+
 # build string templates
 def _build_op_template():
     _op_template = {}
@@ -246,12 +269,68 @@ class ModelSOS(object):
 
 class RepnWrapper(object):
 
-    __slots__ = ('repn','linear_vars','nonlinear_vars')
+    __slots__ = ('repn','linear_vars','nonlinear_vars','cache')
 
-    def __init__(self,repn,linear,nonlinear):
+    def __init__(self,repn,linear,nonlinear,cache=None):
         self.repn = repn
         self.linear_vars = linear
         self.nonlinear_vars = nonlinear
+        self.cache = cache
+
+
+class _NLSegments(object):
+    """The printed NL segments for a cached objective or constraint repn"""
+
+    __slots__ = ('entry', 'segment', 'jacobian')
+
+    def __init__(self, entry):
+        self.entry = entry
+        self.segment = None
+        self.jacobian = None
+
+    @property
+    def repn(self):
+        return self.entry.repn
+
+
+class _NLIncrementalCache(object):
+    """Cache of NL segments reused between writes of a model
+
+    The repns are held in the model's StandardRepnCache, which
+    regenerates them only when the expression, or the mutable Params /
+    fixed Vars they depend on change.  The printed segments are reused
+    as long as the repn was not regenerated and the NL variable ordering
+    is unchanged.
+    """
+
+    def __init__(self):
+        self.segments = ComponentMap()
+        self.layout = None
+        self._repn_cache = None
+        self._next_segments = None
+
+    def begin(self, repn_cache):
+        self._repn_cache = repn_cache
+        self._next_segments = ComponentMap()
+
+    def end(self, layout, model):
+        self._repn_cache.prune(model)
+        self.segments = self._next_segments
+        self._next_segments = None
+        self._repn_cache = None
+        if layout != self.layout:
+            for seg in itervalues(self.segments):
+                seg.segment = None
+                seg.jacobian = None
+            self.layout = layout
+
+    def get(self, component, expr):
+        entry = self._repn_cache.get_entry(component, expr, quadratic=False)
+        seg = self.segments.get(component, None)
+        if seg is None or seg.entry is not entry:
+            seg = _NLSegments(entry)
+        self._next_segments[component] = seg
+        return seg
 
 
 @WriterFactory.register('nl', 'Generate the corresponding AMPL NL file.')
@@ -264,7 +343,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._ampl_con_id = {}
         self._ampl_obj_id = {}
         self._OUTPUT = None
+        self._OUTPUT_filename = None
         self._varID_map = None
+        self._defined_vars = {}
+        self._binary = False
 
     def __call__(self,
                  model,
@@ -320,6 +402,28 @@ class ProblemWriter_nl(AbstractProblemWriter):
         include_all_variable_bounds = \
             io_options.pop("include_all_variable_bounds", False)
 
+        # If True, cache the repns and the NL segments generated for
+        # each objective and constraint on the model, and reuse them
+        # in subsequent writes of the same model when neither the
+        # expression nor the mutable Params / fixed Vars it depends on
+        # have changed.
+        incremental = io_options.pop("incremental", False)
+
+        # Compress the NL file ('gzip' or 'zstd').  By default, the
+        # compression is inferred from the file suffix (.gz or .zst).
+        # The .row and .col files are not compressed.
+        compression = io_options.pop("compression", None)
+
+        # Write the NL file in the AMPL binary ("b") format, which is
+        # faster for ASL-based solvers to read.
+        binary = io_options.pop("binary", False)
+
+        # Detect repeated (structurally identical) nonlinear
+        # subexpressions and write them once as defined variables
+        # ("V" segments) that are referenced by the objective and
+        # constraint expressions.
+        defined_variables = io_options.pop("defined_variables", False)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_nl passed unrecognized io_options:\n\t" +
@@ -354,31 +458,69 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # passed into _print_nonlinear_terms_NL
         self._symbolic_solver_labels = symbolic_solver_labels
         self._output_fixed_variable_bounds = output_fixed_variable_bounds
+        self._binary = binary
         # Speeds up calling name on every component when
         # writing .row and .col files (when symbolic_solver_labels is True)
         self._name_labeler = NameLabeler()
 
         # Pause the GC for the duration of this method
         with PauseGC() as pgc:
-            with open(filename,"w") as f:
-                self._OUTPUT = f
+            with self._open_output_file(filename, compression,
+                                        binary=binary) as f:
+                if binary:
+                    self._OUTPUT = NLBinaryStream(f)
+                else:
+                    self._OUTPUT = f
+                self._OUTPUT_filename = strip_compression_suffix(filename)
                 symbol_map = self._print_model_NL(
                     model,
                     solver_capability,
                     show_section_timing=show_section_timing,
                     skip_trivial_constraints=skip_trivial_constraints,
                     file_determinism=file_determinism,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    incremental=incremental,
+                    defined_variables=defined_variables)
+                if binary:
+                    self._OUTPUT.close()
 
         self._symbolic_solver_labels = False
         self._output_fixed_variable_bounds = False
+        self._binary = False
         self._name_labeler = None
 
         self._OUTPUT = None
+        self._OUTPUT_filename = None
         self._varID_map = None
+        self._defined_vars = {}
         self._op_string = None
         return filename, symbol_map
 
+    def _format_rows(self, fmt, rows):
+        """Format the data lines of an NL segment
+
+        The lines are formatted as text, or packed directly into binary
+        records when writing a binary NL file (see
+        nl_binary.pack_rows).
+        """
+        if self._binary:
+            return pack_rows(fmt, rows)
+        if fmt == 'range':
+            return "".join([_range_templates[row[0]] % row[1:]
+                            for row in rows])
+        template = _row_templates[fmt]
+        return "".join([template % row for row in rows])
+
+    def _write_rows(self, nlines, data):
+        """Write data lines returned by _format_rows"""
+        if self._binary:
+            self._OUTPUT.write_data(nlines, data)
+        else:
+            self._OUTPUT.write(data)
+
+    def _print_rows(self, fmt, rows):
+        self._write_rows(len(rows), self._format_rows(fmt, rows))
+
     def _print_quad_term(self, v1, v2):
         OUTPUT = self._OUTPUT
         if v1 is not v2:
@@ -474,6 +616,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if not exp.is_potentially_variable():
                 OUTPUT.write(self._op_string[NumericConstant] % (value(exp)))
             #
+            # Common subexpressions written as defined variables
+            #
+            elif self._defined_vars and id(exp) in self._defined_vars:
+                OUTPUT.write("v%d\n" % (self._defined_vars[id(exp)]))
+            #
             # We are assuming that _Constant_* expression objects
             # have been preprocessed to form constant values.
             #
@@ -667,7 +814,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         show_section_timing=False,
                         skip_trivial_constraints=False,
                         file_determinism=1,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        incremental=False,
+                        defined_variables=False):
 
         output_fixed_variable_bounds = self._output_fixed_variable_bounds
         symbolic_solver_labels = self._symbolic_solver_labels
@@ -724,6 +873,15 @@ class ProblemWriter_nl(AbstractProblemWriter):
         LinearVarsInt = set()
         LinearVarsBool = set()
 
+        if incremental:
+            nl_cache = getattr(model, '_nl_incremental_cache', None)
+            if nl_cache is None:
+                nl_cache = model._nl_incremental_cache = \
+                    _NLIncrementalCache()
+            nl_cache.begin(get_repn_cache(model))
+        else:
+            nl_cache = None
+
         # Tabulate the External Function definitions
         self.external_byFcn = {}
         external_Libs = set()
@@ -836,9 +994,15 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     if len(objname) > max_rowname_len:
                         max_rowname_len = len(objname)
 
+                cache_entry = None
                 if gen_obj_repn:
-                    repn = generate_standard_repn(active_objective.expr,
-                                                  quadratic=False)
+                    if nl_cache is None:
+                        repn = generate_standard_repn(active_objective.expr,
+                                                      quadratic=False)
+                    else:
+                        cache_entry = nl_cache.get(active_objective,
+                                                   active_objective.expr)
+                        repn = cache_entry.repn
                     block_repn[active_objective] = repn
                     linear_vars = repn.linear_vars
                     nonlinear_vars = repn.nonlinear_vars
@@ -866,7 +1030,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     wrapped_repn = RepnWrapper(
                         repn,
                         list(self_varID_map[id(var)] for var in linear_vars),
-                        list(self_varID_map[id(var)] for var in nonlinear_vars))
+                        list(self_varID_map[id(var)] for var in nonlinear_vars),
+                        cache_entry)
                 except KeyError as err:
                     self._symbolMapKeyError(err, model, self_varID_map,
                                             list(linear_vars) +
@@ -949,14 +1114,20 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     if len(conname) > max_rowname_len:
                         max_rowname_len = len(conname)
 
+                cache_entry = None
                 if constraint_data._linear_canonical_form:
                     repn = constraint_data.canonical_form()
                     linear_vars = repn.linear_vars
                     nonlinear_vars = repn.nonlinear_vars
                 else:
                     if gen_con_repn:
-                        repn = generate_standard_repn(constraint_data.body,
-                                                      quadratic=False)
+                        if nl_cache is None:
+                            repn = generate_standard_repn(
+                                constraint_data.body, quadratic=False)
+                        else:
+                            cache_entry = nl_cache.get(constraint_data,
+                                                       constraint_data.body)
+                            repn = cache_entry.repn
                         block_repn[constraint_data] = repn
                         linear_vars = repn.linear_vars
                         nonlinear_vars = repn.nonlinear_vars
@@ -993,7 +1164,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     wrapped_repn = RepnWrapper(
                         repn,
                         list(self_varID_map[id(var)] for var in linear_vars),
-                        list(self_varID_map[id(var)] for var in nonlinear_vars))
+                        list(self_varID_map[id(var)] for var in nonlinear_vars),
+                        cache_entry)
                 except KeyError as err:
                     self._symbolMapKeyError(err, model, self_varID_map,
                                             list(linear_vars) +
@@ -1033,8 +1205,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 _vid = getattr(constraint_data, '_vid', None)
                 if not _type is None:
                     _vid = self_varID_map[_vid]+1
-                    constraint_bounds_dict[con_ID] = \
-                        "5 {0} {1}\n".format(_type, _vid)
+                    constraint_bounds_dict[con_ID] = (5, _type, _vid)
                     if _type == 1 or _type == 2:
                         n_single_sided_ineq += 1
                     elif _type == 3:
@@ -1049,17 +1220,16 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     if L == U:
                         if L is None:
                             # No constraint on body
-                            constraint_bounds_dict[con_ID] = "3\n"
+                            constraint_bounds_dict[con_ID] = (3,)
                             n_unbounded += 1
                         else:
-                            constraint_bounds_dict[con_ID] = \
-                                "4 %r\n" % (L-offset)
+                            constraint_bounds_dict[con_ID] = (4, L-offset)
                             n_equals += 1
                     elif L is None:
-                        constraint_bounds_dict[con_ID] = "1 %r\n" % (U-offset)
+                        constraint_bounds_dict[con_ID] = (1, U-offset)
                         n_single_sided_ineq += 1
                     elif U is None:
-                        constraint_bounds_dict[con_ID] = "2 %r\n" % (L-offset)
+                        constraint_bounds_dict[con_ID] = (2, L-offset)
                         n_single_sided_ineq += 1
                     elif (L > U):
                         msg = 'Constraint {0}: lower bound greater than upper' \
@@ -1068,7 +1238,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                                                     str(L), str(U)))
                     else:
                         constraint_bounds_dict[con_ID] = \
-                            "0 %r %r\n" % (L-offset, U-offset)
+                            (0, L-offset, U-offset)
                         # double sided inequality
                         # both are not none and they are valid
                         n_ranges += 1
@@ -1097,9 +1267,16 @@ class ProblemWriter_nl(AbstractProblemWriter):
             (con_ID,row_id) for row_id,con_ID in \
             enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list)))
         # populate the symbol_map
-        symbol_map.addSymbols(
-            [(Constraints_dict[con_ID][0],"c%d"%row_id) for row_id,con_ID in \
-             enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list))])
+        con_symbols = [
+            (Constraints_dict[con_ID][0],"c%d"%row_id) for row_id,con_ID in \
+            enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list))]
+        symbol_map.addSymbols(con_symbols)
+        # Record the constraints (and variables, below) in the NL file
+        # order, so that the solution vectors can be loaded by position
+        # (see ModelSolutions.load_vectors)
+        symbol_map._nl_constraints = [
+            weakref_ref(con) for con, _ in con_symbols]
+        del con_symbols
 
         if show_section_timing:
             subsection_timer.report("Generate constraint representations")
@@ -1196,25 +1373,65 @@ class ProblemWriter_nl(AbstractProblemWriter):
         if (idx_nl_obj == idx_nl_con):
             idx_nl_obj = idx_nl_both
 
+        if nl_cache is not None:
+            # The cached NL segments reference the AMPL variable ids
+            # (and names), so they can only be reused if the variable
+            # ordering (and the file format) is unchanged
+            nl_cache.end((symbolic_solver_labels, self._binary,
+                          tuple(id(Vars_dict[var_ID])
+                                for var_ID in full_var_list),
+                          tuple(sorted((fcn, fid) for fcn, (_, fid)
+                                       in iteritems(self.external_byFcn)))),
+                         model)
+
         # create the ampl variable column ids
         self_ampl_var_id.update((var_ID,column_id)
                                 for column_id,var_ID in enumerate(full_var_list))
         # populate the symbol_map
-        symbol_map.addSymbols([(Vars_dict[var_ID],"v%d"%column_id)
-                               for column_id,var_ID in enumerate(full_var_list)])
+        var_symbols = [(Vars_dict[var_ID],"v%d"%column_id)
+                       for column_id,var_ID in enumerate(full_var_list)]
+        symbol_map.addSymbols(var_symbols)
+        symbol_map._nl_variables = [weakref_ref(var) for var, _ in var_symbols]
+        del var_symbols
 
         if show_section_timing:
             subsection_timer.report("Partition variable types")
             subsection_timer.reset()
 
+        defined_var_list = []
+        defined_var_counts = (0, 0, 0)
+        if defined_variables:
+            nl_exprs = []
+            for con_ID in nonlin_con_order_list:
+                repn = Constraints_dict[con_ID][1].repn
+                if repn.nonlinear_expr is not None:
+                    nl_exprs.append((repn.nonlinear_expr, CONSTRAINT))
+            for obj, wrapped_repn in itervalues(Objectives_dict):
+                repn = wrapped_repn.repn
+                if repn.nonlinear_expr is not None:
+                    nl_exprs.append((repn.nonlinear_expr, OBJECTIVE))
+            defined_var_list, defined_var_counts, defined_var_index = \
+                collect_common_subexpressions(nl_exprs, self_varID_map)
+            # Defined variables are numbered after the variables
+            n_vars = len(full_var_list)
+            self._defined_vars = dict(
+                (node_id, n_vars + i)
+                for node_id, i in iteritems(defined_var_index))
+            del nl_exprs
+            del defined_var_index
+
+            if show_section_timing:
+                subsection_timer.report("Identify common subexpressions")
+                subsection_timer.reset()
+
 #        end_time = time.clock()
 #        print (end_time - start_time)
 
         colfilename = None
-        if OUTPUT.name.endswith('.nl'):
-            colfilename = OUTPUT.name.replace('.nl','.col')
+        if self._OUTPUT_filename.endswith('.nl'):
+            colfilename = self._OUTPUT_filename.replace('.nl','.col')
         else:
-            colfilename = OUTPUT.name+'.col'
+            colfilename = self._OUTPUT_filename+'.col'
         if symbolic_solver_labels:
             colf = open(colfilename,'w')
             colfile_line_template = "%s\n"
@@ -1303,7 +1520,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 10
         #
-        OUTPUT.write(" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1\n")
+        OUTPUT.write(" {0} {1} {2} 0 0\t# common exprs: b,c,o,c1,o1\n"
+                     .format(*defined_var_counts))
 
 #        end_time = time.clock()
 #        print (end_time - start_time)
@@ -1506,13 +1724,25 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # "C" lines
         #
         rowfilename = None
-        if OUTPUT.name.endswith('.nl'):
-            rowfilename = OUTPUT.name.replace('.nl','.row')
+        if self._OUTPUT_filename.endswith('.nl'):
+            rowfilename = self._OUTPUT_filename.replace('.nl','.row')
         else:
-            rowfilename = OUTPUT.name+'.row'
+            rowfilename = self._OUTPUT_filename+'.row'
         if symbolic_solver_labels:
             rowf = open(rowfilename,'w')
 
+        #
+        # "V" lines
+        #
+        defined_vars = self._defined_vars
+        for i, expr in enumerate(defined_var_list):
+            # Print the definition itself (and not a reference to it)
+            idx = defined_vars.pop(id(expr))
+            OUTPUT.write("V%d 0 0\n" % (idx,))
+            self._print_nonlinear_terms_NL(expr)
+            defined_vars[id(expr)] = idx
+        del defined_var_list
+
         cu = [0 for i in xrange(len(full_var_list))]
         for con_ID in nonlin_con_order_list:
             con_data, wrapped_repn = Constraints_dict[con_ID]
@@ -1524,15 +1754,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 rowf.write(lbl+"\n")
             OUTPUT.write("\n")
 
-            if wrapped_repn.repn.nonlinear_expr is not None:
-                assert not wrapped_repn.repn.is_quadratic()
-                self._print_nonlinear_terms_NL(
-                    wrapped_repn.repn.nonlinear_expr)
-            else:
-                assert wrapped_repn.repn.is_quadratic()
-                self._print_standard_quadratic_NL(
-                    wrapped_repn.repn.quadratic_vars,
-                    wrapped_repn.repn.quadratic_coefs)
+            self._print_repn_NL(wrapped_repn, False)
 
             for var_ID in set(wrapped_repn.linear_vars).union(
                     wrapped_repn.nonlinear_vars):
@@ -1572,24 +1794,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 rowf.write(lbl+"\n")
             OUTPUT.write("\n")
 
-            if wrapped_repn.repn.is_linear():
-                OUTPUT.write(self._op_string[NumericConstant]
-                             % (wrapped_repn.repn.constant))
-            else:
-                if wrapped_repn.repn.constant != 0:
-                    _, binary_sum_str, _ = self._op_string[EXPR.SumExpressionBase]
-                    OUTPUT.write(binary_sum_str)
-                    OUTPUT.write(self._op_string[NumericConstant]
-                                 % (wrapped_repn.repn.constant))
-                if wrapped_repn.repn.nonlinear_expr is not None:
-                    assert not wrapped_repn.repn.is_quadratic()
-                    self._print_nonlinear_terms_NL(
-                        wrapped_repn.repn.nonlinear_expr)
-                else:
-                    assert wrapped_repn.repn.is_quadratic()
-                    self._print_standard_quadratic_NL(
-                        wrapped_repn.repn.quadratic_vars,
-                        wrapped_repn.repn.quadratic_coefs)
+            self._print_repn_NL(wrapped_repn, True)
 
         if symbolic_solver_labels:
             rowf.close()
@@ -1624,9 +1829,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 if symbolic_solver_labels:
                     OUTPUT.write("\t# dual initial guess")
                 OUTPUT.write("\n")
-                OUTPUT.writelines(suffix_line.format(*_l)
-                                  for _l in sorted(s_lines,
-                                                   key=operator.itemgetter(0)))
+                self._print_rows('id', sorted(s_lines,
+                                              key=operator.itemgetter(0)))
 
         #
         # "x" lines
@@ -1637,7 +1841,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         for ampl_var_id, var_ID in enumerate(full_var_list):
             var = Vars_dict[var_ID]
             if var.value is not None:
-                x_init_list.append("%d %r\n" % (ampl_var_id, var.value))
+                x_init_list.append((ampl_var_id, var.value))
             if var.fixed:
                 if not output_fixed_variable_bounds:
                     raise ValueError(
@@ -1660,21 +1864,21 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if L is not None:
                 if U is not None:
                     if L == U:
-                        var_bound_list.append("4 %r\n" % (L))
+                        var_bound_list.append((4, L))
                     else:
-                        var_bound_list.append("0 %r %r\n" % (L, U))
+                        var_bound_list.append((0, L, U))
                 else:
-                    var_bound_list.append("2 %r\n" % (L))
+                    var_bound_list.append((2, L))
             elif U is not None:
-                var_bound_list.append("1 %r\n" % (U))
+                var_bound_list.append((1, U))
             else:
-                var_bound_list.append("3\n")
+                var_bound_list.append((3,))
 
         OUTPUT.write("x%d" % (len(x_init_list)))
         if symbolic_solver_labels:
             OUTPUT.write("\t# initial guess")
         OUTPUT.write("\n")
-        OUTPUT.writelines(x_init_list)
+        self._print_rows('id', x_init_list)
         del x_init_list
 
         if show_section_timing:
@@ -1690,9 +1894,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
                          % (len(nonlin_con_order_list) + len(lin_con_order_list)))
         OUTPUT.write("\n")
         # *NOTE: This iteration follows the assignment of the ampl_con_id
-        OUTPUT.writelines(constraint_bounds_dict[con_ID]
+        self._print_rows('range',
+                         [constraint_bounds_dict[con_ID]
                           for con_ID in itertools.chain(nonlin_con_order_list,
-                                                        lin_con_order_list))
+                                                        lin_con_order_list)])
 
         if show_section_timing:
             subsection_timer.report("Write constraint bounds")
@@ -1706,7 +1911,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             OUTPUT.write("\t#%d bounds (on variables)"
                          % (len(var_bound_list)))
         OUTPUT.write("\n")
-        OUTPUT.writelines(var_bound_list)
+        self._print_rows('range', var_bound_list)
         del var_bound_list
 
         if show_section_timing:
@@ -1723,10 +1928,13 @@ class ProblemWriter_nl(AbstractProblemWriter):
             OUTPUT.write("\t#intermediate Jacobian column lengths")
         OUTPUT.write("\n")
         ktot = 0
+        k_list = []
         for i in xrange(n1):
             ktot += cu[i]
-            OUTPUT.write("%d\n"%(ktot))
+            k_list.append(ktot)
         del cu
+        self._print_rows('i', k_list)
+        del k_list
 
         if show_section_timing:
             subsection_timer.report("Write k lines")
@@ -1738,45 +1946,19 @@ class ProblemWriter_nl(AbstractProblemWriter):
         for nc, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
                                                     lin_con_order_list)):
             con_data, wrapped_repn = Constraints_dict[con_ID]
-            numnonlinear_vars = len(wrapped_repn.nonlinear_vars)
-            numlinear_vars = len(wrapped_repn.linear_vars)
-            if numnonlinear_vars == 0:
-                if numlinear_vars > 0:
-                    linear_dict = dict((var_ID, coef)
-                                       for var_ID, coef in
-                                       zip(wrapped_repn.linear_vars,
-                                           wrapped_repn.repn.linear_coefs))
-                    OUTPUT.write("J%d %d\n"%(nc, numlinear_vars))
-                    OUTPUT.writelines(
-                        "%d %r\n" % (self_ampl_var_id[con_var],
-                                     linear_dict[con_var])
-                        for con_var in sorted(linear_dict.keys()))
-            elif numlinear_vars == 0:
-                nl_con_vars = \
-                    sorted(wrapped_repn.nonlinear_vars)
-                OUTPUT.write("J%d %d\n"%(nc, numnonlinear_vars))
-                OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
-                    for con_var in nl_con_vars)
+            entry = wrapped_repn.cache
+            if entry is None or entry.jacobian is None:
+                jacobian = self._jacobian_NL(wrapped_repn)
+                if jacobian is not None:
+                    jacobian = (jacobian[0],
+                                self._format_rows('id', jacobian[1]))
+                if entry is not None:
+                    entry.jacobian = jacobian
             else:
-                con_vars = set(wrapped_repn.nonlinear_vars)
-                nl_con_vars = sorted(
-                    con_vars.difference(
-                        wrapped_repn.linear_vars))
-                con_vars.update(wrapped_repn.linear_vars)
-                linear_dict = dict(
-                    (var_ID, coef) for var_ID, coef in
-                    zip(wrapped_repn.linear_vars,
-                        wrapped_repn.repn.linear_coefs))
-                OUTPUT.write("J%d %d\n"%(nc, len(con_vars)))
-                OUTPUT.writelines(
-                    "%d %r\n" % (self_ampl_var_id[con_var],
-                                 linear_dict[con_var])
-                    for con_var in sorted(linear_dict.keys()))
-                OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
-                    for con_var in nl_con_vars)
-
+                jacobian = entry.jacobian
+            if jacobian is not None:
+                OUTPUT.write("J%d %d\n" % (nc, jacobian[0]))
+                self._write_rows(*jacobian)
 
         if show_section_timing:
             subsection_timer.report("Write J lines")
@@ -1800,9 +1982,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if len_ge > 0:
                 OUTPUT.write("G%d %d\n" % (self_ampl_obj_id[obj_ID],
                                            len_ge))
-                for var_ID in sorted(grad_entries.keys()):
-                    OUTPUT.write("%d %r\n" % (var_ID,
-                                              grad_entries[var_ID]))
+                self._print_rows('id', [(var_ID, grad_entries[var_ID])
+                                        for var_ID in sorted(grad_entries)])
 
         if show_section_timing:
             subsection_timer.report("Write G lines")
@@ -1811,6 +1992,87 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
         return symbol_map
 
+    def _print_repn_NL(self, wrapped_repn, is_objective):
+        """Print the nonlinear ("C" / "O") segment for a repn
+
+        When the repn is cached for incremental writes, the segment is
+        recorded the first time it is printed and reused afterwards.
+        """
+        entry = wrapped_repn.cache
+        if entry is not None and not self._defined_vars:
+            # (segments referencing defined variables are not cached)
+            if entry.segment is None:
+                OUTPUT = self._OUTPUT
+                self._OUTPUT = StringIO()
+                try:
+                    self._print_repn_NL(
+                        RepnWrapper(wrapped_repn.repn, None, None),
+                        is_objective)
+                    entry.segment = self._OUTPUT.getvalue()
+                finally:
+                    self._OUTPUT = OUTPUT
+            self._OUTPUT.write(entry.segment)
+            return
+
+        OUTPUT = self._OUTPUT
+        repn = wrapped_repn.repn
+        if is_objective:
+            if repn.is_linear():
+                OUTPUT.write(self._op_string[NumericConstant]
+                             % (repn.constant))
+                return
+            if repn.constant != 0:
+                _, binary_sum_str, _ = self._op_string[EXPR.SumExpressionBase]
+                OUTPUT.write(binary_sum_str)
+                OUTPUT.write(self._op_string[NumericConstant]
+                             % (repn.constant))
+        if repn.nonlinear_expr is not None:
+            assert not repn.is_quadratic()
+            self._print_nonlinear_terms_NL(repn.nonlinear_expr)
+        else:
+            assert repn.is_quadratic()
+            self._print_standard_quadratic_NL(repn.quadratic_vars,
+                                              repn.quadratic_coefs)
+
+    def _jacobian_NL(self, wrapped_repn):
+        """Return the number of entries and the (variable id,
+        coefficient) lines of the "J" segment for a constraint (or None
+        if the constraint has no variables)"""
+        self_ampl_var_id = self.ampl_var_id
+        numnonlinear_vars = len(wrapped_repn.nonlinear_vars)
+        numlinear_vars = len(wrapped_repn.linear_vars)
+        if numnonlinear_vars == 0:
+            if numlinear_vars > 0:
+                linear_dict = dict((var_ID, coef)
+                                   for var_ID, coef in
+                                   zip(wrapped_repn.linear_vars,
+                                       wrapped_repn.repn.linear_coefs))
+                return numlinear_vars, [
+                    (self_ampl_var_id[con_var], linear_dict[con_var])
+                    for con_var in sorted(linear_dict.keys())]
+            return None
+        elif numlinear_vars == 0:
+            nl_con_vars = \
+                sorted(wrapped_repn.nonlinear_vars)
+            return numnonlinear_vars, [
+                (self_ampl_var_id[con_var], 0)
+                for con_var in nl_con_vars]
+        else:
+            con_vars = set(wrapped_repn.nonlinear_vars)
+            nl_con_vars = sorted(
+                con_vars.difference(
+                    wrapped_repn.linear_vars))
+            con_vars.update(wrapped_repn.linear_vars)
+            linear_dict = dict(
+                (var_ID, coef) for var_ID, coef in
+                zip(wrapped_repn.linear_vars,
+                    wrapped_repn.repn.linear_coefs))
+            return len(con_vars), list(itertools.chain(
+                ((self_ampl_var_id[con_var], linear_dict[con_var])
+                 for con_var in sorted(linear_dict.keys())),
+                ((self_ampl_var_id[con_var], 0)
+                 for con_var in nl_con_vars)))
+
     def _symbolMapKeyError(self, err, model, map, vars):
         _errors = []
         for v in vars:
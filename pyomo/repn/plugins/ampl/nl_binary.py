@@ -0,0 +1,465 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# Support for the AMPL binary ("b") NL format
+#
+# The binary format has the same 10-line text header as the text ("g")
+# format (except that it starts with "b" and records the byte order in
+# the "arith" field).  In the remainder of the file, each segment (and
+# expression node) key is written as a single character, followed by
+# the values on that line in native binary form: integers as 4-byte
+# ints, real numbers as 8-byte doubles, and strings as an integer
+# length followed by the characters.
+#
+# The data lines of a segment (e.g., the "J" and "x" segments) can also
+# be packed directly from the values (see pack_rows() and
+# NLBinaryStream.write_data()), which avoids formatting the numbers as
+# text only to parse them again.
+#
+
+__all__ = ['NLBinaryStream', 'nl_binary_to_text', 'pack_rows']
+
+import itertools
+import struct
+import sys
+
+from six import StringIO
+
+_int = struct.Struct('=i')
+_double = struct.Struct('=d')
+_int_double = struct.Struct('=id')
+_int_int = struct.Struct('=ii')
+_structs = {
+    'i': _int,
+    'd': _double,
+    's': struct.Struct('=h'),
+    'l': _int,
+}
+
+# AMPL's Arith_Kind_ASL: 1 for little-endian and 2 for big-endian IEEE
+# arithmetic
+_arith = 1 if sys.byteorder == 'little' else 2
+
+_NHEADER = 10
+
+# The values (after the key) on the header line of each segment
+_segment_formats = {
+    'C': 'i',
+    'L': 'i',
+    'O': 'ii',
+    'V': 'iii',
+    'F': 'iiis',
+    'S': 'iis',
+    'x': 'i',
+    'd': 'i',
+    'r': '',
+    'b': '',
+    'k': 'i',
+    'J': 'ii',
+    'G': 'ii',
+}
+
+# Segments followed by an expression graph
+_expression_segments = frozenset('CLOV')
+
+# The number of bytes in each binary value type
+_sizes = {'i': 4, 'd': 8, 's': 2, 'l': 4}
+
+
+def _range_format(kind):
+    # The format of the values on each line of the 'r' and 'b' segments
+    if kind == 0:
+        return 'dd'
+    elif kind in (1, 2, 4):
+        return 'd'
+    elif kind == 3:
+        return ''
+    elif kind == 5:
+        return 'ii'
+    raise ValueError("Invalid range / bound type %s" % (kind,))
+
+
+# The (kind prefix, values) of each line of the 'r' and 'b' segments
+_range_structs = dict(
+    (kind, (str(kind).encode('ascii'),
+            struct.Struct('=' + _range_format(kind))))
+    for kind in range(6))
+
+
+def pack_rows(fmt, rows):
+    """Pack the data lines of a segment in the binary NL format
+
+    Args:
+        fmt (str): The format of each line: 'id' (an integer and a
+            real number), 'i' (an integer), or 'range' (the lines of
+            the 'r' and 'b' segments: the range type followed by its
+            values)
+        rows (list): The lines: tuples of values ('id' and 'range'),
+            or integers ('i')
+
+    Returns:
+        bytes: The packed lines
+    """
+    if not rows:
+        return b''
+    if fmt == 'id':
+        return struct.pack('=' + 'id'*len(rows),
+                           *itertools.chain.from_iterable(rows))
+    elif fmt == 'i':
+        return struct.pack('=%di' % (len(rows),), *rows)
+    elif fmt == 'range':
+        ans = []
+        for row in rows:
+            prefix, fmt_struct = _range_structs[row[0]]
+            ans.append(prefix)
+            ans.append(fmt_struct.pack(*row[1:]))
+        return b''.join(ans)
+    raise ValueError("Invalid NL data line format '%s'" % (fmt,))
+
+
+def _strip_comment(line):
+    i = line.find('#')
+    if i >= 0:
+        line = line[:i]
+    return line
+
+
+class NLBinaryStream(object):
+    """A text stream that translates a text ("g") NL file into the
+    binary ("b") NL format.
+
+    The text NL file is written to this object (as the NL writer would
+    write to a file), and the binary NL file is streamed to
+    ``ostream``, which must be opened in binary mode.  Comments in the
+    text file are dropped.
+    """
+
+    def __init__(self, ostream):
+        self._ostream = ostream
+        self._buf = ''
+        self._header = []
+        self._n_var = None
+        self._n_con = None
+        # Lines remaining in the current data block, and their format
+        self._ndata = 0
+        self._data_format = None
+        self._in_expression = False
+        self._out = bytearray()
+
+    def write(self, text):
+        self._buf += text
+        self._process()
+        if len(self._out) > 1 << 16:
+            self._flush()
+
+    def writelines(self, lines):
+        self.write(''.join(lines))
+
+    def write_data(self, nlines, data):
+        """Write data lines of the current segment that were already
+        packed (see pack_rows())
+
+        Args:
+            nlines (int): The number of lines in ``data``
+            data (bytes): The packed lines
+        """
+        self._process()
+        if self._buf or self._header is not None:
+            raise ValueError(
+                "Packed NL data must follow a complete segment line")
+        if nlines > self._ndata:
+            raise ValueError(
+                "The current NL segment has only %s data lines remaining "
+                "(%s were written)" % (self._ndata, nlines))
+        self._ndata -= nlines
+        self._out.extend(data)
+        if len(self._out) > 1 << 16:
+            self._flush()
+
+    def close(self):
+        """Check that the NL file was complete and flush the output"""
+        self._process()
+        if self._buf.strip():
+            raise ValueError(
+                "Incomplete NL file: could not translate %r" % (self._buf,))
+        if self._ndata:
+            raise ValueError(
+                "Incomplete NL file: %s data lines are missing"
+                % (self._ndata,))
+        self._flush()
+
+    def _flush(self):
+        self._ostream.write(bytes(self._out))
+        del self._out[:]
+
+    def _process(self):
+        buf = self._buf
+        pos = 0
+        while True:
+            end = buf.find('\n', pos)
+            if end < 0:
+                break
+            if self._header is not None:
+                self._header.append(buf[pos:end])
+                pos = end + 1
+                if len(self._header) == _NHEADER:
+                    self._write_header()
+                continue
+            if buf[pos] == 'h':
+                # String arguments may contain any character (including
+                # '#' and newlines), so they are sized from the length
+                colon = buf.index(':', pos)
+                n = int(buf[pos+1:colon])
+                end = buf.find('\n', colon+1+n)
+                if end < 0:
+                    # The rest of the line has not been written yet
+                    break
+                self._write_string(b'h', buf[colon+1:colon+1+n])
+            else:
+                self._line(_strip_comment(buf[pos:end]).split())
+            pos = end + 1
+        self._buf = buf[pos:]
+
+    def _write_header(self):
+        header = self._header
+        self._header = None
+        if not header[0].startswith('g'):
+            raise ValueError("Expected a text ('g') NL header, found '%s'"
+                             % (header[0],))
+        header[0] = 'b' + header[0][1:]
+        dims = _strip_comment(header[1]).split()
+        self._n_var = int(dims[0])
+        self._n_con = int(dims[1])
+        # Record the byte order in the "arith" field
+        line = header[5]
+        tokens = _strip_comment(line).split()
+        tokens[2] = str(_arith)
+        header[5] = ' ' + ' '.join(tokens)
+        if '#' in line:
+            header[5] += '\t' + line[line.find('#'):]
+        self._out.extend(('\n'.join(header) + '\n').encode('ascii'))
+
+    def _write_string(self, key, s):
+        s = s.encode('utf-8')
+        self._out.extend(key)
+        self._out.extend(_int.pack(len(s)))
+        self._out.extend(s)
+
+    def _pack(self, fmt, tokens):
+        out = self._out
+        for f, tok in zip(fmt, tokens):
+            if f == 'i':
+                out.extend(_int.pack(int(tok)))
+            elif f == 'd':
+                out.extend(_double.pack(float(tok)))
+            else:
+                assert f == 's'
+                s = tok.encode('utf-8')
+                out.extend(_int.pack(len(s)))
+                out.extend(s)
+
+    def _line(self, tokens):
+        if not tokens:
+            return
+        out = self._out
+        if self._ndata:
+            self._ndata -= 1
+            fmt = self._data_format
+            if fmt == 'id':
+                out.extend(_int_double.pack(int(tokens[0]),
+                                            float(tokens[1])))
+            elif fmt == 'range':
+                kind = int(tokens[0])
+                out.extend(tokens[0].encode('ascii'))
+                self._pack(_range_format(kind), tokens[1:])
+            else:
+                self._pack(fmt, tokens)
+            return
+
+        key = tokens[0][0]
+        if self._in_expression:
+            if key == 'o':
+                out.extend(b'o')
+                out.extend(_int.pack(int(tokens[0][1:])))
+                return
+            elif key == 'n':
+                num = tokens[0][1:]
+                if num.lstrip('-').isdigit():
+                    # Integer constants are stored as short / long ints
+                    # (as AMPL does)
+                    num = int(num)
+                    if -0x8000 <= num < 0x8000:
+                        out.extend(b's')
+                        out.extend(_structs['s'].pack(num))
+                        return
+                    elif -0x80000000 <= num < 0x80000000:
+                        out.extend(b'l')
+                        out.extend(_int.pack(num))
+                        return
+                out.extend(b'n')
+                out.extend(_double.pack(float(num)))
+                return
+            elif key == 'v':
+                out.extend(b'v')
+                out.extend(_int.pack(int(tokens[0][1:])))
+                return
+            elif key == 'f':
+                out.extend(b'f')
+                out.extend(_int_int.pack(int(tokens[0][1:]),
+                                         int(tokens[1])))
+                return
+            elif key.isdigit():
+                # The number of operands of an n-ary operator
+                out.extend(_int.pack(int(tokens[0])))
+                return
+
+        fmt = _segment_formats.get(key, None)
+        if fmt is None:
+            raise ValueError("Unrecognized NL segment: '%s'"
+                             % (' '.join(tokens),))
+        tokens = [tokens[0][1:]] + tokens[1:]
+        if not tokens[0]:
+            tokens.pop(0)
+        out.extend(key.encode('ascii'))
+        self._pack(fmt, tokens)
+        self._in_expression = key in _expression_segments
+        if key == 'V':
+            self._ndata = int(tokens[1])
+            self._data_format = 'id'
+        elif key == 'S':
+            self._ndata = int(tokens[1])
+            self._data_format = 'id' if int(tokens[0]) & 4 else 'ii'
+        elif key in 'xdJG':
+            self._ndata = int(tokens[-1])
+            self._data_format = 'id'
+        elif key == 'k':
+            self._ndata = int(tokens[0])
+            self._data_format = 'i'
+        elif key == 'r':
+            self._ndata = self._n_con
+            self._data_format = 'range'
+        elif key == 'b':
+            self._ndata = self._n_var
+            self._data_format = 'range'
+
+
+class _BinaryReader(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def key(self):
+        ans = self.data[self.pos:self.pos+1].decode('ascii')
+        self.pos += 1
+        return ans
+
+    def unpack(self, fmt):
+        # Note: strings are denoted by 'S' ('s' is a short int)
+        ans = []
+        for f in fmt:
+            if f == 'S':
+                n = self.unpack('i')[0]
+                ans.append(
+                    self.data[self.pos:self.pos+n].decode('utf-8'))
+                self.pos += n
+            else:
+                ans.append(_structs[f].unpack_from(self.data, self.pos)[0])
+                self.pos += _sizes[f]
+        return ans
+
+
+def nl_binary_to_text(data):
+    """Translate the contents of a binary ("b") NL file into the text
+    ("g") NL format (without comments).
+
+    Args:
+        data (bytes): The contents of the binary NL file
+
+    Returns:
+        str: The text NL file
+    """
+    output = StringIO()
+    pos = 0
+    header = []
+    for i in range(_NHEADER):
+        end = data.index(b'\n', pos)
+        header.append(data[pos:end].decode('ascii'))
+        pos = end + 1
+    if not header[0].startswith('b'):
+        raise ValueError("Expected a binary ('b') NL header, found '%s'"
+                         % (header[0],))
+    if int(_strip_comment(header[5]).split()[2]) not in (0, _arith):
+        raise ValueError("The binary NL file does not use the native "
+                         "byte order")
+    header[0] = 'g' + header[0][1:]
+    dims = _strip_comment(header[1]).split()
+    n_var = int(dims[0])
+    n_con = int(dims[1])
+    output.write('\n'.join(header) + '\n')
+
+    reader = _BinaryReader(data)
+    reader.pos = pos
+    in_expression = False
+    while reader.pos < len(data):
+        key = reader.key()
+        if in_expression and key in 'onslvfh':
+            if key == 'o':
+                op = reader.unpack('i')[0]
+                output.write('o%d\n' % (op,))
+                if op == 54:
+                    output.write('%d\n' % tuple(reader.unpack('i')))
+            elif key == 'n':
+                output.write('n%r\n' % tuple(reader.unpack('d')))
+            elif key in 'sl':
+                # Integer constants stored as short / long ints
+                output.write('n%d\n' % tuple(reader.unpack(key)))
+            elif key == 'v':
+                output.write('v%d\n' % tuple(reader.unpack('i')))
+            elif key == 'f':
+                output.write('f%d %d\n' % tuple(reader.unpack('ii')))
+            else:
+                s = reader.unpack('S')[0]
+                output.write('h%d:%s\n' % (len(s), s))
+            continue
+        fmt = _segment_formats.get(key, None)
+        if fmt is None:
+            raise ValueError("Unrecognized binary NL segment key '%s' "
+                             "at byte %s" % (key, reader.pos-1))
+        values = reader.unpack(fmt.replace('s', 'S'))
+        output.write(key + ' '.join(str(v) for v in values) + '\n')
+        in_expression = key in _expression_segments
+        ndata = 0
+        data_format = 'id'
+        if key == 'V':
+            ndata = values[1]
+        elif key == 'S':
+            ndata = values[1]
+            if not values[0] & 4:
+                data_format = 'ii'
+        elif key in 'xdJG':
+            ndata = values[-1]
+        elif key == 'k':
+            ndata = values[0]
+            data_format = 'i'
+        elif key in 'rb':
+            ndata = n_con if key == 'r' else n_var
+            data_format = 'range'
+        for i in range(ndata):
+            if data_format == 'range':
+                kind = int(reader.key())
+                values = [kind] + reader.unpack(_range_format(kind))
+            else:
+                values = reader.unpack(data_format)
+            output.write(' '.join(
+                ('%r' % (v,)) if v.__class__ is float else str(v)
+                for v in values) + '\n')
+    return output.getvalue()
@@ -0,0 +1,198 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# Common subexpression detection for the NL writer
+#
+# Expression subtrees are hashed structurally: each distinct subtree is
+# "interned" as a key built from the node type and the ids of its
+# (already interned) children, so that identical subtrees share the
+# same id regardless of whether they are the same Python object.
+# Subtrees that are used more than once are written to the NL file as
+# defined variables ("V" segments) and referenced from the objective /
+# constraint expressions.
+#
+
+__all__ = ['collect_common_subexpressions']
+
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import native_numeric_types, value
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+
+from six import string_types
+from six.moves import xrange
+
+# Flags recording where a subexpression is used
+CONSTRAINT = 1
+OBJECTIVE = 2
+
+# Expression types that are linear if all their arguments are linear.
+# Repeated linear subtrees are not worth promoting to defined variables.
+_linear_types = frozenset((
+    EXPR.SumExpression,
+    EXPR.SumExpressionBase,
+    EXPR.MonomialTermExpression,
+    EXPR.NegationExpression,
+    EXPR.LinearExpression,
+))
+
+
+class _SubexpressionVisitor(StreamBasedExpressionVisitor):
+    """Intern the subtrees of expressions by their structure
+
+    The key for each node is built from the information that the NL
+    writer uses when printing the node, so two subtrees with the same
+    key print identically.  Leaves are keyed by the variable id (for
+    unfixed variables) or by their value (for constants, Params, fixed
+    variables and fixed subexpressions).  Named expressions are
+    transparent (they share the id of their expression).
+    """
+
+    def __init__(self, varID_map):
+        super(_SubexpressionVisitor, self).__init__()
+        self.varID_map = varID_map
+        # structural key -> id
+        self.ids = {}
+        # id -> child ids, is-nonlinear flag, and the first node seen
+        self.children = []
+        self.nonlinear = []
+        self.nodes = []
+        # id(node) -> id for every expression node walked
+        self.node_ids = {}
+
+    def intern(self, key, children=(), nonlinear=False, node=None):
+        _id = self.ids.get(key, None)
+        if _id is None:
+            _id = self.ids[key] = len(self.nodes)
+            self.children.append(children)
+            self.nonlinear.append(nonlinear)
+            self.nodes.append(node)
+        return _id
+
+    def is_leaf(self, node):
+        if node.__class__ in native_numeric_types \
+           or isinstance(node, string_types):
+            return True
+        if not node.is_expression_type():
+            return True
+        if not node.is_potentially_variable():
+            return True
+        return node.__class__ is EXPR.ExternalFunctionExpression \
+            and node.is_fixed()
+
+    def leaf(self, node):
+        if node.__class__ in native_numeric_types:
+            return self.intern(('n', node))
+        if isinstance(node, string_types):
+            return self.intern(('s', node))
+        if node.is_variable_type() and not node.fixed:
+            return self.intern(('v', self.varID_map[id(node)]))
+        return self.intern(('n', value(node)))
+
+    def walk(self, expr):
+        if self.is_leaf(expr):
+            return self.leaf(expr)
+        return self.walk_expression(expr)
+
+    def beforeChild(self, node, child, child_idx):
+        if self.is_leaf(child):
+            return False, self.leaf(child)
+        return True, None
+
+    def exitNode(self, node, data):
+        if node.is_named_expression_type():
+            _id = data[0]
+        else:
+            _type = node.__class__
+            if _type is EXPR.ExternalFunctionExpression:
+                info = node._fcn._function
+            elif isinstance(node, EXPR.UnaryFunctionExpression):
+                info = node.name
+            elif _type in (EXPR.InequalityExpression,
+                           EXPR.RangedExpression):
+                info = node._strict
+            else:
+                info = None
+            data = tuple(data)
+            if _type in _linear_types:
+                nonlinear = any(self.nonlinear[i] for i in data)
+            else:
+                nonlinear = True
+            _id = self.intern((_type, info) + data, data, nonlinear, node)
+        self.node_ids[id(node)] = _id
+        return _id
+
+
+def collect_common_subexpressions(exprs, varID_map):
+    """Identify the repeated subexpressions to write as defined variables
+
+    Args:
+        exprs: an iterable of (expression, flag) tuples, in the order
+            that the expressions are written to the NL file, where flag
+            is CONSTRAINT or OBJECTIVE
+        varID_map: the writer's map from id(var) to the variable ID
+
+    Returns:
+        A tuple (defined, counts, index).  ``defined`` is the list of
+        expressions to write as defined variables (in the order of the
+        defined variables in the NL file, i.e., those used in both
+        constraints and objectives, then those only used in
+        constraints, then those only used in objectives, with every
+        subexpression appearing before the expressions that use it).
+        ``counts`` is the number of defined variables in each of these
+        three groups, and ``index`` maps the id() of every expression
+        node that should be replaced by a defined variable to its
+        position in ``defined``.
+    """
+    visitor = _SubexpressionVisitor(varID_map)
+    roots = [(visitor.walk(expr), flag) for expr, flag in exprs]
+    children = visitor.children
+    n = len(children)
+    #
+    # Count the uses of each subexpression.  Once a subexpression has
+    # been seen, its (already counted) children are only revisited to
+    # record where they are used: a subtree that only appears inside
+    # another repeated subtree is not itself a common subexpression.
+    #
+    uses = [0]*n
+    flags = [0]*n
+    stack = [(_id, flag, True) for _id, flag in reversed(roots)]
+    while stack:
+        _id, flag, count = stack.pop()
+        first = False
+        if count:
+            uses[_id] += 1
+            first = uses[_id] == 1
+        if first:
+            flags[_id] |= flag
+            stack.extend((i, flag, True) for i in children[_id])
+        elif flags[_id] & flag != flag:
+            flags[_id] |= flag
+            stack.extend((i, flag, False) for i in children[_id])
+    #
+    # Ids are assigned as the walker exits each node, so children
+    # always have smaller ids than their parents
+    #
+    groups = ([], [], [])
+    group_of_flags = {CONSTRAINT|OBJECTIVE: 0, CONSTRAINT: 1, OBJECTIVE: 2}
+    nonlinear = visitor.nonlinear
+    for _id in xrange(n):
+        if uses[_id] > 1 and nonlinear[_id]:
+            groups[group_of_flags[flags[_id]]].append(_id)
+    position = {}
+    defined = []
+    for group in groups:
+        for _id in group:
+            position[_id] = len(defined)
+            defined.append(visitor.nodes[_id])
+    index = dict((node_id, position[_id])
+                 for node_id, _id in visitor.node_ids.items()
+                 if _id in position)
+    return defined, tuple(len(group) for group in groups), index
@@ -17,6 +17,7 @@ import logging
 import math
 from six import iteritems, StringIO
 
+from pyomo.common.compression import guess_compression
 from pyomo.common.collections import OrderedSet
 from pyomo.opt import ProblemFormat
 from pyomo.opt.base import AbstractProblemWriter, WriterFactory
@@ -571,6 +572,11 @@ class ProblemWriter_bar(AbstractProblemWriter):
 
         if output_filename is None:
             output_filename = model.name + ".bar"
+        elif guess_compression(output_filename) is not None:
+            # BARON cannot read compressed input files
+            raise ValueError(
+                "Baron problem writer: compressed BARON files are not "
+                "supported (%s)" % (output_filename,))
 
         output_file=open(output_filename, "w")
 
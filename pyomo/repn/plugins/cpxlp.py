@@ -26,6 +26,8 @@ from pyomo.core.base import \
      SOSConstraint, Objective,
      ComponentMap, is_fixed)
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.parallel_repn import parallel_generate_standard_repn
+from pyomo.repn.repn_cache import get_repn_cache
 
 logger = logging.getLogger('pyomo.core')
 
@@ -126,6 +128,19 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         force_objective_constant = \
             io_options.pop("force_objective_constant", False)
 
+        # Generate the constraint repns using a pool of this many
+        # worker processes (the file is identical to the serial output)
+        parallel = io_options.pop("parallel", 1)
+
+        # If True, reuse the repns cached on the model by previous
+        # writes, regenerating only those whose expression or mutable
+        # Param / fixed Var dependencies have changed
+        incremental = io_options.pop("incremental", False)
+
+        # Compress the output file ('gzip' or 'zstd').  By default, the
+        # compression is inferred from the file suffix (.gz or .zst).
+        compression = io_options.pop("compression", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_cpxlp passed unrecognized io_options:\n\t" +
@@ -150,6 +165,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         if output_filename is None:
             output_filename = model.name + ".lp"
 
+        repn_cache = get_repn_cache(model) if incremental else None
+
         # when sorting, there are a non-trivial number of
         # temporary objects created. these all yield
         # non-circular references, so disable GC - the
@@ -157,7 +174,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         # are non-circular, everything will be collected
         # immediately anyway.
         with PauseGC() as pgc:
-            with open(output_filename, "w") as output_file:
+            with self._open_output_file(output_filename,
+                                        compression) as output_file:
                 symbol_map = self._print_model_LP(
                     model,
                     output_file,
@@ -169,7 +187,12 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     column_order=column_order,
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    parallel=parallel,
+                    repn_cache=repn_cache)
+
+        if repn_cache is not None:
+            repn_cache.prune(model)
 
         self._referenced_variable_ids.clear()
 
@@ -385,7 +408,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         column_order=None,
                         skip_trivial_constraints=False,
                         force_objective_constant=False,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        parallel=1,
+                        repn_cache=None):
 
         eq_string_template = self.eq_string_template
         leq_string_template = self.leq_string_template
@@ -509,7 +534,11 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     output.append("max \n")
 
                 if gen_obj_repn:
-                    repn = generate_standard_repn(objective_data.expr)
+                    if repn_cache is None:
+                        repn = generate_standard_repn(objective_data.expr)
+                    else:
+                        repn = repn_cache.get(objective_data,
+                                              objective_data.expr)
                     block_repn[objective_data] = repn
                 else:
                     repn = block_repn[objective_data]
@@ -566,7 +595,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
 
         supports_quadratic_constraint = solver_capability('quadratic_constraint')
 
-        def constraint_generator():
+        def active_constraint_generator():
             for block in all_blocks:
 
                 gen_con_repn = getattr(block, "_gen_con_repn", True)
@@ -587,15 +616,52 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         assert not constraint_data.equality
                         continue # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
-                        repn = constraint_data.canonical_form()
-                    elif gen_con_repn:
+                    yield constraint_data, gen_con_repn, block_repn
+
+        # Generate the repns in worker processes before writing the
+        # constraints (in the same order as the serial case)
+        parallel_repns = ComponentMap()
+        if parallel > 1:
+            parallel_cons = [
+                constraint_data for constraint_data, gen_con_repn, _
+                in active_constraint_generator()
+                if gen_con_repn and \
+                not constraint_data._linear_canonical_form and \
+                (repn_cache is None or repn_cache.lookup(
+                    constraint_data, constraint_data.body) is None)]
+            parallel_repns.update(zip(
+                parallel_cons,
+                parallel_generate_standard_repn(
+                    [constraint_data.body
+                     for constraint_data in parallel_cons],
+                    variable_list,
+                    parallel)))
+            del parallel_cons
+            if repn_cache is not None:
+                for constraint_data, repn in iteritems(parallel_repns):
+                    repn_cache.update(constraint_data,
+                                      constraint_data.body,
+                                      repn)
+                parallel_repns.clear()
+
+        def constraint_generator():
+            for constraint_data, gen_con_repn, block_repn in \
+                    active_constraint_generator():
+
+                if constraint_data._linear_canonical_form:
+                    repn = constraint_data.canonical_form()
+                elif gen_con_repn:
+                    repn = parallel_repns.get(constraint_data, None)
+                    if repn is None and repn_cache is not None:
+                        repn = repn_cache.get(constraint_data,
+                                              constraint_data.body)
+                    elif repn is None:
                         repn = generate_standard_repn(constraint_data.body)
-                        block_repn[constraint_data] = repn
-                    else:
-                        repn = block_repn[constraint_data]
+                    block_repn[constraint_data] = repn
+                else:
+                    repn = block_repn[constraint_data]
 
-                    yield constraint_data, repn
+                yield constraint_data, repn
 
         if row_order is not None:
             sorted_constraint_list = list(constraint_generator())
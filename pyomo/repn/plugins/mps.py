@@ -15,9 +15,10 @@
 import logging
 
 from six import iteritems, StringIO
-from six.moves import xrange
+from six.moves import xrange, zip
 
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.tempfiles import TempfileManager
 from pyomo.opt import ProblemFormat
 from pyomo.opt.base import AbstractProblemWriter, WriterFactory
 from pyomo.core.base import \
@@ -27,9 +28,99 @@ from pyomo.core.base import \
      SOSConstraint, Objective,
      ComponentMap, is_fixed)
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.parallel_repn import parallel_generate_standard_repn
+from pyomo.repn.repn_cache import get_repn_cache
 
 logger = logging.getLogger('pyomo.core')
 
+
+class _SpilledData(object):
+    """Lines appended to a set of temporary files
+
+    At most buffer_size lines are held in memory before they are
+    appended to the files.  A file is only open while lines are written
+    to it or read back from it.  The files are created by the
+    TempfileManager, so they follow its tempdir and keepfiles handling.
+    """
+
+    buffer_size = 100000
+
+    def __init__(self, nfiles):
+        self._filenames = [
+            TempfileManager.create_tempfile(suffix='.pyomo.mps.spill')
+            for i in xrange(nfiles)]
+        self._buffers = [[] for i in xrange(nfiles)]
+        self._nbuffered = 0
+
+    def _write(self, i, line):
+        self._buffers[i].append(line)
+        self._nbuffered += 1
+        if self._nbuffered >= self.buffer_size:
+            self._flush()
+
+    def _flush(self):
+        for fname, lines in zip(self._filenames, self._buffers):
+            if lines:
+                with open(fname, 'a') as f:
+                    f.writelines(lines)
+                del lines[:]
+        self._nbuffered = 0
+
+    def _read(self, i):
+        """Return the lines written to file i"""
+        if self._nbuffered:
+            self._flush()
+        with open(self._filenames[i]) as f:
+            return f.readlines()
+
+
+class _SpilledRowData(_SpilledData):
+    """A list of (row_label, value) pairs stored in a temporary file"""
+
+    def __init__(self):
+        _SpilledData.__init__(self, 1)
+
+    def append(self, entry):
+        self._write(0, "%s %r\n" % (entry[0], float(entry[1])))
+
+    def __iter__(self):
+        for line in self._read(0):
+            row_label, val = line.split()
+            yield row_label, float(val)
+
+
+class _SpilledColumnData(_SpilledData):
+    """Column-major coefficient data spilled to temporary files
+
+    The columns are partitioned into contiguous ranges (buckets), and the
+    (row_label, coef) entries for each bucket are appended to a
+    temporary file.  The columns are then read back one bucket at a
+    time, so only the entries for a single bucket are held in memory.
+    """
+
+    def __init__(self, ncols, nbuckets):
+        self.ncols = ncols
+        self.bucket_size = max(1, -(-ncols // max(1, nbuckets)))
+        _SpilledData.__init__(self, -(-ncols // self.bucket_size))
+
+    def append(self, col, row_label, coef):
+        self._write(col // self.bucket_size,
+                    "%d %s %r\n" % (col, row_label, float(coef)))
+
+    def columns(self):
+        """Yield the list of (row_label, coef) entries for each column
+        (in column order)"""
+        bucket_size = self.bucket_size
+        for i in xrange(len(self._filenames)):
+            start = i*bucket_size
+            entries = [[] for j in xrange(min(bucket_size,
+                                              self.ncols - start))]
+            for line in self._read(i):
+                col, row_label, coef = line.split()
+                entries[int(col) - start].append((row_label, float(coef)))
+            for col_entries in entries:
+                yield col_entries
+
 def _no_negative_zero(val):
     """Make sure -0 is never output. Makes diff tests easier."""
     if val == 0:
@@ -127,6 +218,26 @@ class ProblemWriter_mps(AbstractProblemWriter):
         skip_objective_sense = \
             io_options.pop("skip_objective_sense", False)
 
+        # Generate the constraint repns using a pool of this many
+        # worker processes (the file is identical to the serial output)
+        parallel = io_options.pop("parallel", 1)
+
+        # If set, write the file with bounded memory: the COLUMNS and
+        # RHS data are spilled to this many temporary files (column
+        # buckets) instead of being held in memory, and the generated
+        # constraint repns are not stored on the blocks.  The file is
+        # identical to the in-memory output.
+        column_buckets = io_options.pop("column_buckets", None)
+
+        # If True, reuse the repns cached on the model by previous
+        # writes, regenerating only those whose expression or mutable
+        # Param / fixed Var dependencies have changed
+        incremental = io_options.pop("incremental", False)
+
+        # Compress the output file ('gzip' or 'zstd').  By default, the
+        # compression is inferred from the file suffix (.gz or .zst).
+        compression = io_options.pop("compression", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_mps passed unrecognized io_options:\n\t" +
@@ -148,6 +259,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
         if output_filename is None:
             output_filename = model.name + ".mps"
 
+        repn_cache = get_repn_cache(model) if incremental else None
+
         # when sorting, there are a non-trivial number of
         # temporary objects created. these all yield
         # non-circular references, so disable GC - the
@@ -155,7 +268,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # are non-circular, everything will be collected
         # immediately anyway.
         with PauseGC() as pgc:
-            with open(output_filename, "w") as output_file:
+            with self._open_output_file(output_filename,
+                                        compression) as output_file:
                 symbol_map = self._print_model_MPS(
                     model,
                     output_file,
@@ -168,7 +282,13 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
                     include_all_variable_bounds=include_all_variable_bounds,
-                    skip_objective_sense=skip_objective_sense)
+                    skip_objective_sense=skip_objective_sense,
+                    parallel=parallel,
+                    repn_cache=repn_cache,
+                    column_buckets=column_buckets)
+
+        if repn_cache is not None:
+            repn_cache.prune(model)
 
         self._referenced_variable_ids.clear()
 
@@ -186,9 +306,15 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # Linear
         #
         if len(repn.linear_coefs) > 0:
-            for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
-                self._referenced_variable_ids[id(vardata)] = vardata
-                column_data[variable_to_column[vardata]].append((row_label, coef))
+            if column_data.__class__ is _SpilledColumnData:
+                append = column_data.append
+                for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
+                    self._referenced_variable_ids[id(vardata)] = vardata
+                    append(variable_to_column[vardata], row_label, coef)
+            else:
+                for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
+                    self._referenced_variable_ids[id(vardata)] = vardata
+                    column_data[variable_to_column[vardata]].append((row_label, coef))
 
         #
         # Quadratic
@@ -262,7 +388,10 @@ class ProblemWriter_mps(AbstractProblemWriter):
                          skip_trivial_constraints=False,
                          force_objective_constant=False,
                          include_all_variable_bounds=False,
-                         skip_objective_sense=False):
+                         skip_objective_sense=False,
+                         parallel=1,
+                         repn_cache=None,
+                         column_buckets=None):
 
         symbol_map = SymbolMap()
         variable_symbol_map = SymbolMap()
@@ -318,12 +447,21 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # prepare to hold the sparse columns
         variable_to_column = ComponentMap(
             (vardata, i) for i, vardata in enumerate(variable_list))
-        # add one position for ONE_VAR_CONSTANT
-        column_data = [[] for i in xrange(len(variable_list)+1)]
+        if column_buckets:
+            column_data = _SpilledColumnData(len(variable_list),
+                                             column_buckets)
+            # constraint rhs
+            rhs_data = _SpilledRowData()
+            # ONE_VAR_CONSTANT
+            constant_column = []
+        else:
+            # add one position for ONE_VAR_CONSTANT
+            column_data = [[] for i in xrange(len(variable_list)+1)]
+            # constraint rhs
+            rhs_data = []
+            constant_column = column_data[-1]
         quadobj_data = []
         quadmatrix_data = []
-        # constraint rhs
-        rhs_data = []
 
         # print the model name and the source, so we know
         # roughly where
@@ -381,8 +519,12 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 output_file.write(" N  %s\n" % (objective_label))
 
                 if gen_obj_repn:
-                    repn = \
-                        generate_standard_repn(objective_data.expr)
+                    if repn_cache is None:
+                        repn = \
+                            generate_standard_repn(objective_data.expr)
+                    else:
+                        repn = repn_cache.get(objective_data,
+                                              objective_data.expr)
                     block_repn[objective_data] = repn
                 else:
                     repn = block_repn[objective_data]
@@ -406,7 +548,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     variable_to_column)
                 if force_objective_constant or (constant != 0.0):
                     # ONE_VAR_CONSTANT
-                    column_data[-1].append((objective_label, constant))
+                    constant_column.append((objective_label, constant))
 
         if numObj == 0:
             raise ValueError(
@@ -415,7 +557,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
         assert objective_label is not None
 
         # Constraints
-        def constraint_generator():
+        def active_constraint_generator():
             for block in all_blocks:
 
                 gen_con_repn = \
@@ -437,15 +579,53 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         assert not constraint_data.equality
                         continue # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
-                        repn = constraint_data.canonical_form()
-                    elif gen_con_repn:
+                    yield constraint_data, gen_con_repn, block_repn
+
+        # Generate the repns in worker processes before writing the
+        # constraints (in the same order as the serial case)
+        parallel_repns = ComponentMap()
+        if parallel > 1:
+            parallel_cons = [
+                constraint_data for constraint_data, gen_con_repn, _
+                in active_constraint_generator()
+                if gen_con_repn and \
+                not constraint_data._linear_canonical_form and \
+                (repn_cache is None or repn_cache.lookup(
+                    constraint_data, constraint_data.body) is None)]
+            parallel_repns.update(zip(
+                parallel_cons,
+                parallel_generate_standard_repn(
+                    [constraint_data.body
+                     for constraint_data in parallel_cons],
+                    variable_list,
+                    parallel)))
+            del parallel_cons
+            if repn_cache is not None:
+                for constraint_data, repn in iteritems(parallel_repns):
+                    repn_cache.update(constraint_data,
+                                      constraint_data.body,
+                                      repn)
+                parallel_repns.clear()
+
+        def constraint_generator():
+            for constraint_data, gen_con_repn, block_repn in \
+                    active_constraint_generator():
+
+                if constraint_data._linear_canonical_form:
+                    repn = constraint_data.canonical_form()
+                elif gen_con_repn:
+                    repn = parallel_repns.get(constraint_data, None)
+                    if repn is None and repn_cache is not None:
+                        repn = repn_cache.get(constraint_data,
+                                              constraint_data.body)
+                    elif repn is None:
                         repn = generate_standard_repn(constraint_data.body)
+                    if not column_buckets:
                         block_repn[constraint_data] = repn
-                    else:
-                        repn = block_repn[constraint_data]
+                else:
+                    repn = block_repn[constraint_data]
 
-                    yield constraint_data, repn
+                yield constraint_data, repn
 
         if row_order is not None:
             sorted_constraint_list = list(constraint_generator())
@@ -529,10 +709,10 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 else:
                     assert constraint_data.has_lb()
 
-        if len(column_data[-1]) > 0:
+        if len(constant_column) > 0:
             # ONE_VAR_CONSTANT = 1
             output_file.write(" E  c_e_ONE_VAR_CONSTANT\n")
-            column_data[-1].append(("c_e_ONE_VAR_CONSTANT",1))
+            constant_column.append(("c_e_ONE_VAR_CONSTANT",1))
             rhs_data.append(("c_e_ONE_VAR_CONSTANT",1))
 
         #
@@ -540,9 +720,13 @@ class ProblemWriter_mps(AbstractProblemWriter):
         #
         column_template = "     %s %s %"+self._precision_string+"\n"
         output_file.write("COLUMNS\n")
+        if column_buckets:
+            all_columns = column_data.columns()
+        else:
+            all_columns = column_data
         cnt = 0
-        for vardata in variable_list:
-            col_entries = column_data[variable_to_column[vardata]]
+        # The columns are stored in variable_list order
+        for vardata, col_entries in zip(variable_list, all_columns):
             cnt += 1
             if len(col_entries) > 0:
                 var_label = variable_symbol_dictionary[id(vardata)]
@@ -565,9 +749,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
                                      objective_label,
                                      0))
 
-        assert cnt == len(column_data)-1
-        if len(column_data[-1]) > 0:
-            col_entries = column_data[-1]
+        assert cnt == len(variable_list)
+        if len(constant_column) > 0:
+            col_entries = constant_column
             var_label = "ONE_VAR_CONSTANT"
             for i, (row_label, coef) in enumerate(col_entries):
                 output_file.write(column_template
@@ -0,0 +1,181 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['StandardRepnCache', 'get_repn_cache']
+
+import itertools
+
+from pyomo.core.base import ComponentMap
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import native_numeric_types, value
+from pyomo.core.expr.visitor import (SimpleExpressionVisitor,
+                                     identify_mutable_parameters)
+from pyomo.repn.standard_repn import generate_standard_repn
+
+from six import itervalues
+
+
+class _DependencyVisitor(SimpleExpressionVisitor):
+    """Collect the leaves whose state determines the repn of an expression
+
+    This records the variables (whose fixed status and values are folded
+    into the repn), the mutable parameters, and the named expressions
+    (whose expression may be replaced) that appear in an expression.
+    """
+
+    def __init__(self):
+        self.seen = set()
+        self.vars = []
+        self.params = []
+        self.named = []
+
+    def visit(self, node):
+        if node.__class__ in native_numeric_types or id(node) in self.seen:
+            return
+        self.seen.add(id(node))
+        if node.is_variable_type():
+            self.vars.append(node)
+        elif node.is_named_expression_type():
+            self.named.append(node)
+        elif node.__class__ is EXPR.LinearExpression:
+            for v in node.linear_vars:
+                self.visit(v)
+            for arg in itertools.chain((node.constant,), node.linear_coefs):
+                if arg.__class__ not in native_numeric_types:
+                    for p in identify_mutable_parameters(arg):
+                        self.visit(p)
+        elif not node.is_expression_type() and not node.is_constant():
+            self.params.append(node)
+
+
+class CachedStandardRepn(object):
+    """A StandardRepn together with the state it was generated from
+
+    The state records the fixed status (and values) of the variables,
+    the values of the mutable parameters, and the expressions of the
+    named expressions that appear in the expression.
+    """
+
+    __slots__ = ('expr', 'vars', 'params', 'named', 'state', 'repn')
+
+    def __init__(self, expr, repn=None, quadratic=True):
+        self.expr = expr
+        visitor = _DependencyVisitor()
+        if expr.__class__ in native_numeric_types \
+           or not expr.is_expression_type() or expr.nargs() == 0:
+            visitor.visit(expr)
+        else:
+            visitor.xbfs(expr)
+        self.vars = visitor.vars
+        self.params = visitor.params
+        self.named = visitor.named
+        self.state = self.current_state()
+        if repn is None:
+            repn = generate_standard_repn(expr, quadratic=quadratic)
+        self.repn = repn
+
+    def current_state(self):
+        return (
+            tuple((v.fixed, v.value if v.fixed else None)
+                  for v in self.vars),
+            tuple(value(p) for p in self.params),
+            tuple(id(e.expr) for e in self.named),
+        )
+
+    def is_current(self, expr):
+        """True if the repn is still valid for ``expr``"""
+        return expr is self.expr and self.state == self.current_state()
+
+
+class StandardRepnCache(object):
+    """A cache of StandardRepn objects that tracks their dependencies
+
+    Each cached repn records the mutable Params, Vars and named
+    Expressions its expression depends on.  A repn is regenerated only
+    when the expression itself is replaced, or when one of these
+    dependencies changes (a Param value, a Var being fixed / unfixed or
+    the value of a fixed Var, or the expression of a named Expression).
+
+    Repns generated with and without quadratic processing are cached
+    separately, so writers that use different repn options can share
+    a cache.
+    """
+
+    def __init__(self):
+        self._entries = {True: ComponentMap(), False: ComponentMap()}
+
+    def __len__(self):
+        return sum(len(entries) for entries in itervalues(self._entries))
+
+    def lookup(self, component, expr, quadratic=True):
+        """Return the cached repn entry for ``component`` if it is
+        still valid for ``expr`` (otherwise None)"""
+        entry = self._entries[quadratic].get(component, None)
+        if entry is None or not entry.is_current(expr):
+            return None
+        return entry
+
+    def update(self, component, expr, repn=None, quadratic=True):
+        """Store (and return) a new entry for ``component``
+
+        If ``repn`` is None, it is generated from ``expr``.
+        """
+        entry = CachedStandardRepn(expr, repn, quadratic)
+        self._entries[quadratic][component] = entry
+        return entry
+
+    def get_entry(self, component, expr, quadratic=True):
+        """Return the (possibly regenerated) repn entry for ``component``"""
+        entry = self.lookup(component, expr, quadratic)
+        if entry is None:
+            entry = self.update(component, expr, quadratic=quadratic)
+        return entry
+
+    def get(self, component, expr, quadratic=True):
+        """Return the (possibly regenerated) repn for ``component``"""
+        return self.get_entry(component, expr, quadratic).repn
+
+    def invalidate(self, component=None):
+        """Discard the cached repn for ``component`` (or all repns)"""
+        for entries in itervalues(self._entries):
+            if component is None:
+                entries.clear()
+            elif component in entries:
+                del entries[component]
+
+    def prune(self, model):
+        """Discard the repns for components that are no longer part of
+        the model containing ``model``"""
+        root = _root(model)
+        for entries in itervalues(self._entries):
+            for component in [c for c in entries if _root(c) is not root]:
+                del entries[component]
+
+
+def _root(component):
+    if hasattr(component, 'model'):
+        # The owning component of a data object may already have been
+        # garbage collected
+        if component.parent_component() is None:
+            return None
+        return component.model()
+    # Kernel components
+    while component.parent is not None:
+        component = component.parent
+    return component
+
+
+def get_repn_cache(model):
+    """Return the StandardRepnCache stored on a model (creating it if
+    necessary)"""
+    cache = getattr(model, '_repn_cache', None)
+    if cache is None:
+        cache = model._repn_cache = StandardRepnCache()
+    return cache
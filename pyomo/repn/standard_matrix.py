@@ -0,0 +1,306 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from __future__ import division
+
+__all__ = ['StandardMatrixRepn', 'generate_standard_matrix_repn']
+
+import array
+import logging
+
+from pyomo.common.dependencies import (
+    numpy, numpy_available, scipy,
+)
+from pyomo.core.base import Constraint, Objective, SortComponents
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import native_numeric_types, value
+from pyomo.repn.standard_repn import generate_standard_repn
+
+from six.moves import zip
+
+logger = logging.getLogger('pyomo.core')
+
+
+class StandardMatrixRepn(object):
+    """
+    A columnar (sparse matrix) representation of the active linear
+    constraints and objectives of a block.
+
+    The constraint matrix is stored in compressed sparse row (CSR)
+    format using the ``A_data``, ``A_indices`` and ``A_indptr`` NumPy
+    arrays.  Row ``i`` corresponds to ``constraints[i]`` and column
+    ``j`` corresponds to ``variables[j]``.  The constant term of each
+    constraint body is stored in ``row_constant``, so that the
+    constraints are::
+
+        row_lb <= A*x + row_constant <= row_ub
+
+    Missing bounds are stored as +/- inf.  The objectives are stored the
+    same way in ``c_data``, ``c_indices`` and ``c_indptr`` (one row per
+    objective), with the constant terms in ``obj_constant`` and the
+    sense (1 for minimize, -1 for maximize) in ``obj_sense``.
+    """
+
+    __slots__ = ('variables',
+                 'constraints',
+                 'objectives',
+                 'A_data',
+                 'A_indices',
+                 'A_indptr',
+                 'row_lb',
+                 'row_ub',
+                 'row_constant',
+                 'c_data',
+                 'c_indices',
+                 'c_indptr',
+                 'obj_constant',
+                 'obj_sense')
+
+    def __init__(self):
+        self.variables = []
+        self.constraints = []
+        self.objectives = []
+        self.A_data = None
+        self.A_indices = None
+        self.A_indptr = None
+        self.row_lb = None
+        self.row_ub = None
+        self.row_constant = None
+        self.c_data = None
+        self.c_indices = None
+        self.c_indptr = None
+        self.obj_constant = None
+        self.obj_sense = None
+
+    def __getstate__(self):
+        """
+        This method is required because this class uses slots.
+        """
+        return tuple(getattr(self, k) for k in StandardMatrixRepn.__slots__)
+
+    def __setstate__(self, state):
+        """
+        This method is required because this class uses slots.
+        """
+        for k, v in zip(StandardMatrixRepn.__slots__, state):
+            setattr(self, k, v)
+
+    @property
+    def shape(self):
+        """The (rows, columns) shape of the constraint matrix"""
+        return (len(self.constraints), len(self.variables))
+
+    @property
+    def nnz(self):
+        """The number of nonzeros in the constraint matrix"""
+        return len(self.A_data)
+
+    def coo(self):
+        """Return the constraint matrix as (row, col, data) COO arrays"""
+        row = numpy.repeat(numpy.arange(len(self.constraints)),
+                           numpy.diff(self.A_indptr))
+        return row, self.A_indices, self.A_data
+
+    def to_csr(self):
+        """Return the constraint matrix as a scipy.sparse.csr_matrix"""
+        return scipy.sparse.csr_matrix(
+            (self.A_data, self.A_indices, self.A_indptr), shape=self.shape)
+
+    def to_coo(self):
+        """Return the constraint matrix as a scipy.sparse.coo_matrix"""
+        row, col, data = self.coo()
+        return scipy.sparse.coo_matrix((data, (row, col)), shape=self.shape)
+
+    def objective_to_csr(self):
+        """Return the objective coefficients as a scipy.sparse.csr_matrix"""
+        return scipy.sparse.csr_matrix(
+            (self.c_data, self.c_indices, self.c_indptr),
+            shape=(len(self.objectives), len(self.variables)))
+
+
+def _get_bound(exp, default):
+    if exp is None:
+        return default
+    return value(exp)
+
+
+class _MatrixCollector(object):
+    """Accumulate sparse rows into flat array buffers"""
+
+    def __init__(self, column_map, variables):
+        self.column_map = column_map
+        self.variables = variables
+        self.data = array.array('d')
+        self.indices = array.array('l')
+        self.indptr = array.array('l', [0])
+        self.constant = array.array('d')
+        # Reused for every row to merge duplicate variables
+        self._row = {}
+
+    def _column(self, var):
+        _id = id(var)
+        col = self.column_map.get(_id, None)
+        if col is None:
+            col = self.column_map[_id] = len(self.variables)
+            self.variables.append(var)
+        return col
+
+    def add_row(self, expr, component):
+        """Add the linear expression ``expr``; return False for trivial rows"""
+        row = self._row
+        row.clear()
+        if expr.__class__ is EXPR.LinearExpression:
+            # Fast path: read the coefficients directly from the
+            # expression without creating an intermediate StandardRepn
+            const = value(expr.constant)
+            for c, v in zip(expr.linear_coefs, expr.linear_vars):
+                if c.__class__ not in native_numeric_types:
+                    c = value(c)
+                if v.fixed:
+                    const += c * v.value
+                    continue
+                col = self._column(v)
+                if col in row:
+                    row[col] += c
+                else:
+                    row[col] = c
+        else:
+            repn = generate_standard_repn(expr, quadratic=False)
+            if repn.nonlinear_expr is not None:
+                raise ValueError(
+                    "Cannot generate a standard matrix representation: "
+                    "'%s' is not linear" % (component.name,))
+            const = value(repn.constant)
+            for c, v in zip(repn.linear_coefs, repn.linear_vars):
+                col = self._column(v)
+                if col in row:
+                    row[col] += c
+                else:
+                    row[col] = c
+        self.constant.append(const)
+        self.indices.extend(row.keys())
+        self.data.extend(row.values())
+        self.indptr.append(len(self.indices))
+        return bool(row)
+
+    def pop_row(self):
+        """Remove the most recently added row"""
+        start = self.indptr[-2]
+        del self.indices[start:]
+        del self.data[start:]
+        self.indptr.pop()
+        self.constant.pop()
+
+
+def _to_numpy(buf, dtype):
+    # numpy.frombuffer avoids copying the data accumulated in the
+    # array.array buffer.
+    if not buf:
+        return numpy.zeros(0, dtype=dtype)
+    return numpy.frombuffer(buf, dtype=buf.typecode).astype(dtype, copy=False)
+
+
+def generate_standard_matrix_repn(block,
+                                  sort=SortComponents.deterministic,
+                                  descend_into=True,
+                                  skip_trivial_constraints=False,
+                                  include_objectives=True):
+    """Compile the active constraints and objectives of a block into a
+    :class:`StandardMatrixRepn`.
+
+    All active constraints (and, if ``include_objectives`` is True,
+    objectives) are processed in a single pass.  Columns are assigned
+    to variables in the order in which they are first encountered, so
+    the result is deterministic as long as the component ordering
+    (controlled by ``sort``) is deterministic.  Fixed variables are
+    moved into the constant terms.
+
+    Raises a ValueError if any active constraint or objective is not
+    linear.
+
+    Args:
+        block: The block to compile
+        sort: The SortComponents flags used to order the components
+        descend_into: If True, include components on sub-blocks
+        skip_trivial_constraints: If True, omit constraints whose body
+            does not contain any unfixed variables
+        include_objectives: If True, compile the active objectives
+
+    Returns:
+        StandardMatrixRepn
+    """
+    if not numpy_available:
+        raise RuntimeError(
+            "generate_standard_matrix_repn requires numpy, "
+            "which is not available")
+
+    ans = StandardMatrixRepn()
+    column_map = {}
+    rows = _MatrixCollector(column_map, ans.variables)
+    row_lb = array.array('d')
+    row_ub = array.array('d')
+    inf = float('inf')
+
+    for con in block.component_data_objects(Constraint,
+                                            active=True,
+                                            sort=sort,
+                                            descend_into=descend_into):
+        body = con.body
+        if body is None:
+            raise ValueError(
+                "No expression has been defined for the body "
+                "of constraint %s" % (con.name,))
+        if body.__class__ in native_numeric_types \
+           or not body.is_potentially_variable():
+            nontrivial = False
+            rows.constant.append(value(body))
+            rows.indptr.append(len(rows.indices))
+        else:
+            nontrivial = rows.add_row(body, con)
+        if not nontrivial and skip_trivial_constraints:
+            rows.pop_row()
+            continue
+        ans.constraints.append(con)
+        row_lb.append(_get_bound(con.lower, -inf))
+        row_ub.append(_get_bound(con.upper, inf))
+
+    objs = _MatrixCollector(column_map, ans.variables)
+    obj_sense = array.array('l')
+    if include_objectives:
+        for obj in block.component_data_objects(Objective,
+                                                active=True,
+                                                sort=sort,
+                                                descend_into=descend_into):
+            expr = obj.expr
+            if expr is None:
+                raise ValueError(
+                    "No expression has been defined for objective %s"
+                    % (obj.name,))
+            if expr.__class__ in native_numeric_types \
+               or not expr.is_potentially_variable():
+                objs.constant.append(value(expr))
+                objs.indptr.append(len(objs.indices))
+            else:
+                objs.add_row(expr, obj)
+            ans.objectives.append(obj)
+            obj_sense.append(obj.sense)
+
+    ans.A_data = _to_numpy(rows.data, numpy.float64)
+    ans.A_indices = _to_numpy(rows.indices, numpy.int64)
+    ans.A_indptr = _to_numpy(rows.indptr, numpy.int64)
+    ans.row_lb = _to_numpy(row_lb, numpy.float64)
+    ans.row_ub = _to_numpy(row_ub, numpy.float64)
+    ans.row_constant = _to_numpy(rows.constant, numpy.float64)
+    ans.c_data = _to_numpy(objs.data, numpy.float64)
+    ans.c_indices = _to_numpy(objs.indices, numpy.int64)
+    ans.c_indptr = _to_numpy(objs.indptr, numpy.int64)
+    ans.obj_constant = _to_numpy(objs.constant, numpy.float64)
+    ans.obj_sense = _to_numpy(obj_sense, numpy.int64)
+    return ans
@@ -12,14 +12,38 @@
 #
 
 import os
+from io import BytesIO
 
 import pyutilib.th as unittest
 
 from pyomo.common.getGSL import find_GSL
-from pyomo.environ import ConcreteModel, Var, Constraint, Objective, Param, Block, ExternalFunction, value
+from pyomo.environ import ConcreteModel, Var, Constraint, Objective, Param, Block, ExternalFunction, Expression, Suffix, Integers, RangeSet, value, exp, log, sin
+import pyomo.repn.repn_cache as repn_cache
+from pyomo.repn.plugins.ampl.nl_binary import (NLBinaryStream,
+                                                 nl_binary_to_text,
+                                                 pack_rows)
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
+def _nl_tokens(nl):
+    # Normalize the numbers (and drop the comments) so the text NL file
+    # can be compared to the decoded binary NL file
+    ans = []
+    for i, line in enumerate(nl.splitlines()):
+        line = line.split('#')[0].split()
+        if i == 0:
+            line[0] = line[0][1:]
+        elif i == 5:
+            line[2] = '0'
+        for tok in line:
+            key = tok[0] if tok[0].isalpha() else ''
+            try:
+                ans.append((key, float(tok[len(key):])))
+            except ValueError:
+                ans.append((key, tok[len(key):]))
+    return ans
+
+
 class TestNLWriter(unittest.TestCase):
 
     def _cleanup(self, fname):
@@ -186,6 +210,220 @@ class TestNLWriter(unittest.TestCase):
             delete=True)
         self._cleanup(test_fname)
 
+    def test_incremental(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], bounds=(0,10), initialize=1)
+        m.p = Param(mutable=True, initialize=2)
+        m.q = Param(mutable=True, initialize=3)
+        m.e = Expression(expr=exp(m.x[1]))
+        m.c1 = Constraint(expr=m.p*m.x[1] + m.x[2]**2 <= 4)
+        m.c2 = Constraint(expr=m.q*m.x[2] + m.x[3] >= m.q)
+        m.c3 = Constraint(expr=m.e + m.x[3] == 1)
+        m.o = Objective(expr=m.x[1]**2 + m.q*m.x[3])
+
+        baseline_fname, test_fname = self._get_fnames()
+        ncalls = [0]
+        _generate_standard_repn = repn_cache.generate_standard_repn
+        def _counter(*args, **kwds):
+            ncalls[0] += 1
+            return _generate_standard_repn(*args, **kwds)
+
+        def _check(nrepn):
+            for incremental in (False, True):
+                ncalls[0] = 0
+                fname = baseline_fname if not incremental else test_fname
+                self._cleanup(fname)
+                m.write(fname, format='nl',
+                        io_options={'symbolic_solver_labels': True,
+                                    'incremental': incremental})
+            self.assertEqual(ncalls[0], nrepn)
+            self.assertFileEqualsBaseline(test_fname, baseline_fname)
+            self._cleanup(baseline_fname)
+
+        repn_cache.generate_standard_repn = _counter
+        try:
+            _check(4)
+            _check(0)
+            m.p = 5
+            _check(1)
+            m.q = 7
+            _check(2)
+            m.x[2].fix(3)
+            _check(2)
+            m.x[2].unfix()
+            _check(2)
+            m.e.expr = sin(m.x[2])
+            _check(1)
+            m.c2.set_value(m.x[1] >= 0)
+            _check(1)
+            m.x[1].setub(3)
+            m.c1.deactivate()
+            _check(0)
+        finally:
+            repn_cache.generate_standard_repn = _generate_standard_repn
+            self._cleanup(test_fname)
+        self.assertEqual(len(m._nl_incremental_cache.segments), 3)
+        # The (deactivated) c1 is still cached
+        self.assertEqual(len(m._repn_cache), 4)
+
+    def test_defined_variables(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], initialize=1)
+        m.p = Param(initialize=2, mutable=True)
+        m.e = Expression(expr=exp(m.x[1]*m.x[2]))
+        m.c1 = Constraint(expr=exp(m.x[1]*m.x[2]) + m.x[3] <= 10)
+        m.c2 = Constraint(expr=exp(m.x[1]*m.x[2])**2
+                          + sin(m.x[3]+m.x[1]) >= 1)
+        m.c3 = Constraint(expr=m.e*m.x[3] + sin(m.x[3]+m.x[1])
+                          + m.x[2] == 1)
+        m.c4 = Constraint(expr=m.x[1] + m.x[2] >= 0)
+        m.o = Objective(expr=m.p*m.x[1]**2 + log(1+m.x[1]**2)
+                        + sin(m.x[3]+m.x[1]))
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(test_fname)
+        m.write(test_fname, format='nl',
+                io_options={'symbolic_solver_labels': True,
+                            'defined_variables': True})
+        self.assertFileEqualsBaseline(
+            test_fname,
+            baseline_fname,
+            delete=True)
+        self._cleanup(test_fname)
+
+        # Without repeated nonlinear subexpressions, the NL file is
+        # unchanged
+        m.c2.deactivate()
+        m.c3.deactivate()
+        m.o.set_value(m.x[1]**2 + sin(m.x[3]+m.x[1]))
+        m.write(test_fname, format='nl',
+                io_options={'symbolic_solver_labels': True})
+        with open(test_fname) as f:
+            baseline = f.read()
+        m.write(test_fname, format='nl',
+                io_options={'symbolic_solver_labels': True,
+                            'defined_variables': True})
+        with open(test_fname) as f:
+            self.assertEqual(f.read(), baseline)
+        self._cleanup(test_fname)
+
+    def test_binary(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=2, bounds=(-1, 10))
+        m.y = Var(domain=Integers, bounds=(None, 100))
+        m.c1 = Constraint(expr=(1, m.x[1]**2 + 0.5*m.x[2], 12.5))
+        m.c2 = Constraint(expr=exp(m.x[3]) - m.y >= -3)
+        m.c3 = Constraint(expr=sum(m.x.values()) + m.y == 7)
+        m.o = Objective(expr=sin(m.x[1])*m.x[2] + 2.25*m.y + 1)
+        m.dual = Suffix(direction=Suffix.EXPORT)
+        m.dual[m.c1] = 1.5
+        m.priority = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        m.priority[m.y] = 3
+
+        baseline_fname, test_fname = self._get_fnames()
+        try:
+            for symbolic_solver_labels in (False, True):
+                m.write(baseline_fname, format='nl',
+                        io_options={'symbolic_solver_labels':
+                                    symbolic_solver_labels})
+                m.write(test_fname, format='nl',
+                        io_options={'symbolic_solver_labels':
+                                    symbolic_solver_labels,
+                                    'binary': True})
+                with open(test_fname, 'rb') as f:
+                    data = f.read()
+                self.assertTrue(data.startswith(b'b3 '))
+                with open(baseline_fname) as f:
+                    text = f.read()
+                self.assertEqual(_nl_tokens(nl_binary_to_text(data)),
+                                 _nl_tokens(text))
+        finally:
+            self._cleanup(baseline_fname)
+            self._cleanup(test_fname)
+
+    def test_binary_packed_data(self):
+        m = ConcreteModel()
+        m.I = RangeSet(20)
+        m.x = Var(m.I, initialize=lambda m, i: i/4., bounds=(0, None))
+        m.c = Constraint(m.I, rule=lambda m, i:
+                         sum((i+j)*m.x[j] for j in m.I if j >= i) <= i)
+        m.o = Objective(expr=sum(m.x.values()))
+
+        # The data lines of the segments are packed directly, and are
+        # not written as text (and translated)
+        translated = []
+        orig_line = NLBinaryStream._line
+        def _line(stream, tokens):
+            if stream._ndata:
+                translated.append(tokens)
+            orig_line(stream, tokens)
+        baseline_fname, test_fname = self._get_fnames()
+        NLBinaryStream._line = _line
+        try:
+            # The segments cached by incremental writes are specific to
+            # the format
+            for binary in (False, True, True, False, True):
+                m.write(test_fname, format='nl',
+                        io_options={'binary': binary,
+                                    'incremental': True})
+                m.write(baseline_fname, format='nl')
+                with open(baseline_fname) as f:
+                    baseline = _nl_tokens(f.read())
+                if binary:
+                    with open(test_fname, 'rb') as f:
+                        test = _nl_tokens(nl_binary_to_text(f.read()))
+                else:
+                    with open(test_fname) as f:
+                        test = _nl_tokens(f.read())
+                self.assertEqual(test, baseline)
+        finally:
+            NLBinaryStream._line = orig_line
+            self._cleanup(baseline_fname)
+            self._cleanup(test_fname)
+        self.assertEqual(translated, [])
+
+    def test_pack_rows(self):
+        ostream = BytesIO()
+        stream = NLBinaryStream(ostream)
+        # (2 variables and 2 constraints)
+        stream.write("g3 1 1 0\n 2 2 1 0 0\n 0 0\n 0 0\n 0 0 0\n"
+                     " 0 0 0 1\n 0 0 0 0 0\n 0 0\n 0 0\n 0 0 0 0 0\n")
+        stream.write("x2\n")
+        stream.write_data(2, pack_rows('id', [(0, 1.5), (1, 2)]))
+        stream.write("r\n")
+        stream.write_data(1, pack_rows('range', [(0, -1, 2.5)]))
+        stream.write_data(1, pack_rows('range', [(3,)]))
+        stream.write("b\n")
+        stream.write_data(2, pack_rows('range', [(4, 1), (2, 0)]))
+        stream.write("k1\n")
+        with self.assertRaisesRegexp(ValueError, '1 data lines remaining'):
+            stream.write_data(2, pack_rows('i', [1, 2]))
+        stream.write_data(1, pack_rows('i', [1]))
+        stream.close()
+        text = nl_binary_to_text(ostream.getvalue())
+        self.assertEqual(text.splitlines()[10:], [
+            'x2', '0 1.5', '1 2.0',
+            'r', '0 -1.0 2.5', '3',
+            'b', '4 1.0', '2 0.0',
+            'k1', '1'])
+
+    def test_binary_translation(self):
+        # This binary NL file was generated by AMPL
+        fname = os.path.join(os.path.dirname(os.path.dirname(
+            os.path.dirname(thisdir))), 'solvers', 'tests', 'mip',
+                             'test_mod_nl1.nl')
+        with open(fname, 'rb') as f:
+            data = f.read()
+        text = nl_binary_to_text(data)
+        self.assertTrue(text.startswith('g3 0 1 0'))
+        ostream = BytesIO()
+        stream = NLBinaryStream(ostream)
+        # The translation does not depend on how the text is written
+        for i in range(0, len(text), 7):
+            stream.write(text[i:i+7])
+        stream.close()
+        self.assertEqual(ostream.getvalue(), data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -149,6 +149,16 @@ class Test(unittest.TestCase):
             m.write(test_fname, format="bar")
         self._cleanup(test_fname)
 
+    def test_compressed_file_generates_exception(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.obj = Objective(expr=m.x)
+        test_fname = self._get_fnames()[1] + '.gz'
+        with self.assertRaisesRegexp(
+                ValueError, 'compressed BARON files are not supported'):
+            m.write(test_fname, format="bar")
+        self.assertFalse(os.path.exists(test_fname))
+
     def test_exponential_NPV(self):
         m = ConcreteModel()
         m.x = Var()
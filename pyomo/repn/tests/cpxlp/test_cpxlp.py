@@ -11,12 +11,13 @@
 # Test the canonical expressions
 #
 
+import gzip
 import os
 import random
 
 import pyutilib.th as unittest
 
-from pyomo.environ import ConcreteModel, Var, Constraint, Objective, Block, ComponentMap
+from pyomo.environ import ConcreteModel, Var, Param, Constraint, Objective, Block, ComponentMap
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -142,6 +143,88 @@ class TestCPXLPOrdering(unittest.TestCase):
 
         self._check_baseline(model, file_determinism=2)
 
+    def test_parallel(self):
+        model = ConcreteModel()
+        model.x = Var(range(10), bounds=(0, None))
+        model.b = Block(range(20))
+        for i, b in model.b.items():
+            b.y = Var()
+            b.c1 = Constraint(expr=b.y + sum((i+j)*model.x[j]
+                                             for j in range(i % 10)) >= i)
+            b.c2 = Constraint(expr=(-i, b.y*model.x[i % 10] - model.x[0], 5))
+        model.b[3].y.fix(2)
+        model.obj = Objective(expr=sum(b.y for b in model.b.values()))
+
+        baseline_fname, test_fname = self._get_fnames()
+        for fname, parallel in ((baseline_fname, 1), (test_fname, 3)):
+            self._cleanup(fname)
+            model.write(fname, format="lp",
+                        io_options={"symbolic_solver_labels": True,
+                                    "output_fixed_variable_bounds": True,
+                                    "parallel": parallel})
+        self.assertFileEqualsBaseline(test_fname, baseline_fname)
+        self._cleanup(baseline_fname)
+
+    def test_incremental(self):
+        model = ConcreteModel()
+        model.x = Var(range(5), bounds=(0, None))
+        model.p = Param(range(5), mutable=True, initialize=1)
+        model.c = Constraint(range(5), rule=lambda m, i:
+                             m.p[i]*m.x[i] + m.x[(i+1) % 5] >= i)
+        model.obj = Objective(expr=sum(model.p[i]*model.x[i]**2
+                                       for i in range(5)))
+
+        baseline_fname, test_fname = self._get_fnames()
+        def _check(parallel):
+            for fname, incremental in ((baseline_fname, False),
+                                       (test_fname, True)):
+                self._cleanup(fname)
+                model.write(fname, format="lp",
+                            io_options={"symbolic_solver_labels": True,
+                                        "incremental": incremental,
+                                        "parallel": parallel})
+            self.assertFileEqualsBaseline(test_fname, baseline_fname,
+                                          delete=False)
+        try:
+            _check(1)
+            self.assertEqual(len(model._repn_cache), 6)
+            model.p[2] = 4
+            cache = model._repn_cache
+            self.assertIsNone(cache.lookup(model.c[2], model.c[2].body))
+            self.assertIsNotNone(cache.lookup(model.c[3], model.c[3].body))
+            _check(2)
+            model.x[1].fix(3)
+            _check(1)
+            model.del_component(model.c)
+            _check(1)
+            self.assertEqual(len(model._repn_cache), 1)
+        finally:
+            self._cleanup(baseline_fname)
+            self._cleanup(test_fname)
+
+    def test_compression(self):
+        model = ConcreteModel()
+        model.x = Var(range(5), bounds=(0, None))
+        model.c = Constraint(range(5), rule=lambda m, i:
+                             m.x[i] + m.x[(i+1) % 5] >= i)
+        model.obj = Objective(expr=sum(model.x.values()))
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(baseline_fname)
+        model.write(baseline_fname, format="lp")
+        try:
+            for fname, compression in ((test_fname + ".gz", None),
+                                       (test_fname, "gzip")):
+                self._cleanup(fname)
+                model.write(fname, format="lp",
+                            io_options={"compression": compression})
+                with gzip.open(fname, "rt") as f, \
+                     open(baseline_fname) as baseline:
+                    self.assertEqual(f.read(), baseline.read())
+                self._cleanup(fname)
+        finally:
+            self._cleanup(baseline_fname)
+
     def test_row_ordering(self):
         model = ConcreteModel()
         model.a = Var()
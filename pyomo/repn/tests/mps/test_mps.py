@@ -16,7 +16,9 @@ import random
 
 import pyutilib.th as unittest
 
-from pyomo.environ import ConcreteModel, Var, Objective, Constraint, ComponentMap
+import pyomo.repn.plugins.mps as mps
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.environ import ConcreteModel, Var, Objective, Constraint, Block, ComponentMap, Integers
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -142,6 +144,96 @@ class TestMPSOrdering(unittest.TestCase):
 
         self._check_baseline(model, file_determinism=2)
 
+    def test_parallel(self):
+        model = ConcreteModel()
+        model.x = Var(range(10), bounds=(0, None))
+        model.b = Block(range(20))
+        for i, b in model.b.items():
+            b.y = Var()
+            b.c1 = Constraint(expr=b.y + sum((i+j)*model.x[j]
+                                             for j in range(i % 10)) >= i)
+            b.c2 = Constraint(expr=(-i, b.y*model.x[i % 10] - model.x[0], 5))
+        model.b[3].y.fix(2)
+        model.obj = Objective(expr=sum(b.y for b in model.b.values()))
+
+        baseline_fname, test_fname = self._get_fnames()
+        for fname, parallel in ((baseline_fname, 1), (test_fname, 3)):
+            self._cleanup(fname)
+            model.write(fname, format="mps",
+                        io_options={"symbolic_solver_labels": True,
+                                    "output_fixed_variable_bounds": True,
+                                    "parallel": parallel})
+        self.assertFileEqualsBaseline(test_fname, baseline_fname)
+        self._cleanup(baseline_fname)
+
+    def test_column_buckets(self):
+        model = ConcreteModel()
+        model.x = Var(range(10), bounds=(0, None))
+        model.z = Var(domain=Integers)
+        model.b = Block(range(20))
+        for i, b in model.b.items():
+            b.y = Var()
+            b.c1 = Constraint(expr=b.y + sum((i+j)*model.x[j]
+                                             for j in range(i % 10)) >= i)
+            b.c2 = Constraint(expr=(-i, 0.1*i*b.y - model.x[0] + 1, 5))
+        model.b[3].y.fix(2)
+        model.obj = Objective(expr=sum(b.y for b in model.b.values()) + 3)
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(baseline_fname)
+        io_options = {"symbolic_solver_labels": True,
+                      "output_fixed_variable_bounds": True,
+                      "include_all_variable_bounds": True}
+        model.write(baseline_fname, format="mps", io_options=io_options)
+        try:
+            for nbuckets in (1, 3, 100):
+                self._cleanup(test_fname)
+                io_options["column_buckets"] = nbuckets
+                model.write(test_fname, format="mps", io_options=io_options)
+                self.assertFileEqualsBaseline(test_fname, baseline_fname,
+                                              delete=False)
+        finally:
+            self._cleanup(baseline_fname)
+            self._cleanup(test_fname)
+
+    def test_column_buckets_tempfiles(self):
+        model = ConcreteModel()
+        model.x = Var(range(10), bounds=(0, None))
+        model.c = Constraint(range(10), rule=lambda m, i: sum(
+            (i+j+1)*m.x[j] for j in range(i+1)) >= i)
+        model.obj = Objective(expr=sum(model.x.values()))
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(baseline_fname)
+        io_options = {"symbolic_solver_labels": True}
+        model.write(baseline_fname, format="mps", io_options=io_options)
+        io_options["column_buckets"] = 3
+        orig_tempdir = TempfileManager.tempdir
+        orig_buffer_size = mps._SpilledData.buffer_size
+        # The spill files are flushed (and closed) every 7 entries
+        mps._SpilledData.buffer_size = 7
+        TempfileManager.push()
+        tempdir = TempfileManager.create_tempdir()
+        TempfileManager.tempdir = tempdir
+        try:
+            model.write(test_fname, format="mps", io_options=io_options)
+            # The column buckets and the rhs data are written to the
+            # TempfileManager's tempdir
+            spilled = sorted(os.listdir(tempdir))
+            self.assertEqual(len(spilled), 4)
+            self.assertTrue(all(f.endswith('.pyomo.mps.spill')
+                                for f in spilled))
+        finally:
+            TempfileManager.pop()
+            TempfileManager.tempdir = orig_tempdir
+            mps._SpilledData.buffer_size = orig_buffer_size
+        self.assertFalse(os.path.exists(tempdir))
+        try:
+            self.assertFileEqualsBaseline(test_fname, baseline_fname)
+        finally:
+            self._cleanup(baseline_fname)
+            self._cleanup(test_fname)
+
     def test_row_ordering(self):
         model = ConcreteModel()
         model.a = Var()
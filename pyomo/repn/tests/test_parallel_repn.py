@@ -0,0 +1,78 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the parallel generation of standard repns
+#
+
+import multiprocessing
+
+import pyutilib.th as unittest
+
+from pyomo.environ import ConcreteModel, Var, Param, exp
+from pyomo.repn import generate_standard_repn
+from pyomo.repn.parallel_repn import parallel_generate_standard_repn
+
+try:
+    multiprocessing.get_context('fork')
+    fork_available = True
+except ValueError:
+    fork_available = False
+
+
+def _repn_data(repn):
+    return (repn.constant,
+            tuple(repn.linear_coefs),
+            tuple(id(v) for v in repn.linear_vars),
+            tuple(repn.quadratic_coefs),
+            tuple((id(v1), id(v2)) for v1, v2 in repn.quadratic_vars),
+            str(repn.nonlinear_expr),
+            tuple(id(v) for v in repn.nonlinear_vars))
+
+
+class TestParallelRepn(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var(range(5))
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=3)
+        m.x[4].fix(2)
+        exprs = [m.p*m.x[i] + sum(m.x[j] for j in range(i)) + i
+                 for i in range(5)]
+        exprs.append(m.x[0]*m.x[1] + m.x[2]**2 - m.x[4]*m.x[3])
+        exprs.append(exp(m.x[0]) + m.x[1])
+        exprs.append(m.y + 2*m.x[0])
+        exprs.append(5)
+        return m, exprs
+
+    def _check(self, nprocs, quadratic=True):
+        m, exprs = self._model()
+        ans = parallel_generate_standard_repn(
+            exprs, list(m.x.values()), nprocs, quadratic=quadratic)
+        self.assertEqual(len(ans), len(exprs))
+        for repn, expr in zip(ans, exprs):
+            self.assertEqual(
+                _repn_data(repn),
+                _repn_data(generate_standard_repn(expr, quadratic=quadratic)))
+
+    @unittest.skipIf(not fork_available, "fork is not available")
+    def test_parallel(self):
+        self._check(3)
+
+    @unittest.skipIf(not fork_available, "fork is not available")
+    def test_parallel_no_quadratic(self):
+        self._check(2, quadratic=False)
+
+    def test_serial(self):
+        self._check(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the dependency-tracked StandardRepn cache
+#
+
+import pyutilib.th as unittest
+
+from pyomo.environ import (ConcreteModel, Var, Param, Constraint,
+                           Expression, exp)
+from pyomo.repn import StandardRepnCache, get_repn_cache
+
+
+class TestStandardRepnCache(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.p = Param(mutable=True, initialize=2)
+        m.q = Param(mutable=True, initialize=3)
+        m.e = Expression(expr=m.q*m.x[3])
+        m.c1 = Constraint(expr=m.p*m.x[1] + m.x[2] >= 1)
+        m.c2 = Constraint(expr=exp(m.x[2]) + m.e <= 4)
+        return m
+
+    def test_reuse(self):
+        m = self._model()
+        cache = StandardRepnCache()
+        repn = cache.get(m.c1, m.c1.body)
+        self.assertEqual(repn.linear_coefs, (2, 1))
+        self.assertIs(cache.get(m.c1, m.c1.body), repn)
+        self.assertEqual(len(cache), 1)
+        # repns generated with / without quadratic processing are
+        # cached separately
+        self.assertIsNot(cache.get(m.c1, m.c1.body, quadratic=False), repn)
+        self.assertEqual(len(cache), 2)
+
+    def test_param_change(self):
+        m = self._model()
+        cache = StandardRepnCache()
+        repn1 = cache.get(m.c1, m.c1.body)
+        repn2 = cache.get(m.c2, m.c2.body)
+        m.p = 5
+        self.assertIsNone(cache.lookup(m.c1, m.c1.body))
+        self.assertIs(cache.lookup(m.c2, m.c2.body).repn, repn2)
+        self.assertEqual(cache.get(m.c1, m.c1.body).linear_coefs, (5, 1))
+        m.q = 1
+        self.assertIsNotNone(cache.lookup(m.c1, m.c1.body))
+        self.assertIsNone(cache.lookup(m.c2, m.c2.body))
+
+    def test_fixed_var(self):
+        m = self._model()
+        cache = StandardRepnCache()
+        cache.get(m.c1, m.c1.body)
+        m.x[2].fix(1)
+        self.assertIsNone(cache.lookup(m.c1, m.c1.body))
+        self.assertEqual(cache.get(m.c1, m.c1.body).constant, 1)
+        m.x[2].value = 2
+        self.assertIsNone(cache.lookup(m.c1, m.c1.body))
+        self.assertEqual(cache.get(m.c1, m.c1.body).constant, 2)
+        m.x[2].unfix()
+        self.assertIsNone(cache.lookup(m.c1, m.c1.body))
+        self.assertEqual(cache.get(m.c1, m.c1.body).constant, 0)
+        # Changing the value of an unfixed variable does not invalidate
+        # the repn
+        m.x[1].value = 7
+        self.assertIsNotNone(cache.lookup(m.c1, m.c1.body))
+
+    def test_expression_change(self):
+        m = self._model()
+        cache = StandardRepnCache()
+        cache.get(m.c2, m.c2.body)
+        m.e.expr = m.x[1]
+        self.assertIsNone(cache.lookup(m.c2, m.c2.body))
+        cache.get(m.c2, m.c2.body)
+        m.c2.set_value(m.x[1] <= 4)
+        self.assertIsNone(cache.lookup(m.c2, m.c2.body))
+
+    def test_invalidate_and_prune(self):
+        m = self._model()
+        cache = get_repn_cache(m)
+        self.assertIs(get_repn_cache(m), cache)
+        cache.get(m.c1, m.c1.body)
+        cache.get(m.c2, m.c2.body)
+        cache.invalidate(m.c1)
+        self.assertEqual(len(cache), 1)
+        cache.get(m.c1, m.c1.body)
+        cache.prune(m)
+        self.assertEqual(len(cache), 2)
+        m.del_component(m.c2)
+        cache.prune(m)
+        self.assertEqual(len(cache), 1)
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
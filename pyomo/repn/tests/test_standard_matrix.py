@@ -0,0 +1,132 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the standard matrix representation
+#
+
+import pickle
+
+import pyutilib.th as unittest
+
+from pyomo.common.dependencies import numpy_available, scipy_available
+from pyomo.environ import (ConcreteModel, Var, Param, Block, Constraint,
+                           Objective, maximize, quicksum, exp)
+from pyomo.repn import generate_standard_matrix_repn
+
+
+def _dense(repn):
+    A = [[0]*repn.shape[1] for i in range(repn.shape[0])]
+    for i in range(repn.shape[0]):
+        for k in range(repn.A_indptr[i], repn.A_indptr[i+1]):
+            A[i][repn.A_indices[k]] += repn.A_data[k]
+    return A
+
+
+@unittest.skipIf(not numpy_available, "numpy is not available")
+class TestStandardMatrixRepn(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.p = Param(mutable=True, initialize=2)
+        m.c1 = Constraint(expr=m.x[1] + 2*m.x[2] + m.x[1] >= 1)
+        m.c2 = Constraint(expr=(0, m.p*m.x[3] - m.x[2] + 5, 10))
+        m.b = Block()
+        m.b.c3 = Constraint(expr=quicksum(i*m.x[i] for i in m.x) == 4)
+        m.o = Objective(expr=3*m.x[1] + 4, sense=maximize)
+        return m
+
+    def test_linear(self):
+        m = self._model()
+        repn = generate_standard_matrix_repn(m)
+        self.assertEqual(repn.shape, (3, 3))
+        self.assertEqual(repn.nnz, 7)
+        self.assertEqual([c.name for c in repn.constraints],
+                         ['c1', 'c2', 'b.c3'])
+        self.assertEqual([v.name for v in repn.variables],
+                         ['x[1]', 'x[2]', 'x[3]'])
+        self.assertEqual(_dense(repn), [[2, 2, 0], [0, -1, 2], [1, 2, 3]])
+        self.assertEqual(list(repn.row_lb), [1, 0, 4])
+        self.assertEqual(list(repn.row_ub), [float('inf'), 10, 4])
+        self.assertEqual(list(repn.row_constant), [0, 5, 0])
+        self.assertEqual(list(repn.c_indptr), [0, 1])
+        self.assertEqual(list(repn.c_indices), [0])
+        self.assertEqual(list(repn.c_data), [3])
+        self.assertEqual(list(repn.obj_constant), [4])
+        self.assertEqual(list(repn.obj_sense), [-1])
+
+        row, col, data = repn.coo()
+        self.assertEqual(list(row), [0, 0, 1, 1, 2, 2, 2])
+        self.assertEqual(list(col), [0, 1, 2, 1, 0, 1, 2])
+
+    def test_mutable_and_fixed(self):
+        m = self._model()
+        m.p = 5
+        m.x[2].fix(1)
+        repn = generate_standard_matrix_repn(m)
+        self.assertEqual([v.name for v in repn.variables], ['x[1]', 'x[3]'])
+        self.assertEqual(_dense(repn), [[2, 0], [0, 5], [1, 3]])
+        self.assertEqual(list(repn.row_constant), [2, 4, 2])
+
+    def test_skip_trivial(self):
+        m = self._model()
+        m.x.fix(0)
+        repn = generate_standard_matrix_repn(m)
+        self.assertEqual(repn.shape, (3, 0))
+        self.assertEqual(list(repn.A_indptr), [0, 0, 0, 0])
+        repn = generate_standard_matrix_repn(
+            m, skip_trivial_constraints=True)
+        self.assertEqual(repn.shape, (0, 0))
+        self.assertEqual(list(repn.A_indptr), [0])
+        self.assertEqual(len(repn.row_constant), 0)
+
+    def test_options(self):
+        m = self._model()
+        repn = generate_standard_matrix_repn(
+            m, descend_into=False, include_objectives=False)
+        self.assertEqual([c.name for c in repn.constraints], ['c1', 'c2'])
+        self.assertEqual(len(repn.objectives), 0)
+        self.assertEqual(list(repn.c_indptr), [0])
+
+        m.c2.deactivate()
+        m.o.deactivate()
+        repn = generate_standard_matrix_repn(m)
+        self.assertEqual([c.name for c in repn.constraints], ['c1', 'b.c3'])
+        self.assertEqual(len(repn.objectives), 0)
+
+    def test_nonlinear(self):
+        m = self._model()
+        m.c4 = Constraint(expr=exp(m.x[1]) <= 2)
+        with self.assertRaisesRegex(ValueError, "'c4' is not linear"):
+            generate_standard_matrix_repn(m)
+        m.c4.deactivate()
+        m.c5 = Constraint(expr=m.x[1]*m.x[2] <= 2)
+        with self.assertRaisesRegex(ValueError, "'c5' is not linear"):
+            generate_standard_matrix_repn(m)
+
+    def test_pickle(self):
+        m = self._model()
+        repn = generate_standard_matrix_repn(m)
+        repn = pickle.loads(pickle.dumps((m, repn)))[1]
+        self.assertEqual(_dense(repn), [[2, 2, 0], [0, -1, 2], [1, 2, 3]])
+        self.assertEqual(repn.constraints[0].name, 'c1')
+
+    @unittest.skipIf(not scipy_available, "scipy is not available")
+    def test_scipy(self):
+        m = self._model()
+        repn = generate_standard_matrix_repn(m)
+        self.assertEqual(repn.to_csr().toarray().tolist(), _dense(repn))
+        self.assertEqual(repn.to_coo().toarray().tolist(), _dense(repn))
+        self.assertEqual(repn.objective_to_csr().toarray().tolist(),
+                         [[3, 0, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,15 +9,80 @@
 #  ___________________________________________________________________________
 
 
+import errno
 import os
+import tempfile
 from six import iteritems, PY3
 
+from pyomo.common.compression import strip_compression_suffix
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.opt.base import ProblemFormat
 from pyomo.opt.base.convert import ProblemConverterFactory
 from pyomo.solvers.plugins.converter.pico import PicoMIPConverter
 from pyomo.core.kernel.block import IBlock
 
+# Problem formats whose solvers can read compressed input files
+_compressible_formats = (ProblemFormat.cpxlp,
+                         ProblemFormat.mps,
+                         ProblemFormat.nl)
+
+
+def _create_problem_file(suffix, io_options, dir=None):
+    """Create a temporary problem file (and declare the NL label files
+    as temporary files)"""
+    problem_filename = TempfileManager.create_tempfile(
+        suffix=suffix, compression=io_options.get('compression'), dir=dir)
+    if suffix == '.pyomo.nl' and \
+       io_options.get("symbolic_solver_labels", False):
+        TempfileManager.add_tempfile(
+            strip_compression_suffix(problem_filename)[:-3]+".row",
+            exists=False)
+        TempfileManager.add_tempfile(
+            strip_compression_suffix(problem_filename)[:-3]+".col",
+            exists=False)
+    return problem_filename
+
+
+def _write_instance(instance, problem_filename, problem_format,
+                    capabilities, io_options):
+    if isinstance(instance, IBlock):
+        symbol_map_id = instance.write(
+            problem_filename,
+            format=problem_format,
+            _solver_capability=capabilities,
+            _called_by_solver=True,
+            **io_options)
+        return problem_filename, symbol_map_id
+    return instance.write(
+        filename=problem_filename,
+        format=problem_format,
+        solver_capability=capabilities,
+        io_options=io_options)
+
+
+def _write_problem_file(instance, suffix, problem_format,
+                        capabilities, io_options):
+    """Write the instance to a new temporary problem file
+
+    The free space of the RAM-backed temporary directory is only checked
+    when the file is created.  If that file system fills up while the
+    file is written, the file is written again in the default temporary
+    directory.
+    """
+    problem_filename = _create_problem_file(suffix, io_options)
+    try:
+        return _write_instance(instance, problem_filename, problem_format,
+                               capabilities, io_options)
+    except EnvironmentError as e:
+        if e.errno != errno.ENOSPC or \
+           not TempfileManager.in_ram_tempdir(problem_filename):
+            raise
+    os.remove(problem_filename)
+    problem_filename = _create_problem_file(
+        suffix, io_options, dir=tempfile.gettempdir())
+    return _write_instance(instance, problem_filename, problem_format,
+                           capabilities, io_options)
+
 
 @ProblemConverterFactory.register('pyomo')
 class PyomoMIPConverter(object):
@@ -57,6 +122,14 @@ class PyomoMIPConverter(object):
             io_options[kwd] = value
         kwds.clear()
 
+        if args[1] not in _compressible_formats:
+            compression = io_options.pop("compression", None)
+            if compression not in (None, 'none'):
+                raise ValueError(
+                    "Problem format '%s' does not support compressed "
+                    "problem files (compression=%s)"
+                    % (args[1], compression))
+
         # basestring is gone in Python 3.x, merged with str.
         if PY3:
             compare_type = str
@@ -69,25 +142,14 @@ class PyomoMIPConverter(object):
             instance = args[2]
 
         if args[1] == ProblemFormat.cpxlp:
-            problem_filename = TempfileManager.\
-                               create_tempfile(suffix = '.pyomo.lp')
             if instance is not None:
-                if isinstance(instance, IBlock):
-                    symbol_map_id = instance.write(
-                        problem_filename,
-                        format=ProblemFormat.cpxlp,
-                        _solver_capability=capabilities,
-                        _called_by_solver=True,
-                        **io_options)
-                else:
-                    (problem_filename, symbol_map_id) = \
-                        instance.write(
-                            filename=problem_filename,
-                            format=ProblemFormat.cpxlp,
-                            solver_capability=capabilities,
-                            io_options=io_options)
+                (problem_filename, symbol_map_id) = _write_problem_file(
+                    instance, '.pyomo.lp', ProblemFormat.cpxlp,
+                    capabilities, io_options)
                 return (problem_filename,), symbol_map_id
             else:
+                problem_filename = _create_problem_file(
+                    '.pyomo.lp', io_options)
 
                 #
                 # I'm simply exposing a fatal issue with
@@ -115,25 +177,14 @@ class PyomoMIPConverter(object):
                 return (problem_filename,),symbol_map
 
         elif args[1] == ProblemFormat.bar:
-            problem_filename = TempfileManager.\
-                               create_tempfile(suffix = '.pyomo.bar')
             if instance is not None:
-                if isinstance(instance, IBlock):
-                    symbol_map_id = instance.write(
-                        problem_filename,
-                        format=ProblemFormat.bar,
-                        _solver_capability=capabilities,
-                        _called_by_solver=True,
-                        **io_options)
-                else:
-                    (problem_filename, symbol_map_id) = \
-                        instance.write(
-                            filename=problem_filename,
-                            format=ProblemFormat.bar,
-                            solver_capability=capabilities,
-                            io_options=io_options)
+                (problem_filename, symbol_map_id) = _write_problem_file(
+                    instance, '.pyomo.bar', ProblemFormat.bar,
+                    capabilities, io_options)
                 return (problem_filename,), symbol_map_id
             else:
+                problem_filename = _create_problem_file(
+                    '.pyomo.bar', io_options)
 
                 #
                 # I'm simply exposing a fatal issue with
@@ -161,36 +212,16 @@ class PyomoMIPConverter(object):
 
         elif args[1] in [ProblemFormat.mps, ProblemFormat.nl]:
             if args[1] == ProblemFormat.nl:
-                problem_filename = TempfileManager.\
-                                   create_tempfile(suffix = '.pyomo.nl')
-                if io_options.get("symbolic_solver_labels", False):
-                    TempfileManager.add_tempfile(
-                        problem_filename[:-3]+".row",
-                        exists=False)
-                    TempfileManager.add_tempfile(
-                        problem_filename[:-3]+".col",
-                        exists=False)
+                suffix = '.pyomo.nl'
             else:
                 assert args[1] == ProblemFormat.mps
-                problem_filename = TempfileManager.\
-                                   create_tempfile(suffix = '.pyomo.mps')
+                suffix = '.pyomo.mps'
             if instance is not None:
-                if isinstance(instance, IBlock):
-                    symbol_map_id = instance.write(
-                        problem_filename,
-                        format=args[1],
-                        _solver_capability=capabilities,
-                        _called_by_solver=True,
-                        **io_options)
-                else:
-                    (problem_filename, symbol_map_id) = \
-                        instance.write(
-                            filename=problem_filename,
-                            format=args[1],
-                            solver_capability=capabilities,
-                            io_options=io_options)
+                (problem_filename, symbol_map_id) = _write_problem_file(
+                    instance, suffix, args[1], capabilities, io_options)
                 return (problem_filename,), symbol_map_id
             else:
+                problem_filename = _create_problem_file(suffix, io_options)
 
                 #
                 # I'm simply exposing a fatal issue with
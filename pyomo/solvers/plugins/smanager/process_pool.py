@@ -0,0 +1,366 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+__all__ = []
+
+import collections
+import os
+import time
+try:
+    import cPickle as pickle
+except:
+    import pickle
+
+from pyomo.common.collections import Bunch
+from pyomo.common.dependencies import attempt_import
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt.base import OptSolver, SolverFactory
+from pyomo.opt.base.solvers import _lean_results
+from pyomo.opt.parallel.manager import (ActionManagerError,
+                                        ActionHandle,
+                                        ActionStatus)
+from pyomo.opt.parallel.async_solver import (AsynchronousSolverManager,
+                                             SolverManagerFactory)
+from pyomo.core.base.block import _BlockData
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.var import Var
+import pyomo.core.base.suffix
+
+import six
+
+futures, futures_available = attempt_import('concurrent.futures')
+
+#
+# The worker functions.  These are module-level functions so that they
+# can be pickled (by reference) and sent to the worker processes.
+#
+
+def _create_solver(data):
+    # Make sure that all solver plugins are registered (when the
+    # workers are not forked from the parent process)
+    import pyomo.environ
+    opt = SolverFactory(data.opt, solver_io=data.solver_io)
+    if opt is None:
+        raise ActionManagerError(
+            "Problem constructing solver `%s'" % (data.opt,))
+    if data.executable is not None:
+        opt.set_executable(data.executable)
+    for key, val in six.iteritems(data.solver_options):
+        opt.options[key] = val
+    return opt
+
+
+def _solve_problem_file(data):
+    """Solve a problem file written by the parent process
+
+    Returns the results object, which (as no model is available in the
+    worker) holds the solutions keyed by the symbols in the problem
+    file.
+    """
+    time_start = time.time()
+    TempfileManager.push()
+    try:
+        with _create_solver(data) as opt:
+            problem_file = TempfileManager.create_tempfile(
+                suffix="." + os.path.split(data.filename)[1])
+            with open(problem_file, 'wb') as f:
+                f.write(data.file)
+            kwds = data.kwds
+            if data.warmstart_file is not None:
+                warmstart_file = TempfileManager.create_tempfile(
+                    suffix="." + os.path.split(data.warmstart_filename)[1])
+                with open(warmstart_file, 'wb') as f:
+                    f.write(data.warmstart_file)
+                kwds['warmstart_file'] = warmstart_file
+            results = opt.solve(problem_file, **kwds)
+    finally:
+        TempfileManager.pop(remove=True)
+    results.pyomo_solve_time = time.time() - time_start
+    return results
+
+
+def _component_data(model):
+    # The (deterministic) order of the components is the same for the
+    # parent's model and the worker's (unpickled) copy
+    return (list(model.component_data_objects(Var, descend_into=True)),
+            list(model.component_data_objects(Constraint, descend_into=True)))
+
+
+def _solve_instance(data):
+    """Solve an instance pickled by the parent process
+
+    Returns the results object (without the solutions) along with the
+    variable values and the import suffix values, with the components
+    identified by their position in the lists returned by
+    _component_data.
+    """
+    time_start = time.time()
+    model = pickle.loads(data.instance)
+    with _create_solver(data) as opt:
+        results = opt.solve(model, **data.kwds)
+    results.pyomo_solve_time = time.time() - time_start
+
+    variables, constraints = _component_data(model)
+    values = [var.value for var in variables]
+    positions = {}
+    for i, var in enumerate(variables):
+        positions[id(var)] = (0, i)
+    for i, con in enumerate(constraints):
+        positions[id(con)] = (1, i)
+    suffixes = {}
+    for name, suffix in pyomo.core.base.suffix.\
+            active_import_suffix_generator(model):
+        suffixes[name] = [(positions[id(comp)], val)
+                          for comp, val in six.iteritems(suffix)
+                          if id(comp) in positions]
+    return results, values, suffixes
+
+
+@SolverManagerFactory.register(
+    'process_pool',
+    doc="Execute solvers in a pool of local worker processes")
+class SolverManager_ProcessPool(AsynchronousSolverManager):
+    """A solver manager that executes the solvers in a pool of local
+    worker processes (using concurrent.futures).
+
+    For solvers that use problem files (e.g., the shell solver
+    interfaces), the problem file is written by this process and the
+    solver is applied to it by a worker.  Other solvers (e.g., the
+    direct solver interfaces) are applied by the worker to a pickled
+    copy of the model, so the model must be picklable.  In both cases,
+    the solution is loaded into the model by this process when the
+    action completes.
+
+    Keyword Arguments
+    -----------------
+    max_workers: int
+        The number of worker processes (defaults to the number of
+        processors on the machine).
+    """
+
+    def __init__(self, **kwds):
+        self._max_workers = kwds.pop('max_workers', None)
+        self._executor = None
+        self._futures = {}
+        self._load_data = {}
+        self._completed = collections.deque()
+        super(SolverManager_ProcessPool, self).__init__(**kwds)
+
+    def clear(self):
+        """Clear manager state"""
+        super(SolverManager_ProcessPool, self).clear()
+        self.results = collections.OrderedDict()
+        for future in self._futures:
+            future.cancel()
+        self._futures = {}
+        self._load_data = {}
+        self._completed = collections.deque()
+
+    def close(self):
+        """Shut down the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __exit__(self, t, v, traceback):
+        self.close()
+
+    def _get_executor(self):
+        if self._executor is None:
+            if not futures_available:
+                raise ActionManagerError(
+                    "The %s requires the concurrent.futures module"
+                    % (type(self).__name__,))
+            self._executor = futures.ProcessPoolExecutor(
+                max_workers=self._max_workers)
+        return self._executor
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the
+        ActionHandle, and the ActionHandle status indicates whether
+        the queue was successful.
+        """
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        if isinstance(opt, six.string_types):
+            opt = SolverFactory(opt, solver_io=kwds.pop('solver_io', None))
+
+        model = None
+        for arg in args:
+            if isinstance(arg, _BlockData):
+                if not arg.is_constructed():
+                    raise RuntimeError(
+                        "Attempting to solve model=%s with unconstructed "
+                        "component(s)" % (arg.name,))
+                model = arg
+        # import suffixes must be on the top-level model
+        if model is not None:
+            model_suffixes = list(
+                name for name, comp in pyomo.core.base.suffix.
+                active_import_suffix_generator(model))
+            if model_suffixes:
+                kwds_suffixes = kwds.setdefault('suffixes', [])
+                for name in model_suffixes:
+                    if name not in kwds_suffixes:
+                        kwds_suffixes.append(name)
+
+        #
+        # We can't pickle the options object itself - so extract a
+        # simple dictionary of solver options and re-construct it in
+        # the worker.
+        #
+        solver_options = {}
+        for key in opt.options:
+            solver_options[key] = opt.options[key]
+        solver_options.update(kwds.pop('options', {}))
+        solver_options.update(
+            OptSolver._options_string_to_dict(kwds.pop('options_string', '')))
+
+        data = Bunch(opt=opt.type,
+                     solver_io=getattr(opt, '_solver_io', None),
+                     executable=getattr(opt, '_user_executable', None),
+                     solver_options=solver_options)
+
+        load_solutions = kwds.pop('load_solutions', True)
+        results_mode = kwds.pop('results_mode', 'full')
+        if results_mode not in ('full', 'lean'):
+            raise ValueError("Invalid results_mode '%s': expected one of "
+                             "'full' or 'lean'" % (results_mode,))
+        if results_mode == 'lean' and \
+           (model is None or not load_solutions):
+            raise ValueError(
+                "results_mode='lean' requires a (non-kernel) Pyomo model "
+                "and load_solutions=True")
+        # Solutions are always loaded by this process
+        kwds.pop('vectorized_load', None)
+
+        if opt._problem_format is None and model is not None:
+            if not load_solutions:
+                raise ValueError(
+                    "load_solutions=False is not supported by the %s for "
+                    "solvers that do not use problem files"
+                    % (type(self).__name__,))
+            data.instance = pickle.dumps(model, pickle.HIGHEST_PROTOCOL)
+            data.kwds = kwds
+            future = self._get_executor().submit(_solve_instance, data)
+            self._load_data[ah.id] = (model, results_mode, None)
+        else:
+            kwds['available'] = True
+            opt._presolve(*args, **kwds)
+            try:
+                with open(opt._problem_files[0], 'rb') as f:
+                    data.file = f.read()
+                data.filename = opt._problem_files[0]
+                data.warmstart_file = None
+                data.warmstart_filename = None
+                if getattr(opt, '_warm_start_solve', False) and \
+                   opt._warm_start_file_name is not None:
+                    data.warmstart_filename = opt._warm_start_file_name
+                    with open(data.warmstart_filename, 'rb') as f:
+                        data.warmstart_file = f.read()
+            finally:
+                # _presolve (for the shell solvers) opened a temporary
+                # file context for the problem file
+                if hasattr(opt, '_keepfiles'):
+                    TempfileManager.pop(remove=not opt._keepfiles)
+            del kwds['available']
+            data.kwds = kwds
+            future = self._get_executor().submit(_solve_problem_file, data)
+            self._load_data[ah.id] = (
+                model,
+                results_mode,
+                (opt._smap_id,
+                 load_solutions,
+                 opt._select_index,
+                 opt._default_variable_value))
+
+        self._futures[future] = ah
+        return ah
+
+    def _process_future(self, future):
+        ah = self._futures.pop(future)
+        model, results_mode, opt_data = self._load_data.pop(ah.id)
+        try:
+            ans = future.result()
+        except:
+            ah.status = ActionStatus.error
+            if opt_data is not None and model is not None:
+                model.solutions.delete_symbol_map(opt_data[0])
+            raise
+
+        if opt_data is None:
+            # The worker solved a pickled copy of the model
+            results, values, suffixes = ans
+            variables, constraints = _component_data(model)
+            for var, val in zip(variables, values):
+                if not var.fixed:
+                    var.set_value(val)
+                    var.stale = False
+            components = (variables, constraints)
+            for name, suffix in pyomo.core.base.suffix.\
+                    active_import_suffix_generator(model):
+                suffix.clear_all_values()
+                for (ctype, i), val in suffixes.get(name, ()):
+                    suffix[components[ctype][i]] = val
+            results._smap_id = None
+            if results_mode == 'lean':
+                _lean_results(results, model)
+        else:
+            results = ans
+            (smap_id,
+             load_solutions,
+             select_index,
+             default_variable_value) = opt_data
+            # Tag the results object with the symbol map id.
+            results._smap_id = smap_id
+            if model is not None:
+                if load_solutions:
+                    model.solutions.load_from(
+                        results,
+                        select=select_index,
+                        default_variable_value=default_variable_value)
+                    results._smap_id = None
+                    if results_mode == 'lean':
+                        _lean_results(results, model)
+                    else:
+                        results.solution.clear()
+                else:
+                    results._smap = model.solutions.symbol_map[smap_id]
+                    model.solutions.delete_symbol_map(smap_id)
+
+        self.results[ah.id] = results
+        ah.status = ActionStatus.done
+        self._completed.append(ah)
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if not self._completed:
+            if not self._futures:
+                return ActionHandle(
+                    error=True,
+                    explanation=("No queued evaluations available in "
+                                 "the 'process_pool' solver manager"))
+            done, not_done = futures.wait(
+                list(self._futures), return_when=futures.FIRST_COMPLETED)
+            # Process the completed actions in the order they were queued
+            for future in sorted(done, key=lambda f: self._futures[f].id):
+                self._process_future(future)
+        return self._completed.popleft()
@@ -29,6 +29,7 @@ from pyomo.opt.base import ProblemFormat, ResultsFormat, OptSolver
 from pyomo.opt.base.solvers import _extract_version, SolverFactory
 from pyomo.opt.results import SolverResults, SolverStatus, TerminationCondition, SolutionStatus, ProblemSense, Solution
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.executable_cache import ExecutableCache
 from pyomo.solvers.mockmip import MockMIP
 
 logger = logging.getLogger('pyomo.solvers')
@@ -41,6 +42,15 @@ def _version_to_string(version):
 _cbc_compiled_with_asl = None
 _cbc_version = None
 _cbc_old_version = None
+
+def _query_cbc(cbc_exec):
+    results = run( [cbc_exec,"-stop"], timelimit=1 )
+    version = _extract_version(results[1])
+    results = run(
+        [cbc_exec,"dummy","-AMPL","-stop"], timelimit=1 )
+    compiled_with_asl = not ('No match for AMPL' in results[1])
+    return version, compiled_with_asl
+
 def configure_cbc():
     global _cbc_compiled_with_asl
     global _cbc_version
@@ -53,11 +63,10 @@ def configure_cbc():
     if not executable:
         return
     cbc_exec = executable.path()
-    results = run( [cbc_exec,"-stop"], timelimit=1 )
-    _cbc_version = _extract_version(results[1])
-    results = run(
-        [cbc_exec,"dummy","-AMPL","-stop"], timelimit=1 )
-    _cbc_compiled_with_asl = not ('No match for AMPL' in results[1])
+    # Note: do not cache (possibly spurious) failures to get the version
+    _cbc_version, _cbc_compiled_with_asl = ExecutableCache.get(
+        cbc_exec, 'cbc.configure', lambda: _query_cbc(cbc_exec),
+        cacheable=lambda ans: ans[0] is not None)
     if _cbc_version is not None:
         _cbc_old_version = _cbc_version < (2,7,0,0)
 
@@ -406,6 +415,35 @@ class CBCSHELL(SystemCallSolver):
 
         return Bunch(cmd=cmd, log_file=self._log_file, env=None)
 
+    def _worker_session(self, command):
+        #
+        # CBC reads the same commands (without the leading '-') from
+        # stdin when it is run without arguments.  The options that
+        # precede the problem import persist across the problems solved
+        # in a session, so they are the session setup.
+        #
+        if self._problem_format == ProblemFormat.nl or \
+           self._warm_start_solve:
+            return None
+        cmd = list(command.cmd)
+        if self._timer:
+            cmd.pop(0)
+        executable = cmd.pop(0)
+        lines = []
+        for arg in cmd:
+            if arg.startswith('-') or not lines:
+                lines.append(arg.lstrip('-'))
+            else:
+                lines[-1] += ' ' + arg
+        for i, line in enumerate(lines):
+            if line.startswith('import '):
+                return [executable], lines[:i], lines[i:]
+        return None
+
+    def _worker_marker_line(self, marker):
+        # CBC echoes unknown commands ("No match for <marker> ...")
+        return marker
+
     def process_logfile(self):
         """
         Process logfile
@@ -21,6 +21,7 @@ from pyomo.common.collections import Bunch, Options
 from pyomo.opt import SolverFactory, OptSolver, ProblemFormat, ResultsFormat, SolverResults, TerminationCondition, SolutionStatus, ProblemSense
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.executable_cache import ExecutableCache
 
 from six import iteritems, string_types
 
@@ -34,10 +35,16 @@ def configure_glpk():
     _glpk_version = _extract_version("")
     if not Executable("glpsol"):
         return
+    glpsol = Executable('glpsol').path()
+    _glpk_version = ExecutableCache.get(
+        glpsol, 'glpk.version', lambda: _query_glpk_version(glpsol))
+
+def _query_glpk_version(glpsol):
     errcode, results = pyutilib.subprocess.run(
-        [Executable('glpsol').path(), "--version"], timelimit=2)
+        [glpsol, "--version"], timelimit=2)
     if errcode == 0:
-        _glpk_version = _extract_version(results)
+        return _extract_version(results)
+    return None
 
 # Not sure how better to get these constants, but pulled from GLPK
 # documentation and source code (include/glpk.h)
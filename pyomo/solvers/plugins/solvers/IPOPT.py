@@ -10,6 +10,8 @@
 
 import os
 
+from six import iteritems
+
 from pyomo.common import Executable
 from pyomo.common.collections import Options, Bunch
 from pyomo.common.tempfiles import TempfileManager
@@ -19,6 +21,11 @@ from pyomo.opt.base import ProblemFormat, ResultsFormat
 from pyomo.opt.base.solvers import _extract_version, SolverFactory
 from pyomo.opt.results import SolverStatus, SolverResults, TerminationCondition
 from pyomo.opt.solver import  SystemCallSolver
+from pyomo.core.base.block import _BlockData
+from pyomo.core.base.componentuid import ComponentUID
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.suffix import Suffix
+from pyomo.core.base.var import Var
 
 import logging
 logger = logging.getLogger('pyomo.solvers')
@@ -59,6 +66,15 @@ class IPOPT(SystemCallSolver):
         self._capabilities.sos1 = False
         self._capabilities.sos2 = False
 
+        self._warm_start_solve = False
+        self._warm_start_model = None
+        # The solution of the last warm-start solve, keyed by the
+        # ComponentUID of the variables and constraints
+        self._warm_start_point = None
+
+    def warm_start_capable(self):
+        return True
+
     def _default_results_format(self, prob_format):
         return ResultsFormat.sol
 
@@ -189,6 +205,167 @@ class IPOPT(SystemCallSolver):
 
         return Bunch(cmd=cmd, log_file=self._log_file, env=env)
 
+    # The (suffix name, point key) pairs used to pass the bound
+    # multipliers to and from Ipopt
+    _bound_multiplier_suffixes = (('ipopt_zL_out', 'ipopt_zL_in', 'zL'),
+                                  ('ipopt_zU_out', 'ipopt_zU_in', 'zU'))
+
+    def _presolve(self, *args, **kwds):
+        #
+        # With warmstart=True, the primal, dual and bound multiplier
+        # values from the last warm-start solve (matched to the
+        # components of this model by their ComponentUID, so the point
+        # survives rebuilding the model) are passed to Ipopt through
+        # the NL file, and warm_start_init_point is enabled.
+        #
+        self._warm_start_solve = kwds.pop('warmstart', False)
+        self._warm_start_model = None
+        if not self._warm_start_solve or len(args) != 1 or \
+           not isinstance(args[0], _BlockData):
+            # we assume the user knows what they are doing...
+            return SystemCallSolver._presolve(self, *args, **kwds)
+
+        if kwds.get('problem_fifo', False):
+            raise ValueError(
+                "Solver (%s): warmstart=True cannot be combined with "
+                "problem_fifo=True" % (self.name,))
+        model = self._warm_start_model = args[0]
+        # Read the duals and bound multipliers from the solution file
+        suffixes = list(kwds.get('suffixes', []))
+        for name in ('dual',) + tuple(
+                out for out, _, _ in self._bound_multiplier_suffixes):
+            if name not in suffixes:
+                suffixes.append(name)
+        kwds['suffixes'] = suffixes
+
+        restore = self._export_warm_start_point(model)
+        try:
+            return SystemCallSolver._presolve(self, *args, **kwds)
+        finally:
+            for name, direction, added in restore:
+                if direction is None:
+                    model.del_component(name)
+                    continue
+                suffix = model.component(name)
+                for obj in added:
+                    suffix.clear_value(obj)
+                suffix.set_direction(direction)
+
+    def _export_warm_start_point(self, model):
+        """Export the last warm-start point through (temporary) Suffix
+        components on the model.  Returns the list of (name, direction,
+        added) tuples needed to undo the changes to the suffixes on the
+        model (a direction of None indicates a component to delete, and
+        added lists the components whose values were added to an
+        existing suffix)."""
+        point = self._warm_start_point
+        if point is None:
+            return []
+        if 'warm_start_init_point' not in self.options:
+            self.options['warm_start_init_point'] = 'yes'
+
+        restore = []
+        def _export_suffix(name, values, ctype):
+            suffix = model.component(name)
+            added = []
+            if suffix is None:
+                suffix = Suffix(direction=Suffix.EXPORT)
+                model.add_component(name, suffix)
+                restore.append((name, None, added))
+            elif suffix.ctype is not Suffix:
+                return
+            elif not suffix.export_enabled():
+                # Export the values stored in the suffix (e.g., the
+                # values imported by the last solve)
+                restore.append((name, suffix.get_direction(), added))
+                suffix.set_direction(Suffix.IMPORT_EXPORT)
+            else:
+                restore.append((name, suffix.get_direction(), added))
+            # Values already in the suffix take precedence over the
+            # stored point
+            cuid_buffer = {}
+            for obj in model.component_data_objects(ctype, active=True,
+                                                    descend_into=True):
+                if suffix.get(obj) is not None:
+                    continue
+                val = values.get(ComponentUID(obj, cuid_buffer=cuid_buffer,
+                                              context=model))
+                if val is not None:
+                    suffix[obj] = val
+                    added.append(obj)
+
+        _export_suffix('dual', point['dual'], Constraint)
+        for _, name, key in self._bound_multiplier_suffixes:
+            _export_suffix(name, point[key], Var)
+
+        # Initialize the (unfixed) variables with their value in the
+        # last solution, so that the primal point matches the
+        # multipliers
+        cuid_buffer = {}
+        values = point['x']
+        for var in model.component_data_objects(Var, descend_into=True):
+            if var.fixed:
+                continue
+            val = values.get(ComponentUID(var, cuid_buffer=cuid_buffer,
+                                          context=model))
+            if val is not None:
+                var.set_value(val, valid=True)
+        return restore
+
+    def _postsolve(self):
+        results = super(IPOPT, self)._postsolve()
+        if self._warm_start_model is not None:
+            self._save_warm_start_point(results)
+            self._warm_start_model = None
+        return results
+
+    def _save_warm_start_point(self, results):
+        """Record the solution in the results (before it is loaded into
+        the model) as the starting point for the next warm-start
+        solve"""
+        model = self._warm_start_model
+        bySymbol = model.solutions.symbol_map[self._smap_id].bySymbol
+        x = {}
+        dual = {}
+        multipliers = dict((key, {}) for _, _, key
+                           in self._bound_multiplier_suffixes)
+        cuid_buffer = {}
+        def _cuid(symbol):
+            obj = bySymbol[symbol]()
+            return ComponentUID(obj, cuid_buffer=cuid_buffer, context=model)
+
+        vectors = results.__dict__.get('_sol_vectors', None)
+        if vectors is not None:
+            var_cuids = [_cuid("v%d" % i) for i in range(len(vectors.primal))]
+            x.update(zip(var_cuids, vectors.primal))
+            if vectors.dual is not None:
+                dual.update((_cuid("c%d" % i), val)
+                            for i, val in enumerate(vectors.dual))
+            for name, _, key in self._bound_multiplier_suffixes:
+                if name in vectors.var_suffixes:
+                    idx, vals = vectors.var_suffixes[name]
+                    multipliers[key].update(
+                        (var_cuids[i], val) for i, val in zip(idx, vals))
+        elif len(results.solution) > 0:
+            soln = results.solution(0)
+            for symbol, entry in iteritems(soln.variable):
+                cuid = _cuid(symbol)
+                if 'Value' in entry:
+                    x[cuid] = entry['Value']
+                for name, _, key in self._bound_multiplier_suffixes:
+                    if name in entry:
+                        multipliers[key][cuid] = entry[name]
+            for symbol, entry in iteritems(soln.constraint):
+                if 'Dual' in entry:
+                    dual[_cuid(symbol)] = entry['Dual']
+        else:
+            # No solution is available: keep the last point
+            return
+        point = dict(multipliers)
+        point['x'] = x
+        point['dual'] = dual
+        self._warm_start_point = point
+
     def process_output(self, rc):
         if os.path.exists(self._results_file):
             return super(IPOPT, self).process_output(rc)
@@ -489,6 +489,7 @@ class CPLEXDirect(DirectSolver):
         for var in referenced_vars:
             self._referenced_variables[var] += 1
         self._vars_referenced_by_con[con] = referenced_vars
+        self._con_body_constants[con] = cplex_expr.offset
         self._pyomo_con_to_solver_con_map[con] = conname
         self._solver_con_to_pyomo_con_map[conname] = con
 
@@ -732,39 +733,42 @@ class CPLEXDirect(DirectSolver):
 
                 var_names = self._solver_model.variables.get_names()
                 assert set(var_names) == set(self._pyomo_var_to_solver_var_map.values())
-                var_vals = self._solver_model.solution.get_values()
-                for name, val in zip(var_names, var_vals):
-                    pyomo_var = self._solver_var_to_pyomo_var_map[name]
-                    if self._referenced_variables[pyomo_var] > 0:
-                        pyomo_var.stale = False
-                        soln_variables[name] = {"Value": val}
+                pyomo_vars, var_vals = self._get_var_values(
+                    None, self._solver_model.solution.get_values)
+                var_map = self._pyomo_var_to_solver_var_map
+                names = [var_map[pyomo_var] for pyomo_var in pyomo_vars]
+                for pyomo_var, val, name in zip(pyomo_vars, var_vals, names):
+                    pyomo_var.stale = False
+                    soln_variables[name] = {"Value": val}
 
                 if extract_reduced_costs:
-                    reduced_costs = self._solver_model.solution.get_reduced_costs(var_names)
-                    for i, name in enumerate(var_names):
-                        pyomo_var = self._solver_var_to_pyomo_var_map[name]
-                        if self._referenced_variables[pyomo_var] > 0:
-                            soln_variables[name]["Rc"] = reduced_costs[i]
+                    reduced_costs = self._get_var_values(
+                        None, self._solver_model.solution.get_reduced_costs)[1]
+                    for val, name in zip(reduced_costs, names):
+                        soln_variables[name]["Rc"] = val
 
+                if extract_duals or extract_slacks:
+                    linear_con_names = self._solver_model.linear_constraints.get_names()
                 if extract_slacks:
-                    for con_name in self._solver_model.linear_constraints.get_names():
+                    quadratic_con_names = self._solver_model.quadratic_constraints.get_names()
+                    for con_name in linear_con_names:
                         soln_constraints[con_name] = {}
-                    for con_name in self._solver_model.quadratic_constraints.get_names():
+                    for con_name in quadratic_con_names:
                         soln_constraints[con_name] = {}
                 elif extract_duals:
                     # CPLEX PYTHON API DOES NOT SUPPORT QUADRATIC DUAL COLLECTION
-                    for con_name in self._solver_model.linear_constraints.get_names():
+                    for con_name in linear_con_names:
                         soln_constraints[con_name] = {}
 
                 if extract_duals:
                     dual_values = self._solver_model.solution.get_dual_values()
-                    for i, con_name in enumerate(self._solver_model.linear_constraints.get_names()):
-                        soln_constraints[con_name]["Dual"] = dual_values[i]
+                    for val, con_name in zip(dual_values, linear_con_names):
+                        soln_constraints[con_name]["Dual"] = val
 
                 if extract_slacks:
                     linear_slacks = self._solver_model.solution.get_linear_slacks()
                     qudratic_slacks = self._solver_model.solution.get_quadratic_slacks()
-                    for i, con_name in enumerate(self._solver_model.linear_constraints.get_names()):
+                    for i, con_name in enumerate(linear_con_names):
                         pyomo_con = self._solver_con_to_pyomo_con_map[con_name]
                         if pyomo_con in self._range_constraints:
                             R_ = self._solver_model.linear_constraints.get_range_values(con_name)
@@ -779,8 +783,8 @@ class CPLEXDirect(DirectSolver):
                                     soln_constraints[con_name]["Slack"] = -Ls_
                         else:
                             soln_constraints[con_name]["Slack"] = linear_slacks[i]
-                    for i, con_name in enumerate(self._solver_model.quadratic_constraints.get_names()):
-                        soln_constraints[con_name]["Slack"] = qudratic_slacks[i]
+                    for val, con_name in zip(qudratic_slacks, quadratic_con_names):
+                        soln_constraints[con_name]["Slack"] = val
         elif self._load_solutions:
             if cpxprob.solution.get_solution_type() > 0:
                 self._load_vars()
@@ -824,35 +828,35 @@ class CPLEXDirect(DirectSolver):
                     [var_names, var_values],
                     self._solver_model.MIP_starts.effort_level.auto)
 
-    def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_ndx_map
+    def _get_var_values(self, vars_to_load, get_values):
+        # Query the solver by column index (rather than name) and, when
+        # loading every variable, with a single call for all columns
+        pyomo_vars, ndxs = self._get_vars_to_load(
+            vars_to_load, self._pyomo_var_to_ndx_map)
         if vars_to_load is None:
-            vals = self._solver_model.solution.get_values()
-            vars_to_load = var_map.keys()
+            vals = get_values()
+            vals = [vals[ndx] for ndx in ndxs]
+        elif ndxs:
+            vals = get_values(ndxs)
         else:
-            cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-            vals = self._solver_model.solution.get_values(cplex_vars_to_load)
+            vals = []
+        return pyomo_vars, vals
+
+    def _load_vars(self, vars_to_load=None):
+        pyomo_vars, vals = self._get_var_values(
+            vars_to_load, self._solver_model.solution.get_values)
 
-        for pyomo_var, val in zip(vars_to_load, vals):
-            if self._referenced_variables[pyomo_var] > 0:
-                pyomo_var.stale = False
-                pyomo_var.value = val
+        for pyomo_var, val in zip(pyomo_vars, vals):
+            pyomo_var.stale = False
+            pyomo_var.value = val
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.solution.get_reduced_costs(cplex_vars_to_load)
+        pyomo_vars, vals = self._get_var_values(
+            vars_to_load, self._solver_model.solution.get_reduced_costs)
 
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                rc[pyomo_var] = vals[i]
+        self._pyomo_model.rc.update(zip(pyomo_vars, vals))
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
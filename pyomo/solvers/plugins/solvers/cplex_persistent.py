@@ -9,10 +9,13 @@
 #  ___________________________________________________________________________
 
 from pyomo.core.expr.numvalue import value
-from pyomo.solvers.plugins.solvers.cplex_direct import CPLEXDirect
+from pyomo.solvers.plugins.solvers.cplex_direct import (
+    CPLEXDirect, _LinearConstraintData, _VariableData)
 from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
 from pyomo.opt.base import SolverFactory
 
+from bisect import bisect_left
+
 
 @SolverFactory.register('cplex_persistent', doc='Persistent python interface to CPLEX')
 class CPLEXPersistent(PersistentSolver, CPLEXDirect):
@@ -68,6 +71,38 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
         del self._pyomo_var_to_ndx_map[pyomo_var]
         self._solver_model.variables.delete(solver_var)
 
+    def _remove_constraints(self, solver_cons):
+        try:
+            self._solver_model.linear_constraints.delete(solver_cons)
+        except self._cplex.exceptions.CplexError:
+            # Some of the constraints are quadratic
+            PersistentSolver._remove_constraints(self, solver_cons)
+
+    def _remove_vars(self, solver_vars):
+        removed = []
+        for solver_var in solver_vars:
+            pyomo_var = self._solver_var_to_pyomo_var_map[solver_var]
+            removed.append(self._pyomo_var_to_ndx_map[pyomo_var])
+            del self._pyomo_var_to_ndx_map[pyomo_var]
+        removed.sort()
+        for tmp_var, tmp_ndx in self._pyomo_var_to_ndx_map.items():
+            self._pyomo_var_to_ndx_map[tmp_var] = \
+                tmp_ndx - bisect_left(removed, tmp_ndx)
+        self._ndx_count -= len(removed)
+        self._solver_model.variables.delete(solver_vars)
+
+    def _add_vars(self, variables):
+        var_data = _VariableData(self._solver_model)
+        for var in variables:
+            self._add_var(var, var_data)
+        var_data.store_in_cplex()
+
+    def _add_constraints(self, cons):
+        lin_con_data = _LinearConstraintData(self._solver_model)
+        for con in cons:
+            self._add_constraint(con, lin_con_data)
+        lin_con_data.store_in_cplex()
+
     def _warm_start(self):
         CPLEXDirect._warm_start(self)
 
@@ -99,6 +134,64 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
         self._solver_model.variables.set_upper_bounds(cplex_var, ub)
         self._solver_model.variables.set_types(cplex_var, vtype)
 
+    def update_vars(self, variables):
+        """Update several variables in the solver's model.
+
+        This will update bounds, fix/unfix the variables as needed, and
+        update the variable types, setting each attribute for all of
+        the variables in a single call.
+
+        Parameters
+        ----------
+        variables: iterable of _VarData
+
+        """
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in variables:
+            if var not in self._pyomo_var_to_solver_var_map:
+                raise ValueError('The Var provided to update_vars needs to be added first: {0}'.format(var))
+            cplex_var = self._pyomo_var_to_solver_var_map[var]
+            lb, ub = self._cplex_lb_ub_from_var(var)
+            lbs.append((cplex_var, lb))
+            ubs.append((cplex_var, ub))
+            vtypes.append((cplex_var, self._cplex_vtype_from_var(var)))
+        if not vtypes:
+            return
+
+        self._solver_model.variables.set_lower_bounds(lbs)
+        self._solver_model.variables.set_upper_bounds(ubs)
+        self._solver_model.variables.set_types(vtypes)
+
+    def _update_constraint_bounds(self, cons):
+        rhs = []
+        range_values = []
+        for con in cons:
+            cplex_con = self._pyomo_con_to_solver_con_map[con]
+            offset = self._get_constraint_offset(con)
+            if con in self._range_constraints:
+                lb = value(con.lower)
+                ub = value(con.upper)
+                rhs.append((cplex_con, ub - offset))
+                range_values.append((cplex_con, lb - ub))
+            elif con.has_lb():
+                rhs.append((cplex_con, value(con.lower) - offset))
+            else:
+                rhs.append((cplex_con, value(con.upper) - offset))
+        if not rhs:
+            return
+
+        try:
+            self._solver_model.linear_constraints.set_rhs(rhs)
+        except self._cplex.exceptions.CplexError:
+            # Some of the constraints are quadratic
+            PersistentSolver._update_constraint_bounds(self, cons)
+            return
+        if range_values:
+            self._solver_model.linear_constraints.set_range_values(
+                range_values)
+
     def write(self, filename, filetype=''):
         """
         Write the model to a file (e.g., and lp file).
@@ -68,6 +68,10 @@ class DirectOrPersistentSolver(OptSolver):
         constraint. This is primarily needed for the persistent solvers. When a constraint is deleted, we need
         to decrement the number of times those variables are referenced (see self._referenced_variables)."""
 
+        self._con_body_constants = ComponentMap()
+        """A dictionary mapping constraints to the constant term in their body (which the solver interfaces move
+        to the right-hand side). This is used by the persistent solvers to update the constraint bounds."""
+
         self._vars_referenced_by_obj = ComponentSet()
         """A set containing the pyomo variables referenced by that the objective.
         This is primarily needed for the persistent solvers. When a the objective is deleted, we need
@@ -136,6 +140,10 @@ class DirectOrPersistentSolver(OptSolver):
         # use the base class _presolve to consume the
         # important keywords
         OptSolver._presolve(self, **kwds)
+        if self._results_mode == 'lean':
+            # The solution is loaded directly from the solver, without
+            # building the Solution object on the results
+            self._save_results = False
 
         # ***********************************************************
         # The following code is only needed for backwards compatability of load_solutions=False.
@@ -185,6 +193,7 @@ class DirectOrPersistentSolver(OptSolver):
         self._pyomo_con_to_solver_con_map = dict()
         self._solver_con_to_pyomo_con_map = dict()
         self._vars_referenced_by_con = ComponentMap()
+        self._con_body_constants = ComponentMap()
         self._vars_referenced_by_obj = ComponentSet()
         self._referenced_variables = ComponentMap()
         self._objective_label = None
@@ -271,6 +280,31 @@ class DirectOrPersistentSolver(OptSolver):
         raise NotImplementedError("This method should be implemented "
                                   "by subclasses")
 
+    def _get_vars_to_load(self, vars_to_load=None, var_map=None):
+        """
+        Return aligned lists of the pyomo variables in vars_to_load (all
+        variables if None) that are referenced by the solver model and
+        the corresponding entries in var_map (by default, the solver
+        variables). The solver values for all of the variables can
+        then be retrieved with a single (vectorized) call to the solver
+        API and assigned with a simple loop over the two lists.
+        """
+        if var_map is None:
+            var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        if vars_to_load is None:
+            var_items = var_map.items()
+        else:
+            var_items = ((pyomo_var, var_map[pyomo_var])
+                         for pyomo_var in vars_to_load)
+        pyomo_vars = []
+        solver_vars = []
+        for pyomo_var, solver_var in var_items:
+            if ref_vars[pyomo_var] > 0:
+                pyomo_vars.append(pyomo_var)
+                solver_vars.append(solver_var)
+        return pyomo_vars, solver_vars
+
     def load_vars(self, vars_to_load=None):
         """
         Load the values from the solver's variables into the corresponding pyomo variables.
@@ -16,6 +16,7 @@ from pyomo.core.base.block import _BlockData
 from pyomo.core.kernel.block import IBlock
 from pyomo.core.base.suffix import active_import_suffix_generator
 from pyomo.core.kernel.suffix import import_suffix_generator
+from pyomo.opt.base.solvers import _lean_results
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Options
 
@@ -187,6 +188,10 @@ class DirectSolver(DirectOrPersistentSolver):
                             result._smap = _model.solutions.symbol_map[self._smap_id]
                             _model.solutions.delete_symbol_map(self._smap_id)
             # ********************************************************
+            elif self._results_mode == 'lean' and \
+                 isinstance(self._pyomo_model, _BlockData):
+                # The solution was loaded directly into the model
+                _lean_results(result, self._pyomo_model)
             postsolve_completion_time = time.time()
 
             if self._report_timing:
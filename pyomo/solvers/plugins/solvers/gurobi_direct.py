@@ -278,17 +278,20 @@ class GurobiDirect(DirectSolver):
         conname = self._symbol_map.getSymbol(con, self._labeler)
 
         if con._linear_canonical_form:
-            gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-                con.canonical_form(),
-                self._max_constraint_degree)
+            repn = con.canonical_form()
         #elif isinstance(con, LinearCanonicalRepn):
-        #    gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-        #        con,
-        #        self._max_constraint_degree)
+        #    repn = con
         else:
-            gurobi_expr, referenced_vars = self._get_expr_from_pyomo_expr(
-                con.body,
+            repn = generate_standard_repn(
+                con.body, quadratic=self._max_constraint_degree == 2)
+        try:
+            gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
+                repn,
                 self._max_constraint_degree)
+        except DegreeError as e:
+            msg = e.args[0]
+            msg += '\nexpr: {0}'.format(con.body)
+            raise DegreeError(msg)
 
         if con.has_lb():
             if not is_fixed(con.lower):
@@ -327,6 +330,7 @@ class GurobiDirect(DirectSolver):
         for var in referenced_vars:
             self._referenced_variables[var] += 1
         self._vars_referenced_by_con[con] = referenced_vars
+        self._con_body_constants[con] = value(repn.constant)
         self._pyomo_con_to_solver_con_map[con] = gurobipy_con
         self._solver_con_to_pyomo_con_map[gurobipy_con] = con
 
@@ -613,22 +617,17 @@ class GurobiDirect(DirectSolver):
                 soln_variables = soln.variable
                 soln_constraints = soln.constraint
 
-                gurobi_vars = self._solver_model.getVars()
-                gurobi_vars = list(set(gurobi_vars).intersection(set(self._pyomo_var_to_solver_var_map.values())))
+                pyomo_vars, gurobi_vars = self._get_vars_to_load()
                 var_vals = self._solver_model.getAttr("X", gurobi_vars)
                 names = self._solver_model.getAttr("VarName", gurobi_vars)
-                for gurobi_var, val, name in zip(gurobi_vars, var_vals, names):
-                    pyomo_var = self._solver_var_to_pyomo_var_map[gurobi_var]
-                    if self._referenced_variables[pyomo_var] > 0:
-                        pyomo_var.stale = False
-                        soln_variables[name] = {"Value": val}
+                for pyomo_var, val, name in zip(pyomo_vars, var_vals, names):
+                    pyomo_var.stale = False
+                    soln_variables[name] = {"Value": val}
 
                 if extract_reduced_costs:
                     vals = self._solver_model.getAttr("Rc", gurobi_vars)
-                    for gurobi_var, val, name in zip(gurobi_vars, vals, names):
-                        pyomo_var = self._solver_var_to_pyomo_var_map[gurobi_var]
-                        if self._referenced_variables[pyomo_var] > 0:
-                            soln_variables[name]["Rc"] = val
+                    for val, name in zip(vals, names):
+                        soln_variables[name]["Rc"] = val
 
                 if extract_duals or extract_slacks:
                     gurobi_cons = self._solver_model.getConstrs()
@@ -705,88 +704,86 @@ class GurobiDirect(DirectSolver):
         self._needs_updated = True
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
+        pyomo_vars, gurobi_vars = self._get_vars_to_load(vars_to_load)
+        vals = self._solver_model.getAttr("X", gurobi_vars)
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                var.stale = False
-                var.value = val
+        for var, val in zip(pyomo_vars, vals):
+            var.stale = False
+            var.value = val
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
+        pyomo_vars, gurobi_vars = self._get_vars_to_load(vars_to_load)
+        vals = self._solver_model.getAttr("Rc", gurobi_vars)
 
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
+        self._pyomo_model.rc.update(zip(pyomo_vars, vals))
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+    def _split_cons_to_load(self, cons_to_load):
+        """Return the linear and quadratic gurobi constraints (in the
+        order they are given) for the pyomo constraints in
+        cons_to_load (all constraints if None)"""
+        if cons_to_load is None:
+            linear_cons = self._solver_model.getConstrs()
+            if self._version_major >= 5:
+                quadratic_cons = self._solver_model.getQConstrs()
+            else:
+                quadratic_cons = []
+            return linear_cons, quadratic_cons
+
+        con_map = self._pyomo_con_to_solver_con_map
+        Constr = self._gurobipy.Constr
+        QConstr = getattr(self._gurobipy, 'QConstr', None)
+        linear_cons = []
+        quadratic_cons = []
+        for pyomo_con in cons_to_load:
+            gurobi_con = con_map[pyomo_con]
+            if type(gurobi_con) is Constr:
+                linear_cons.append(gurobi_con)
+            elif type(gurobi_con) is QConstr:
+                quadratic_cons.append(gurobi_con)
+        return linear_cons, quadratic_cons
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
             self._pyomo_model.dual = Suffix(direction=Suffix.IMPORT)
-        con_map = self._pyomo_con_to_solver_con_map
         reverse_con_map = self._solver_con_to_pyomo_con_map
         dual = self._pyomo_model.dual
 
-        if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.getConstrs()
-            if self._version_major >= 5:
-                quadratic_cons_to_load = self._solver_model.getQConstrs()
-        else:
-            gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
-            if self._version_major >= 5:
-                quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
-        linear_vals = self._solver_model.getAttr("Pi", linear_cons_to_load)
-        if self._version_major >= 5:
+        linear_cons_to_load, quadratic_cons_to_load = \
+            self._split_cons_to_load(cons_to_load)
+        if linear_cons_to_load:
+            linear_vals = self._solver_model.getAttr("Pi", linear_cons_to_load)
+            dual.update(zip(map(reverse_con_map.__getitem__, linear_cons_to_load),
+                            linear_vals))
+        if quadratic_cons_to_load:
             quadratic_vals = self._solver_model.getAttr("QCPi", quadratic_cons_to_load)
-
-        for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
-            pyomo_con = reverse_con_map[gurobi_con]
-            dual[pyomo_con] = val
-        if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                dual[pyomo_con] = val
+            dual.update(zip(map(reverse_con_map.__getitem__, quadratic_cons_to_load),
+                            quadratic_vals))
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
             self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
-        con_map = self._pyomo_con_to_solver_con_map
         reverse_con_map = self._solver_con_to_pyomo_con_map
         slack = self._pyomo_model.slack
 
-        gurobi_range_con_vars = set(self._solver_model.getVars()) - set(self._pyomo_var_to_solver_var_map.values())
-
-        if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.getConstrs()
-            if self._version_major >= 5:
-                quadratic_cons_to_load = self._solver_model.getQConstrs()
+        linear_cons_to_load, quadratic_cons_to_load = \
+            self._split_cons_to_load(cons_to_load)
+        if linear_cons_to_load:
+            linear_vals = self._solver_model.getAttr("Slack", linear_cons_to_load)
         else:
-            gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
-            if self._version_major >= 5:
-                quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
-        linear_vals = self._solver_model.getAttr("Slack", linear_cons_to_load)
-        if self._version_major >= 5:
+            linear_vals = []
+        if quadratic_cons_to_load:
             quadratic_vals = self._solver_model.getAttr("QCSlack", quadratic_cons_to_load)
+            slack.update(zip(map(reverse_con_map.__getitem__, quadratic_cons_to_load),
+                             quadratic_vals))
 
+        gurobi_range_con_vars = None
         for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
             pyomo_con = reverse_con_map[gurobi_con]
             if pyomo_con in self._range_constraints:
+                if gurobi_range_con_vars is None:
+                    gurobi_range_con_vars = set(self._solver_model.getVars()) - set(self._pyomo_var_to_solver_var_map.values())
                 lin_expr = self._solver_model.getRow(gurobi_con)
                 for i in reversed(range(lin_expr.size())):
                     v = lin_expr.getVar(i)
@@ -800,10 +797,6 @@ class GurobiDirect(DirectSolver):
                         break
             else:
                 slack[pyomo_con] = val
-        if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                slack[pyomo_con] = val
 
     def load_duals(self, cons_to_load=None):
         """
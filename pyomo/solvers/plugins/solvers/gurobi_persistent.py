@@ -89,6 +89,44 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
         self._solver_model.remove(solver_var)
         self._needs_updated = True
 
+    def _remove_constraints(self, solver_cons):
+        # constraints can only be removed once they are in the model
+        if self._needs_updated:
+            self._update()
+        self._solver_model.remove(solver_cons)
+        self._needs_updated = True
+
+    def _remove_vars(self, solver_vars):
+        if self._needs_updated:
+            self._update()
+        self._solver_model.remove(solver_vars)
+        self._needs_updated = True
+
+    def _add_vars(self, variables):
+        if not variables:
+            return
+        names = []
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in variables:
+            names.append(self._symbol_map.getSymbol(var, self._labeler))
+            vtypes.append(self._gurobi_vtype_from_var(var))
+            lb, ub = self._gurobi_lb_ub_from_var(var)
+            lbs.append(lb)
+            ubs.append(ub)
+
+        gurobipy_vars = self._solver_model.addVars(
+            len(variables), lb=lbs, ub=ubs, vtype=vtypes, name=names)
+
+        for i, var in enumerate(variables):
+            gurobipy_var = gurobipy_vars[i]
+            self._pyomo_var_to_solver_var_map[var] = gurobipy_var
+            self._solver_var_to_pyomo_var_map[gurobipy_var] = var
+            self._referenced_variables[var] = 0
+
+        self._needs_updated = True
+
     def _warm_start(self):
         GurobiDirect._warm_start(self)
 
@@ -121,6 +159,66 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
         gurobipy_var.setAttr('vtype', vtype)
         self._needs_updated = True
 
+    def update_vars(self, variables):
+        """Update several variables in the solver's model.
+
+        This will update bounds, fix/unfix the variables as needed, and
+        update the variable types, setting each attribute for all of
+        the variables in a single call.
+
+        Parameters
+        ----------
+        variables: iterable of _VarData
+
+        """
+        gurobipy_vars = []
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in variables:
+            if var not in self._pyomo_var_to_solver_var_map:
+                raise ValueError('The Var provided to update_vars needs to be added first: {0}'.format(var))
+            gurobipy_vars.append(self._pyomo_var_to_solver_var_map[var])
+            vtypes.append(self._gurobi_vtype_from_var(var))
+            lb, ub = self._gurobi_lb_ub_from_var(var)
+            lbs.append(lb)
+            ubs.append(ub)
+        if not gurobipy_vars:
+            return
+
+        self._solver_model.setAttr('LB', gurobipy_vars, lbs)
+        self._solver_model.setAttr('UB', gurobipy_vars, ubs)
+        self._solver_model.setAttr('VType', gurobipy_vars, vtypes)
+        self._needs_updated = True
+
+    def _update_constraint_bounds(self, cons):
+        gurobipy_cons = []
+        rhs = []
+        others = []
+        for con in cons:
+            gurobipy_con = self._pyomo_con_to_solver_con_map[con]
+            # Range constraints are modeled with an additional range
+            # variable, and quadratic constraints have a different RHS
+            # attribute: those are simply added again
+            if con in self._range_constraints or \
+               not isinstance(gurobipy_con, self._gurobipy.Constr):
+                others.append(con)
+                continue
+            if con.has_lb():
+                bound = value(con.lower)
+            else:
+                bound = value(con.upper)
+            gurobipy_cons.append(gurobipy_con)
+            rhs.append(bound - self._get_constraint_offset(con))
+
+        if gurobipy_cons:
+            if self._version_major < 7 and self._needs_updated:
+                self._update()
+            self._solver_model.setAttr('RHS', gurobipy_cons, rhs)
+            self._needs_updated = True
+        if others:
+            PersistentSolver._update_constraint_bounds(self, others)
+
     def write(self, filename):
         """
         Write the model to a file (e.g., and lp file).
@@ -133,7 +231,18 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
         self._solver_model.write(filename)
         self._needs_updated = False
 
-    def update(self):
+    def update(self, detect_changes=False):
+        """Process the pending modifications of the gurobipy model (see
+        gurobipy.Model.update).
+
+        Parameters
+        ----------
+        detect_changes: bool
+            If True, first update the solver's model to match the Pyomo
+            model (see PersistentSolver.update).
+        """
+        if detect_changes:
+            PersistentSolver.update(self)
         self._update()
 
     def set_linear_constraint_attr(self, con, attr, val):
@@ -13,15 +13,22 @@ from pyomo.core.base.block import _BlockData
 from pyomo.core.kernel.block import IBlock
 from pyomo.core.base.suffix import active_import_suffix_generator
 from pyomo.core.kernel.suffix import import_suffix_generator
-from pyomo.core.expr.numvalue import native_numeric_types, value
-from pyomo.core.expr.visitor import evaluate_expression
+from pyomo.core.expr.numvalue import native_numeric_types, value, is_fixed
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.visitor import (evaluate_expression,
+                                     SimpleExpressionVisitor)
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.var import Var
 from pyomo.core.base.sos import SOSConstraint
+from pyomo.core.base.objective import Objective
+from pyomo.core.kernel.sos import ISOS
+from pyomo.repn import generate_standard_repn
 
+from pyomo.opt.base.solvers import _lean_results
 from pyomo.common.errors import ApplicationError
-from pyomo.common.collections import Options
+from pyomo.common.collections import Options, ComponentMap, ComponentSet
 
+import itertools
 import time
 import logging
 
@@ -35,6 +42,85 @@ def _convert_to_const(val):
     else:
         return value(val)
 
+class _FixedLeafVisitor(SimpleExpressionVisitor):
+    """Collect the leaves of an expression whose values are part of the
+    expression sent to the solver (mutable parameters and fixed
+    variables)"""
+
+    def __init__(self):
+        self.seen = set()
+        self.leaves = []
+
+    def walk(self, expr):
+        if expr.__class__ in native_numeric_types:
+            return
+        for _ in self.xbfs_yield_leaves(expr):
+            pass
+
+    def visit(self, node):
+        if node.__class__ in native_numeric_types:
+            return
+        if isinstance(node, LinearExpression):
+            # The xbfs walk treats LinearExpression objects as leaves
+            for arg in itertools.chain(
+                    (node.constant,), node.linear_coefs, node.linear_vars):
+                self.walk(arg)
+            return
+        if not node.is_fixed() or node.is_constant():
+            return
+        if id(node) in self.seen:
+            return
+        self.seen.add(id(node))
+        self.leaves.append(node)
+
+
+def _fixed_leaves(expr):
+    visitor = _FixedLeafVisitor()
+    visitor.walk(expr)
+    return tuple(visitor.leaves)
+
+
+def _leaf_value(leaf):
+    if leaf.is_variable_type():
+        if not leaf.fixed:
+            return None
+        return leaf.value
+    return value(leaf)
+
+
+def _bound_value(bound):
+    if bound is None:
+        return None
+    return value(bound)
+
+
+def _var_state(var):
+    return (_bound_value(var.lb), _bound_value(var.ub), var.fixed,
+            var.value if var.fixed else None,
+            var.is_binary(), var.is_integer())
+
+
+def _con_state(con):
+    # The body is only compared by identity (the bodies of linear
+    # canonical constraints are rebuilt on every access)
+    body = None if con._linear_canonical_form else con.body
+    return (body, con.equality,
+            _bound_value(con.lower), _bound_value(con.upper))
+
+
+def _con_bounds_changed(old_state, new_state):
+    """Returns None if the constraint did not change, True if only the
+    values of its bounds changed, and False otherwise"""
+    if new_state[0] is not old_state[0] or new_state[1] != old_state[1]:
+        return False
+    if new_state[2:] == old_state[2:]:
+        return None
+    if (new_state[2] is None) != (old_state[2] is None) or \
+       (new_state[3] is None) != (old_state[3] is None):
+        return False
+    return True
+
+
 class PersistentSolver(DirectOrPersistentSolver):
     """
     A base class for persistent solvers. Direct solver interfaces do not use any file io.
@@ -82,7 +168,9 @@ class PersistentSolver(DirectOrPersistentSolver):
             This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
             solver constraints. If True, then the error will not be raised.
         """
-        return self._set_instance(model, kwds)
+        ans = self._set_instance(model, kwds)
+        self._take_snapshot()
+        return ans
 
     def add_block(self, block):
         """Add a single Pyomo Block to the solver's model.
@@ -104,6 +192,16 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_block(block)
         #    return
         self._add_block(block)
+        for var in block.component_data_objects(
+                ctype=Var, descend_into=True, active=True):
+            self._snapshot_vars[var] = _var_state(var)
+        for con in block.component_data_objects(
+                ctype=Constraint, descend_into=True, active=True):
+            if con.has_lb() or con.has_ub():
+                self._snapshot_constraint(con)
+        self._snapshot_sos.update(block.component_data_objects(
+            ctype=SOSConstraint, descend_into=True, active=True))
+        self._snapshot_objective()
 
     def set_objective(self, obj):
         """
@@ -116,7 +214,9 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         if self._pyomo_model is None:
             raise RuntimeError('You must call set_instance before calling set_objective.')
-        return self._set_objective(obj)
+        ans = self._set_objective(obj)
+        self._snapshot_objective()
+        return ans
 
     def add_constraint(self, con):
         """Add a single constraint to the solver's model.
@@ -138,6 +238,31 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_constraint(child_con)
         #else:
         self._add_constraint(con)
+        self._snapshot_constraint(con)
+
+    def add_constraints(self, cons):
+        """Add several constraints to the solver's model.
+
+        This is equivalent to calling add_constraint for each
+        constraint, but solver interfaces that support it add the
+        constraints to the solver's model with a single (batched) call.
+
+        Parameters
+        ----------
+        cons: iterable of _ConstraintData
+
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling add_constraints.')
+        cons = list(cons)
+        self._add_constraints(cons)
+        for con in cons:
+            self._snapshot_constraint(con)
+
+    """ This method can be overridden by subclasses to add the constraints in a single call."""
+    def _add_constraints(self, cons):
+        for con in cons:
+            self._add_constraint(con)
 
     def add_var(self, var):
         """Add a single variable to the solver's model.
@@ -161,6 +286,34 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_var(child_var)
         #else:
         self._add_var(var)
+        self._snapshot_vars[var] = _var_state(var)
+
+    def add_vars(self, variables):
+        """Add several variables to the solver's model.
+
+        This is equivalent to calling add_var for each variable, but
+        solver interfaces that support it add the variables to the
+        solver's model with a single (batched) call.
+
+        Parameters
+        ----------
+        variables: iterable of _VarData
+
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling add_vars.')
+        variables = list(variables)
+        for var in variables:
+            if id(self._pyomo_model) != id(var.model()):
+                raise RuntimeError('The pyomo var must be attached to the solver model')
+        self._add_vars(variables)
+        for var in variables:
+            self._snapshot_vars[var] = _var_state(var)
+
+    """ This method can be overridden by subclasses to add the variables in a single call."""
+    def _add_vars(self, variables):
+        for var in variables:
+            self._add_var(var)
 
     def add_sos_constraint(self, con):
         """Add a single SOS constraint to the solver's model (if supported).
@@ -182,6 +335,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_sos_constraint(child_con)
         #else:
         self._add_sos_constraint(con)
+        self._snapshot_sos.add(con)
 
     def add_column(self, model, var, obj_coef, constraints, coefficients):
         """Add a column to the solver's and Pyomo model
@@ -216,9 +370,15 @@ class PersistentSolver(DirectOrPersistentSolver):
         if len(constraints) != len(coefficients):
             raise RuntimeError('The list of constraints and the list of coefficents '
                                'be of equal length')
+        pyomo_cons = constraints
         obj_coef, constraints, coefficients = self._add_and_collect_column_data(
                 var, obj_coef, constraints, coefficients)
         self._add_column(var, obj_coef, constraints, coefficients)
+        # the bodies of the constraints and the objective were modified
+        self._snapshot_vars[var] = _var_state(var)
+        for con in pyomo_cons:
+            self._snapshot_constraint(con)
+        self._snapshot_objective()
 
     """ This method should be implemented by subclasses."""
     def _add_column(self, var, obj_coef, constraints, coefficients):
@@ -257,6 +417,11 @@ class PersistentSolver(DirectOrPersistentSolver):
     def _remove_constraint(self, solver_con):
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    """ This method can be overridden by subclasses to remove the constraints in a single call."""
+    def _remove_constraints(self, solver_cons):
+        for solver_con in solver_cons:
+            self._remove_constraint(solver_con)
+
     """ This method should be implemented by subclasses."""
     def _remove_sos_constraint(self, solver_sos_con):
         raise NotImplementedError('This method should be implemented by subclasses.')
@@ -265,6 +430,11 @@ class PersistentSolver(DirectOrPersistentSolver):
     def _remove_var(self, solver_var):
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    """ This method can be overridden by subclasses to remove the variables in a single call."""
+    def _remove_vars(self, solver_vars):
+        for solver_var in solver_vars:
+            self._remove_var(solver_var)
+
     def remove_block(self, block):
         """Remove a single block from the solver's model.
 
@@ -284,15 +454,15 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    for sub_block in block.values():
         #        self.remove_block(sub_block)
         #    return
+        cons = []
         for sub_block in block.block_data_objects(descend_into=True, active=True):
-            for con in sub_block.component_data_objects(ctype=Constraint, descend_into=False, active=True):
-                self.remove_constraint(con)
+            cons.extend(sub_block.component_data_objects(ctype=Constraint, descend_into=False, active=True))
 
             for con in sub_block.component_data_objects(ctype=SOSConstraint, descend_into=False, active=True):
                 self.remove_sos_constraint(con)
+        self.remove_constraints(cons)
 
-        for var in block.component_data_objects(ctype=Var, descend_into=True, active=True):
-            self.remove_var(var)
+        self.remove_vars(block.component_data_objects(ctype=Var, descend_into=True, active=True))
 
     def remove_constraint(self, con):
         """Remove a single constraint from the solver's model.
@@ -313,11 +483,34 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    return
         solver_con = self._pyomo_con_to_solver_con_map[con]
         self._remove_constraint(solver_con)
+        self._forget_constraint(con, solver_con)
+
+    def remove_constraints(self, cons):
+        """Remove several constraints from the solver's model.
+
+        This is equivalent to calling remove_constraint for each
+        constraint, but solver interfaces that support it remove the
+        constraints from the solver's model with a single (batched)
+        call.
+
+        Parameters
+        ----------
+        cons: iterable of _ConstraintData
+
+        """
+        cons = list(cons)
+        solver_cons = [self._pyomo_con_to_solver_con_map[con] for con in cons]
+        self._remove_constraints(solver_cons)
+        for con, solver_con in zip(cons, solver_cons):
+            self._forget_constraint(con, solver_con)
+
+    def _forget_constraint(self, con, solver_con):
         self._symbol_map.removeSymbol(con)
         self._labeler.remove_obj(con)
         for var in self._vars_referenced_by_con[con]:
             self._referenced_variables[var] -= 1
         del self._vars_referenced_by_con[con]
+        self._con_body_constants.pop(con, None)
         del self._pyomo_con_to_solver_con_map[con]
         del self._solver_con_to_pyomo_con_map[solver_con]
 
@@ -340,13 +533,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    return
         solver_con = self._pyomo_con_to_solver_con_map[con]
         self._remove_sos_constraint(solver_con)
-        self._symbol_map.removeSymbol(con)
-        self._labeler.remove_obj(con)
-        for var in self._vars_referenced_by_con[con]:
-            self._referenced_variables[var] -= 1
-        del self._vars_referenced_by_con[con]
-        del self._pyomo_con_to_solver_con_map[con]
-        del self._solver_con_to_pyomo_con_map[solver_con]
+        self._forget_constraint(con, solver_con)
 
     def remove_var(self, var):
         """Remove a single variable from the solver's model.
@@ -370,6 +557,33 @@ class PersistentSolver(DirectOrPersistentSolver):
                              'objective or one or more constraints')
         solver_var = self._pyomo_var_to_solver_var_map[var]
         self._remove_var(solver_var)
+        self._forget_var(var, solver_var)
+
+    def remove_vars(self, variables):
+        """Remove several variables from the solver's model.
+
+        This is equivalent to calling remove_var for each variable, but
+        solver interfaces that support it remove the variables from the
+        solver's model with a single (batched) call. No variable is
+        removed if any of them is still referenced by the objective or
+        a constraint.
+
+        Parameters
+        ----------
+        variables: iterable of _VarData
+
+        """
+        variables = list(variables)
+        for var in variables:
+            if self._referenced_variables[var] != 0:
+                raise ValueError('Cannot remove Var {0} because it is still referenced by the '.format(var) +
+                                 'objective or one or more constraints')
+        solver_vars = [self._pyomo_var_to_solver_var_map[var] for var in variables]
+        self._remove_vars(solver_vars)
+        for var, solver_var in zip(variables, solver_vars):
+            self._forget_var(var, solver_var)
+
+    def _forget_var(self, var, solver_var):
         self._symbol_map.removeSymbol(var)
         self._labeler.remove_obj(var)
         del self._referenced_variables[var]
@@ -388,6 +602,331 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def update_vars(self, variables):
+        """Update several variables in the solver's model.
+
+        This is equivalent to calling update_var for each variable
+        (updating the bounds, fixing/unfixing the variables as needed,
+        and updating the variable types), but solver interfaces that
+        support it update the variables with a single (batched) call
+        per attribute.
+
+        Parameters
+        ----------
+        variables: iterable of _VarData
+
+        """
+        for var in variables:
+            self.update_var(var)
+
+    def update_constraint_bounds(self, cons):
+        """Update the bounds (right-hand sides) of several constraints.
+
+        This pushes the current values of the lower and upper bounds of
+        each constraint to the solver's model. The constraint body and
+        the kind of constraint (equality, range, or single-sided
+        inequality) must not have changed since the constraint was
+        added. Solver interfaces that support it change the
+        right-hand sides with a single (batched) call; otherwise the
+        constraints are removed and added again.
+
+        Parameters
+        ----------
+        cons: iterable of _ConstraintData
+
+        """
+        cons = list(cons)
+        for con in cons:
+            if con not in self._pyomo_con_to_solver_con_map:
+                raise ValueError('The Constraint provided to update_constraint_bounds '
+                                 'needs to be added first: {0}'.format(con))
+            if con.has_lb() and not is_fixed(con.lower):
+                raise ValueError("Lower bound of constraint {0} "
+                                 "is not constant.".format(con))
+            if con.has_ub() and not is_fixed(con.upper):
+                raise ValueError("Upper bound of constraint {0} "
+                                 "is not constant.".format(con))
+        self._update_constraint_bounds(cons)
+
+    """ This method can be overridden by subclasses to change the right-hand sides in a single call."""
+    def _update_constraint_bounds(self, cons):
+        self.remove_constraints(cons)
+        self._add_constraints(cons)
+
+    def update(self):
+        """Update the solver's model to match the Pyomo model.
+
+        This compares the Pyomo model with the state it had when
+        set_instance (or update) was last called and sends only the
+        differences to the solver:
+
+          - variables whose bounds, domain, or fixed status / fixed
+            value changed are updated (see update_vars)
+          - constraints whose body was replaced, or whose body
+            references mutable parameters or fixed variables whose
+            values changed (or a variable that was fixed or unfixed),
+            are removed and added again
+          - constraints whose (numeric) bounds changed are updated
+            (see update_constraint_bounds)
+          - constraints, SOS constraints, and variables that were added
+            to (or activated in) the model are added to the solver's
+            model, and those that were removed from (or deactivated in)
+            the model are removed from the solver's model
+          - the objective is set again if the active objective, its
+            expression or sense, or the values in it changed
+
+        Changes to the terms of linear canonical constraints
+        (e.g., pyomo.kernel linear_constraint objects) and to the
+        members of SOS constraints are not detected. Components that
+        were explicitly removed with the remove_* methods are not added
+        back unless they are deactivated and reactivated.
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling update.')
+        model = self._pyomo_model
+        is_sos = lambda con: con.ctype is SOSConstraint or con.ctype is ISOS
+
+        #
+        # Collect the current (active) model components
+        #
+        all_vars = list(model.component_data_objects(
+            ctype=Var, descend_into=True, active=True, sort=True))
+        all_cons = []
+        all_sos = []
+        objectives = []
+        for sub_block in model.block_data_objects(descend_into=True,
+                                                  active=True):
+            for con in sub_block.component_data_objects(
+                    ctype=Constraint, descend_into=False,
+                    active=True, sort=True):
+                if (not con.has_lb()) and (not con.has_ub()):
+                    continue  # non-binding, so skip
+                all_cons.append(con)
+            all_sos.extend(sub_block.component_data_objects(
+                ctype=SOSConstraint, descend_into=False,
+                active=True, sort=True))
+            objectives.extend(sub_block.component_data_objects(
+                ctype=Objective, descend_into=False, active=True))
+        if len(objectives) > 1:
+            raise ValueError("Solver interface does not "
+                             "support multiple objectives.")
+        current = ComponentSet(all_cons)
+        current.update(all_sos)
+
+        #
+        # Fixed variables and mutable parameters whose values changed
+        #
+        changed_cons = ComponentSet()
+        obj_changed = False
+        changed_leaves = []
+        for leaf, old_val in self._snapshot_leaves.items():
+            if _leaf_value(leaf) != old_val:
+                changed_leaves.append(leaf)
+                changed_cons.update(self._snapshot_cons_by_leaf.get(leaf, ()))
+                if leaf in self._snapshot_obj_leaves:
+                    obj_changed = True
+
+        #
+        # Variables
+        #
+        new_vars = []
+        updated_vars = []
+        newly_fixed = ComponentSet()
+        for var in all_vars:
+            old_state = self._snapshot_vars.get(var, None)
+            if old_state is None:
+                if var not in self._pyomo_var_to_solver_var_map:
+                    new_vars.append(var)
+                continue
+            new_state = _var_state(var)
+            if new_state != old_state:
+                if var in self._pyomo_var_to_solver_var_map:
+                    updated_vars.append(var)
+                if new_state[2] and not old_state[2]:
+                    newly_fixed.add(var)
+        if newly_fixed:
+            # Fixed variables are sent to the solver as constants
+            for con, referenced in self._vars_referenced_by_con.items():
+                if any(var in newly_fixed for var in referenced):
+                    changed_cons.add(con)
+            if any(var in newly_fixed for var in self._vars_referenced_by_obj):
+                obj_changed = True
+        in_model = ComponentSet(all_vars)
+        removed_vars = [var for var in self._pyomo_var_to_solver_var_map
+                        if var not in in_model]
+
+        #
+        # Constraints
+        #
+        new_cons = []
+        new_sos = []
+        bound_cons = []
+        for con in all_cons:
+            old_state = self._snapshot_cons.get(con, None)
+            if old_state is None:
+                if con not in self._pyomo_con_to_solver_con_map:
+                    new_cons.append(con)
+                continue
+            if con in changed_cons:
+                continue
+            bounds_changed = _con_bounds_changed(old_state, _con_state(con))
+            if bounds_changed is None:
+                continue
+            elif bounds_changed:
+                # Only constraints that are in the solver's model are updated
+                if con in self._pyomo_con_to_solver_con_map:
+                    bound_cons.append(con)
+            else:
+                changed_cons.add(con)
+        for con in all_sos:
+            if con not in self._snapshot_sos and \
+               con not in self._pyomo_con_to_solver_con_map:
+                new_sos.append(con)
+        removed_cons = []
+        removed_sos = []
+        for con in self._pyomo_con_to_solver_con_map:
+            if con in current:
+                continue
+            if is_sos(con):
+                removed_sos.append(con)
+            else:
+                removed_cons.append(con)
+        # Only constraints that are in the solver's model are re-added
+        readd_cons = [con for con in changed_cons
+                      if con in current and not is_sos(con) and
+                      con in self._pyomo_con_to_solver_con_map]
+
+        #
+        # Send the changes to the solver
+        #
+        if removed_cons or readd_cons:
+            self.remove_constraints(removed_cons + readd_cons)
+        for con in removed_sos:
+            self.remove_sos_constraint(con)
+        if new_vars:
+            self.add_vars(new_vars)
+        if updated_vars:
+            self.update_vars(updated_vars)
+        if readd_cons or new_cons:
+            self._add_constraints(readd_cons + new_cons)
+        if bound_cons:
+            self.update_constraint_bounds(bound_cons)
+        for con in new_sos:
+            self._add_sos_constraint(con)
+
+        obj = objectives[0] if objectives else None
+        if obj is not None:
+            if obj_changed or obj is not self._objective or \
+               self._snapshot_obj[0] is not obj.expr or \
+               self._snapshot_obj[1] != obj.sense:
+                self._set_objective(obj)
+
+        removed_vars = [var for var in removed_vars
+                        if self._referenced_variables[var] == 0]
+        if removed_vars:
+            self.remove_vars(removed_vars)
+
+        #
+        # Record the new state of the model
+        #
+        for leaf in changed_leaves:
+            self._snapshot_leaves[leaf] = _leaf_value(leaf)
+        for con in [con for con in self._snapshot_cons
+                    if con not in current]:
+            self._forget_snapshot_constraint(con)
+        for con in changed_cons:
+            if con in current and not is_sos(con):
+                self._snapshot_constraint(con)
+            else:
+                self._forget_snapshot_constraint(con)
+        for con in new_cons:
+            self._snapshot_constraint(con)
+        for con in bound_cons:
+            self._snapshot_cons[con] = _con_state(con)
+        self._snapshot_sos = ComponentSet(all_sos)
+        self._snapshot_vars = ComponentMap(
+            (var, _var_state(var)) for var in all_vars)
+        self._snapshot_objective()
+
+    def _take_snapshot(self):
+        """Record the state of the model (see update)"""
+        model = self._pyomo_model
+        self._snapshot_vars = ComponentMap(
+            (var, _var_state(var)) for var in model.component_data_objects(
+                ctype=Var, descend_into=True, active=True))
+        self._snapshot_cons = ComponentMap()
+        self._snapshot_leaves = ComponentMap()
+        self._snapshot_cons_by_leaf = ComponentMap()
+        self._snapshot_leaves_by_con = ComponentMap()
+        self._snapshot_obj = None
+        self._snapshot_obj_leaves = ComponentSet()
+        self._snapshot_sos = ComponentSet(model.component_data_objects(
+            ctype=SOSConstraint, descend_into=True, active=True))
+        for con in model.component_data_objects(
+                ctype=Constraint, descend_into=True, active=True):
+            if con.has_lb() or con.has_ub():
+                self._snapshot_constraint(con)
+        self._snapshot_objective()
+
+    def _snapshot_constraint(self, con):
+        self._forget_snapshot_constraint(con)
+        self._snapshot_cons[con] = _con_state(con)
+        leaves = _fixed_leaves(con.body)
+        self._snapshot_leaves_by_con[con] = leaves
+        for leaf in leaves:
+            if leaf not in self._snapshot_leaves:
+                self._snapshot_leaves[leaf] = _leaf_value(leaf)
+                self._snapshot_cons_by_leaf[leaf] = ComponentSet()
+            self._snapshot_cons_by_leaf[leaf].add(con)
+
+    def _forget_snapshot_constraint(self, con):
+        if con not in self._snapshot_cons:
+            return
+        del self._snapshot_cons[con]
+        for leaf in self._snapshot_leaves_by_con.pop(con):
+            cons = self._snapshot_cons_by_leaf[leaf]
+            cons.discard(con)
+            if not cons and leaf not in self._snapshot_obj_leaves:
+                del self._snapshot_cons_by_leaf[leaf]
+                del self._snapshot_leaves[leaf]
+
+    def _snapshot_objective(self):
+        obj = self._objective
+        old_leaves = self._snapshot_obj_leaves
+        if obj is None:
+            self._snapshot_obj = None
+            self._snapshot_obj_leaves = ComponentSet()
+        else:
+            self._snapshot_obj = (obj.expr, obj.sense)
+            self._snapshot_obj_leaves = ComponentSet(_fixed_leaves(obj.expr))
+        for leaf in old_leaves:
+            if leaf not in self._snapshot_obj_leaves and \
+               not self._snapshot_cons_by_leaf[leaf]:
+                del self._snapshot_cons_by_leaf[leaf]
+                del self._snapshot_leaves[leaf]
+        for leaf in self._snapshot_obj_leaves:
+            if leaf not in self._snapshot_leaves:
+                self._snapshot_leaves[leaf] = _leaf_value(leaf)
+                self._snapshot_cons_by_leaf[leaf] = ComponentSet()
+
+    def _get_constraint_offset(self, con):
+        """
+        Return the constant term in the body of a constraint, which the
+        solver interfaces move to the right-hand side
+
+        The constant is recorded when the constraint is added to the
+        solver's model (and refreshed when it is added again).
+        """
+        try:
+            return self._con_body_constants[con]
+        except KeyError:
+            pass
+        if con._linear_canonical_form:
+            repn = con.canonical_form()
+        else:
+            repn = generate_standard_repn(con.body, quadratic=True)
+        return value(repn.constant)
+
     def solve(self, *args, **kwds):
         """
         Solve the model.
@@ -530,6 +1069,10 @@ class PersistentSolver(DirectOrPersistentSolver):
                             result._smap = _model.solutions.symbol_map[self._smap_id]
                             _model.solutions.delete_symbol_map(self._smap_id)
             # ********************************************************
+            elif self._results_mode == 'lean' and \
+                 isinstance(self._pyomo_model, _BlockData):
+                # The solution was loaded directly into the model
+                _lean_results(result, self._pyomo_model)
             postsolve_completion_time = time.time()
 
             if self._report_timing:
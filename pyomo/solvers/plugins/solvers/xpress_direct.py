@@ -266,16 +266,30 @@ class XpressDirect(DirectSolver):
             if self._skip_trivial_constraints:
                 return None
 
+        xpress_con, referenced_vars, body_constant = \
+            self._xpress_con_from_pyomo_con(con)
+
+        self._solver_model.addConstraint(xpress_con)
+
+        self._record_constraint(con, xpress_con, referenced_vars,
+                                body_constant)
+
+    def _xpress_con_from_pyomo_con(self, con):
         conname = self._symbol_map.getSymbol(con, self._labeler)
 
         if con._linear_canonical_form:
+            repn = con.canonical_form()
+        else:
+            repn = generate_standard_repn(
+                con.body, quadratic=self._max_constraint_degree == 2)
+        try:
             xpress_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-                con.canonical_form(),
+                repn,
                 self._max_constraint_degree)
-        else:
-            xpress_expr, referenced_vars = self._get_expr_from_pyomo_expr(
-                con.body,
-                self._max_constraint_degree) 
+        except DegreeError as e:
+            msg = e.args[0]
+            msg += '\nexpr: {0}'.format(con.body)
+            raise DegreeError(msg)
 
         if con.has_lb():
             if not is_fixed(con.lower):
@@ -312,11 +326,14 @@ class XpressDirect(DirectSolver):
             raise ValueError("Constraint does not have a lower "
                              "or an upper bound: {0} \n".format(con))
 
-        self._solver_model.addConstraint(xpress_con)
+        return xpress_con, referenced_vars, value(repn.constant)
 
+    def _record_constraint(self, con, xpress_con, referenced_vars,
+                           body_constant):
         for var in referenced_vars:
             self._referenced_variables[var] += 1
         self._vars_referenced_by_con[con] = referenced_vars
+        self._con_body_constants[con] = body_constant
         self._pyomo_con_to_solver_con_map[con] = xpress_con
         self._solver_con_to_pyomo_con_map[xpress_con] = con
 
@@ -616,20 +633,16 @@ class XpressDirect(DirectSolver):
                 soln_variables = soln.variable
                 soln_constraints = soln.constraint
 
-                xpress_vars = list(self._solver_var_to_pyomo_var_map.keys())
-                var_vals = xprob.getSolution(xpress_vars)
-                for xpress_var, val in zip(xpress_vars, var_vals):
-                    pyomo_var = self._solver_var_to_pyomo_var_map[xpress_var]
-                    if self._referenced_variables[pyomo_var] > 0:
-                        pyomo_var.stale = False
-                        soln_variables[xpress_var.name] = {"Value": val}
+                pyomo_vars, xpress_vars = self._get_vars_to_load()
+                var_vals = xprob.getSolution(xpress_vars) if xpress_vars else []
+                for pyomo_var, xpress_var, val in zip(pyomo_vars, xpress_vars, var_vals):
+                    pyomo_var.stale = False
+                    soln_variables[xpress_var.name] = {"Value": val}
 
-                if extract_reduced_costs:
+                if extract_reduced_costs and xpress_vars:
                     vals = xprob.getRCost(xpress_vars)
                     for xpress_var, val in zip(xpress_vars, vals):
-                        pyomo_var = self._solver_var_to_pyomo_var_map[xpress_var]
-                        if self._referenced_variables[pyomo_var] > 0:
-                            soln_variables[xpress_var.name]["Rc"] = val
+                        soln_variables[xpress_var.name]["Rc"] = val
 
                 if extract_duals or extract_slacks:
                     xpress_cons = list(self._solver_con_to_pyomo_con_map.keys())
@@ -694,34 +707,24 @@ class XpressDirect(DirectSolver):
         self._solver_model.addmipsol(mipsolval, mipsolcol)
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        xpress_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getSolution(xpress_vars_to_load)
+        pyomo_vars, xpress_vars = self._get_vars_to_load(vars_to_load)
+        if not xpress_vars:
+            return
+        vals = self._solver_model.getSolution(xpress_vars)
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                var.stale = False
-                var.value = val
+        for var, val in zip(pyomo_vars, vals):
+            var.stale = False
+            var.value = val
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        xpress_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getRCost(xpress_vars_to_load)
+        pyomo_vars, xpress_vars = self._get_vars_to_load(vars_to_load)
+        if not xpress_vars:
+            return
+        vals = self._solver_model.getRCost(xpress_vars)
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+        self._pyomo_model.rc.update(zip(pyomo_vars, vals))
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -754,8 +757,8 @@ class XpressDirect(DirectSolver):
             if xpress_con in self._range_constraints:
                 ## for xpress, the slack on a range constraint
                 ## is based on the upper bound
-                lb = con.lb
-                ub = con.ub
+                lb = xpress_con.lb
+                ub = xpress_con.ub
                 ub_s = val
                 expr_val = ub-ub_s
                 lb_s = lb-expr_val
@@ -57,6 +57,64 @@ class XpressPersistent(PersistentSolver, XpressDirect):
     def _remove_var(self, solver_var):
         self._solver_model.delVariable(solver_var)
 
+    def _remove_constraints(self, solver_cons):
+        self._solver_model.delConstraint(solver_cons)
+
+    def _remove_vars(self, solver_vars):
+        self._solver_model.delVariable(solver_vars)
+
+    def _add_vars(self, variables):
+        if not variables:
+            return
+        xpress_vars = []
+        # bounds on binary variables don't seem to be set correctly
+        # when the variables are added (see XpressDirect._add_var)
+        bound_vars = []
+        bound_types = []
+        bounds = []
+        for var in variables:
+            varname = self._symbol_map.getSymbol(var, self._labeler)
+            vartype = self._xpress_vartype_from_var(var)
+            lb, ub = self._xpress_lb_ub_from_var(var)
+
+            xpress_var = self._xpress.var(name=varname, lb=lb, ub=ub, vartype=vartype)
+            xpress_vars.append(xpress_var)
+            if vartype == self._xpress.binary:
+                if lb == ub:
+                    bound_vars.append(xpress_var)
+                    bound_types.append('B')
+                    bounds.append(lb)
+                else:
+                    bound_vars.extend((xpress_var, xpress_var))
+                    bound_types.extend(('L', 'U'))
+                    bounds.extend((lb, ub))
+
+        self._solver_model.addVariable(xpress_vars)
+        if bound_vars:
+            self._solver_model.chgbounds(bound_vars, bound_types, bounds)
+
+        for var, xpress_var in zip(variables, xpress_vars):
+            self._pyomo_var_to_solver_var_map[var] = xpress_var
+            self._solver_var_to_pyomo_var_map[xpress_var] = var
+            self._referenced_variables[var] = 0
+
+    def _add_constraints(self, cons):
+        new_cons = []
+        for con in cons:
+            if not con.active:
+                continue
+            if self._skip_trivial_constraints and is_fixed(con.body):
+                continue
+            new_cons.append((con,) + self._xpress_con_from_pyomo_con(con))
+        if not new_cons:
+            return
+
+        self._solver_model.addConstraint([c[1] for c in new_cons])
+
+        for con, xpress_con, referenced_vars, body_constant in new_cons:
+            self._record_constraint(con, xpress_con, referenced_vars,
+                                    body_constant)
+
     def _warm_start(self):
         XpressDirect._warm_start(self)
 
@@ -104,6 +162,66 @@ class XpressPersistent(PersistentSolver, XpressDirect):
         self._solver_model.chgbounds([xpress_var, xpress_var], ['L', 'U'], [lb, ub])
         self._solver_model.chgcoltype([xpress_var], [qctype])
 
+    def update_vars(self, variables):
+        """Update several variables in the solver's model.
+
+        This will update bounds, fix/unfix the variables as needed, and
+        update the variable types, changing all of the bounds and all
+        of the types in a single call each.
+
+        Parameters
+        ----------
+        variables: iterable of _VarData
+
+        """
+        bound_vars = []
+        bound_types = []
+        bounds = []
+        type_vars = []
+        qctypes = []
+        for var in variables:
+            if var not in self._pyomo_var_to_solver_var_map:
+                raise ValueError('The Var provided to update_vars needs to be added first: {0}'.format(var))
+            xpress_var = self._pyomo_var_to_solver_var_map[var]
+            lb, ub = self._xpress_lb_ub_from_var(var)
+            bound_vars.extend((xpress_var, xpress_var))
+            bound_types.extend(('L', 'U'))
+            bounds.extend((lb, ub))
+            type_vars.append(xpress_var)
+            qctypes.append(self._xpress_chgcoltype_from_var(var))
+        if not type_vars:
+            return
+
+        self._solver_model.chgbounds(bound_vars, bound_types, bounds)
+        self._solver_model.chgcoltype(type_vars, qctypes)
+
+    def _update_constraint_bounds(self, cons):
+        xpress_cons = []
+        rhs = []
+        range_cons = []
+        ranges = []
+        for con in cons:
+            xpress_con = self._pyomo_con_to_solver_con_map[con]
+            offset = self._get_constraint_offset(con)
+            if xpress_con in self._range_constraints:
+                lb = value(con.lower)
+                ub = value(con.upper)
+                xpress_cons.append(xpress_con)
+                rhs.append(ub - offset)
+                range_cons.append(xpress_con)
+                ranges.append(ub - lb)
+            elif con.has_lb():
+                xpress_cons.append(xpress_con)
+                rhs.append(value(con.lower) - offset)
+            else:
+                xpress_cons.append(xpress_con)
+                rhs.append(value(con.upper) - offset)
+
+        if xpress_cons:
+            self._solver_model.chgrhs(xpress_cons, rhs)
+        if range_cons:
+            self._solver_model.chgrhsrange(range_cons, ranges)
+
     def _add_column(self, var, obj_coef, constraints, coefficients):
         """Add a column to the solver's model
 
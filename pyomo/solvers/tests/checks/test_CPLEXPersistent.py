@@ -12,7 +12,7 @@ import pyutilib.th as unittest
 
 import pyomo.environ
 from pyomo.core import (ConcreteModel, Var, Objective,
-                        Constraint, NonNegativeReals)
+                        Constraint, NonNegativeReals, Param, RangeSet)
 from pyomo.opt import SolverFactory
 
 try:
@@ -113,3 +113,101 @@ class TestQuadraticObjective(unittest.TestCase):
         opt.add_var(m.y)
         # var already in solver model
         self.assertRaises(RuntimeError, opt.add_column, m, m.y, -2, [m.c], [1])
+
+    def test_bulk_updates(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I, within=NonNegativeReals)
+        m.p = Param(m.I, mutable=True, initialize=lambda m, i: i + 1)
+        m.obj = Objective(expr=-sum(m.x.values()))
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] + 1 <= m.p[i])
+
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m)
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i)
+
+        for i in m.I:
+            m.p[i] = 2*i + 1
+        opt.update_constraint_bounds(m.c.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, 2*i)
+
+        for i in m.I:
+            m.x[i].setub(i - 1)
+        opt.update_vars(m.x.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i - 1)
+
+        m.y = Var(m.I, within=NonNegativeReals)
+        m.d = Constraint(m.I, rule=lambda m, i: m.y[i] <= m.x[i])
+        opt.add_vars(m.y.values())
+        opt.add_constraints(m.d.values())
+        m.obj.expr -= sum(m.y.values())
+        opt.set_objective(m.obj)
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.y[i].value, i - 1)
+
+        with self.assertRaisesRegex(ValueError, 'still referenced'):
+            opt.remove_vars(m.y.values())
+        opt.remove_constraints(m.d.values())
+        m.obj.expr = -sum(m.x.values())
+        opt.set_objective(m.obj)
+        opt.remove_vars(m.y.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i - 1)
+
+    def test_update_detects_changes(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 10))
+        m.p = Param(mutable=True, initialize=1)
+        m.q = Param(mutable=True, initialize=4)
+        m.obj = Objective(expr=-m.x[1] - m.x[2])
+        m.c = Constraint(expr=m.p*m.x[1] + m.x[2] <= m.q)
+
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value + m.x[2].value, 4)
+
+        # bound (RHS) change
+        m.q = 6
+        opt.update()
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value + m.x[2].value, 6)
+
+        # change in the body of the constraint and in the variable bounds
+        m.p = 2
+        m.x[2].setub(1)
+        opt.update()
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 2.5)
+        self.assertAlmostEqual(m.x[2].value, 1)
+
+        # fixed variables and new / deactivated components
+        m.x[2].fix(0)
+        m.d = Constraint(expr=m.x[1] <= 2)
+        opt.update()
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 2)
+        self.assertAlmostEqual(m.x[2].value, 0)
+
+        m.d.deactivate()
+        m.x[2].unfix()
+        opt.update()
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 2.5)
+        self.assertAlmostEqual(m.x[2].value, 1)
+
+        # new objective
+        m.obj.deactivate()
+        m.obj2 = Objective(expr=m.x[1] + m.x[2])
+        opt.update()
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 0)
+        self.assertAlmostEqual(m.x[2].value, 0)
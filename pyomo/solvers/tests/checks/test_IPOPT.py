@@ -0,0 +1,186 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.environ import (ConcreteModel, Var, Constraint, Objective,
+                           Suffix, SolverFactory, value)
+
+# A fake Ipopt executable: it records the command line and the
+# initial point in the NL file (the "x" and "d" segments and the
+# suffixes) in a JSON file, and returns x[i] = 1+i, a dual of 10+i
+# for constraint i and bound multipliers zL[i] = i and zU[i] = -i
+_mock_ipopt = """
+import json, sys
+if sys.argv[1] == '-v':
+    print('Ipopt 3.12.0 (mock)')
+    sys.exit(0)
+nlfile = sys.argv[1]
+info = {'args': sys.argv[2:], 'x': {}, 'd': {}, 'S': {}}
+with open(nlfile) as FILE:
+    lines = [line.split('#')[0].strip() for line in FILE]
+n, m = [int(i) for i in lines[1].split()[:2]]
+i = 0
+while i < len(lines):
+    line = lines[i]
+    if line[:1] in 'xdS' and line[1:2].isdigit():
+        if line[0] == 'S':
+            kind, cnt, name = line[1:].split()
+            data = info['S'][name] = {}
+        else:
+            cnt = line[1:]
+            data = info[line[0]]
+        for j in range(int(cnt)):
+            i += 1
+            idx, val = lines[i].split()
+            data[idx] = float(val)
+    i += 1
+info_file = [a for a in sys.argv if a.startswith('info_file=')][0]
+with open(info_file[10:], 'w') as FILE:
+    json.dump(info, FILE)
+with open(nlfile[:-3] + '.sol', 'w') as FILE:
+    FILE.write("Mock Ipopt\\n\\nOptions\\n3\\n1\\n1\\n0\\n"
+               "%s\\n%s\\n%s\\n%s\\n" % (m, m, n, n))
+    FILE.write("".join("%s\\n" % (10+j,) for j in range(m)))
+    FILE.write("".join("%s\\n" % (1+j,) for j in range(n)))
+    FILE.write("objno 0 0\\n")
+    for name, sign in (('ipopt_zL_out', 1), ('ipopt_zU_out', -1)):
+        FILE.write("suffix 4 %s %s 0 0\\n%s\\n" % (n, len(name), name))
+        FILE.write("".join("%s %s\\n" % (j, sign*j) for j in range(n)))
+"""
+
+
+def _make_model():
+    m = ConcreteModel()
+    m.x = Var([1, 2], bounds=(0, 10))
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    m.o = Objective(expr=m.x[1]**2 + m.x[2]**2)
+    return m
+
+
+@unittest.skipIf(os.name == 'nt', "the mock Ipopt executable is a script")
+class TestIpoptWarmStart(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        script = os.path.join(self.tmpdir, 'mock_ipopt.py')
+        with open(script, 'w') as FILE:
+            FILE.write(_mock_ipopt)
+        self.exe = os.path.join(self.tmpdir, 'ipopt')
+        with open(self.exe, 'w') as FILE:
+            FILE.write('#!/bin/sh\nexec "%s" "%s" "$@"\n'
+                       % (sys.executable, script))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IXUSR)
+        self.info_file = os.path.join(self.tmpdir, 'info.json')
+        self.opt = SolverFactory('ipopt')
+        self.opt.set_executable(self.exe)
+        # The mock solver writes the initial point to this file
+        self.opt.options['info_file'] = self.info_file
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _info(self):
+        with open(self.info_file) as FILE:
+            return json.load(FILE)
+
+    def test_warm_start_capable(self):
+        self.assertTrue(self.opt.warm_start_capable())
+
+    def test_warmstart(self):
+        m = _make_model()
+        self.opt.solve(m, warmstart=True)
+        info = self._info()
+        # There is no previous point for the first solve
+        self.assertNotIn('warm_start_init_point=yes', info['args'])
+        self.assertEqual(info['d'], {})
+        self.assertEqual(info['S'], {})
+        self.assertEqual(value(m.x[1]), 1)
+        self.assertEqual(value(m.x[2]), 2)
+
+        # Rebuild the model: the point from the last solve is matched
+        # to the new variables and constraints (and replaces the
+        # initial values of the new variables)
+        m = _make_model()
+        m.x[2].value = 5
+        self.opt.solve(m, warmstart=True)
+        info = self._info()
+        self.assertIn('warm_start_init_point=yes', info['args'])
+        self.assertEqual(info['x'], {'0': 1, '1': 2})
+        self.assertEqual(info['d'], {'0': 10})
+        self.assertEqual(info['S']['ipopt_zL_in'], {'0': 0, '1': 1})
+        self.assertEqual(info['S']['ipopt_zU_in'], {'0': 0, '1': -1})
+        # The temporary suffixes were removed from the model
+        self.assertIsNone(m.component('dual'))
+        self.assertIsNone(m.component('ipopt_zL_in'))
+        self.assertIsNone(m.component('ipopt_zU_in'))
+
+        # Without warmstart, the point is not exported
+        self.opt.solve(m)
+        info = self._info()
+        self.assertNotIn('warm_start_init_point=yes', info['args'])
+        self.assertEqual(info['d'], {})
+
+    def test_warmstart_import_suffix(self):
+        m = _make_model()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        self.opt.solve(m, warmstart=True)
+        self.assertEqual(m.dual[m.c], 10)
+        m.dual[m.c] = 7
+        self.opt.solve(m, warmstart=True)
+        # The values in the (import) dual suffix are exported
+        self.assertEqual(self._info()['d'], {'0': 7})
+        self.assertEqual(m.dual.get_direction(), Suffix.IMPORT)
+        self.assertEqual(m.dual[m.c], 10)
+
+    def test_warmstart_rebuild_import_suffix(self):
+        m = _make_model()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        self.opt.solve(m, warmstart=True)
+
+        # Rebuild the model (with initial values and an empty import
+        # dual suffix): the suffix is filled from the stored point
+        m = _make_model()
+        m.x[1].value = 3
+        m.x[2].value = 4
+        m.d = Constraint(expr=m.x[1] - m.x[2] <= 1)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.dual[m.d] = 7
+        self.opt.solve(m, warmstart=True, symbolic_solver_labels=True)
+        info = self._info()
+        self.assertIn('warm_start_init_point=yes', info['args'])
+        self.assertEqual(info['x'], {'0': 1, '1': 2})
+        self.assertEqual(info['d'], {'0': 10, '1': 7})
+        self.assertEqual(info['S']['ipopt_zL_in'], {'0': 0, '1': 1})
+        # The suffix was restored before the solution was loaded
+        self.assertEqual(m.dual.get_direction(), Suffix.IMPORT)
+        self.assertEqual(m.dual[m.c], 10)
+        self.assertEqual(m.dual[m.d], 11)
+
+    def test_warmstart_vectorized(self):
+        m = _make_model()
+        self.opt.solve(m, warmstart=True, vectorized_load=True)
+        m = _make_model()
+        self.opt.solve(m, warmstart=True, vectorized_load=True)
+        info = self._info()
+        self.assertEqual(info['x'], {'0': 1, '1': 2})
+        self.assertEqual(info['d'], {'0': 10})
+        self.assertEqual(info['S']['ipopt_zU_in'], {'0': 0, '1': -1})
+
+
+if __name__ == "__main__":
+    unittest.main()
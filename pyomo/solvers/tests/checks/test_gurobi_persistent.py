@@ -389,3 +389,159 @@ class TestGurobiPersistent(unittest.TestCase):
         opt.add_var(m.y)
         # var already in solver model
         self.assertRaises(RuntimeError, opt.add_column, m, m.y, -2, [m.c], [1])
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_bulk_updates(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(3)
+        m.x = pyo.Var(m.I, within=pyo.NonNegativeReals)
+        m.p = pyo.Param(m.I, mutable=True, initialize=lambda m, i: i + 1)
+        m.obj = pyo.Objective(expr=-sum(m.x.values()))
+        m.c = pyo.Constraint(m.I, rule=lambda m, i: m.x[i] + 1 <= m.p[i])
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m)
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i)
+
+        for i in m.I:
+            m.p[i] = 2*i + 1
+        opt.update_constraint_bounds(m.c.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, 2*i)
+
+        for i in m.I:
+            m.x[i].setub(i - 1)
+        opt.update_vars(m.x.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i - 1)
+
+        m.y = pyo.Var(m.I, within=pyo.NonNegativeReals)
+        m.d = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] <= m.x[i])
+        opt.add_vars(m.y.values())
+        opt.add_constraints(m.d.values())
+        m.obj.expr -= sum(m.y.values())
+        opt.set_objective(m.obj)
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.y[i].value, i - 1)
+
+        with self.assertRaisesRegex(ValueError, 'still referenced'):
+            opt.remove_vars(m.y.values())
+        opt.remove_constraints(m.d.values())
+        m.obj.expr = -sum(m.x.values())
+        opt.set_objective(m.obj)
+        opt.remove_vars(m.y.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i - 1)
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_update_detects_changes(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2], bounds=(0, 10))
+        m.p = pyo.Param(mutable=True, initialize=1)
+        m.q = pyo.Param(mutable=True, initialize=4)
+        m.obj = pyo.Objective(expr=-m.x[1] - m.x[2])
+        m.c = pyo.Constraint(expr=m.p*m.x[1] + m.x[2] <= m.q)
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value + m.x[2].value, 4)
+
+        # bound (RHS) change
+        m.q = 6
+        opt.update(detect_changes=True)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value + m.x[2].value, 6)
+
+        # change in the body of the constraint and in the variable bounds
+        m.p = 2
+        m.x[2].setub(1)
+        opt.update(detect_changes=True)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 2.5)
+        self.assertAlmostEqual(m.x[2].value, 1)
+
+        # fixed variables and new / deactivated components
+        m.x[2].fix(0)
+        m.d = pyo.Constraint(expr=m.x[1] <= 2)
+        opt.update(detect_changes=True)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 2)
+        self.assertAlmostEqual(m.x[2].value, 0)
+
+        m.d.deactivate()
+        m.x[2].unfix()
+        opt.update(detect_changes=True)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 2.5)
+        self.assertAlmostEqual(m.x[2].value, 1)
+
+        # new objective
+        m.obj.deactivate()
+        m.obj2 = pyo.Objective(expr=m.x[1] + m.x[2])
+        opt.update(detect_changes=True)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 0)
+        self.assertAlmostEqual(m.x[2].value, 0)
+
+
+class _MockGurobiVar(object):
+    def __init__(self, x, rc):
+        self.X = x
+        self.RC = rc
+
+
+class _MockGurobiModel(object):
+    """Records the getAttr() calls made when loading a solution"""
+    def __init__(self):
+        self.calls = []
+
+    def getAttr(self, attr, objs):
+        self.calls.append((attr, len(objs)))
+        return [getattr(obj, attr.upper()) for obj in objs]
+
+
+class TestGurobiDirectLoad(unittest.TestCase):
+    def _make_solver(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3])
+        opt = pyo.SolverFactory('gurobi_direct')
+        opt._pyomo_model = m
+        opt._solver_model = _MockGurobiModel()
+        for i in m.x:
+            opt._pyomo_var_to_solver_var_map[m.x[i]] = \
+                _MockGurobiVar(10*i, -i)
+            # x[2] is not referenced by the solver model
+            opt._referenced_variables[m.x[i]] = 0 if i == 2 else 1
+        return m, opt
+
+    def test_load_vars(self):
+        m, opt = self._make_solver()
+        m.x[2].value = 5
+        opt.load_vars()
+        self.assertEqual(m.x[1].value, 10)
+        self.assertEqual(m.x[2].value, 5)
+        self.assertEqual(m.x[3].value, 30)
+        self.assertFalse(m.x[1].stale)
+        # Only the referenced variables are queried, in a single call
+        self.assertEqual(opt._solver_model.calls, [('X', 2)])
+
+        m.x[1].value = None
+        opt.load_vars([m.x[1], m.x[2]])
+        self.assertEqual(m.x[1].value, 10)
+        self.assertEqual(m.x[2].value, 5)
+        self.assertEqual(opt._solver_model.calls[-1], ('X', 1))
+
+    def test_load_rc(self):
+        m, opt = self._make_solver()
+        opt.load_rc(None)
+        self.assertEqual(len(m.rc), 2)
+        self.assertEqual(m.rc[m.x[1]], -1)
+        self.assertEqual(m.rc[m.x[3]], -3)
+        self.assertEqual(opt._solver_model.calls, [('Rc', 2)])
@@ -0,0 +1,233 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+import pyomo.environ as pyo
+import pyomo.solvers.plugins.solvers.persistent_solver as persistent_solver
+from pyomo.common.collections import Bunch, ComponentSet
+from pyomo.core.expr.numvalue import value
+from pyomo.repn import generate_standard_repn
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import \
+    DirectOrPersistentSolver
+from pyomo.opt import (SolverResults, Solution, SolutionStatus,
+                       SolverStatus, TerminationCondition)
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+
+class _RecordingPersistent(PersistentSolver):
+    """A (solver-independent) persistent interface that records the
+    linear rows sent to the solver"""
+
+    def __init__(self, **kwds):
+        kwds.setdefault('type', 'recording_persistent')
+        PersistentSolver.__init__(self, **kwds)
+
+    def _set_instance(self, model, kwds={}):
+        DirectOrPersistentSolver._set_instance(self, model, kwds)
+        self.rows = {}
+        self.added = []
+        self._add_block(model)
+
+    def _add_var(self, var):
+        varname = self._symbol_map.getSymbol(var, self._labeler)
+        self._pyomo_var_to_solver_var_map[var] = varname
+        self._solver_var_to_pyomo_var_map[varname] = var
+        self._referenced_variables[var] = 0
+
+    def _remove_var(self, solver_var):
+        pass
+
+    def update_var(self, var):
+        pass
+
+    def _add_constraint(self, con):
+        conname = self._symbol_map.getSymbol(con, self._labeler)
+        repn = generate_standard_repn(con.body)
+        referenced_vars = ComponentSet(repn.linear_vars)
+        self.rows[conname] = (
+            dict((v.name, value(c)) for v, c in
+                 zip(repn.linear_vars, repn.linear_coefs)),
+            value(repn.constant))
+        self.added.append(con.name)
+        for var in referenced_vars:
+            self._referenced_variables[var] += 1
+        self._vars_referenced_by_con[con] = referenced_vars
+        self._con_body_constants[con] = value(repn.constant)
+        self._pyomo_con_to_solver_con_map[con] = conname
+        self._solver_con_to_pyomo_con_map[conname] = con
+
+    def _remove_constraint(self, solver_con):
+        del self.rows[solver_con]
+
+    def _set_objective(self, obj):
+        self._objective = obj
+
+    def row(self, con):
+        return self.rows[self._pyomo_con_to_solver_con_map[con]]
+
+
+class _SolvingPersistent(_RecordingPersistent):
+    """A persistent interface that "solves" the model by setting every
+    variable to 1"""
+
+    def available(self, exception_flag=True):
+        return True
+
+    def _apply_solver(self):
+        return Bunch(rc=None)
+
+    def _postsolve(self):
+        self.results = SolverResults()
+        self.results.solver.status = SolverStatus.ok
+        self.results.solver.termination_condition = \
+            TerminationCondition.optimal
+        self.results.problem.lower_bound = 1.5
+        self.results.problem.upper_bound = 2.5
+        soln = Solution()
+        soln.status = SolutionStatus.optimal
+        soln.gap = 1
+        for var, name in self._pyomo_var_to_solver_var_map.items():
+            if self._save_results:
+                soln.variable[name] = {'Value': 1}
+            elif self._load_solutions:
+                var.value = 1
+        self.results.solution.insert(soln)
+        return DirectOrPersistentSolver._postsolve(self)
+
+
+class TestPersistentSolverUpdate(unittest.TestCase):
+
+    def test_update_linear_expression_body(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.Set(initialize=[1, 2, 3])
+        m.p = pyo.Param(m.I, initialize={1: 1, 2: 2, 3: 3}, mutable=True)
+        m.x = pyo.Var(m.I)
+        m.y = pyo.Var()
+        m.y.fix(1)
+        m.c = pyo.Constraint(
+            expr=pyo.quicksum(m.p[i]*m.x[i] for i in m.I) + m.y <= 5)
+        m.d = pyo.Constraint(expr=m.x[1] >= 0)
+        opt = _RecordingPersistent()
+        opt.set_instance(m)
+        self.assertEqual(opt.row(m.c),
+                         ({'x[1]': 1, 'x[2]': 2, 'x[3]': 3}, 1))
+        del opt.added[:]
+
+        opt.update()
+        self.assertEqual(opt.added, [])
+
+        m.p[2] = 5
+        opt.update()
+        self.assertEqual(opt.added, ['c'])
+        self.assertEqual(opt.row(m.c),
+                         ({'x[1]': 1, 'x[2]': 5, 'x[3]': 3}, 1))
+        del opt.added[:]
+
+        # The value of a fixed variable in the body changed
+        m.y.fix(4)
+        opt.update()
+        self.assertEqual(opt.added, ['c'])
+        self.assertEqual(opt.row(m.c),
+                         ({'x[1]': 1, 'x[2]': 5, 'x[3]': 3}, 4))
+        del opt.added[:]
+
+        # Fixing a variable in the LinearExpression
+        m.x[3].fix(2)
+        opt.update()
+        self.assertEqual(sorted(opt.added), ['c'])
+        self.assertEqual(opt.row(m.c), ({'x[1]': 1, 'x[2]': 5}, 10))
+        del opt.added[:]
+
+        m.x[3].fix(3)
+        opt.update()
+        self.assertEqual(opt.added, ['c'])
+        self.assertEqual(opt.row(m.c), ({'x[1]': 1, 'x[2]': 5}, 13))
+
+    def test_constraint_offset(self):
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param(initialize=2, mutable=True)
+        m.x = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x + m.p <= 5)
+        opt = _RecordingPersistent()
+        opt.set_instance(m)
+        self.assertEqual(opt._con_body_constants[m.c], 2)
+
+        # The offset is recorded when the constraint is added (the
+        # body is not processed again)
+        orig = persistent_solver.generate_standard_repn
+        def _fail(*args, **kwds):
+            raise AssertionError("generate_standard_repn was called")
+        persistent_solver.generate_standard_repn = _fail
+        try:
+            self.assertEqual(opt._get_constraint_offset(m.c), 2)
+        finally:
+            persistent_solver.generate_standard_repn = orig
+
+        # ... and refreshed when the constraint is added again
+        m.p = 3
+        opt.update()
+        self.assertEqual(opt._get_constraint_offset(m.c), 3)
+
+        opt.remove_constraint(m.c)
+        self.assertNotIn(m.c, opt._con_body_constants)
+
+    def test_update_removed_constraint_bounds(self):
+        m = pyo.ConcreteModel()
+        m.q = pyo.Param(initialize=4, mutable=True)
+        m.x = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x <= m.q)
+        opt = _RecordingPersistent()
+        opt.set_instance(m)
+        del opt.added[:]
+
+        # Explicitly removed constraints are not added (or updated)
+        # again when their bounds change
+        opt.remove_constraint(m.c)
+        m.q = 5
+        opt.update()
+        self.assertEqual(opt.added, [])
+        self.assertNotIn(m.c, opt._pyomo_con_to_solver_con_map)
+
+
+class TestPersistentSolverResults(unittest.TestCase):
+
+    def test_lean_results(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2])
+        m.o = pyo.Objective(expr=m.x[1] + 2*m.x[2])
+        m.c = pyo.Constraint(expr=m.x[1] >= 0)
+        opt = _SolvingPersistent()
+        opt.set_instance(m)
+
+        results = opt.solve(results_mode='lean')
+        self.assertEqual(m.x[2].value, 1)
+        # The objective bounds and values are kept ...
+        self.assertEqual(results.problem.lower_bound, 1.5)
+        self.assertEqual(results.problem.upper_bound, 2.5)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(len(results.solution), 1)
+        self.assertEqual(results.solution(0).status, SolutionStatus.optimal)
+        self.assertEqual(results.solution(0).gap, 1)
+        self.assertEqual(results.solution(0).objective['o']['Value'], 3)
+        # ... but not the variable and constraint values
+        self.assertEqual(len(results.solution(0).variable), 0)
+        self.assertEqual(len(results.solution(0).constraint), 0)
+        self.assertEqual(len(m.solutions), 0)
+
+        m.x[2].value = None
+        results = opt.solve()
+        self.assertEqual(m.x[2].value, 1)
+        self.assertEqual(results.problem.lower_bound, 1.5)
+        self.assertEqual(len(results.solution), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
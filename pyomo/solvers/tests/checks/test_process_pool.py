@@ -0,0 +1,173 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import multiprocessing
+
+import pyutilib.th as unittest
+
+from pyomo.common.collections import Bunch
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.environ import (ConcreteModel, Var, Constraint, Objective,
+                           Suffix, SolverFactory, SolverManagerFactory,
+                           value)
+from pyomo.opt import (OptSolver, SolverResults, ProblemFormat,
+                       ResultsFormat, ReaderFactory, TerminationCondition)
+from pyomo.opt.parallel.manager import FailedActionHandle
+from pyomo.solvers.plugins.smanager.process_pool import futures_available
+
+_fork_available = 'fork' in multiprocessing.get_all_start_methods() \
+    if hasattr(multiprocessing, 'get_all_start_methods') else False
+
+
+@SolverFactory.register('_mock_pool_sol',
+                        doc='Mock NL solver for the process pool tests')
+class MockSolSolver(OptSolver):
+    """A solver that writes a *.sol file with v<i> = i/10 and a dual
+    of 10+i for c<i> for the NL file it is given"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_mock_pool_sol'
+        OptSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.nl]
+        self._problem_format = ProblemFormat.nl
+        self._results_format = ResultsFormat.sol
+        self._capabilities.linear = True
+
+    def _apply_solver(self):
+        nlfile = self._problem_files[0]
+        with open(nlfile) as FILE:
+            FILE.readline()
+            n, m = [int(x) for x in FILE.readline().split()[:2]]
+        self._solfile = nlfile[:-3] + '.sol'
+        with open(self._solfile, 'w') as FILE:
+            FILE.write("Mock solver\n\nOptions\n3\n1\n1\n0\n"
+                       "%s\n%s\n%s\n%s\n" % (m, m, n, n))
+            FILE.write("".join("%s\n" % (10+i,) for i in range(m)))
+            FILE.write("".join("%s\n" % (i/10.,) for i in range(n)))
+            FILE.write("objno 0 0\n")
+        return Bunch(rc=0)
+
+    def _postsolve(self):
+        with ReaderFactory("sol") as reader:
+            results = reader(self._solfile, suffixes=self._suffixes)
+        os.remove(self._solfile)
+        return results
+
+
+@SolverFactory.register('_mock_pool_direct',
+                        doc='Mock direct solver for the process pool tests')
+class MockDirectSolver(OptSolver):
+    """A solver that sets the variables to their (0-based) position
+    in the model, along with the dual of the constraints"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_mock_pool_direct'
+        OptSolver.__init__(self, **kwds)
+
+    def available(self, exception_flag=True):
+        return True
+
+    def solve(self, model, **kwds):
+        for i, v in enumerate(model.component_data_objects(Var)):
+            v.value = i + self.options.get('offset', 0)
+        if hasattr(model, 'dual'):
+            for i, c in enumerate(model.component_data_objects(Constraint)):
+                model.dual[c] = -i
+        results = SolverResults()
+        results.solver.termination_condition = \
+            TerminationCondition.optimal
+        results.solver.pid = os.getpid()
+        return results
+
+
+def _c_rule(m, i):
+    return m.x[i] >= i
+
+def _make_model(n):
+    m = ConcreteModel()
+    m.x = Var(range(n))
+    m.c = Constraint(range(n), rule=_c_rule)
+    m.o = Objective(expr=sum(m.x.values()))
+    return m
+
+
+@unittest.skipIf(not futures_available, "concurrent.futures not available")
+@unittest.skipIf(not _fork_available, "fork start method not available")
+class TestProcessPool(unittest.TestCase):
+
+    def tearDown(self):
+        TempfileManager.clear_tempfiles()
+
+    def test_problem_file(self):
+        models = [_make_model(n) for n in (2, 3, 4)]
+        with SolverManagerFactory('process_pool', max_workers=2) as manager:
+            handles = [manager.queue(m, opt=SolverFactory('_mock_pool_sol'))
+                       for m in models]
+            manager.wait_all(handles)
+            for ah, m in zip(handles, models):
+                results = manager.get_results(ah)
+                self.assertEqual(results.solver.termination_condition,
+                                 TerminationCondition.optimal)
+                for i in range(len(m.x)):
+                    self.assertAlmostEqual(value(m.x[i]), i/10.)
+                self.assertEqual(len(results.solution), 0)
+
+    def test_wait_any(self):
+        models = [_make_model(n) for n in (2, 3)]
+        for m in models:
+            m.dual = Suffix(direction=Suffix.IMPORT)
+        with SolverManagerFactory('process_pool', max_workers=2) as manager:
+            handles = set(manager.queue(m, opt='_mock_pool_sol')
+                          for m in models)
+            while handles:
+                ah = manager.wait_any()
+                self.assertIn(ah, handles)
+                handles.remove(ah)
+            self.assertEqual(manager.num_queued(), 0)
+        for m in models:
+            for i in range(len(m.c)):
+                self.assertEqual(m.dual[m.c[i]], 10+i)
+
+    def test_no_load_solutions(self):
+        m = _make_model(3)
+        with SolverManagerFactory('process_pool') as manager:
+            results = manager.solve(m, opt='_mock_pool_sol',
+                                    load_solutions=False)
+        self.assertIsNone(m.x[0].value)
+        self.assertEqual(len(results.solution), 1)
+        m.solutions.load_from(results)
+        self.assertAlmostEqual(value(m.x[2]), 0.2)
+
+    def test_pickled_instance(self):
+        models = [_make_model(n) for n in (2, 3)]
+        models[1].dual = Suffix(direction=Suffix.IMPORT)
+        with SolverManagerFactory('process_pool', max_workers=2) as manager:
+            handles = [manager.queue(m, opt='_mock_pool_direct',
+                                     options={'offset': 5})
+                       for m in models]
+            manager.wait_all()
+            for ah, m in zip(handles, models):
+                results = manager.get_results(ah)
+                # The model was solved by a worker process
+                self.assertNotEqual(results.solver.pid, os.getpid())
+                for i in range(len(m.x)):
+                    self.assertEqual(m.x[i].value, i + 5)
+        for i in range(len(models[1].c)):
+            self.assertEqual(models[1].dual[models[1].c[i]], -i)
+
+    def test_no_queued_actions(self):
+        with SolverManagerFactory('process_pool') as manager:
+            ah = manager.wait_any()
+            self.assertEqual(ah, FailedActionHandle)
+
+
+if __name__ == "__main__":
+    unittest.main()
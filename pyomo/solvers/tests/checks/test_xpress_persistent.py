@@ -267,3 +267,53 @@ class TestXpressPersistent(unittest.TestCase):
         opt.add_var(m.y)
         # var already in solver model
         self.assertRaises(RuntimeError, opt.add_column, m, m.y, -2, [m.c], [1])
+
+    @unittest.skipIf(not xpress_available, "xpress is not available")
+    def test_bulk_updates(self):
+        m = pe.ConcreteModel()
+        m.I = pe.RangeSet(3)
+        m.x = pe.Var(m.I, within=pe.NonNegativeReals)
+        m.p = pe.Param(m.I, mutable=True, initialize=lambda m, i: i + 1)
+        m.obj = pe.Objective(expr=-sum(m.x.values()))
+        m.c = pe.Constraint(m.I, rule=lambda m, i: m.x[i] + 1 <= m.p[i])
+
+        opt = pe.SolverFactory('xpress_persistent')
+        opt.set_instance(m)
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i)
+
+        for i in m.I:
+            m.p[i] = 2*i + 1
+        opt.update_constraint_bounds(m.c.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, 2*i)
+
+        for i in m.I:
+            m.x[i].setub(i - 1)
+        opt.update_vars(m.x.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i - 1)
+
+        m.y = pe.Var(m.I, within=pe.NonNegativeReals)
+        m.d = pe.Constraint(m.I, rule=lambda m, i: m.y[i] <= m.x[i])
+        opt.add_vars(m.y.values())
+        opt.add_constraints(m.d.values())
+        m.obj.expr -= sum(m.y.values())
+        opt.set_objective(m.obj)
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.y[i].value, i - 1)
+
+        with self.assertRaisesRegex(ValueError, 'still referenced'):
+            opt.remove_vars(m.y.values())
+        opt.remove_constraints(m.d.values())
+        m.obj.expr = -sum(m.x.values())
+        opt.set_objective(m.obj)
+        opt.remove_vars(m.y.values())
+        opt.solve()
+        for i in m.I:
+            self.assertAlmostEqual(m.x[i].value, i - 1)
+
@@ -11,6 +11,7 @@
 # Unit Tests for pyomo.opt.base.convert
 #
 
+import errno
 import re
 import sys
 import os
@@ -81,6 +82,19 @@ class MockArg4(MockArg):
         INPUT.close()
         return (filename,None)
 
+class MockArg5(MockArg4):
+
+    def __init__(self, full_dir):
+        self.full_dir = full_dir
+        self.filenames = []
+
+    def write(self,filename="", format=None, solver_capability=None, io_options={}):
+        self.filenames.append(filename)
+        if os.path.dirname(filename) == self.full_dir:
+            raise IOError(errno.ENOSPC, "No space left on device")
+        return MockArg4.write(self, filename, format,
+                              solver_capability, io_options)
+
 
 class Test(unittest.TestCase):
 
@@ -260,6 +274,38 @@ class Test(unittest.TestCase):
         self.assertNotEqual(re.match(".*tmp.*pyomo.nl$",ans[0][0]), None)
         os.remove(ans[0][0])
 
+    def test_mock_nl_ram_tempdir_full(self):
+        #""" Write the NL file to disk when the RAM-backed directory fills up """
+        ramdir = TempfileManager.create_tempdir()
+        arg = MockArg5(ramdir)
+        TempfileManager.tempdir = None
+        try:
+            TempfileManager.use_ram_tempdir(ramdir, min_free=0)
+            ans = convert_problem( (arg, ProblemFormat.nl,arg), None, [ProblemFormat.nl])
+        finally:
+            TempfileManager.use_ram_tempdir(False)
+            TempfileManager.ram_tempdir_min_free = \
+                type(TempfileManager).ram_tempdir_min_free
+            TempfileManager.tempdir = currdir
+        self.assertEqual(len(arg.filenames), 2)
+        self.assertEqual(os.path.dirname(arg.filenames[0]), ramdir)
+        self.assertFalse(os.path.exists(arg.filenames[0]))
+        self.assertEqual(ans[0][0], arg.filenames[1])
+        self.assertNotEqual(os.path.dirname(ans[0][0]), ramdir)
+        self.assertTrue(os.path.exists(ans[0][0]))
+
+    def test_mock_bar_compression(self):
+        #""" BARON cannot read compressed problem files """
+        arg = MockArg4()
+        with self.assertRaisesRegexp(
+                ValueError, "does not support compressed problem files"):
+            convert_problem( (arg, ProblemFormat.bar, arg), None,
+                             [ProblemFormat.bar], compression='gzip')
+        ans = convert_problem( (arg, ProblemFormat.bar, arg), None,
+                               [ProblemFormat.bar], compression='none')
+        self.assertNotEqual(re.match(".*tmp.*pyomo.bar$",ans[0][0]), None)
+        os.remove(ans[0][0])
+
     def test_pyomo_nl1(self):
         #""" Convert from Pyomo to NL with file"""
         ans = convert_problem( (currdir+'model.py', ProblemFormat.nl,), None, [ProblemFormat.nl])